@@ -93,14 +93,8 @@ class TaggingAnalysisPlugin(interface.AnalysisPlugin):
             'no events will be tagged.')
         return
 
-    matched_label_names = []
-    for label_name, filter_objects in self._tagging_rules.items():
-      for filter_object in filter_objects:
-        # Note that tagging events based on existing labels is currently
-        # not supported.
-        if filter_object.Match(event, event_data, None):
-          matched_label_names.append(label_name)
-          break
+    matched_label_names = self._tagging_rules.GetMatchingLabels(
+        event, event_data)
 
     if matched_label_names:
       event_tag = self._CreateEventTag(
@@ -116,7 +110,8 @@ class TaggingAnalysisPlugin(interface.AnalysisPlugin):
       tagging_file_path (str): path of the tagging file.
     """
     tag_file = tagging_file.TaggingFile(tagging_file_path)
-    self._tagging_rules = tag_file.GetEventTaggingRules()
+    tagging_rules = tag_file.GetEventTaggingRules()
+    self._tagging_rules = tagging_file.TaggingRulesIndex(tagging_rules)
 
 
 manager.AnalysisPluginManager.RegisterPlugin(TaggingAnalysisPlugin)
@@ -56,9 +56,12 @@ class ExtractionTool(
         input_reader=input_reader, output_writer=output_writer)
     self._artifacts_registry = None
     self._buffer_size = 0
+    self._dtfabric_cache_directory = None
     self._mount_path = None
     self._operating_system = None
+    self._order_by_data_offset = False
     self._parser_filter_expression = None
+    self._path_spec_cache_directory = None
     self._preferred_year = None
     self._presets_file = None
     self._presets_manager = parsers_presets.ParserPresetsManager()
@@ -67,7 +70,9 @@ class ExtractionTool(
     self._process_memory_limit = None
     self._queue_size = self._DEFAULT_QUEUE_SIZE
     self._resolver_context = dfvfs_context.Context()
+    self._shared_chunk_cache_size = 0
     self._single_process_mode = False
+    self._status_transport = definitions.DEFAULT_STATUS_TRANSPORT
     self._storage_file_path = None
     self._storage_format = definitions.STORAGE_FORMAT_SQLITE
     self._task_storage_format = definitions.STORAGE_FORMAT_SQLITE
@@ -139,10 +144,12 @@ class ExtractionTool(
     configuration.artifact_filters = self._artifact_filters
     configuration.credentials = self._credential_configurations
     configuration.debug_output = self._debug_mode
+    configuration.dtfabric_cache_directory = self._dtfabric_cache_directory
     configuration.event_extraction.text_prepend = self._text_prepend
     configuration.extraction.hasher_file_size_limit = (
         self._hasher_file_size_limit)
     configuration.extraction.hasher_names_string = self._hasher_names_string
+    configuration.extraction.order_by_data_offset = self._order_by_data_offset
     configuration.extraction.process_archives = self._process_archives
     configuration.extraction.process_compressed_streams = (
         self._process_compressed_streams)
@@ -151,10 +158,13 @@ class ExtractionTool(
     configuration.input_source.mount_path = self._mount_path
     configuration.log_filename = self._log_file
     configuration.parser_filter_expression = parser_filter_expression
+    configuration.path_spec_cache_directory = self._path_spec_cache_directory
     configuration.preferred_year = self._preferred_year
     configuration.profiling.directory = self._profiling_directory
     configuration.profiling.sample_rate = self._profiling_sample_rate
     configuration.profiling.profilers = self._profilers
+    configuration.shared_chunk_cache_size = self._shared_chunk_cache_size
+    configuration.status_transport = self._status_transport
     configuration.task_storage_format = self._task_storage_format
     configuration.temporary_directory = self._temporary_directory
 
@@ -184,8 +194,37 @@ class ExtractionTool(
         raise errors.BadConfigOption(
             'Invalid buffer size: {0!s}.'.format(self._buffer_size))
 
+    self._order_by_data_offset = getattr(
+        options, 'order_by_data_offset', False)
+
     self._queue_size = self.ParseNumericOption(options, 'queue_size')
 
+    shared_chunk_cache_size = self.ParseNumericOption(
+        options, 'shared_chunk_cache_size', default_value=0)
+    if shared_chunk_cache_size < 0:
+      raise errors.BadConfigOption(
+          'Invalid shared chunk cache size: {0:d}.'.format(
+              shared_chunk_cache_size))
+
+    self._shared_chunk_cache_size = (
+        shared_chunk_cache_size * self._BYTES_IN_A_MIB)
+
+    self._dtfabric_cache_directory = getattr(
+        options, 'dtfabric_cache_directory', None)
+    if (self._dtfabric_cache_directory and
+        not os.path.isdir(self._dtfabric_cache_directory)):
+      raise errors.BadConfigOption(
+          'No such dtFabric cache directory: {0:s}'.format(
+              self._dtfabric_cache_directory))
+
+    self._path_spec_cache_directory = getattr(
+        options, 'path_spec_cache_directory', None)
+    if (self._path_spec_cache_directory and
+        not os.path.isdir(self._path_spec_cache_directory)):
+      raise errors.BadConfigOption(
+          'No such path specification cache directory: {0:s}'.format(
+              self._path_spec_cache_directory))
+
   def _ParseProcessingOptions(self, options):
     """Parses the processing options.
 
@@ -289,12 +328,49 @@ class ExtractionTool(
         action='store', default=0, help=(
             'The buffer size for the output (defaults to 196MiB).'))
 
+    argument_group.add_argument(
+        '--dtfabric_cache_directory', '--dtfabric-cache-directory',
+        dest='dtfabric_cache_directory', type=str, action='store',
+        default=None, metavar='DIRECTORY', help=(
+            'Path to a directory to store the parsed dtFabric definition '
+            'files, so that worker processes do not need to parse them '
+            'again.'))
+
+    argument_group.add_argument(
+        '--order_by_data_offset', '--order-by-data-offset',
+        dest='order_by_data_offset', action='store_true', default=False,
+        help=(
+            'Schedule the file entries of a storage media image in the order '
+            'of the offsets of their data and group file entries with '
+            'neighbouring data into the same task. This reduces random reads '
+            'of the image and repeated decompression of the same chunks of '
+            'a compressed image, such as EWF, at the expense of processing '
+            'the largest files first.'))
+
+    argument_group.add_argument(
+        '--path_spec_cache_directory', '--path-spec-cache-directory',
+        dest='path_spec_cache_directory', type=str, action='store',
+        default=None, metavar='DIRECTORY', help=(
+            'Path to a directory to store the file entries enumerated from '
+            'a storage media image, so that subsequent runs over the same '
+            'image with a filter file do not need to walk its file systems '
+            'again.'))
+
     argument_group.add_argument(
         '--queue_size', '--queue-size', dest='queue_size', action='store',
         default=0, help=(
             'The maximum number of queued items per worker '
             '(defaults to {0:d})').format(self._DEFAULT_QUEUE_SIZE))
 
+    argument_group.add_argument(
+        '--shared_chunk_cache_size', '--shared-chunk-cache-size',
+        dest='shared_chunk_cache_size', action='store', default=0,
+        metavar='SIZE', help=(
+            'Size in MiB of a cache of decompressed chunks of compressed '
+            'storage media images, such as EWF, that is shared by the worker '
+            'processes, so that a chunk is only decompressed once. A value of '
+            '0 disables the cache (defaults to 0).'))
+
   def AddProcessingOptions(self, argument_group):
     """Adds the processing options to the argument group.
 
@@ -15,6 +15,7 @@ from plaso.cli.helpers import hashers
 from plaso.cli.helpers import language
 from plaso.cli.helpers import nsrlsvr_analysis
 from plaso.cli.helpers import output_modules
+from plaso.cli.helpers import parquet_output
 from plaso.cli.helpers import parsers
 from plaso.cli.helpers import profiling
 from plaso.cli.helpers import process_resources
@@ -33,6 +33,7 @@ class ElasticSearchOutputArgumentsHelper(interface.ArgumentsHelper):
   _DEFAULT_INDEX_NAME = uuid4().hex
   _DEFAULT_DOCUMENT_TYPE = 'plaso_event'
   _DEFAULT_FLUSH_INTERVAL = 1000
+  _DEFAULT_NUMBER_OF_CONCURRENT_REQUESTS = 4
   _DEFAULT_RAW_FIELDS = False
 
   @classmethod
@@ -58,6 +59,12 @@ class ElasticSearchOutputArgumentsHelper(interface.ArgumentsHelper):
         '--flush_interval', dest='flush_interval', type=int,
         action='store', default=cls._DEFAULT_FLUSH_INTERVAL, help=(
             'Events to queue up before bulk insert to ElasticSearch.'))
+    argument_group.add_argument(
+        '--concurrent_requests', '--concurrent-requests',
+        dest='concurrent_requests', type=int, action='store',
+        default=cls._DEFAULT_NUMBER_OF_CONCURRENT_REQUESTS, help=(
+            'Maximum number of bulk inserts that are sent to ElasticSearch '
+            'concurrently.'))
     argument_group.add_argument(
         '--raw_fields', dest='raw_fields', action='store_true',
         default=cls._DEFAULT_RAW_FIELDS, help=(
@@ -110,6 +117,9 @@ class ElasticSearchOutputArgumentsHelper(interface.ArgumentsHelper):
         options, 'document_type', default_value=cls._DEFAULT_DOCUMENT_TYPE)
     flush_interval = cls._ParseNumericOption(
         options, 'flush_interval', default_value=cls._DEFAULT_FLUSH_INTERVAL)
+    concurrent_requests = cls._ParseNumericOption(
+        options, 'concurrent_requests',
+        default_value=cls._DEFAULT_NUMBER_OF_CONCURRENT_REQUESTS)
     raw_fields = getattr(options, 'raw_fields', cls._DEFAULT_RAW_FIELDS)
     elastic_user = cls._ParseStringOption(options, 'elastic_user')
     elastic_password = cls._ParseStringOption(options, 'elastic_password')
@@ -119,6 +129,11 @@ class ElasticSearchOutputArgumentsHelper(interface.ArgumentsHelper):
         options, 'ca_certificates_file_path')
     elastic_url_prefix = cls._ParseStringOption(options, 'elastic_url_prefix')
 
+    if concurrent_requests < 1:
+      raise errors.BadConfigOption(
+          'Invalid number of concurrent requests: {0:d}.'.format(
+              concurrent_requests))
+
     if elastic_password is None:
       elastic_password = os.getenv('PLASO_ELASTIC_PASSWORD', None)
 
@@ -135,6 +150,7 @@ class ElasticSearchOutputArgumentsHelper(interface.ArgumentsHelper):
     output_module.SetIndexName(index_name)
     output_module.SetDocumentType(document_type)
     output_module.SetFlushInterval(flush_interval)
+    output_module.SetNumberOfConcurrentRequests(concurrent_requests)
     output_module.SetRawFields(raw_fields)
     output_module.SetUsername(elastic_user)
     output_module.SetPassword(elastic_password)
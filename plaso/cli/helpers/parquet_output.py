@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""The Parquet output module CLI arguments helper."""
+
+from __future__ import unicode_literals
+
+from plaso.lib import errors
+from plaso.cli.helpers import interface
+from plaso.cli.helpers import manager
+from plaso.output import parquet
+
+
+class ParquetOutputArgumentsHelper(interface.ArgumentsHelper):
+  """Parquet output module CLI arguments helper."""
+
+  NAME = 'parquet'
+  CATEGORY = 'output'
+  DESCRIPTION = 'Argument helper for the Parquet output module.'
+
+  _DEFAULT_ROW_GROUP_SIZE = 65536
+
+  @classmethod
+  def AddArguments(cls, argument_group):
+    """Adds command line arguments the helper supports to an argument group.
+
+    This function takes an argument parser or an argument group object and adds
+    to it all the command line arguments this helper supports.
+
+    Args:
+      argument_group (argparse._ArgumentGroup|argparse.ArgumentParser):
+          argparse group.
+    """
+    argument_group.add_argument(
+        '--row_group_size', '--row-group-size', dest='row_group_size',
+        type=int, action='store', default=cls._DEFAULT_ROW_GROUP_SIZE,
+        metavar='NUMBER', help=(
+            'Number of events that are written per row group of the Parquet '
+            'file, the default is {0:d}.').format(cls._DEFAULT_ROW_GROUP_SIZE))
+
+  # pylint: disable=arguments-differ
+  @classmethod
+  def ParseOptions(cls, options, output_module):
+    """Parses and validates options.
+
+    Args:
+      options (argparse.Namespace): parser options.
+      output_module (ParquetOutputModule): output module to configure.
+
+    Raises:
+      BadConfigObject: when the output module object is of the wrong type.
+      BadConfigOption: when the output filename was not provided or the row
+          group size is invalid.
+    """
+    if not isinstance(output_module, parquet.ParquetOutputModule):
+      raise errors.BadConfigObject(
+          'Output module is not an instance of ParquetOutputModule')
+
+    filename = getattr(options, 'write', None)
+    if not filename:
+      raise errors.BadConfigOption(
+          'Output filename was not provided use "-w filename" to specify.')
+
+    row_group_size = cls._ParseNumericOption(
+        options, 'row_group_size', default_value=cls._DEFAULT_ROW_GROUP_SIZE)
+
+    if row_group_size < 1:
+      raise errors.BadConfigOption(
+          'Invalid row group size: {0:d}.'.format(row_group_size))
+
+    output_module.SetFilename(filename)
+    output_module.SetRowGroupSize(row_group_size)
+
+
+manager.ArgumentHelperManager.RegisterHelper(ParquetOutputArgumentsHelper)
@@ -21,6 +21,7 @@ class TimesketchOutputArgumentsHelper(interface.ArgumentsHelper):
   _DEFAULT_DOCUMENT_TYPE = 'plaso_event'
   _DEFAULT_FLUSH_INTERVAL = 1000
   _DEFAULT_NAME = ''
+  _DEFAULT_NUMBER_OF_CONCURRENT_REQUESTS = 4
   _DEFAULT_USERNAME = None
   _DEFAULT_UUID = '{0:s}'.format(uuid.uuid4().hex)
 
@@ -56,6 +57,14 @@ class TimesketchOutputArgumentsHelper(interface.ArgumentsHelper):
             'The number of events to queue up before sent in bulk '
             'to Elasticsearch.'))
 
+    argument_group.add_argument(
+        '--concurrent_requests', '--concurrent-requests',
+        dest='concurrent_requests', type=int, action='store',
+        default=cls._DEFAULT_NUMBER_OF_CONCURRENT_REQUESTS, required=False,
+        help=(
+            'The maximum number of bulk requests that are sent to '
+            'Elasticsearch concurrently.'))
+
     argument_group.add_argument(
         '--doc_type', dest='document_type', type=str,
         action='store', default=cls._DEFAULT_DOCUMENT_TYPE, help=(
@@ -91,6 +100,16 @@ class TimesketchOutputArgumentsHelper(interface.ArgumentsHelper):
         options, 'flush_interval', default_value=cls._DEFAULT_FLUSH_INTERVAL)
     output_module.SetFlushInterval(flush_interval)
 
+    concurrent_requests = cls._ParseNumericOption(
+        options, 'concurrent_requests',
+        default_value=cls._DEFAULT_NUMBER_OF_CONCURRENT_REQUESTS)
+    if concurrent_requests < 1:
+      raise errors.BadConfigOption(
+          'Invalid number of concurrent requests: {0:d}.'.format(
+              concurrent_requests))
+
+    output_module.SetNumberOfConcurrentRequests(concurrent_requests)
+
     index = cls._ParseStringOption(
         options, 'index', default_value=cls._DEFAULT_UUID)
     output_module.SetIndexName(index)
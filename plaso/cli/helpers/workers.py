@@ -6,6 +6,7 @@ from __future__ import unicode_literals
 from plaso.cli import tools
 from plaso.cli.helpers import interface
 from plaso.cli.helpers import manager
+from plaso.lib import definitions
 from plaso.lib import errors
 
 
@@ -26,6 +27,28 @@ class WorkersArgumentsHelper(interface.ArgumentsHelper):
       argument_group (argparse._ArgumentGroup|argparse.ArgumentParser):
           argparse group.
     """
+    argument_group.add_argument(
+        '--maximum_workers', '--maximum-workers', dest='maximum_workers',
+        action='store', type=int, default=0, help=(
+            'Maximum number of worker processes. If set to a value larger '
+            'than the number of worker processes, worker processes are added '
+            'or retired based on the CPU, I/O wait and memory usage of the '
+            'system [defaults to 0, which represents a fixed number of '
+            'worker processes].'))
+
+    status_transports = sorted(definitions.STATUS_TRANSPORTS)
+
+    argument_group.add_argument(
+        '--status_transport', '--status-transport', action='store',
+        choices=status_transports, dest='status_transport', type=str,
+        metavar='TRANSPORT', default=definitions.DEFAULT_STATUS_TRANSPORT,
+        help=(
+            'Transport used by the worker processes to report their status '
+            'to the main (foreman) process, the default is: {0:s}. Supported '
+            'options: {1:s}'.format(
+                definitions.DEFAULT_STATUS_TRANSPORT,
+                ', '.join(status_transports))))
+
     argument_group.add_argument(
         '--worker_memory_limit', '--worker-memory-limit',
         dest='worker_memory_limit', action='store', type=int,
@@ -65,6 +88,22 @@ class WorkersArgumentsHelper(interface.ArgumentsHelper):
       raise errors.BadConfigOption(
           'Invalid number of extraction workers value cannot be negative.')
 
+    maximum_number_of_extraction_workers = cls._ParseNumericOption(
+        options, 'maximum_workers', default_value=0)
+
+    if maximum_number_of_extraction_workers < 0:
+      raise errors.BadConfigOption(
+          'Invalid maximum number of extraction workers value cannot be '
+          'negative.')
+
+    status_transport = cls._ParseStringOption(
+        options, 'status_transport',
+        default_value=definitions.DEFAULT_STATUS_TRANSPORT)
+
+    if status_transport not in definitions.STATUS_TRANSPORTS:
+      raise errors.BadConfigOption(
+          'Unsupported status transport: {0:s}'.format(status_transport))
+
     worker_memory_limit = cls._ParseNumericOption(
         options, 'worker_memory_limit')
 
@@ -72,9 +111,13 @@ class WorkersArgumentsHelper(interface.ArgumentsHelper):
       raise errors.BadConfigOption(
           'Invalid worker memory limit value cannot be negative.')
 
+    setattr(
+        configuration_object, '_maximum_number_of_extraction_workers',
+        maximum_number_of_extraction_workers)
     setattr(
         configuration_object, '_number_of_extraction_workers',
         number_of_extraction_workers)
+    setattr(configuration_object, '_status_transport', status_transport)
     setattr(configuration_object, '_worker_memory_limit', worker_memory_limit)
 
 
@@ -8,10 +8,11 @@ import codecs
 import collections
 import io
 import json
+import multiprocessing
 import os
+import tempfile
 import textwrap
 
-from dfvfs.helpers import file_system_searcher
 from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.lib import errors as dfvfs_errors
 from dfvfs.resolver import context
@@ -24,12 +25,84 @@ from plaso.cli.helpers import manager as helpers_manager
 from plaso.engine import engine
 from plaso.engine import extractors
 from plaso.engine import path_helper
+from plaso.engine import path_spec_cache
 from plaso.filters import file_entry as file_entry_filters
 from plaso.lib import errors
 from plaso.lib import loggers
 from plaso.lib import specification
 
 
+class ExportedDataStream(object):
+  """Data stream written to a temporary file to be exported.
+
+  Attributes:
+    digest (str): hexadecimal representation of the SHA-256 hash of the content
+        of the data stream.
+    display_name (str): display name of the file entry of the data stream.
+    error_message (str): message that describes why the data stream could not
+        be written or None if the data stream was written.
+    target_directory (str): sanitized path of the destination directory.
+    target_filename (str): sanitized filename of the destination.
+    temporary_path (str): path of the temporary file that contains the content
+        of the data stream.
+  """
+
+  def __init__(self, display_name):
+    """Initializes an exported data stream.
+
+    Args:
+      display_name (str): display name of the file entry of the data stream.
+    """
+    super(ExportedDataStream, self).__init__()
+    self.digest = None
+    self.display_name = display_name
+    self.error_message = None
+    self.target_directory = None
+    self.target_filename = None
+    self.temporary_path = None
+
+
+# Image export tool used by a worker process, which is set when the worker
+# process is initialized.
+_WORKER_PROCESS_TOOL = None
+
+
+def _InitializeWorkerProcess(image_export_tool):
+  """Initializes a worker process.
+
+  Note that the image export tool is inherited by the worker process, since
+  the worker processes are forked, and is not shared with the main process.
+  The image export tool cannot be pickled, for example its filter collection
+  can contain a signature scanner, hence worker processes cannot be spawned.
+
+  Args:
+    image_export_tool (ImageExportTool): image export tool.
+  """
+  # pylint: disable=global-statement,protected-access
+  global _WORKER_PROCESS_TOOL
+
+  # Every worker process opens file entries with its own resolver context.
+  image_export_tool._resolver_context = context.Context()
+  _WORKER_PROCESS_TOOL = image_export_tool
+
+
+def _WriteFileEntryInWorkerProcess(arguments):
+  """Writes the data streams of a file entry to temporary files.
+
+  Args:
+    arguments (tuple[dfvfs.PathSpec, str]): path specification of the file
+        entry and path where the extracted files should be stored.
+
+  Returns:
+    tuple[str, list[ExportedDataStream]]: warning message or None and
+        the data streams written to temporary files.
+  """
+  # pylint: disable=protected-access
+  path_spec, destination_path = arguments
+  return _WORKER_PROCESS_TOOL._WriteFileEntryToTemporaryFiles(
+      path_spec, destination_path)
+
+
 class ImageExportTool(storage_media_tool.StorageMediaTool):
   """Class that implements the image export CLI tool.
 
@@ -72,6 +145,9 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
 
   _HASHES_FILENAME = 'hashes.json'
 
+  # Number of path specifications passed to a worker process at a time.
+  _WORKER_PROCESS_CHUNK_SIZE = 8
+
   def __init__(self, input_reader=None, output_writer=None):
     """Initializes the CLI tool object.
 
@@ -92,6 +168,8 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
     self._digests = {}
     self._filter_collection = file_entry_filters.FileEntryFilterCollection()
     self._filter_file = None
+    self._last_file_entry = None
+    self._number_of_worker_processes = 0
     self._path_spec_extractor = extractors.PathSpecExtractor()
     self._process_memory_limit = None
     self._paths_by_hash = collections.defaultdict(list)
@@ -203,88 +281,159 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
     path_spec_generator = self._path_spec_extractor.ExtractPathSpecs(
         source_path_specs, resolver_context=self._resolver_context)
 
-    for path_spec in path_spec_generator:
-      self._ExtractFileEntry(
-          path_spec, destination_path, skip_duplicates=skip_duplicates)
+    self._ExtractFileEntries(
+        path_spec_generator, destination_path,
+        skip_duplicates=skip_duplicates)
 
+  def _ExportDataStream(
+      self, exported_data_stream, destination_path, skip_duplicates=True):
+    """Exports a data stream that was written to a temporary file.
 
-  def _ExtractDataStream(
-      self, file_entry, data_stream_name, destination_path,
-      skip_duplicates=True):
-    """Extracts a data stream.
+    The temporary file is moved to the destination of the data stream or
+    removed if the data stream is not exported, for example when its content
+    is a duplicate of a previously exported data stream.
 
     Args:
-      file_entry (dfvfs.FileEntry): file entry containing the data stream.
-      data_stream_name (str): name of the data stream.
+      exported_data_stream (ExportedDataStream): data stream written
+          to a temporary file.
       destination_path (str): path where the extracted files should be stored.
       skip_duplicates (Optional[bool]): True if files with duplicate content
           should be skipped.
     """
-    if not data_stream_name and not file_entry.IsFile():
-      return
-
-    display_name = path_helper.PathHelper.GetDisplayNameForPathSpec(
-        file_entry.path_spec)
-
-    try:
-      digest = self._CalculateDigestHash(file_entry, data_stream_name)
-    except (IOError, dfvfs_errors.BackEndError) as exception:
-      logger.error((
-          '[skipping] unable to read content of file entry: {0:s} '
-          'with error: {1!s}').format(display_name, exception))
-      return
-
-    if not digest:
-      logger.error(
-          '[skipping] unable to read content of file entry: {0:s}'.format(
-              display_name))
+    if exported_data_stream.error_message:
+      logger.error(exported_data_stream.error_message)
       return
 
-    target_directory, target_filename = self._CreateSanitizedDestination(
-        file_entry, file_entry.path_spec, data_stream_name, destination_path)
+    digest = exported_data_stream.digest
+    display_name = exported_data_stream.display_name
+    target_directory = exported_data_stream.target_directory
+    temporary_path = exported_data_stream.temporary_path
 
     # If does not exist, append path separator to have consistant behaviour.
     if not destination_path.endswith(os.path.sep):
       destination_path = destination_path + os.path.sep
 
-    target_path = os.path.join(target_directory, target_filename)
+    target_path = os.path.join(
+        target_directory, exported_data_stream.target_filename)
     if target_path.startswith(destination_path):
       path = target_path[len(destination_path):]
 
     self._paths_by_hash[digest].append(path)
 
-    if skip_duplicates:
-      duplicate_display_name = self._digests.get(digest, None)
-      if duplicate_display_name:
+    try:
+      if skip_duplicates:
+        duplicate_display_name = self._digests.get(digest, None)
+        if duplicate_display_name:
+          logger.warning((
+              '[skipping] file entry: {0:s} is a duplicate of: {1:s} with '
+              'digest: {2:s}').format(
+                  display_name, duplicate_display_name, digest))
+          return
+
+        self._digests[digest] = display_name
+
+      if not os.path.isdir(target_directory):
+        os.makedirs(target_directory)
+
+      if os.path.exists(target_path):
         logger.warning((
-            '[skipping] file entry: {0:s} is a duplicate of: {1:s} with '
-            'digest: {2:s}').format(
-                display_name, duplicate_display_name, digest))
+            '[skipping] unable to export contents of file entry: {0:s} '
+            'because exported file: {1:s} already exists.').format(
+                display_name, target_path))
         return
 
-      self._digests[digest] = display_name
+      try:
+        os.rename(temporary_path, target_path)
+      except OSError as exception:
+        logger.error((
+            '[skipping] unable to export contents of file entry: {0:s} '
+            'with error: {1!s}').format(display_name, exception))
 
-    if not os.path.isdir(target_directory):
-      os.makedirs(target_directory)
+    finally:
+      if os.path.exists(temporary_path):
+        os.remove(temporary_path)
 
-    if os.path.exists(target_path):
-      logger.warning((
-          '[skipping] unable to export contents of file entry: {0:s} '
-          'because exported file: {1:s} already exists.').format(
-              display_name, target_path))
+  def _ExtractDataStream(
+      self, file_entry, data_stream_name, destination_path,
+      skip_duplicates=True):
+    """Extracts a data stream.
+
+    Args:
+      file_entry (dfvfs.FileEntry): file entry containing the data stream.
+      data_stream_name (str): name of the data stream.
+      destination_path (str): path where the extracted files should be stored.
+      skip_duplicates (Optional[bool]): True if files with duplicate content
+          should be skipped.
+    """
+    if not data_stream_name and not file_entry.IsFile():
       return
 
+    exported_data_stream = self._WriteDataStreamToTemporaryFile(
+        file_entry, data_stream_name, destination_path)
+
+    self._ExportDataStream(
+        exported_data_stream, destination_path,
+        skip_duplicates=skip_duplicates)
+
+  def _ExtractFileEntries(
+      self, path_spec_generator, destination_path, skip_duplicates=True):
+    """Extracts file entries.
+
+    If worker processes are used, the data streams of the file entries are
+    written to temporary files by the worker processes, while the main process
+    exports the temporary files in the order of the path specifications. As a
+    result the exported files and digests do not depend on the number of
+    worker processes.
+
+    Args:
+      path_spec_generator (generator[dfvfs.PathSpec]): path specifications of
+          the file entries to extract.
+      destination_path (str): path where the extracted files should be stored.
+      skip_duplicates (Optional[bool]): True if files with duplicate content
+          should be skipped.
+    """
+    if self._number_of_worker_processes <= 0:
+      for path_spec in path_spec_generator:
+        if self._abort:
+          break
+
+        self._ExtractFileEntry(
+            path_spec, destination_path, skip_duplicates=skip_duplicates)
+
+      return
+
+    arguments_generator = (
+        (path_spec, destination_path) for path_spec in path_spec_generator)
+
+    # The worker processes are forked to inherit the image export tool.
+    multiprocessing_context = multiprocessing.get_context('fork')
+    process_pool = multiprocessing_context.Pool(
+        processes=self._number_of_worker_processes,
+        initializer=_InitializeWorkerProcess, initargs=(self, ))
+
     try:
-      self._WriteFileEntry(file_entry, data_stream_name, target_path)
-    except (IOError, dfvfs_errors.BackEndError) as exception:
-      logger.error((
-          '[skipping] unable to export contents of file entry: {0:s} '
-          'with error: {1!s}').format(display_name, exception))
+      for warning_message, exported_data_streams in process_pool.imap(
+          _WriteFileEntryInWorkerProcess, arguments_generator,
+          chunksize=self._WORKER_PROCESS_CHUNK_SIZE):
+        if warning_message:
+          logger.warning(warning_message)
 
-      try:
-        os.remove(target_path)
-      except (IOError, OSError):
-        pass
+        for exported_data_stream in exported_data_streams:
+          if self._abort:
+            break
+
+          self._ExportDataStream(
+              exported_data_stream, destination_path,
+              skip_duplicates=skip_duplicates)
+
+        if self._abort:
+          break
+
+      process_pool.close()
+
+    finally:
+      process_pool.terminate()
+      process_pool.join()
 
   def _ExtractFileEntry(
       self, path_spec, destination_path, skip_duplicates=True):
@@ -296,30 +445,17 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
       skip_duplicates (Optional[bool]): True if files with duplicate content
           should be skipped.
     """
-    file_entry = path_spec_resolver.Resolver.OpenFileEntry(path_spec)
+    warning_message, exported_data_streams = (
+        self._WriteFileEntryToTemporaryFiles(path_spec, destination_path))
 
-    if not file_entry:
-      logger.warning('Unable to open file entry for path spec: {0:s}'.format(
-          path_spec.comparable))
-      return
+    if warning_message:
+      logger.warning(warning_message)
 
-    if not self._filter_collection.Matches(file_entry):
-      return
-
-    file_entry_processed = False
-    for data_stream in file_entry.data_streams:
-      if self._abort:
-        break
-      self._ExtractDataStream(
-          file_entry, data_stream.name, destination_path,
+    for exported_data_stream in exported_data_streams:
+      self._ExportDataStream(
+          exported_data_stream, destination_path,
           skip_duplicates=skip_duplicates)
 
-      file_entry_processed = True
-
-    if not file_entry_processed:
-      self._ExtractDataStream(
-          file_entry, '', destination_path, skip_duplicates=skip_duplicates)
-
   # TODO: merge with collector and/or engine.
   def _ExtractWithFilter(
       self, source_path_specs, destination_path, output_writer,
@@ -354,9 +490,6 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
       self._PreprocessSources(extraction_engine)
 
     for source_path_spec in source_path_specs:
-      file_system, mount_point = extraction_engine.GetSourceFileSystem(
-          source_path_spec, resolver_context=self._resolver_context)
-
       display_name = path_helper.PathHelper.GetDisplayNameForPathSpec(
           source_path_spec)
       output_writer.Write('Extracting file entries from: {0:s}\n'.format(
@@ -371,15 +504,17 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
             'Unable to build collection filters with error: {0!s}'.format(
                 exception))
 
-      searcher = file_system_searcher.FileSystemSearcher(
-          file_system, mount_point)
+      # The path specification extractor reads the file system from the path
+      # specification cache, when configured.
       filters_helper = extraction_engine.collection_filters_helper
-      for path_spec in searcher.Find(find_specs=(
-          filters_helper.included_file_system_find_specs)):
-        self._ExtractFileEntry(
-            path_spec, destination_path, skip_duplicates=skip_duplicates)
+      path_spec_generator = self._path_spec_extractor.ExtractPathSpecs(
+          [source_path_spec],
+          find_specs=filters_helper.included_file_system_find_specs,
+          resolver_context=self._resolver_context)
 
-      file_system.Close()
+      self._ExtractFileEntries(
+          path_spec_generator, destination_path,
+          skip_duplicates=skip_duplicates)
 
   def _ParseExtensionsString(self, extensions_string):
     """Parses the extensions string.
@@ -549,6 +684,60 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
 
     return specification_store
 
+  def _WriteDataStreamToTemporaryFile(
+      self, file_entry, data_stream_name, destination_path):
+    """Writes a data stream to a temporary file.
+
+    The data stream is read only once, since its digest is calculated while
+    it is written to the temporary file.
+
+    Args:
+      file_entry (dfvfs.FileEntry): file entry containing the data stream.
+      data_stream_name (str): name of the data stream.
+      destination_path (str): path where the extracted files should be stored,
+          which also contains the temporary file.
+
+    Returns:
+      ExportedDataStream: data stream written to a temporary file.
+    """
+    display_name = path_helper.PathHelper.GetDisplayNameForPathSpec(
+        file_entry.path_spec)
+
+    exported_data_stream = ExportedDataStream(display_name)
+
+    file_descriptor, temporary_path = tempfile.mkstemp(
+        prefix='.image_export-', suffix='.tmp', dir=destination_path)
+    os.close(file_descriptor)
+
+    try:
+      digest = self._WriteFileEntry(
+          file_entry, data_stream_name, temporary_path)
+    except (IOError, dfvfs_errors.BackEndError) as exception:
+      digest = None
+      exported_data_stream.error_message = (
+          '[skipping] unable to read content of file entry: {0:s} '
+          'with error: {1!s}').format(display_name, exception)
+
+    if not digest:
+      os.remove(temporary_path)
+
+      if not exported_data_stream.error_message:
+        exported_data_stream.error_message = (
+            '[skipping] unable to read content of file entry: {0:s}').format(
+                display_name)
+
+      return exported_data_stream
+
+    target_directory, target_filename = self._CreateSanitizedDestination(
+        file_entry, file_entry.path_spec, data_stream_name, destination_path)
+
+    exported_data_stream.digest = digest
+    exported_data_stream.target_directory = target_directory
+    exported_data_stream.target_filename = target_filename
+    exported_data_stream.temporary_path = temporary_path
+
+    return exported_data_stream
+
   def _WriteFileEntry(self, file_entry, data_stream_name, destination_file):
     """Writes the contents of the source file entry to a destination file.
 
@@ -559,24 +748,81 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
       data_stream_name (str): name of the data stream whose content is to be
           written.
       destination_file (str): path of the destination file.
+
+    Returns:
+      str: hexadecimal representation of the SHA-256 hash of the content or
+          None if the content cannot be read.
     """
     source_file_object = file_entry.GetFileObject(
         data_stream_name=data_stream_name)
     if not source_file_object:
-      return
+      return None
 
     try:
+      hasher_object = hashers_manager.HashersManager.GetHasher('sha256')
+
       with open(destination_file, 'wb') as destination_file_object:
         source_file_object.seek(0, os.SEEK_SET)
 
         data = source_file_object.read(self._COPY_BUFFER_SIZE)
         while data:
+          hasher_object.Update(data)
           destination_file_object.write(data)
           data = source_file_object.read(self._COPY_BUFFER_SIZE)
 
     finally:
       source_file_object.close()
 
+    return hasher_object.GetStringDigest()
+
+  def _WriteFileEntryToTemporaryFiles(self, path_spec, destination_path):
+    """Writes the data streams of a file entry to temporary files.
+
+    Args:
+      path_spec (dfvfs.PathSpec): path specification of the source file.
+      destination_path (str): path where the extracted files should be stored,
+          which also contains the temporary files.
+
+    Returns:
+      tuple[str, list[ExportedDataStream]]: warning message or None and
+          the data streams written to temporary files.
+    """
+    file_entry = path_spec_resolver.Resolver.OpenFileEntry(
+        path_spec, resolver_context=self._resolver_context)
+
+    if not file_entry:
+      warning_message = 'Unable to open file entry for path spec: {0:s}'.format(
+          path_spec.comparable)
+      return warning_message, []
+
+    # Keep a reference to the file entry so that its file system remains open
+    # and is reused for the next file entry, which is likely stored in the
+    # same file system. Otherwise a worker process, that does not enumerate
+    # the file system, would open the file system for every file entry.
+    self._last_file_entry = file_entry
+
+    if not self._filter_collection.Matches(file_entry):
+      return None, []
+
+    data_stream_names = [
+        data_stream.name for data_stream in file_entry.data_streams]
+    if not data_stream_names:
+      data_stream_names = ['']
+
+    exported_data_streams = []
+    for data_stream_name in data_stream_names:
+      if self._abort:
+        break
+
+      if not data_stream_name and not file_entry.IsFile():
+        continue
+
+      exported_data_stream = self._WriteDataStreamToTemporaryFile(
+          file_entry, data_stream_name, destination_path)
+      exported_data_streams.append(exported_data_stream)
+
+    return None, exported_data_streams
+
   def AddFilterOptions(self, argument_group):
     """Adds the filter options to the argument group.
 
@@ -683,6 +929,22 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
             'previously exported files and duplicates are skipped. Use '
             'this option to include duplicate files in the export.'))
 
+    argument_parser.add_argument(
+        '--workers', dest='workers', action='store', default=0, help=(
+            'Number of worker processes that read and hash the contents of '
+            'file entries in parallel [defaults to 0, which represents that '
+            'the contents are read and hashed by the main process]. Worker '
+            'processes are only supported on platforms that can fork '
+            'processes.'))
+
+    argument_parser.add_argument(
+        '--path_spec_cache_directory', '--path-spec-cache-directory',
+        dest='path_spec_cache_directory', type=str, action='store',
+        default=None, metavar='DIRECTORY', help=(
+            'Path to a directory to store the file entries enumerated from '
+            'the image, so that subsequent exports from the same image do '
+            'not need to walk its file systems again.'))
+
     argument_parser.add_argument(
         self._SOURCE_OPTION, nargs='?', action='store', metavar='IMAGE',
         default=None, type=str, help=(
@@ -755,6 +1017,29 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
 
     self._ParseFilterOptions(options)
 
+    self._number_of_worker_processes = self.ParseNumericOption(
+        options, 'workers', default_value=0)
+    if self._number_of_worker_processes < 0:
+      raise errors.BadConfigOption(
+          'Invalid number of worker processes value cannot be negative.')
+
+    if (self._number_of_worker_processes > 0 and
+        'fork' not in multiprocessing.get_all_start_methods()):
+      raise errors.BadConfigOption(
+          'Worker processes are not supported on this platform.')
+
+    path_spec_cache_directory = self.ParseStringOption(
+        options, 'path_spec_cache_directory')
+    if path_spec_cache_directory:
+      if not os.path.isdir(path_spec_cache_directory):
+        raise errors.BadConfigOption(
+            'No such path specification cache directory: {0:s}'.format(
+                path_spec_cache_directory))
+
+      cache = path_spec_cache.PathSpecCache(path_spec_cache_directory)
+      self._path_spec_extractor = extractors.PathSpecExtractor(
+          path_spec_cache=cache)
+
     if (getattr(options, 'no_vss', False) or
         getattr(options, 'include_duplicates', False)):
       self._skip_duplicates = False
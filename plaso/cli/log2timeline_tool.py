@@ -92,6 +92,7 @@ class Log2TimelineTool(extraction_tool.ExtractionTool):
         input_reader=input_reader, output_writer=output_writer)
     self._command_line_arguments = None
     self._enable_sigsegv_handler = False
+    self._maximum_number_of_extraction_workers = 0
     self._number_of_extraction_workers = 0
     self._storage_serializer_format = definitions.SERIALIZER_FORMAT_JSON
     self._source_type = None
@@ -443,6 +444,8 @@ class Log2TimelineTool(extraction_tool.ExtractionTool):
       processing_status = extraction_engine.ProcessSources(
           session.identifier, self._source_path_specs, storage_writer,
           configuration, enable_sigsegv_handler=self._enable_sigsegv_handler,
+          maximum_number_of_worker_processes=(
+              self._maximum_number_of_extraction_workers),
           number_of_worker_processes=self._number_of_extraction_workers,
           status_update_callback=status_update_callback,
           worker_memory_limit=self._worker_memory_limit)
@@ -285,6 +285,28 @@ class PsortTool(
 
       table_view.Write(self._output_writer)
 
+  def _PrintWindowsEventMessageCacheDetails(self, formatter_mediator):
+    """Prints the details of the Windows Event Log message cache.
+
+    Args:
+      formatter_mediator (FormatterMediator): formatter mediator.
+    """
+    cache_hits = formatter_mediator.winevt_message_cache_hits
+    cache_misses = formatter_mediator.winevt_message_cache_misses
+
+    number_of_lookups = cache_hits + cache_misses
+    if not number_of_lookups:
+      return
+
+    hit_rate = (float(cache_hits) / number_of_lookups) * 100.0
+
+    table_view = views.ViewsFactory.GetTableView(
+        self._views_format_type, title='Windows Event Log message cache')
+    table_view.AddRow(['Hits', cache_hits])
+    table_view.AddRow(['Misses', cache_misses])
+    table_view.AddRow(['Hit rate', '{0:.1f}%'.format(hit_rate)])
+    table_view.Write(self._output_writer)
+
   def AddProcessingOptions(self, argument_group):
     """Adds processing options to the argument group
 
@@ -366,6 +388,14 @@ class PsortTool(
     helpers_manager.ArgumentHelperManager.AddCommandLineArguments(
         output_group, names=['language'])
 
+    output_group.add_argument(
+        '--preload_winevt_rc', '--preload-winevt-rc', action='store_true',
+        dest='preload_winevt_rc', default=False, help=(
+            'Read the Windows Event Log resource database into memory '
+            'before the events are output. This speeds up the output of '
+            'a large number of Windows Event Log events at the cost of '
+            'memory.'))
+
     self.AddTimeZoneOption(output_group)
 
     output_format_group = argument_parser.add_argument_group(
@@ -468,6 +498,7 @@ class PsortTool(
         options, self, names=['event_filters'])
 
     self._deduplicate_events = getattr(options, 'dedup', True)
+    self._preload_winevt_rc = getattr(options, 'preload_winevt_rc', False)
 
     if self._data_location:
       # Update the data location with the calculated value.
@@ -587,6 +618,9 @@ class PsortTool(
       table_view.AddRow(['Total', analysis_counter['total']])
       table_view.Write(self._output_writer)
 
+    if self._formatter_mediator:
+      self._PrintWindowsEventMessageCacheDetails(self._formatter_mediator)
+
     storage_reader = storage_factory.StorageFactory.CreateStorageReaderForFile(
         self._storage_file_path)
     self._PrintAnalysisReportsDetails(storage_reader)
@@ -105,6 +105,7 @@ class PstealTool(
     self._deduplicate_events = True
     self._enable_sigsegv_handler = False
     self._knowledge_base = knowledge_base.KnowledgeBase()
+    self._maximum_number_of_extraction_workers = 0
     self._number_of_analysis_reports = 0
     self._number_of_extraction_workers = 0
     self._output_format = None
@@ -337,6 +338,8 @@ class PstealTool(
           session.identifier, self._source_path_specs, storage_writer,
           configuration,
           enable_sigsegv_handler=self._enable_sigsegv_handler,
+          maximum_number_of_worker_processes=(
+              self._maximum_number_of_extraction_workers),
           number_of_worker_processes=self._number_of_extraction_workers,
           status_update_callback=status_update_callback)
 
@@ -144,9 +144,11 @@ class OutputModuleOptions(object):
   def __init__(self):
     """Initializes output module options."""
     super(OutputModuleOptions, self).__init__()
+    self._formatter_mediator = None
     self._output_filename = None
     self._output_format = None
     self._output_module = None
+    self._preload_winevt_rc = False
 
   def _CreateOutputModule(self, options):
     """Creates the output module.
@@ -169,6 +171,13 @@ class OutputModuleOptions(object):
     except (KeyError, TypeError) as exception:
       raise RuntimeError(exception)
 
+    if (self._preload_winevt_rc and
+        not formatter_mediator.PreloadWindowsEventMessages()):
+      logger.warning(
+          'Unable to preload the Windows Event Log resource database.')
+
+    self._formatter_mediator = formatter_mediator
+
     mediator = output_mediator.OutputMediator(
         self._knowledge_base, formatter_mediator,
         preferred_encoding=self.preferred_encoding)
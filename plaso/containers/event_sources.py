@@ -15,8 +15,13 @@ class EventSource(interface.AttributeContainer):
   or Application Compatibility cache.
 
   Attributes:
+    data_offset (int): offset of the first data run of the file entry data,
+        relative to the start of the volume that contains the file system,
+        or None if not available.
     data_type (str): attribute container type indicator.
     file_entry_type (str): dfVFS file entry type.
+    file_size (int): size of the file entry data in bytes or None if not
+        available.
     path_spec (dfvfs.PathSpec): path specification.
   """
   CONTAINER_TYPE = 'event_source'
@@ -29,8 +34,10 @@ class EventSource(interface.AttributeContainer):
       path_spec (Optional[dfvfs.PathSpec]): path specification.
     """
     super(EventSource, self).__init__()
+    self.data_offset = None
     self.data_type = self.DATA_TYPE
     self.file_entry_type = None
+    self.file_size = None
     self.path_spec = path_spec
 
   # This method is necessary for heap sort.
@@ -23,6 +23,12 @@ class Task(interface.AttributeContainer):
         number of micro seconds since January 1, 1970, 00:00:00 UTC.
     file_entry_type (str): dfVFS type of the file entry the path specification
         is referencing.
+    file_size (int): size of the file entry data the path specification is
+        referencing in bytes or None if not available.
+    grouped_path_specs (list[dfvfs.PathSpec]): path specifications of file
+        entries with data that neighbours that of the file entry the path
+        specification is referencing, which are processed by the same task,
+        or None if not set.
     has_retry (bool): True if the task was previously abandoned and a retry
         task was created, False otherwise.
     identifier (str): unique identifier of the task.
@@ -50,6 +56,8 @@ class Task(interface.AttributeContainer):
     self.aborted = False
     self.completion_time = None
     self.file_entry_type = None
+    self.file_size = None
+    self.grouped_path_specs = None
     self.has_retry = False
     self.identifier = '{0:s}'.format(uuid.uuid4().hex)
     self.last_processing_time = None
@@ -83,6 +91,8 @@ class Task(interface.AttributeContainer):
     """
     retry_task = Task(session_identifier=self.session_identifier)
     retry_task.file_entry_type = self.file_entry_type
+    retry_task.file_size = self.file_size
+    retry_task.grouped_path_specs = self.grouped_path_specs
     retry_task.merge_priority = self.merge_priority
     retry_task.path_spec = self.path_spec
     retry_task.storage_file_size = self.storage_file_size
@@ -38,6 +38,7 @@ PYTHON_DEPENDENCIES = {
     'lz4': ('', '0.10.0', None, True),
     'pefile': ('__version__', '2018.8.8', None, True),
     'psutil': ('__version__', '5.4.3', None, True),
+    'pyarrow': ('__version__', '0.15.0', None, False),
     'pybde': ('get_version()', '20140531', None, True),
     'pyesedb': ('get_version()', '20150409', None, True),
     'pyevt': ('get_version()', '20191104', None, True),
@@ -60,6 +60,9 @@ class ExtractionConfiguration(interface.AttributeContainer):
         should process, where 0 or None represents unlimited.
     hasher_names_string (str): comma separated string of names
         of hashers to use during processing.
+    order_by_data_offset (bool): True if file entries should be scheduled in
+        the order of the offsets of their data and file entries with
+        neighbouring data should be grouped into the same task.
     process_archives (bool): True if archive files should be
         scanned for file entries.
     process_compressed_streams (bool): True if file content in
@@ -73,6 +76,7 @@ class ExtractionConfiguration(interface.AttributeContainer):
     super(ExtractionConfiguration, self).__init__()
     self.hasher_file_size_limit = None
     self.hasher_names_string = None
+    self.order_by_data_offset = False
     self.process_archives = False
     self.process_compressed_streams = True
     self.yara_rules_string = None
@@ -187,6 +191,8 @@ class ProcessingConfiguration(interface.AttributeContainer):
     credentials (list[CredentialConfiguration]): credential configurations.
     data_location (str): path to the data files.
     debug_output (bool): True if debug output should be enabled.
+    dtfabric_cache_directory (str): path of the directory to store parsed
+        dtFabric definition files.
     event_extraction (EventExtractionConfiguration): event extraction
         configuration.
     extraction (ExtractionConfiguration): extraction configuration.
@@ -195,9 +201,16 @@ class ProcessingConfiguration(interface.AttributeContainer):
     log_filename (str): name of the log file.
     parser_filter_expression (str): parser filter expression,
         where None represents all parsers and plugins.
+    path_spec_cache_directory (str): path of the directory to store the file
+        entries enumerated from storage media images.
     preferred_year (int): preferred initial year value for year-less date and
         time values.
     profiling (ProfilingConfiguration): profiling configuration.
+    shared_chunk_cache_size (int): size, in bytes, of the cache of
+        decompressed chunks of compressed storage media images that is shared
+        by the worker processes, where 0 represents no cache.
+    status_transport (str): transport used by worker processes to report
+        their status to the main (foreman) process.
     task_storage_format (str): format to use for storing task results.
     temporary_directory (str): path of the directory for temporary files.
   """
@@ -210,13 +223,17 @@ class ProcessingConfiguration(interface.AttributeContainer):
     self.credentials = []
     self.data_location = None
     self.debug_output = False
+    self.dtfabric_cache_directory = None
     self.event_extraction = EventExtractionConfiguration()
     self.extraction = ExtractionConfiguration()
     self.filter_file = None
     self.input_source = InputSourceConfiguration()
     self.log_filename = None
     self.parser_filter_expression = None
+    self.path_spec_cache_directory = None
     self.preferred_year = None
     self.profiling = ProfilingConfiguration()
+    self.shared_chunk_cache_size = 0
+    self.status_transport = None
     self.task_storage_format = None
     self.temporary_directory = None
@@ -15,8 +15,10 @@ from dfvfs.helpers import file_system_searcher
 from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.lib import errors as dfvfs_errors
 from dfvfs.resolver import resolver as path_spec_resolver
+from dfvfs.vfs import ntfs_file_system
 
 from plaso.engine import logger
+from plaso.engine import ntfs_enumerator
 from plaso.lib import errors
 from plaso.parsers import interface as parsers_interface
 from plaso.parsers import manager as parsers_manager
@@ -365,7 +367,9 @@ class PathSpecExtractor(object):
 
   _MAXIMUM_DEPTH = 255
 
-  def __init__(self, duplicate_file_check=False):
+  def __init__(
+      self, duplicate_file_check=False, ntfs_mft_enumeration=True,
+      path_spec_cache=None):
     """Initializes a path specification extractor.
 
     The source collector discovers all the file entries in the source.
@@ -375,10 +379,17 @@ class PathSpecExtractor(object):
     Args:
       duplicate_file_check (Optional[bool]): True if duplicate files should
           be ignored.
+      ntfs_mft_enumeration (Optional[bool]): True if the file entries of
+          a NTFS file system should be enumerated in MFT order, instead of
+          walking the file system directory by directory.
+      path_spec_cache (Optional[PathSpecCache]): path specification cache,
+          where None represents that file systems should always be walked.
     """
     super(PathSpecExtractor, self).__init__()
     self._duplicate_file_check = duplicate_file_check
     self._hashlist = {}
+    self._ntfs_mft_enumeration = ntfs_mft_enumeration
+    self._path_spec_cache = path_spec_cache
 
   def _CalculateNTFSTimeHash(self, file_entry):
     """Calculates an MD5 from the date and time value of a NTFS file entry.
@@ -546,11 +557,12 @@ class PathSpecExtractor(object):
     """
     produced_main_path_spec = False
     for data_stream in file_entry.data_streams:
-      # Make a copy so we don't make the changes on a path specification
-      # directly. Otherwise already produced path specifications can be
-      # altered in the process.
-      path_spec = copy.deepcopy(file_entry.path_spec)
+      path_spec = file_entry.path_spec
       if data_stream.name:
+        # Make a copy so we don't make the changes on a path specification
+        # directly. Otherwise already produced path specifications can be
+        # altered in the process.
+        path_spec = copy.deepcopy(path_spec)
         setattr(path_spec, 'data_stream', data_stream.name)
       yield path_spec
 
@@ -560,6 +572,30 @@ class PathSpecExtractor(object):
     if not produced_main_path_spec:
       yield file_entry.path_spec
 
+  def _ExtractPathSpecsFromNTFSMFT(self, path_spec, resolver_context=None):
+    """Extracts path specification from the MFT of a NTFS file system.
+
+    Args:
+      path_spec (dfvfs.PathSpec): path specification of the root of
+          the NTFS file system.
+      resolver_context (Optional[dfvfs.Context]): resolver context.
+
+    Returns:
+      generator[dfvfs.PathSpec]: path specifications of the file entries
+          found in the file system, in MFT order, or None if the MFT could
+          not be read.
+    """
+    mft_enumerator = ntfs_enumerator.NTFSMFTEnumerator(
+        maximum_depth=self._MAXIMUM_DEPTH)
+
+    try:
+      mft_enumerator.ReadMFT(path_spec, resolver_context=resolver_context)
+    except IOError as exception:
+      logger.warning('Unable to read MFT with error: {0!s}'.format(exception))
+      return None
+
+    return mft_enumerator.GetPathSpecs()
+
   def _ExtractPathSpecsFromFileSystem(
       self, path_spec, find_specs=None, recurse_file_system=True,
       resolver_context=None):
@@ -580,8 +616,22 @@ class PathSpecExtractor(object):
     """
     file_system = None
     try:
-      file_system = path_spec_resolver.Resolver.OpenFileSystem(
-          path_spec, resolver_context=resolver_context)
+      # The file system of a storage media image is read from the path
+      # specification cache, when available, which provides the file entries
+      # without walking the file system again.
+      if self._path_spec_cache and (find_specs or recurse_file_system):
+        try:
+          file_system = self._path_spec_cache.OpenFileSystem(
+              path_spec, resolver_context=resolver_context)
+        except (IOError, OSError) as exception:
+          logger.warning((
+              'Unable to use path specification cache with error: '
+              '{0!s}').format(exception))
+
+      if not file_system:
+        file_system = path_spec_resolver.Resolver.OpenFileSystem(
+            path_spec, resolver_context=resolver_context)
+
     except (
         dfvfs_errors.AccessError, dfvfs_errors.BackEndError,
         dfvfs_errors.PathSpecError) as exception:
@@ -597,12 +647,29 @@ class PathSpecExtractor(object):
             yield extracted_path_spec
 
         elif recurse_file_system:
-          file_entry = file_system.GetFileEntryByPathSpec(path_spec)
-          if file_entry:
-            for extracted_path_spec in self._ExtractPathSpecsFromDirectory(
-                file_entry):
+          extracted_path_specs = None
+          # Reading the MFT sequentially is faster than walking the directory
+          # indexes of a NTFS file system. The duplicate file check requires
+          # the date and time values of the file entries, which are not read
+          # from the MFT.
+          if (self._ntfs_mft_enumeration and not self._duplicate_file_check and
+              isinstance(file_system, ntfs_file_system.NTFSFileSystem) and
+              getattr(path_spec, 'location', None) == (
+                  file_system.LOCATION_ROOT)):
+            extracted_path_specs = self._ExtractPathSpecsFromNTFSMFT(
+                path_spec, resolver_context=resolver_context)
+
+          if extracted_path_specs is not None:
+            for extracted_path_spec in extracted_path_specs:
               yield extracted_path_spec
 
+          else:
+            file_entry = file_system.GetFileEntryByPathSpec(path_spec)
+            if file_entry:
+              for extracted_path_spec in (
+                  self._ExtractPathSpecsFromDirectory(file_entry)):
+                yield extracted_path_spec
+
         else:
           yield path_spec
 
@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+"""The NTFS Master File Table (MFT) enumerator.
+
+The MFT enumerator reads the MFT of a NTFS file system sequentially and
+reconstructs the paths of the file entries from the parent file references in
+their $FILE_NAME attributes. This produces the same path specifications as
+walking the file system directory by directory, but in MFT order.
+"""
+
+from __future__ import unicode_literals
+
+import pyfsntfs  # pylint: disable=wrong-import-order
+
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.lib import errors as dfvfs_errors
+from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import resolver as path_spec_resolver
+
+from plaso.engine import logger
+
+
+class NTFSMFTEnumerator(object):
+  """NTFS Master File Table (MFT) enumerator.
+
+  The file entries that are enumerated are those a directory walk over
+  the NTFS file system with dfVFS would produce: allocated file entries that
+  are listed in a directory that can be reached from the root directory.
+  Links, such as junctions, are ignored and not descended into.
+  """
+
+  _ATTRIBUTE_TYPE_FILE_NAME = 0x00000030
+
+  _FILE_REFERENCE_MFT_ENTRY_BITMASK = 0xffffffffffff
+
+  _MFT_ENTRY_ROOT_DIRECTORY = 5
+
+  # The DOS (8.3) names are not listed as directory entries by pyfsntfs.
+  _NAME_SPACE_DOS = 2
+
+  _PATH_SEPARATOR = '\\'
+
+  def __init__(self, maximum_depth=255):
+    """Initializes a NTFS MFT enumerator.
+
+    Args:
+      maximum_depth (Optional[int]): maximum depth of directories whose
+          entries are enumerated, where 0 represents the root directory.
+    """
+    super(NTFSMFTEnumerator, self).__init__()
+    self._directories = {}
+    self._file_entries = []
+    self._locations = {}
+    self._maximum_depth = maximum_depth
+    self._parent_path_spec = None
+
+  def _GetDirectoryLocation(self, mft_entry_index):
+    """Retrieves the location of a directory.
+
+    Args:
+      mft_entry_index (int): MFT entry index of the directory.
+
+    Returns:
+      tuple[str, int]: location of the directory, without the root directory
+          path separator, and its depth, or None if the directory cannot be
+          reached from the root directory.
+    """
+    # The parent directories are resolved iteratively, since the chain of
+    # parent file references can be longer than the Python maximum recursion
+    # depth.
+    mft_entry_indexes = []
+    parent_mft_entry_index = mft_entry_index
+    while parent_mft_entry_index not in self._locations:
+      # Marking the MFT entry as unresolved prevents cycles of parent file
+      # references.
+      self._locations[parent_mft_entry_index] = None
+
+      directory = self._directories.get(parent_mft_entry_index, None)
+      if not directory:
+        break
+
+      mft_entry_indexes.append(parent_mft_entry_index)
+
+      _, _, parent_file_reference = directory
+      parent_mft_entry_index = (
+          parent_file_reference & self._FILE_REFERENCE_MFT_ENTRY_BITMASK)
+
+    for directory_mft_entry_index in reversed(mft_entry_indexes):
+      _, name, parent_file_reference = self._directories[
+          directory_mft_entry_index]
+
+      parent_location = self._GetParentLocation(parent_file_reference)
+      if parent_location:
+        location, depth = parent_location
+        self._locations[directory_mft_entry_index] = (
+            self._PATH_SEPARATOR.join([location, name]), depth + 1)
+
+    return self._locations[mft_entry_index]
+
+  def _GetParentLocation(self, parent_file_reference):
+    """Retrieves the location of a parent directory.
+
+    Args:
+      parent_file_reference (int): file reference of the parent directory,
+          as stored in a $FILE_NAME attribute.
+
+    Returns:
+      tuple[str, int]: location of the parent directory, without the root
+          directory path separator, and its depth, or None if the parent
+          directory cannot be reached from the root directory or its entries
+          are not enumerated due to the maximum depth.
+    """
+    mft_entry_index = (
+        parent_file_reference & self._FILE_REFERENCE_MFT_ENTRY_BITMASK)
+
+    directory = self._directories.get(mft_entry_index, None)
+    if not directory:
+      return None
+
+    # A file entry is not listed in its parent directory when the MFT entry
+    # of the parent directory was reused, in which case the sequence number
+    # in the parent file reference no longer matches.
+    file_reference, _, _ = directory
+    if file_reference != parent_file_reference:
+      return None
+
+    parent_location = self._GetDirectoryLocation(mft_entry_index)
+
+    if not parent_location or parent_location[1] >= self._maximum_depth:
+      return None
+
+    return parent_location
+
+  def _ReadMFTEntry(self, mft_entry_index, fsntfs_file_entry):
+    """Reads a MFT entry.
+
+    Args:
+      mft_entry_index (int): MFT entry index.
+      fsntfs_file_entry (pyfsntfs.file_entry): NTFS file entry.
+    """
+    if not fsntfs_file_entry.is_allocated():
+      return
+
+    file_attribute_flags = fsntfs_file_entry.file_attribute_flags or 0
+    if file_attribute_flags & pyfsntfs.file_attribute_flags.REPARSE_POINT:
+      return
+
+    names = []
+    for attribute_index in range(fsntfs_file_entry.number_of_attributes):
+      fsntfs_attribute = fsntfs_file_entry.get_attribute(attribute_index)
+      if (fsntfs_attribute.attribute_type != self._ATTRIBUTE_TYPE_FILE_NAME or
+          fsntfs_attribute.name_space == self._NAME_SPACE_DOS):
+        continue
+
+      names.append((
+          attribute_index, fsntfs_attribute.name,
+          fsntfs_attribute.parent_file_reference))
+
+    if not names:
+      return
+
+    if fsntfs_file_entry.has_directory_entries_index():
+      _, name, parent_file_reference = names[0]
+      self._directories[mft_entry_index] = (
+          fsntfs_file_entry.file_reference, name, parent_file_reference)
+
+    data_stream_names = []
+    if fsntfs_file_entry.has_default_data_stream():
+      data_stream_names.append('')
+
+    for fsntfs_data_stream in fsntfs_file_entry.alternate_data_streams:
+      data_stream_names.append(fsntfs_data_stream.name)
+
+    self._file_entries.append((mft_entry_index, names, data_stream_names))
+
+  def GetPathSpecs(self):
+    """Retrieves the path specifications of the file entries in MFT order.
+
+    Yields:
+      dfvfs.PathSpec: path specification of a file entry, where a file entry
+          with multiple data streams or names has a path specification for
+          each.
+    """
+    for mft_entry_index, names, data_stream_names in self._file_entries:
+      if mft_entry_index == self._MFT_ENTRY_ROOT_DIRECTORY:
+        continue
+
+      # The path specification of the default data stream is always produced.
+      if '' not in data_stream_names:
+        data_stream_names = data_stream_names + ['']
+
+      for attribute_index, name, parent_file_reference in names:
+        parent_location = self._GetParentLocation(parent_file_reference)
+        if not parent_location:
+          continue
+
+        location, _ = parent_location
+        location = self._PATH_SEPARATOR.join([location, name])
+
+        for data_stream_name in data_stream_names:
+          yield path_spec_factory.Factory.NewPathSpec(
+              dfvfs_definitions.TYPE_INDICATOR_NTFS,
+              data_stream=data_stream_name or None, location=location,
+              mft_attribute=attribute_index, mft_entry=mft_entry_index,
+              parent=self._parent_path_spec)
+
+  def ReadMFT(self, path_spec, resolver_context=None):
+    """Reads the MFT of a NTFS file system.
+
+    Args:
+      path_spec (dfvfs.PathSpec): path specification of the root directory of
+          the NTFS file system.
+      resolver_context (Optional[dfvfs.Context]): resolver context.
+
+    Raises:
+      IOError: if the NTFS file system cannot be opened.
+    """
+    self._directories = {}
+    self._file_entries = []
+    self._locations = {self._MFT_ENTRY_ROOT_DIRECTORY: ('', 0)}
+    self._parent_path_spec = path_spec.parent
+
+    try:
+      file_object = path_spec_resolver.Resolver.OpenFileObject(
+          path_spec.parent, resolver_context=resolver_context)
+    except (
+        dfvfs_errors.AccessError, dfvfs_errors.BackEndError,
+        dfvfs_errors.PathSpecError) as exception:
+      raise IOError('Unable to open volume with error: {0!s}'.format(
+          exception))
+
+    try:
+      fsntfs_volume = pyfsntfs.volume()
+      fsntfs_volume.open_file_object(file_object)
+
+      try:
+        for mft_entry_index in range(fsntfs_volume.number_of_file_entries):
+          try:
+            fsntfs_file_entry = fsntfs_volume.get_file_entry(mft_entry_index)
+            self._ReadMFTEntry(mft_entry_index, fsntfs_file_entry)
+
+          except IOError as exception:
+            logger.warning(
+                'Unable to read MFT entry: {0:d} with error: {1!s}'.format(
+                    mft_entry_index, exception))
+
+      finally:
+        fsntfs_volume.close()
+
+    finally:
+      file_object.close()
@@ -0,0 +1,669 @@
+# -*- coding: utf-8 -*-
+"""The path specification cache.
+
+The path specification cache stores the file entries enumerated from a file
+system within a storage media image, such that subsequent runs over the same
+image do not need to walk the file system again.
+"""
+
+from __future__ import unicode_literals
+
+import collections
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.lib import errors as dfvfs_errors
+from dfvfs.lib import ewf
+from dfvfs.lib import raw
+from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import resolver as path_spec_resolver
+
+from plaso.engine import logger
+
+
+class CachedDateTimeValue(object):
+  """Date and time value read from a path specification cache."""
+
+  def __init__(self, timestamp, fraction_of_second):
+    """Initializes a cached date and time value.
+
+    Args:
+      timestamp (int): POSIX timestamp in seconds.
+      fraction_of_second (int): remainder in 100 nano seconds or None if not
+          available.
+    """
+    super(CachedDateTimeValue, self).__init__()
+    self._fraction_of_second = fraction_of_second
+    self._timestamp = timestamp
+
+  def CopyToDateTimeString(self):
+    """Copies the date time value to a date and time string.
+
+    Note that the string is not formatted as an ISO 8601 date and time value,
+    it is only suitable to compare against the strings of other cached date
+    and time values, such as in duplicate file detection.
+
+    Returns:
+      str: date and time value formatted as: "seconds.remainder".
+    """
+    return '{0!s}.{1!s}'.format(self._timestamp, self._fraction_of_second)
+
+  def CopyToStatTimeTuple(self):
+    """Copies the date time value to a stat timestamp tuple.
+
+    Returns:
+      tuple[int, int]: a POSIX timestamp in seconds and the remainder in
+          100 nano seconds or (None, None) on error.
+    """
+    return self._timestamp, self._fraction_of_second
+
+
+class CachedDataStream(object):
+  """Data stream read from a path specification cache.
+
+  Attributes:
+    name (str): name of the data stream, where an empty string represents
+        the default data stream.
+  """
+
+  def __init__(self, name):
+    """Initializes a cached data stream.
+
+    Args:
+      name (str): name of the data stream.
+    """
+    super(CachedDataStream, self).__init__()
+    self.name = name
+
+
+class CachedFileEntry(object):
+  """File entry read from a path specification cache.
+
+  The cached file entry provides the subset of the dfVFS file entry interface
+  used by the path specification extractor and the dfVFS file system searcher.
+
+  Attributes:
+    access_time (CachedDateTimeValue): access time or None if not available.
+    change_time (CachedDateTimeValue): change time or None if not available.
+    creation_time (CachedDateTimeValue): creation time or None if not
+        available.
+    entry_type (str): file entry type, such as device, directory, file, link,
+        socket or pipe.
+    modification_time (CachedDateTimeValue): modification time or None if not
+        available.
+    name (str): name of the file entry.
+    size (int): size of the file entry data or None if not available.
+    type_indicator (str): type indicator of the file system.
+  """
+
+  def __init__(self, file_system, row):
+    """Initializes a cached file entry.
+
+    Args:
+      file_system (CachedFileSystem): cached file system.
+      row (sqlite3.Row): row of the file entries table.
+    """
+    super(CachedFileEntry, self).__init__()
+    self._data_stream_names = row['data_stream_names']
+    self._file_system = file_system
+    self._identifier = row['identifier']
+    self._is_allocated = row['is_allocated']
+    self._is_root = row['parent_identifier'] is None
+    self._path_spec = None
+    self._path_spec_properties = row['path_spec_properties']
+    self.access_time = self._GetDateTimeValue(row, 'access_time')
+    self.change_time = self._GetDateTimeValue(row, 'change_time')
+    self.creation_time = self._GetDateTimeValue(row, 'creation_time')
+    self.entry_type = row['entry_type']
+    self.modification_time = self._GetDateTimeValue(row, 'modification_time')
+    self.name = row['name']
+    self.size = row['size']
+    self.type_indicator = file_system.type_indicator
+
+  def _GetDateTimeValue(self, row, column_name):
+    """Retrieves a cached date and time value.
+
+    Args:
+      row (sqlite3.Row): row of the file entries table.
+      column_name (str): name of the column that contains the timestamp.
+
+    Returns:
+      CachedDateTimeValue: date and time value or None if not available.
+    """
+    timestamp = row[column_name]
+    if timestamp is None:
+      return None
+
+    fraction_of_second = row['{0:s}_fraction'.format(column_name)]
+    return CachedDateTimeValue(timestamp, fraction_of_second)
+
+  @property
+  def data_streams(self):
+    """list[CachedDataStream]: data streams."""
+    return [
+        CachedDataStream(name)
+        for name in json.loads(self._data_stream_names)]
+
+  @property
+  def path_spec(self):
+    """dfvfs.PathSpec: path specification."""
+    # Most file entries are skipped by find specifications, hence the path
+    # specification is only created on demand.
+    if self._path_spec is None:
+      path_spec_properties = json.loads(self._path_spec_properties)
+      self._path_spec = path_spec_factory.Factory.NewPathSpec(
+          self.type_indicator, parent=self._file_system.parent_path_spec,
+          **path_spec_properties)
+
+    return self._path_spec
+
+  @property
+  def sub_file_entries(self):
+    """generator[CachedFileEntry]: sub file entries."""
+    return self._file_system.GetSubFileEntries(self._identifier)
+
+  def IsAllocated(self):
+    """Determines if the file entry is allocated.
+
+    Returns:
+      bool: True if the file entry is allocated.
+    """
+    return self._is_allocated
+
+  def IsDevice(self):
+    """Determines if the file entry is a device.
+
+    Returns:
+      bool: True if the file entry is a device.
+    """
+    return self.entry_type == dfvfs_definitions.FILE_ENTRY_TYPE_DEVICE
+
+  def IsDirectory(self):
+    """Determines if the file entry is a directory.
+
+    Returns:
+      bool: True if the file entry is a directory.
+    """
+    return self.entry_type == dfvfs_definitions.FILE_ENTRY_TYPE_DIRECTORY
+
+  def IsFile(self):
+    """Determines if the file entry is a file.
+
+    Returns:
+      bool: True if the file entry is a file.
+    """
+    return self.entry_type == dfvfs_definitions.FILE_ENTRY_TYPE_FILE
+
+  def IsLink(self):
+    """Determines if the file entry is a link.
+
+    Returns:
+      bool: True if the file entry is a link.
+    """
+    return self.entry_type == dfvfs_definitions.FILE_ENTRY_TYPE_LINK
+
+  def IsPipe(self):
+    """Determines if the file entry is a pipe.
+
+    Returns:
+      bool: True if the file entry is a pipe.
+    """
+    return self.entry_type == dfvfs_definitions.FILE_ENTRY_TYPE_PIPE
+
+  def IsRoot(self):
+    """Determines if the file entry is the root file entry.
+
+    Returns:
+      bool: True if the file entry is the root file entry.
+    """
+    return self._is_root
+
+  def IsSocket(self):
+    """Determines if the file entry is a socket.
+
+    Returns:
+      bool: True if the file entry is a socket.
+    """
+    return self.entry_type == dfvfs_definitions.FILE_ENTRY_TYPE_SOCKET
+
+
+class CachedFileSystem(object):
+  """File system read from a path specification cache.
+
+  The cached file system provides the subset of the dfVFS file system
+  interface used by the path specification extractor and the dfVFS file
+  system searcher.
+
+  Attributes:
+    parent_path_spec (dfvfs.PathSpec): path specification of the parent of
+        the file system, such as a partition within a storage media image.
+    type_indicator (str): type indicator of the file system.
+  """
+
+  def __init__(self, path, root_path_spec, type_indicator):
+    """Initializes a cached file system.
+
+    Args:
+      path (str): path of the cache file.
+      root_path_spec (dfvfs.PathSpec): path specification of the root of
+          the file system.
+      type_indicator (str): type indicator of the file system.
+    """
+    super(CachedFileSystem, self).__init__()
+    self._connection = sqlite3.connect(path)
+    self._connection.row_factory = sqlite3.Row
+    self._root_path_spec = root_path_spec
+    self.parent_path_spec = root_path_spec.parent
+    self.type_indicator = type_indicator
+
+  def Close(self):
+    """Closes the file system."""
+    if self._connection:
+      self._connection.close()
+      self._connection = None
+
+  def GetFileEntryByPathSpec(self, path_spec):
+    """Retrieves a file entry for a path specification.
+
+    Args:
+      path_spec (dfvfs.PathSpec): path specification.
+
+    Returns:
+      CachedFileEntry: file entry or None if not available, where only
+          the root of the file system is available.
+    """
+    if path_spec.comparable != self._root_path_spec.comparable:
+      return None
+
+    return self.GetRootFileEntry()
+
+  def GetRootFileEntry(self):
+    """Retrieves the root file entry.
+
+    Returns:
+      CachedFileEntry: file entry or None if not available.
+    """
+    cursor = self._connection.execute(
+        'SELECT * FROM file_entries WHERE parent_identifier IS NULL')
+    row = cursor.fetchone()
+    if not row:
+      return None
+
+    return CachedFileEntry(self, row)
+
+  def GetSubFileEntries(self, identifier):
+    """Retrieves the sub file entries of a file entry.
+
+    Args:
+      identifier (int): identifier of the parent file entry.
+
+    Yields:
+      CachedFileEntry: sub file entry.
+    """
+    cursor = self._connection.execute((
+        'SELECT * FROM file_entries WHERE parent_identifier = ? '
+        'ORDER BY identifier'), (identifier,))
+    for row in cursor:
+      yield CachedFileEntry(self, row)
+
+
+class PathSpecCache(object):
+  """Path specification cache.
+
+  The cache contains a database file per file system, which stores the path
+  specification, type, size and date and time values of every file entry in
+  the file system. A cache file is identified by the size, modification time
+  and a hash of the first and last MiB of every segment file of the storage
+  media image, and the path specification of the file system, such as
+  a specific partition or volume shadow snapshot within the image. Hashing
+  the entire image would take longer than walking the file system.
+  """
+
+  _FORMAT_VERSION = 1
+
+  _HASHED_DATA_SIZE = 1024 * 1024
+
+  _TABLE_DEFINITIONS = [
+      'CREATE TABLE metadata (key TEXT, value TEXT)',
+      ('CREATE TABLE file_entries (identifier INTEGER PRIMARY KEY, '
+       'parent_identifier INTEGER, name TEXT, entry_type TEXT, '
+       'is_allocated INTEGER, size INTEGER, data_stream_names TEXT, '
+       'access_time INTEGER, access_time_fraction INTEGER, '
+       'change_time INTEGER, change_time_fraction INTEGER, '
+       'creation_time INTEGER, creation_time_fraction INTEGER, '
+       'modification_time INTEGER, modification_time_fraction INTEGER, '
+       'path_spec_properties TEXT)'),
+      ('CREATE INDEX file_entries_parent_identifier ON file_entries '
+       '(parent_identifier)')]
+
+  _INSERT_FILE_ENTRY_QUERY = (
+      'INSERT INTO file_entries VALUES ({0:s})'.format(', '.join(['?'] * 16)))
+
+  # The names of the VFSStat attributes that contain the access, change,
+  # creation and modification time, in the order of the table columns.
+  _STAT_TIME_ATTRIBUTE_NAMES = ('atime', 'ctime', 'crtime', 'mtime')
+
+  def __init__(self, path, maximum_depth=255):
+    """Initializes a path specification cache.
+
+    Args:
+      path (str): path of the directory that contains the cache files.
+      maximum_depth (Optional[int]): maximum depth of directories to list,
+          where 0 represents the file system root.
+    """
+    super(PathSpecCache, self).__init__()
+    self._maximum_depth = maximum_depth
+    self._path = path
+
+  def _GetCacheKey(self, path_spec):
+    """Retrieves the key that identifies the cache file of a file system.
+
+    Args:
+      path_spec (dfvfs.PathSpec): path specification of the root of the file
+          system.
+
+    Returns:
+      str: cache key or None if the file system is not stored in a storage
+          media image, such as a directory on the operating system.
+    """
+    if not path_spec.HasParent():
+      return None
+
+    image_path_spec = path_spec
+    while image_path_spec.parent.HasParent():
+      image_path_spec = image_path_spec.parent
+
+    source_path_spec = image_path_spec.parent
+    if source_path_spec.type_indicator != dfvfs_definitions.TYPE_INDICATOR_OS:
+      return None
+
+    location = getattr(source_path_spec, 'location', None)
+    if not location or not os.path.isfile(location):
+      return None
+
+    key_values = [self._FORMAT_VERSION]
+    for segment_location in self._GetSegmentFileLocations(image_path_spec):
+      key_values.extend(self._GetSegmentFileKeyValues(segment_location))
+
+    key_values.append(path_spec.comparable)
+    key_string = json.dumps(key_values, sort_keys=True)
+
+    return hashlib.sha256(key_string.encode('utf-8')).hexdigest()
+
+  def _GetFileEntryValues(self, identifier, parent_identifier, file_entry):
+    """Retrieves the values of a file entry to store in the cache.
+
+    Args:
+      identifier (int): identifier of the file entry.
+      parent_identifier (int): identifier of the parent file entry or None if
+          the file entry is the root of the file system.
+      file_entry (dfvfs.FileEntry): file entry.
+
+    Returns:
+      tuple: values of a row of the file entries table.
+
+    Raises:
+      BackEndError: if the file entry cannot be read.
+    """
+    stat_object = file_entry.GetStat()
+    is_allocated = file_entry.IsAllocated()
+
+    data_stream_names = [
+        data_stream.name for data_stream in file_entry.data_streams]
+
+    # The timestamps are read from the stat object, which already contains
+    # them and is considerably cheaper than converting the date and time
+    # values of the file entry again.
+    stat_time_values = []
+    for attribute_name in self._STAT_TIME_ATTRIBUTE_NAMES:
+      stat_time_values.append(getattr(stat_object, attribute_name, None))
+      stat_time_values.append(getattr(
+          stat_object, '{0:s}_nano'.format(attribute_name), None))
+
+    if is_allocated is not None:
+      is_allocated = bool(is_allocated)
+
+    # The file entries of a file system share the parent path specification
+    # of the file system, hence only the properties specific to the file
+    # entry, such as its location and inode, are stored.
+    path_spec_properties = {}
+    for property_name in path_spec_factory.Factory.PROPERTY_NAMES:
+      property_value = getattr(file_entry.path_spec, property_name, None)
+      if property_value is not None:
+        path_spec_properties[property_name] = property_value
+
+    values = [
+        identifier, parent_identifier, file_entry.name,
+        getattr(stat_object, 'type', None), is_allocated,
+        getattr(stat_object, 'size', None), json.dumps(data_stream_names)]
+    values.extend(stat_time_values)
+    values.append(json.dumps(path_spec_properties))
+
+    return tuple(values)
+
+  def _GetSegmentFileKeyValues(self, location):
+    """Retrieves the values of a segment file that are part of the cache key.
+
+    Args:
+      location (str): location of the segment file.
+
+    Returns:
+      list[object]: size, modification time and hash of the first and last
+          MiB of the segment file.
+    """
+    stat_object = os.stat(location)
+
+    hash_context = hashlib.sha256()
+    with open(location, 'rb') as file_object:
+      hash_context.update(file_object.read(self._HASHED_DATA_SIZE))
+      if stat_object.st_size > self._HASHED_DATA_SIZE:
+        file_object.seek(-self._HASHED_DATA_SIZE, os.SEEK_END)
+        hash_context.update(file_object.read(self._HASHED_DATA_SIZE))
+
+    return [
+        stat_object.st_size,
+        '{0:d}'.format(int(stat_object.st_mtime * 1000000)),
+        hash_context.hexdigest()]
+
+  def _GetSegmentFileLocations(self, image_path_spec):
+    """Retrieves the locations of the segment files of a storage media image.
+
+    Args:
+      image_path_spec (dfvfs.PathSpec): path specification of the storage
+          media image, which has an operating system path specification as
+          parent.
+
+    Returns:
+      list[str]: locations of the segment files, such as E01 and E02 or
+          001 and 002, or the location of the storage media image if it is
+          not split into segment files.
+    """
+    source_path_spec = image_path_spec.parent
+
+    glob_function = None
+    if image_path_spec.type_indicator == dfvfs_definitions.TYPE_INDICATOR_EWF:
+      glob_function = ewf.EWFGlobPathSpec
+    elif image_path_spec.type_indicator == (
+        dfvfs_definitions.TYPE_INDICATOR_RAW):
+      glob_function = raw.RawGlobPathSpec
+
+    segment_path_specs = None
+    if glob_function:
+      file_system = path_spec_resolver.Resolver.OpenFileSystem(
+          source_path_spec)
+      try:
+        segment_path_specs = glob_function(file_system, image_path_spec)
+      except (RuntimeError, dfvfs_errors.PathSpecError) as exception:
+        logger.warning((
+            'Unable to determine segment files of: {0:s} with error: '
+            '{1!s}').format(source_path_spec.location, exception))
+      finally:
+        file_system.Close()
+
+    if not segment_path_specs:
+      return [source_path_spec.location]
+
+    return [
+        segment_path_spec.location for segment_path_spec in segment_path_specs]
+
+  def _WriteCacheFile(self, path, file_system, path_spec):
+    """Writes a cache file.
+
+    All file entries are stored, including unallocated file entries and
+    links, such that find specifications can be applied to the cache.
+
+    Args:
+      path (str): path of the cache file.
+      file_system (dfvfs.FileSystem): file system.
+      path_spec (dfvfs.PathSpec): path specification of the root of the file
+          system.
+
+    Returns:
+      int: number of file entries stored in the cache file.
+
+    Raises:
+      BackEndError: if the root of the file system cannot be read.
+      IOError: if not all file entries of the file system can be read, since
+          an incomplete cache file would cause file entries to be skipped.
+    """
+    root_file_entry = file_system.GetFileEntryByPathSpec(path_spec)
+    if not root_file_entry:
+      return 0
+
+    connection = sqlite3.connect(path)
+    try:
+      for table_definition in self._TABLE_DEFINITIONS:
+        connection.execute(table_definition)
+
+      connection.execute(
+          'INSERT INTO metadata VALUES (?, ?)',
+          ('format_version', '{0:d}'.format(self._FORMAT_VERSION)))
+
+      connection.execute(
+          self._INSERT_FILE_ENTRY_QUERY,
+          self._GetFileEntryValues(0, None, root_file_entry))
+
+      number_of_file_entries = 1
+
+      # The file entries are stored breadth-first, such that the identifiers
+      # of the sub file entries of a directory are consecutive and in the
+      # order the file system returned them.
+      directories = collections.deque([(root_file_entry, 0, 0)])
+      while directories:
+        file_entry, identifier, depth = directories.popleft()
+        if depth >= self._maximum_depth:
+          continue
+
+        rows = []
+        try:
+          for sub_file_entry in file_entry.sub_file_entries:
+            try:
+              row = self._GetFileEntryValues(
+                  number_of_file_entries, identifier, sub_file_entry)
+            except dfvfs_errors.BackEndError as exception:
+              raise IOError(
+                  'Unable to cache file: {0:s} with error: {1!s}'.format(
+                      sub_file_entry.path_spec.comparable.replace(
+                          '\n', ';'), exception))
+
+            rows.append(row)
+            if sub_file_entry.IsDirectory():
+              directories.append((
+                  sub_file_entry, number_of_file_entries, depth + 1))
+
+            number_of_file_entries += 1
+
+        except (
+            dfvfs_errors.AccessError, dfvfs_errors.BackEndError,
+            dfvfs_errors.PathSpecError, RuntimeError) as exception:
+          raise IOError((
+              'Unable to cache sub file entries of: {0:s} with error: '
+              '{1!s}').format(
+                  file_entry.path_spec.comparable.replace('\n', ';'),
+                  exception))
+
+        connection.executemany(self._INSERT_FILE_ENTRY_QUERY, rows)
+
+      connection.commit()
+
+    finally:
+      connection.close()
+
+    return number_of_file_entries
+
+  def OpenFileSystem(self, path_spec, resolver_context=None):
+    """Opens a file system from the cache.
+
+    If the file system is not cached yet, its file entries are enumerated and
+    stored in the cache first.
+
+    Args:
+      path_spec (dfvfs.PathSpec): path specification of the root of the file
+          system.
+      resolver_context (Optional[dfvfs.Context]): resolver context.
+
+    Returns:
+      CachedFileSystem: file system or None if the file system cannot be
+          cached, such as a directory on the operating system.
+
+    Raises:
+      AccessError: if the file system cannot be accessed.
+      BackEndError: if the file system cannot be opened.
+      IOError: if the cache file cannot be read or written.
+      PathSpecError: if the path specification is incorrect.
+    """
+    cache_key = self._GetCacheKey(path_spec)
+    if not cache_key:
+      return None
+
+    path = os.path.join(self._path, '{0:s}.db'.format(cache_key))
+
+    if not os.path.exists(path):
+      # The cache file is written to a temporary file first, such that an
+      # interrupted run does not leave an incomplete cache file behind.
+      file_descriptor, temporary_path = tempfile.mkstemp(
+          prefix='.path_spec_cache-', suffix='.tmp', dir=self._path)
+      os.close(file_descriptor)
+
+      file_system = None
+      try:
+        file_system = path_spec_resolver.Resolver.OpenFileSystem(
+            path_spec, resolver_context=resolver_context)
+
+        number_of_file_entries = self._WriteCacheFile(
+            temporary_path, file_system, path_spec)
+
+        os.rename(temporary_path, path)
+
+      except sqlite3.Error as exception:
+        raise IOError(
+            'Unable to write cache file: {0:s} with error: {1!s}'.format(
+                path, exception))
+
+      finally:
+        if file_system:
+          file_system.Close()
+
+        if os.path.exists(temporary_path):
+          os.remove(temporary_path)
+
+      logger.debug('Cached {0:d} file entries in: {1:s}'.format(
+          number_of_file_entries, path))
+
+    else:
+      logger.debug('Reading file entries from cache: {0:s}'.format(path))
+
+    file_system = CachedFileSystem(path, path_spec, path_spec.type_indicator)
+
+    try:
+      file_system.GetRootFileEntry()
+    except sqlite3.Error as exception:
+      file_system.Close()
+      raise IOError('Unable to read cache file: {0:s} with error: {1!s}'.format(
+          path, exception))
+
+    return file_system
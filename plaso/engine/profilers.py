@@ -230,3 +230,15 @@ class TasksProfiler(SampleFileProfiler):
     sample = '{0:f}\t{1:s}\t{2:s}\n'.format(
         sample_time, task.identifier, status)
     self._WritesString(sample)
+
+  def SampleWorkerProcess(self, process_name, status):
+    """Takes a sample of the status of a worker process for profiling.
+
+    Args:
+      process_name (str): name of the worker process.
+      status (str): status, such as a scaling decision.
+    """
+    sample_time = time.time()
+    sample = '{0:f}\t{1:s}\t{2:s}\n'.format(
+        sample_time, process_name, status)
+    self._WritesString(sample)
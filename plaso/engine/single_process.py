@@ -13,9 +13,11 @@ from plaso.containers import event_sources
 from plaso.engine import engine
 from plaso.engine import extractors
 from plaso.engine import logger
+from plaso.engine import path_spec_cache
 from plaso.engine import process_info
 from plaso.engine import worker
 from plaso.lib import definitions
+from plaso.parsers import dtfabric_cache
 from plaso.parsers import mediator as parsers_mediator
 
 
@@ -243,6 +245,9 @@ class SingleProcessEngine(engine.BaseEngine):
     parser_mediator.SetInputSourceConfiguration(
         processing_configuration.input_source)
 
+    dtfabric_cache.DtFabricCache.SetCacheDirectory(
+        processing_configuration.dtfabric_cache_directory)
+
     extraction_worker = worker.EventExtractionWorker(
         parser_filter_expression=(
             processing_configuration.parser_filter_expression))
@@ -253,6 +258,12 @@ class SingleProcessEngine(engine.BaseEngine):
     self._processing_configuration = processing_configuration
     self._status_update_callback = status_update_callback
 
+    if processing_configuration.path_spec_cache_directory:
+      cache = path_spec_cache.PathSpecCache(
+          processing_configuration.path_spec_cache_directory)
+      self._path_spec_extractor = extractors.PathSpecExtractor(
+          path_spec_cache=cache)
+
     logger.debug('Processing started.')
 
     parser_mediator.StartProfiling(
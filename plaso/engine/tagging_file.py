@@ -67,17 +67,106 @@ class TaggingFile(object):
     filter_objects_per_label = {}
 
     for label_name, rules in rules_per_label.items():
-      filter_object = event_filter.EventObjectFilter()
+      filter_objects = []
+      for rule in rules:
+        filter_object = event_filter.EventObjectFilter()
 
-      try:
-        filter_rule = ' OR '.join(['({0:s})'.format(rule) for rule in rules])
-        filter_object.CompileFilter(filter_rule)
-      except errors.ParseError as exception:
-        raise errors.TaggingFileError((
-            'Unable to compile filter for label: {0:s} with error: '
-            '{1!s}').format(label_name, exception))
+        try:
+          filter_object.CompileFilter(rule)
+        except errors.ParseError as exception:
+          raise errors.TaggingFileError((
+              'Unable to compile filter for label: {0:s} with error: '
+              '{1!s}').format(label_name, exception))
 
-      # TODO: change other code remove list around filter_object
-      filter_objects_per_label[label_name] = [filter_object]
+        filter_objects.append(filter_object)
+
+      filter_objects_per_label[label_name] = filter_objects
 
     return filter_objects_per_label
+
+
+class TaggingRulesIndex(object):
+  """Index of event tagging rules by event data type.
+
+  Rules that require an event data type, such as "data_type is 'fs:stat'",
+  are only evaluated against events of that data type. Rules that cannot
+  be indexed are evaluated against every event.
+  """
+
+  _INDEX_ATTRIBUTE_NAME = 'data_type'
+
+  def __init__(self, tagging_rules):
+    """Initializes a tagging rules index.
+
+    Args:
+      tagging_rules (dict[str, list[FilterObject]]): tagging rules, that
+          consists of one or more filter objects per label.
+    """
+    super(TaggingRulesIndex, self).__init__()
+    self._indexed_rules = {}
+    self._label_names = list(tagging_rules.keys())
+    self._rules_per_data_type = {}
+    self._unindexed_rules = {}
+
+    for label_name, filter_objects in tagging_rules.items():
+      for filter_object in filter_objects:
+        data_types = filter_object.GetRequiredValues(
+            self._INDEX_ATTRIBUTE_NAME)
+        if data_types is None:
+          rules = self._unindexed_rules.setdefault(label_name, [])
+          rules.append(filter_object)
+          continue
+
+        for data_type in data_types:
+          rules_per_label = self._indexed_rules.setdefault(data_type, {})
+          rules = rules_per_label.setdefault(label_name, [])
+          rules.append(filter_object)
+
+  def _GetRulesForDataType(self, data_type):
+    """Retrieves the rules that can match an event of a specific data type.
+
+    Args:
+      data_type (str): event data type.
+
+    Returns:
+      list[tuple[str, list[FilterObject]]]: label names and corresponding
+          filter objects, in the order the labels were defined.
+    """
+    rules = self._rules_per_data_type.get(data_type, None)
+    if rules is None:
+      rules_per_label = self._indexed_rules.get(data_type, {})
+
+      rules = []
+      for label_name in self._label_names:
+        filter_objects = rules_per_label.get(label_name, [])
+        filter_objects = filter_objects + self._unindexed_rules.get(
+            label_name, [])
+        if filter_objects:
+          rules.append((label_name, filter_objects))
+
+      self._rules_per_data_type[data_type] = rules
+
+    return rules
+
+  def GetMatchingLabels(self, event, event_data):
+    """Retrieves the labels of the rules that match an event.
+
+    Args:
+      event (EventObject): event.
+      event_data (EventData): event data.
+
+    Returns:
+      list[str]: names of the labels of which a rule matched the event.
+    """
+    data_type = getattr(event_data, self._INDEX_ATTRIBUTE_NAME, None)
+
+    matched_label_names = []
+    for label_name, filter_objects in self._GetRulesForDataType(data_type):
+      for filter_object in filter_objects:
+        # Note that tagging events based on existing labels is currently
+        # not supported.
+        if filter_object.Match(event, event_data, None):
+          matched_label_names.append(label_name)
+          break
+
+    return matched_label_names
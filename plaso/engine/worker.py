@@ -8,6 +8,8 @@ import os
 import re
 import time
 
+import pytsk3
+
 from dfvfs.analyzer import analyzer
 from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.lib import errors as dfvfs_errors
@@ -94,6 +96,17 @@ class EventExtractionWorker(object):
   _TYPES_WITH_ROOT_METADATA = frozenset([
       dfvfs_definitions.TYPE_INDICATOR_GZIP])
 
+  _NTFS_EXTENT_FLAG_IS_SPARSE = 0x00000001
+
+  _TSK_DATA_ATTRIBUTE_TYPES = frozenset([
+      pytsk3.TSK_FS_ATTR_TYPE_DEFAULT,
+      pytsk3.TSK_FS_ATTR_TYPE_HFS_DATA,
+      pytsk3.TSK_FS_ATTR_TYPE_HFS_DEFAULT,
+      pytsk3.TSK_FS_ATTR_TYPE_NTFS_DATA])
+
+  _TSK_RUN_FLAGS_WITHOUT_DATA = (
+      pytsk3.TSK_FS_ATTR_RUN_FLAG_FILLER | pytsk3.TSK_FS_ATTR_RUN_FLAG_SPARSE)
+
   def __init__(self, parser_filter_expression=None):
     """Initializes an event extraction worker.
 
@@ -114,6 +127,7 @@ class EventExtractionWorker(object):
     self._event_extractor = extractors.EventExtractor(
         parser_filter_expression=parser_filter_expression)
     self._hasher_file_size_limit = None
+    self._order_by_data_offset = False
     self._path_spec_extractor = extractors.PathSpecExtractor()
     self._process_archives = None
     self._process_compressed_streams = None
@@ -415,6 +429,50 @@ class EventExtractionWorker(object):
 
     return type_indicators
 
+  def _GetDataOffset(self, file_entry):
+    """Retrieves the offset of the data of a file entry.
+
+    Args:
+      file_entry (dfvfs.FileEntry): file entry.
+
+    Returns:
+      int: offset of the first data run of the default data stream, relative
+          to the start of the volume that contains the file system, or None
+          if not available, for example if the file system back-end does not
+          expose data runs or the data is stored in the metadata of the file
+          entry.
+    """
+    try:
+      if file_entry.type_indicator == dfvfs_definitions.TYPE_INDICATOR_NTFS:
+        fsntfs_file_entry = file_entry.GetNTFSFileEntry()
+        for extent_index in range(fsntfs_file_entry.number_of_extents):
+          extent_offset, _, extent_flags = fsntfs_file_entry.get_extent(
+              extent_index)
+          if not extent_flags & self._NTFS_EXTENT_FLAG_IS_SPARSE:
+            return extent_offset
+
+      elif file_entry.type_indicator == dfvfs_definitions.TYPE_INDICATOR_TSK:
+        tsk_file = file_entry.GetTSKFile()
+        block_size = tsk_file.info.fs_info.block_size
+
+        for tsk_attribute in tsk_file:
+          attribute_type = getattr(tsk_attribute.info, 'type', None)
+          attribute_name = getattr(tsk_attribute.info, 'name', None)
+          if (attribute_type not in self._TSK_DATA_ATTRIBUTE_TYPES or
+              attribute_name):
+            continue
+
+          for tsk_attribute_run in tsk_attribute:
+            if not tsk_attribute_run.flags & self._TSK_RUN_FLAGS_WITHOUT_DATA:
+              return tsk_attribute_run.addr * block_size
+
+          break
+
+    except (IOError, dfvfs_errors.BackEndError):
+      pass
+
+    return None
+
   def _GetCompressedStreamTypes(self, mediator, path_spec):
     """Determines if a data stream contains a compressed stream such as: gzip.
 
@@ -618,6 +676,10 @@ class EventExtractionWorker(object):
       stat_object = sub_file_entry.GetStat()
       if stat_object:
         event_source.file_entry_type = stat_object.type
+        event_source.file_size = getattr(stat_object, 'size', None)
+
+      if self._order_by_data_offset and sub_file_entry.IsFile():
+        event_source.data_offset = self._GetDataOffset(sub_file_entry)
 
       mediator.ProduceEventSource(event_source)
 
@@ -862,6 +924,7 @@ class EventExtractionWorker(object):
     """
     self._hasher_file_size_limit = configuration.hasher_file_size_limit
     self._SetHashers(configuration.hasher_names_string)
+    self._order_by_data_offset = configuration.order_by_data_offset
     self._process_archives = configuration.process_archives
     self._process_compressed_streams = configuration.process_compressed_streams
     self._SetYaraRules(configuration.yara_rules_string)
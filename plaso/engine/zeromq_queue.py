@@ -136,8 +136,11 @@ class ZeroMQQueue(plaso_queue.Queue):
       QueueEmpty: if no item could be received within the timeout.
       zmq.error.ZMQError: if an error occurs in ZeroMQ
     """
-    events = zmq_socket.poll(
-        self._ZMQ_SOCKET_RECEIVE_TIMEOUT_MILLISECONDS)
+    # Note that timeout must be an integer value.
+    timeout = min(
+        self._ZMQ_SOCKET_RECEIVE_TIMEOUT_MILLISECONDS,
+        int(self.timeout_seconds * 1000))
+    events = zmq_socket.poll(timeout)
     if events:
       try:
         received_object = self._zmq_socket.recv_pyobj()
@@ -386,6 +389,14 @@ class ZeroMQPullQueue(ZeroMQQueue):
     raise errors.WrongQueueType()
 
 
+class ZeroMQPullBindQueue(ZeroMQPullQueue):
+  """A Plaso queue backed by a ZeroMQ PULL socket that binds to a port.
+
+  This queue may only be used to pop items, not to push.
+  """
+  SOCKET_CONNECTION_TYPE = ZeroMQQueue.SOCKET_CONNECTION_BIND
+
+
 class ZeroMQPullConnectQueue(ZeroMQPullQueue):
   """A Plaso queue backed by a ZeroMQ PULL socket that connects to a port.
 
@@ -469,6 +480,14 @@ class ZeroMQPushBindQueue(ZeroMQPushQueue):
   SOCKET_CONNECTION_TYPE = ZeroMQQueue.SOCKET_CONNECTION_BIND
 
 
+class ZeroMQPushConnectQueue(ZeroMQPushQueue):
+  """A Plaso queue backed by a ZeroMQ PUSH socket that connects to a port.
+
+  This queue may only be used to push items, not to pop.
+  """
+  SOCKET_CONNECTION_TYPE = ZeroMQQueue.SOCKET_CONNECTION_CONNECT
+
+
 class ZeroMQRequestQueue(ZeroMQQueue):
   """Parent class for Plaso queues backed by ZeroMQ REQ sockets.
 
@@ -33,6 +33,22 @@ class EventObjectFilter(interface.FilterObject):
     self._event_filter = expression.Compile()
     self._filter_expression = filter_expression
 
+  def GetRequiredValues(self, attribute_name):
+    """Retrieves the values an attribute is required to have by the filter.
+
+    Args:
+      attribute_name (str): name of the attribute, such as "data_type".
+
+    Returns:
+      set[object]: values of which the attribute must have one for the filter
+          to match or None if the filter does not restrict the attribute to
+          specific values.
+    """
+    if not self._event_filter:
+      return None
+
+    return self._event_filter.GetRequiredValues(attribute_name)
+
   def Match(self, event, event_data, event_tag):
     """Determines if an event matches the filter.
 
@@ -53,6 +53,19 @@ class Filter(object):
       return codecs.decode(value, 'utf8', 'ignore')
     return value
 
+  def GetRequiredValues(self, attribute_name):
+    """Retrieves the values an attribute is required to have by the filter.
+
+    Args:
+      attribute_name (str): name of the attribute.
+
+    Returns:
+      set[object]: values of which the attribute must have one for the filter
+          to match or None if the filter does not restrict the attribute to
+          specific values.
+    """
+    return None
+
   @abc.abstractmethod
   def Matches(self, event, event_data, event_tag):
     """Determines if the event, data and tag match the filter.
@@ -73,6 +86,28 @@ class AndFilter(Filter):
   Note that if no conditions are passed, all objects will pass.
   """
 
+  def GetRequiredValues(self, attribute_name):
+    """Retrieves the values an attribute is required to have by the filter.
+
+    Args:
+      attribute_name (str): name of the attribute.
+
+    Returns:
+      set[object]: values of which the attribute must have one for the filter
+          to match or None if the filter does not restrict the attribute to
+          specific values.
+    """
+    required_values = None
+    for sub_filter in self.args:
+      values = sub_filter.GetRequiredValues(attribute_name)
+      if values is not None:
+        if required_values is None:
+          required_values = set(values)
+        else:
+          required_values.intersection_update(values)
+
+    return required_values
+
   def Matches(self, event, event_data, event_tag):
     """Determines if the event, data and tag match the filter.
 
@@ -97,6 +132,30 @@ class OrFilter(Filter):
   Note that if no conditions are passed, all objects will pass.
   """
 
+  def GetRequiredValues(self, attribute_name):
+    """Retrieves the values an attribute is required to have by the filter.
+
+    Args:
+      attribute_name (str): name of the attribute.
+
+    Returns:
+      set[object]: values of which the attribute must have one for the filter
+          to match or None if the filter does not restrict the attribute to
+          specific values.
+    """
+    if not self.args:
+      return None
+
+    required_values = set()
+    for sub_filter in self.args:
+      values = sub_filter.GetRequiredValues(attribute_name)
+      if values is None:
+        return None
+
+      required_values.update(values)
+
+    return required_values
+
   def Matches(self, event, event_data, event_tag):
     """Determines if the event, data and tag match the filter.
 
@@ -285,6 +344,26 @@ class GenericBinaryOperator(BinaryOperator):
 class EqualsOperator(GenericBinaryOperator):
   """Equals (==) operator."""
 
+  def GetRequiredValues(self, attribute_name):
+    """Retrieves the values an attribute is required to have by the filter.
+
+    Args:
+      attribute_name (str): name of the attribute.
+
+    Returns:
+      set[object]: values of which the attribute must have one for the filter
+          to match or None if the filter does not restrict the attribute to
+          specific values.
+    """
+    if not self._bool_value or self.left_operand != attribute_name:
+      return None
+
+    # Date and time values are compared by value and cannot be looked up.
+    if attribute_name in self._EVENT_ATTRIBUTE_NAMES:
+      return None
+
+    return set([self.right_operand])
+
   def _CompareValue(self, event_value, filter_value):
     """Compares if two values are equal.
 
@@ -15,11 +15,82 @@ from __future__ import unicode_literals
 
 import abc
 import re
+import string
 
 from plaso.formatters import logger
 from plaso.lib import errors
 
 
+class _FormatStringTemplate(object):
+  """Format string template.
+
+  The format string is parsed once to determine the names of the attributes
+  it uses, so that formatting an event only requires looking up these
+  attribute values instead of copying all the event data attributes. Format
+  strings that contain fields other than attribute names, such as {0} or
+  {name[0]}, do not have attribute names.
+
+  Attributes:
+    attribute_names (list[str]): names of the attributes used by the format
+        string or None if they cannot be determined.
+    format_string (str): format string.
+    number_of_fields (int): number of replacement fields in the format string.
+  """
+
+  _FORMATTER = string.Formatter()
+
+  def __init__(self, format_string):
+    """Initializes a format string template.
+
+    Args:
+      format_string (str): format string.
+    """
+    super(_FormatStringTemplate, self).__init__()
+    self.attribute_names = None
+    self.format_string = format_string
+    self.number_of_fields = 0
+
+    self._Compile()
+
+  def _Compile(self):
+    """Determines the names of the attributes used by the format string."""
+    try:
+      parsed_format_string = list(self._FORMATTER.parse(self.format_string))
+    except ValueError:
+      # The error is raised again by format_map() when the template is used.
+      return
+
+    attribute_names = []
+    for _, field_name, format_spec, _ in parsed_format_string:
+      if field_name is None:
+        continue
+
+      self.number_of_fields += 1
+
+      if not field_name.isidentifier() or '{' in format_spec:
+        return
+
+      if field_name not in attribute_names:
+        attribute_names.append(field_name)
+
+    self.attribute_names = attribute_names
+
+  def Format(self, event_values):
+    """Formats the event values.
+
+    Args:
+      event_values (dict[str, object]): event values.
+
+    Returns:
+      str: formatted string.
+
+    Raises:
+      KeyError: if an attribute used in the format string is missing from
+          the event values.
+    """
+    return self.format_string.format_map(event_values)
+
+
 class EventFormatterHelper(object):
   """Base class of helper for formatting event data."""
 
@@ -109,7 +180,10 @@ class EventFormatter(object):
   def __init__(self):
     """Initializes an event formatter object."""
     super(EventFormatter, self).__init__()
+    self._event_values_attribute_names = None
+    self._event_values_attribute_names_determined = False
     self._format_string_attribute_names = None
+    self._format_string_templates = {}
     self.helpers = []
 
   def _FormatMessage(self, format_string, event_values):
@@ -122,16 +196,49 @@ class EventFormatter(object):
     Returns:
       str: formatted message string.
     """
-    if not isinstance(format_string, str):
-      logger.warning('Format string: {0:s} is non-Unicode.'.format(
-          format_string))
+    template = self._GetFormatStringTemplate(format_string)
+    return self._FormatTemplates([template], event_values)
 
-      # Plaso code files should be in UTF-8 any thus binary strings are
-      # assumed UTF-8. If this is not the case this should be fixed.
-      format_string = format_string.decode('utf-8', errors='ignore')
+  def _FormatMessages(self, format_string, short_format_string, event_values):
+    """Determines the formatted message strings.
+
+    Args:
+      format_string (str): message format string.
+      short_format_string (str): short message format string.
+      event_values (dict[str, object]): event values.
+
+    Returns:
+      tuple(str, str): formatted message string and short message string.
+    """
+    templates = [self._GetFormatStringTemplate(format_string)]
 
+    short_templates = []
+    if short_format_string:
+      short_templates.append(
+          self._GetFormatStringTemplate(short_format_string))
+
+    return self._FormatTemplatesMessages(
+        templates, short_templates, event_values)
+
+  def _FormatTemplates(self, templates, event_values, separator=''):
+    """Determines a formatted message string from format string templates.
+
+    Args:
+      templates (list[_FormatStringTemplate]): format string templates of
+          the message.
+      event_values (dict[str, object]): event values.
+      separator (Optional[str]): separator used to join the formatted
+          templates.
+
+    Returns:
+      str: formatted message string.
+    """
     try:
-      message_string = format_string.format(**event_values)
+      if len(templates) == 1:
+        message_string = templates[0].Format(event_values)
+      else:
+        message_string = separator.join([
+            template.Format(event_values) for template in templates])
 
     except KeyError as exception:
       data_type = event_values.get('data_type', 'N/A')
@@ -139,6 +246,9 @@ class EventFormatter(object):
       event_identifier = event_values.get('uuid', 'N/A')
       parser_chain = event_values.get('parser', 'N/A')
 
+      format_string = separator.join([
+          template.format_string for template in templates])
+
       error_message = (
           'unable to format string: "{0:s}" event object is missing required '
           'attributes: {1!s}').format(format_string, exception)
@@ -176,22 +286,31 @@ class EventFormatter(object):
     # string.strip().
     return message_string.replace('\r', '').replace('\n', '')
 
-  def _FormatMessages(self, format_string, short_format_string, event_values):
-    """Determines the formatted message strings.
+  def _FormatTemplatesMessages(
+      self, templates, short_templates, event_values, separator=''):
+    """Determines the formatted message strings from format string templates.
 
     Args:
-      format_string (str): message format string.
-      short_format_string (str): short message format string.
+      templates (list[_FormatStringTemplate]): format string templates of
+          the message.
+      short_templates (list[_FormatStringTemplate]): format string templates
+          of the short message, where the message is used as short message if
+          the short message format string is empty.
       event_values (dict[str, object]): event values.
+      separator (Optional[str]): separator used to join the formatted
+          templates.
 
     Returns:
       tuple(str, str): formatted message string and short message string.
     """
-    message_string = self._FormatMessage(format_string, event_values)
+    message_string = self._FormatTemplates(
+        templates, event_values, separator=separator)
 
+    short_format_string = separator.join([
+        template.format_string for template in short_templates])
     if short_format_string:
-      short_message_string = self._FormatMessage(
-          short_format_string, event_values)
+      short_message_string = self._FormatTemplates(
+          short_templates, event_values, separator=separator)
     else:
       short_message_string = message_string
 
@@ -201,6 +320,53 @@ class EventFormatter(object):
 
     return message_string, short_message_string
 
+  def _GetEventValues(self, event_data, attribute_names):
+    """Retrieves the event values used by the format strings.
+
+    Args:
+      event_data (EventData): event data.
+      attribute_names (list[str]): names of the attributes used by the format
+          strings or None if all attributes should be retrieved.
+
+    Returns:
+      dict[str, object]: event values, where attributes that are set to None
+          are ignored.
+    """
+    if attribute_names is None:
+      return event_data.CopyToDict()
+
+    event_values = {}
+    for attribute_name in attribute_names:
+      attribute_value = getattr(event_data, attribute_name, None)
+      if attribute_value is not None:
+        event_values[attribute_name] = attribute_value
+
+    return event_values
+
+  def _GetFormatStringTemplate(self, format_string):
+    """Retrieves the template of a format string.
+
+    Args:
+      format_string (str): format string.
+
+    Returns:
+      _FormatStringTemplate: format string template.
+    """
+    if not isinstance(format_string, str):
+      logger.warning('Format string: {0:s} is non-Unicode.'.format(
+          format_string))
+
+      # Plaso code files should be in UTF-8 any thus binary strings are
+      # assumed UTF-8. If this is not the case this should be fixed.
+      format_string = format_string.decode('utf-8', errors='ignore')
+
+    template = self._format_string_templates.get(format_string, None)
+    if not template:
+      template = _FormatStringTemplate(format_string)
+      self._format_string_templates[format_string] = template
+
+    return template
+
   def GetFormatStringAttributeNames(self):
     """Retrieves the attribute names in the format string.
 
@@ -234,7 +400,30 @@ class EventFormatter(object):
       raise errors.WrongFormatter('Unsupported data type: {0:s}.'.format(
           event_data.data_type))
 
-    event_values = event_data.CopyToDict()
+    if not self._event_values_attribute_names_determined:
+      attribute_names = []
+      for format_string in (self.FORMAT_STRING, self.FORMAT_STRING_SHORT):
+        template = self._GetFormatStringTemplate(format_string)
+        if template.attribute_names is None:
+          attribute_names = None
+          break
+
+        attribute_names.extend(template.attribute_names)
+
+      if attribute_names is not None:
+        attribute_names = sorted(set(attribute_names))
+
+      self._event_values_attribute_names = attribute_names
+      self._event_values_attribute_names_determined = True
+
+    event_values = self._GetEventValues(
+        event_data, self._event_values_attribute_names)
+
+    # Missing attributes are reported with all the event values.
+    if (self._event_values_attribute_names is not None and
+        len(event_values) != len(self._event_values_attribute_names)):
+      event_values = event_data.CopyToDict()
+
     return self._FormatMessages(
         self.FORMAT_STRING, self.FORMAT_STRING_SHORT, event_values)
 
@@ -282,58 +471,83 @@ class ConditionalEventFormatter(EventFormatter):
     """Initializes the conditional formatter."""
     super(ConditionalEventFormatter, self).__init__()
     self._format_string_pieces_map = []
+    self._format_string_pieces_templates = []
     self._format_string_short_pieces_map = []
+    self._format_string_short_pieces_templates = []
 
   def _CreateFormatStringMaps(self):
     """Creates the format string maps.
 
     Maps are built of the string pieces and their corresponding attribute
-    name to optimize conditional string formatting.
+    name to optimize conditional string formatting. The string pieces are
+    compiled into format string templates.
 
     Raises:
       RuntimeError: when an invalid format string piece is encountered.
     """
-    # The format string can be defined as:
-    # {name}, {name:format}, {name!conversion}, {name!conversion:format}
-    regexp = re.compile('{[a-z][a-zA-Z0-9_]*[!]?[^:}]*[:]?[^}]*}')
-    regexp_name = re.compile('[a-z][a-zA-Z0-9_]*')
-
     # The format string pieces map is a list containing the attribute name
     # per format string piece. E.g. ["Description: {description}"] would be
     # mapped to: [0] = "description". If the string piece does not contain
     # an attribute name it is treated as text that does not needs formatting.
+    uses_all_event_values = False
+
     self._format_string_pieces_map = []
+    self._format_string_pieces_templates = []
     for format_string_piece in self.FORMAT_STRING_PIECES:
-      result = regexp.findall(format_string_piece)
-      if not result:
-        # The text format string piece is stored as an empty map entry to
-        # keep the index in the map equal to the format string pieces.
-        self._format_string_pieces_map.append('')
-      elif len(result) == 1:
-        # Extract the attribute name.
-        attribute_name = regexp_name.findall(result[0])[0]
-        self._format_string_pieces_map.append(attribute_name)
-      else:
+      template = self._GetFormatStringTemplate(format_string_piece)
+      attribute_names = template.attribute_names
+      if attribute_names is None:
+        attribute_names = self._FORMAT_STRING_ATTRIBUTE_NAME_RE.findall(
+            format_string_piece)
+        uses_all_event_values = True
+
+      if len(attribute_names) > 1 or template.number_of_fields > 1:
         raise RuntimeError((
             'Invalid format string piece: [{0:s}] contains more than 1 '
             'attribute name.').format(format_string_piece))
 
+      # The text format string piece is stored as an empty map entry to
+      # keep the index in the map equal to the format string pieces.
+      attribute_name = ''
+      if attribute_names:
+        attribute_name = attribute_names[0]
+
+      self._format_string_pieces_map.append(attribute_name)
+      self._format_string_pieces_templates.append(template)
+
     self._format_string_short_pieces_map = []
+    self._format_string_short_pieces_templates = []
     for format_string_piece in self.FORMAT_STRING_SHORT_PIECES:
-      result = regexp.findall(format_string_piece)
-      if not result:
-        # The text format string piece is stored as an empty map entry to
-        # keep the index in the map equal to the format string pieces.
-        self._format_string_short_pieces_map.append('')
-      elif len(result) == 1:
-        # Extract the attribute name.
-        attribute_name = regexp_name.findall(result[0])[0]
-        self._format_string_short_pieces_map.append(attribute_name)
-      else:
+      template = self._GetFormatStringTemplate(format_string_piece)
+      attribute_names = template.attribute_names
+      if attribute_names is None:
+        attribute_names = self._FORMAT_STRING_ATTRIBUTE_NAME_RE.findall(
+            format_string_piece)
+        uses_all_event_values = True
+
+      if len(attribute_names) > 1 or template.number_of_fields > 1:
         raise RuntimeError((
             'Invalid short format string piece: [{0:s}] contains more '
             'than 1 attribute name.').format(format_string_piece))
 
+      attribute_name = ''
+      if attribute_names:
+        attribute_name = attribute_names[0]
+
+      self._format_string_short_pieces_map.append(attribute_name)
+      self._format_string_short_pieces_templates.append(template)
+
+    if uses_all_event_values:
+      self._event_values_attribute_names = None
+    else:
+      attribute_names = set(self._format_string_pieces_map)
+      attribute_names.update(self._format_string_short_pieces_map)
+      attribute_names.discard('')
+
+      self._event_values_attribute_names = sorted(attribute_names)
+
+    self._event_values_attribute_names_determined = True
+
   def _ConditionalFormatMessages(self, event_values):
     """Determines the conditional formatted message strings.
 
@@ -349,34 +563,30 @@ class ConditionalEventFormatter(EventFormatter):
     if not self._format_string_pieces_map:
       self._CreateFormatStringMaps()
 
-    # Using getattr here to make sure the attribute is not set to None.
-    # if A.b = None, hasattr(A, b) is True but getattr(A, b, None) is False.
-    string_pieces = []
-    for map_index, attribute_name in enumerate(self._format_string_pieces_map):
-      if not attribute_name or attribute_name in event_values:
-        if attribute_name:
-          attribute = event_values.get(attribute_name, None)
-          # If an attribute is an int, yet has zero value we want to include
-          # that in the format string, since that is still potentially valid
-          # information. Otherwise we would like to skip it.
-          if not isinstance(attribute, (bool, float, int)) and not attribute:
-            continue
-
-        string_pieces.append(self.FORMAT_STRING_PIECES[map_index])
-
-    format_string = self.FORMAT_STRING_SEPARATOR.join(string_pieces)
-
-    string_pieces = []
-    for map_index, attribute_name in enumerate(
-        self._format_string_short_pieces_map):
-
+    templates = []
+    for attribute_name, template in zip(
+        self._format_string_pieces_map, self._format_string_pieces_templates):
+      if attribute_name:
+        attribute = event_values.get(attribute_name, None)
+        # If an attribute is an int, yet has zero value we want to include
+        # that in the format string, since that is still potentially valid
+        # information. Otherwise we would like to skip it.
+        if not isinstance(attribute, (bool, float, int)) and not attribute:
+          continue
+
+      templates.append(template)
+
+    short_templates = []
+    for attribute_name, template in zip(
+        self._format_string_short_pieces_map,
+        self._format_string_short_pieces_templates):
       if not attribute_name or event_values.get(
           attribute_name, None) not in (None, '', b''):
-        string_pieces.append(self.FORMAT_STRING_SHORT_PIECES[map_index])
-    short_format_string = self.FORMAT_STRING_SEPARATOR.join(string_pieces)
+        short_templates.append(template)
 
-    return self._FormatMessages(
-        format_string, short_format_string, event_values)
+    return self._FormatTemplatesMessages(
+        templates, short_templates, event_values,
+        separator=self.FORMAT_STRING_SEPARATOR)
 
   def GetFormatStringAttributeNames(self):
     """Retrieves the attribute names in the format string.
@@ -416,7 +626,21 @@ class ConditionalEventFormatter(EventFormatter):
       raise errors.WrongFormatter('Unsupported data type: {0:s}.'.format(
           event_data.data_type))
 
-    event_values = event_data.CopyToDict()
+    if not self._format_string_pieces_map:
+      self._CreateFormatStringMaps()
+
+    attribute_names = self._event_values_attribute_names
+    if attribute_names is not None and self.helpers:
+      attribute_names = set(attribute_names)
+      for helper in self.helpers:
+        # Other helpers can use any of the event values.
+        if not isinstance(helper, EnumerationEventFormatterHelper):
+          attribute_names = None
+          break
+
+        attribute_names.add(helper.input_attribute)
+
+    event_values = self._GetEventValues(event_data, attribute_names)
 
     for helper in self.helpers:
       helper.FormatEventValues(event_values)
@@ -3,6 +3,7 @@
 
 from __future__ import unicode_literals
 
+import collections
 import os
 
 from plaso.formatters import winevt_rc
@@ -18,6 +19,9 @@ class FormatterMediator(object):
   # LCID 0x0409 is en-US.
   DEFAULT_LCID = 0x0409
 
+  # Maximum number of Windows Event Log message strings to cache.
+  _MAXIMUM_NUMBER_OF_CACHED_WINEVT_MESSAGES = 16384
+
   _WINEVT_RC_DATABASE = 'winevt-rc.db'
 
   def __init__(self, data_location=None):
@@ -31,6 +35,9 @@ class FormatterMediator(object):
     self._language_identifier = self.DEFAULT_LANGUAGE_IDENTIFIER
     self._lcid = self.DEFAULT_LCID
     self._winevt_database_reader = None
+    self._winevt_message_cache = collections.OrderedDict()
+    self._winevt_message_cache_hits = 0
+    self._winevt_message_cache_misses = 0
 
   def _GetWinevtRcDatabaseReader(self):
     """Opens the Windows Event Log resource database reader.
@@ -57,9 +64,21 @@ class FormatterMediator(object):
     """int: preferred Language Code identifier (LCID)."""
     return self._lcid
 
+  @property
+  def winevt_message_cache_hits(self):
+    """int: number of Windows Event Log message strings read from cache."""
+    return self._winevt_message_cache_hits
+
+  @property
+  def winevt_message_cache_misses(self):
+    """int: number of Windows Event Log message strings not read from cache."""
+    return self._winevt_message_cache_misses
+
   def GetWindowsEventMessage(self, log_source, message_identifier):
     """Retrieves the message string for a specific Windows Event Log source.
 
+    The most recently used message strings are cached.
+
     Args:
       log_source (str): Event Log source, such as "Application Error".
       message_identifier (int): message identifier.
@@ -71,14 +90,42 @@ class FormatterMediator(object):
     if not database_reader:
       return None
 
+    lookup_key = (log_source, self._lcid, message_identifier)
+    if lookup_key in self._winevt_message_cache:
+      self._winevt_message_cache.move_to_end(lookup_key)
+      self._winevt_message_cache_hits += 1
+      return self._winevt_message_cache[lookup_key]
+
+    self._winevt_message_cache_misses += 1
+
+    message_string = None
     if self._lcid != self.DEFAULT_LCID:
       message_string = database_reader.GetMessage(
           log_source, self.lcid, message_identifier)
-      if message_string:
-        return message_string
 
-    return database_reader.GetMessage(
-        log_source, self.DEFAULT_LCID, message_identifier)
+    if not message_string:
+      message_string = database_reader.GetMessage(
+          log_source, self.DEFAULT_LCID, message_identifier)
+
+    self._winevt_message_cache[lookup_key] = message_string
+    if (len(self._winevt_message_cache) >
+        self._MAXIMUM_NUMBER_OF_CACHED_WINEVT_MESSAGES):
+      self._winevt_message_cache.popitem(last=False)
+
+    return message_string
+
+  def PreloadWindowsEventMessages(self):
+    """Reads the Windows Event Log resource database into memory.
+
+    Returns:
+      bool: True if the Windows Event Log resource database was preloaded.
+    """
+    database_reader = self._GetWinevtRcDatabaseReader()
+    if not database_reader:
+      return False
+
+    database_reader.Preload()
+    return True
 
   def SetPreferredLanguageIdentifier(self, language_identifier):
     """Sets the preferred language identifier.
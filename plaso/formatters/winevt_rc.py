@@ -19,6 +19,9 @@ class Sqlite3DatabaseFile(object):
       'SELECT name FROM sqlite_master '
       'WHERE type = "table" AND name = "{0:s}"')
 
+  _TABLE_NAMES_QUERY = (
+      'SELECT name FROM sqlite_master WHERE type = "table"')
+
   def __init__(self):
     """Initializes the database file object."""
     super(Sqlite3DatabaseFile, self).__init__()
@@ -69,6 +72,21 @@ class Sqlite3DatabaseFile(object):
 
     return False
 
+  def GetTableNames(self):
+    """Retrieves the names of the tables.
+
+    Returns:
+      list[str]: table names.
+
+    Raises:
+      RuntimeError: if the database is not opened.
+    """
+    if not self._connection:
+      raise RuntimeError('Cannot retrieve table names database not opened.')
+
+    self._cursor.execute(self._TABLE_NAMES_QUERY)
+    return [row[0] for row in self._cursor.fetchall()]
+
   def GetValues(self, table_names, column_names, condition):
     """Retrieves values from a table.
 
@@ -174,11 +192,34 @@ class WinevtResourcesSqlite3DatabaseReader(Sqlite3DatabaseReader):
   # Message string specifiers that expand to a variable place holder.
   _PLACE_HOLDER_SPECIFIER_RE = re.compile(r'%([1-9][0-9]?)[!]?[s]?[!]?')
 
+  # Name of a message table, such as "message_table_1_0x00000409".
+  _MESSAGE_TABLE_NAME_RE = re.compile(
+      r'^message_table_([0-9]+)_0x([0-9a-f]{8})$')
+
+  # Value used in preloaded tables for keys that have more than one value
+  # in the database.
+  _DUPLICATE_VALUE = object()
+
   def __init__(self):
     """Initializes the database reader object."""
     super(WinevtResourcesSqlite3DatabaseReader, self).__init__()
+    self._event_log_provider_keys = None
+    self._message_file_keys = None
+    self._message_tables = None
     self._string_format = 'wrc'
 
+  def _AddPreloadedValue(self, values_per_key, key, value):
+    """Adds a value to a preloaded table.
+
+    Args:
+      values_per_key (dict[object, object]): preloaded table.
+      key (object): key of the value.
+      value (object): value.
+    """
+    if key in values_per_key:
+      value = self._DUPLICATE_VALUE
+    values_per_key[key] = value
+
   def _GetEventLogProviderKey(self, log_source):
     """Retrieves the Event Log provider key.
 
@@ -191,6 +232,13 @@ class WinevtResourcesSqlite3DatabaseReader(Sqlite3DatabaseReader):
     Raises:
       RuntimeError: if more than one value is found in the database.
     """
+    if self._event_log_provider_keys is not None:
+      event_log_provider_key = self._event_log_provider_keys.get(
+          log_source, None)
+      if event_log_provider_key is self._DUPLICATE_VALUE:
+        raise RuntimeError('More than one value found in database.')
+      return event_log_provider_key
+
     table_names = ['event_log_providers']
     column_names = ['event_log_provider_key']
     condition = 'log_source == "{0:s}"'.format(log_source)
@@ -222,6 +270,18 @@ class WinevtResourcesSqlite3DatabaseReader(Sqlite3DatabaseReader):
     Raises:
       RuntimeError: if more than one value is found in the database.
     """
+    message_identifier_string = '0x{0:08x}'.format(message_identifier)
+
+    if self._message_tables is not None:
+      message_table = self._message_tables.get((message_file_key, lcid), None)
+      if not message_table:
+        return None
+
+      message_string = message_table.get(message_identifier_string, None)
+      if message_string is self._DUPLICATE_VALUE:
+        raise RuntimeError('More than one value found in database.')
+      return message_string
+
     table_name = 'message_table_{0:d}_0x{1:08x}'.format(message_file_key, lcid)
 
     has_table = self._database_file.HasTable(table_name)
@@ -229,7 +289,8 @@ class WinevtResourcesSqlite3DatabaseReader(Sqlite3DatabaseReader):
       return None
 
     column_names = ['message_string']
-    condition = 'message_identifier == "0x{0:08x}"'.format(message_identifier)
+    condition = 'message_identifier == "{0:s}"'.format(
+        message_identifier_string)
 
     values = list(self._database_file.GetValues(
         [table_name], column_names, condition))
@@ -252,6 +313,12 @@ class WinevtResourcesSqlite3DatabaseReader(Sqlite3DatabaseReader):
     Yields:
       int: message file key.
     """
+    if self._message_file_keys is not None:
+      for message_file_key in self._message_file_keys.get(
+          event_log_provider_key, []):
+        yield message_file_key
+      return
+
     table_names = ['message_file_per_event_log_provider']
     column_names = ['message_file_key']
     condition = 'event_log_provider_key == {0:d}'.format(
@@ -309,13 +376,14 @@ class WinevtResourcesSqlite3DatabaseReader(Sqlite3DatabaseReader):
     if not event_log_provider_key:
       return None
 
-    generator = self._GetMessageFileKeys(event_log_provider_key)
-    if not generator:
+    # The message file keys are read before the messages are retrieved since
+    # both queries use the same database cursor.
+    message_file_keys = list(self._GetMessageFileKeys(event_log_provider_key))
+    if not message_file_keys:
       return None
 
-    # TODO: cache a number of message strings.
     message_string = None
-    for message_file_key in generator:
+    for message_file_key in message_file_keys:
       message_string = self._GetMessage(
           message_file_key, lcid, message_identifier)
 
@@ -360,6 +428,50 @@ class WinevtResourcesSqlite3DatabaseReader(Sqlite3DatabaseReader):
 
     raise RuntimeError('More than one value found in database.')
 
+  def Preload(self):
+    """Reads the Event Log providers and message tables into memory.
+
+    After preloading messages are retrieved without querying the database.
+    The message strings are stored as in the database and are reformatted
+    when retrieved.
+    """
+    event_log_provider_keys = {}
+    for values in self._database_file.GetValues(
+        ['event_log_providers'], ['log_source', 'event_log_provider_key'], ''):
+      self._AddPreloadedValue(
+          event_log_provider_keys, values['log_source'],
+          values['event_log_provider_key'])
+
+    message_file_keys = {}
+    for values in self._database_file.GetValues(
+        ['message_file_per_event_log_provider'],
+        ['event_log_provider_key', 'message_file_key'], ''):
+      message_file_keys.setdefault(
+          values['event_log_provider_key'], []).append(
+              values['message_file_key'])
+
+    message_tables = {}
+    for table_name in self._database_file.GetTableNames():
+      match_object = self._MESSAGE_TABLE_NAME_RE.match(table_name)
+      if not match_object:
+        continue
+
+      message_file_key = int(match_object.group(1), 10)
+      lcid = int(match_object.group(2), 16)
+
+      message_table = {}
+      for values in self._database_file.GetValues(
+          [table_name], ['message_identifier', 'message_string'], ''):
+        self._AddPreloadedValue(
+            message_table, values['message_identifier'],
+            values['message_string'])
+
+      message_tables[(message_file_key, lcid)] = message_table
+
+    self._event_log_provider_keys = event_log_provider_keys
+    self._message_file_keys = message_file_keys
+    self._message_tables = message_tables
+
   def Open(self, filename):
     """Opens the database reader object.
 
@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+"""Buffered file-like object with a read-ahead window."""
+
+from __future__ import unicode_literals
+
+import os
+
+
+class BufferedFileObject(object):
+  """Buffered file-like object with a block-aligned read-ahead window.
+
+  Reading a file-like object, such as a dfVFS file-like object, can be
+  relatively expensive per read, since a read can pass through multiple
+  layers, for example a file system, a volume system and a storage media
+  image. Parsers that read many small structures, such as records or tokens,
+  can read the file-like object using this buffered file-like object instead,
+  which reads block-aligned windows of data from the underlying file-like
+  object and serves reads that fall within the window from memory.
+
+  Attributes:
+    number_of_reads (int): number of reads of the underlying file-like object.
+  """
+
+  _BLOCK_SIZE = 4096
+
+  _DEFAULT_READ_AHEAD_SIZE = 64 * 1024
+
+  def __init__(self, file_object, read_ahead_size=None):
+    """Initializes a buffered file-like object.
+
+    Args:
+      file_object (dfvfs.FileIO): file-like object to read from.
+      read_ahead_size (Optional[int]): size of the read-ahead window, which is
+          rounded up to a multiple of the block size. Reads larger than the
+          read-ahead window are not buffered.
+
+    Raises:
+      ValueError: if the read-ahead size is invalid.
+    """
+    if read_ahead_size is None:
+      read_ahead_size = self._DEFAULT_READ_AHEAD_SIZE
+
+    if read_ahead_size <= 0:
+      raise ValueError('Invalid read-ahead size value out of bounds.')
+
+    _, remainder = divmod(read_ahead_size, self._BLOCK_SIZE)
+    if remainder:
+      read_ahead_size += self._BLOCK_SIZE - remainder
+
+    super(BufferedFileObject, self).__init__()
+    self._buffer = memoryview(b'')
+    self._buffer_offset = 0
+    self._current_offset = file_object.get_offset()
+    self._file_object = file_object
+    self._file_size = file_object.get_size()
+    self._read_ahead_size = read_ahead_size
+    self.number_of_reads = 0
+
+  def _ReadFileObject(self, offset, size):
+    """Reads data from the underlying file-like object.
+
+    Args:
+      offset (int): offset of the data.
+      size (int): size of the data.
+
+    Returns:
+      bytes: data read.
+
+    Raises:
+      IOError: if the data cannot be read.
+      OSError: if the data cannot be read.
+    """
+    self._file_object.seek(offset, os.SEEK_SET)
+    self.number_of_reads += 1
+    return self._file_object.read(size)
+
+  def _ReadWindow(self, offset, size):
+    """Reads the window of data that contains the requested range.
+
+    Args:
+      offset (int): offset of the requested data.
+      size (int): size of the requested data.
+
+    Raises:
+      IOError: if the data cannot be read.
+      OSError: if the data cannot be read.
+    """
+    window_offset = offset - (offset % self._BLOCK_SIZE)
+
+    window_end_offset = max(
+        offset + size, window_offset + self._read_ahead_size)
+    _, remainder = divmod(window_end_offset, self._BLOCK_SIZE)
+    if remainder:
+      window_end_offset += self._BLOCK_SIZE - remainder
+
+    window_end_offset = min(window_end_offset, self._file_size)
+
+    data = self._ReadFileObject(
+        window_offset, window_end_offset - window_offset)
+
+    self._buffer = memoryview(data)
+    self._buffer_offset = window_offset
+
+  # Note: that the following functions do not follow the style guide
+  # because they are part of the file-like object interface.
+  # pylint: disable=invalid-name
+
+  def get_offset(self):
+    """Retrieves the current offset into the file-like object.
+
+    Returns:
+      int: current offset into the file-like object.
+    """
+    return self._current_offset
+
+  def get_size(self):
+    """Retrieves the size of the file-like object.
+
+    Returns:
+      int: size of the file-like object data.
+    """
+    return self._file_size
+
+  def read(self, size=None):
+    """Reads a byte string from the file-like object at the current offset.
+
+    Args:
+      size (Optional[int]): number of bytes to read, where None is all
+          remaining data.
+
+    Returns:
+      bytes: data read.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    if self._current_offset >= self._file_size:
+      return b''
+
+    remaining_size = self._file_size - self._current_offset
+    if size is None or size < 0 or size > remaining_size:
+      size = remaining_size
+
+    if size > self._read_ahead_size:
+      data = self._ReadFileObject(self._current_offset, size)
+
+    else:
+      buffer_start_offset = self._current_offset - self._buffer_offset
+      if (buffer_start_offset < 0 or
+          buffer_start_offset + size > len(self._buffer)):
+        self._ReadWindow(self._current_offset, size)
+        buffer_start_offset = self._current_offset - self._buffer_offset
+
+      data = self._buffer[
+          buffer_start_offset:buffer_start_offset + size].tobytes()
+
+    self._current_offset += len(data)
+    return data
+
+  def seek(self, offset, whence=os.SEEK_SET):
+    """Seeks to an offset within the file-like object.
+
+    Args:
+      offset (int): offset to seek to.
+      whence (Optional(int)): value that indicates whether offset is an
+          absolute or relative position within the file.
+
+    Raises:
+      IOError: if the seek failed.
+      OSError: if the seek failed.
+    """
+    if whence == os.SEEK_CUR:
+      offset += self._current_offset
+    elif whence == os.SEEK_END:
+      offset += self._file_size
+    elif whence != os.SEEK_SET:
+      raise IOError('Unsupported whence.')
+
+    if offset < 0:
+      raise IOError('Invalid offset value less than zero.')
+
+    self._current_offset = offset
+
+  def tell(self):
+    """Retrieves the current offset into the file-like object.
+
+    Returns:
+      int: current offset into the file-like object.
+    """
+    return self._current_offset
@@ -87,6 +87,15 @@ ERROR_STATUS_INDICATORS = frozenset([
     STATUS_INDICATOR_NOT_RESPONDING,
     STATUS_INDICATOR_KILLED])
 
+STATUS_TRANSPORT_XMLRPC = 'xmlrpc'
+STATUS_TRANSPORT_ZEROMQ = 'zeromq'
+
+STATUS_TRANSPORTS = frozenset([
+    STATUS_TRANSPORT_XMLRPC,
+    STATUS_TRANSPORT_ZEROMQ])
+
+DEFAULT_STATUS_TRANSPORT = STATUS_TRANSPORT_ZEROMQ
+
 STORAGE_FORMAT_SQLITE = 'sqlite'
 STORAGE_FORMAT_REDIS = 'redis'
 
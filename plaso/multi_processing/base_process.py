@@ -9,10 +9,14 @@ import multiprocessing
 import os
 import random
 import signal
+import threading
 import time
 
+import zmq
+
 from plaso.engine import process_info
 from plaso.engine import profilers
+from plaso.lib import errors
 from plaso.lib import loggers
 from plaso.multi_processing import logger
 from plaso.multi_processing import plaso_xmlrpc
@@ -28,8 +32,12 @@ class MultiProcessBaseProcess(multiprocessing.Process):
   _NUMBER_OF_RPC_SERVER_START_ATTEMPTS = 14
   _PROCESS_JOIN_TIMEOUT = 5.0
 
+  # Number of seconds between publishing the process status.
+  _STATUS_PUBLISH_INTERVAL = 0.5
+
   def __init__(
-      self, processing_configuration, enable_sigsegv_handler=False, **kwargs):
+      self, processing_configuration, enable_sigsegv_handler=False,
+      status_queue=None, **kwargs):
     """Initializes a process.
 
     Args:
@@ -37,6 +45,9 @@ class MultiProcessBaseProcess(multiprocessing.Process):
           configuration.
       enable_sigsegv_handler (Optional[bool]): True if the SIGSEGV handler
           should be enabled.
+      status_queue (Optional[PlasoQueue]): queue on which the process status
+          is published, where None represents the process status is retrieved
+          by the engine via the process status RPC server.
       kwargs (dict[str,object]): keyword arguments to pass to
           multiprocessing.Process.
     """
@@ -56,6 +67,9 @@ class MultiProcessBaseProcess(multiprocessing.Process):
     self._rpc_server = None
     self._serializers_profiler = None
     self._status_is_running = False
+    self._status_publisher_stop_event = None
+    self._status_publisher_thread = None
+    self._status_queue = status_queue
     self._storage_profiler = None
     self._tasks_profiler = None
 
@@ -135,6 +149,48 @@ class MultiProcessBaseProcess(multiprocessing.Process):
     """
     self.SignalAbort()
 
+  def _PublishStatus(self):
+    """Publishes the process status on the status queue."""
+    try:
+      self._status_queue.PushItem((self._pid, self._GetStatus()), block=False)
+    except (errors.QueueFull, zmq.error.ZMQError) as exception:
+      # The status is published again on the next interval.
+      logger.debug((
+          'Process: {0!s} (PID: {1:d}) unable to publish status with error: '
+          '{2!s}').format(self._name, self._pid, exception))
+
+  def _StatusPublisherThreadMain(self):
+    """Main function of the process status publisher thread."""
+    while not self._status_publisher_stop_event.is_set():
+      self._PublishStatus()
+      self._status_publisher_stop_event.wait(self._STATUS_PUBLISH_INTERVAL)
+
+    # Make sure the engine gets one more status update so it knows
+    # the process has completed.
+    self._PublishStatus()
+
+    try:
+      self._status_queue.Close()
+    except (errors.QueueAlreadyClosed, RuntimeError):
+      pass
+
+  def _StartProcessStatusPublisher(self):
+    """Starts the process status publisher.
+
+    The process status is published from a separate thread, which is also the
+    only thread that uses the status queue.
+    """
+    if self._status_publisher_thread:
+      return
+
+    self._status_publisher_stop_event = threading.Event()
+    self._status_publisher_thread = threading.Thread(
+        name='Status publisher', target=self._StatusPublisherThreadMain)
+    self._status_publisher_thread.start()
+
+    logger.debug(
+        'Process: {0!s} process status publisher started'.format(self._name))
+
   def _StartProcessStatusRPCServer(self):
     """Starts the process status RPC server."""
     if self._rpc_server:
@@ -207,6 +263,18 @@ class MultiProcessBaseProcess(multiprocessing.Process):
       self._tasks_profiler = profilers.TasksProfiler(self._name, configuration)
       self._tasks_profiler.Start()
 
+  def _StopProcessStatusPublisher(self):
+    """Stops the process status publisher."""
+    if not self._status_publisher_thread:
+      return
+
+    self._status_publisher_stop_event.set()
+    self._status_publisher_thread.join()
+    self._status_publisher_thread = None
+
+    logger.debug(
+        'Process: {0!s} process status publisher stopped'.format(self._name))
+
   def _StopProcessStatusRPCServer(self):
     """Stops the process status RPC server."""
     if not self._rpc_server:
@@ -292,11 +360,17 @@ class MultiProcessBaseProcess(multiprocessing.Process):
     logger.debug(
         'Process: {0!s} (PID: {1:d}) started'.format(self._name, self._pid))
 
-    self._StartProcessStatusRPCServer()
+    if self._status_queue:
+      self._StartProcessStatusPublisher()
+    else:
+      self._StartProcessStatusRPCServer()
 
     self._Main()
 
-    self._StopProcessStatusRPCServer()
+    if self._status_queue:
+      self._StopProcessStatusPublisher()
+    else:
+      self._StopProcessStatusRPCServer()
 
     logger.debug(
         'Process: {0!s} (PID: {1:d}) stopped'.format(self._name, self._pid))
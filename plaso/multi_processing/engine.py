@@ -11,9 +11,12 @@ import sys
 import threading
 import time
 
+import zmq
+
 from plaso.engine import engine
 from plaso.engine import process_info
 from plaso.lib import definitions
+from plaso.lib import errors
 from plaso.multi_processing import logger
 from plaso.multi_processing import plaso_xmlrpc
 
@@ -23,13 +26,18 @@ class MultiProcessEngine(engine.BaseEngine):
 
   This class contains functionality to:
   * monitor and manage worker processes;
-  * retrieve a process status information via RPC;
+  * retrieve a process status information via RPC or a status queue;
   * manage the status update thread.
   """
 
   # Note that on average Windows seems to require a longer wait.
   _RPC_SERVER_TIMEOUT = 8.0
   _MAXIMUM_RPC_ERRORS = 10
+  # Maximum number of seconds since the status of a process was received from
+  # the status queue, after which the process is considered not responding.
+  # The status is published and checked at the same interval, hence twice the
+  # interval allows for the status to arrive just after a check.
+  _MAXIMUM_STATUS_AGE = 2 * engine.BaseEngine._STATUS_UPDATE_INTERVAL
   # Maximum number of attempts to try to start a replacement worker process.
   _MAXIMUM_REPLACEMENT_RETRIES = 3
   # Number of seconds to wait between attempts to start a replacement worker
@@ -53,6 +61,8 @@ class MultiProcessEngine(engine.BaseEngine):
     self._quiet_mode = False
     self._rpc_clients_per_pid = {}
     self._rpc_errors_per_pid = {}
+    self._status_per_pid = {}
+    self._status_queue = None
     self._status_update_active = False
     self._status_update_callback = None
     self._status_update_thread = None
@@ -113,10 +123,14 @@ class MultiProcessEngine(engine.BaseEngine):
     process = self._processes_per_pid[pid]
 
     process_status = self._QueryProcessStatus(process)
-    if process_status is None:
-      process_is_alive = False
-    else:
+    if process_status is not None:
       process_is_alive = True
+    elif self._status_queue:
+      # A process that has not published its status recently is handled as
+      # a process with RPC errors, as long as it is alive.
+      process_is_alive = process.is_alive()
+    else:
+      process_is_alive = False
 
     process_information = self._process_information_per_pid[pid]
     used_memory = process_information.GetUsedMemory() or 0
@@ -140,11 +154,16 @@ class MultiProcessEngine(engine.BaseEngine):
         process_is_alive = False
 
       if process_is_alive:
-        rpc_port = process.rpc_port.value
-        logger.warning((
-            'Unable to retrieve process: {0:s} (PID: {1:d}) status via '
-            'RPC socket: http://localhost:{2:d}').format(
-                process.name, pid, rpc_port))
+        if self._status_queue:
+          logger.warning((
+              'No recent status of process: {0:s} (PID: {1:d}) received via '
+              'status queue.').format(process.name, pid))
+        else:
+          rpc_port = process.rpc_port.value
+          logger.warning((
+              'Unable to retrieve process: {0:s} (PID: {1:d}) status via '
+              'RPC socket: http://localhost:{2:d}').format(
+                  process.name, pid, rpc_port))
 
         processing_status_string = 'RPC error'
         status_indicator = definitions.STATUS_INDICATOR_RUNNING
@@ -213,20 +232,48 @@ class MultiProcessEngine(engine.BaseEngine):
   def _QueryProcessStatus(self, process):
     """Queries a process to determine its status.
 
+    If the engine has a status queue the most recent status published by
+    the process is returned, otherwise the process is queried via RPC.
+
     Args:
       process (MultiProcessBaseProcess): process to query for its status.
 
     Returns:
-      dict[str, str]: status values received from the worker process.
+      dict[str, str]: status values received from the worker process or None
+          if not available, for example if the process is not alive or has
+          not published its status recently.
     """
     process_is_alive = process.is_alive()
-    if process_is_alive:
+    if process_is_alive and self._status_queue:
+      self._ReceiveProcessStatus()
+      receive_time, process_status = self._status_per_pid.get(
+          process.pid, (None, None))
+      if (receive_time is None or
+          time.time() - receive_time > self._MAXIMUM_STATUS_AGE):
+        process_status = None
+    elif process_is_alive:
       rpc_client = self._rpc_clients_per_pid.get(process.pid, None)
       process_status = rpc_client.CallFunction()
     else:
       process_status = None
     return process_status
 
+  def _ReceiveProcessStatus(self):
+    """Receives the process status published on the status queue.
+
+    The status queue is drained without blocking and only the most recent
+    status of every monitored process is kept, together with the time it was
+    received.
+    """
+    while True:
+      try:
+        pid, process_status = self._status_queue.PopItem()
+      except (errors.QueueEmpty, zmq.error.ZMQError):
+        break
+
+      if pid in self._process_information_per_pid:
+        self._status_per_pid[pid] = (time.time(), process_status)
+
   def _RaiseIfNotMonitored(self, pid):
     """Raises if the process is not monitored by the engine.
 
@@ -313,6 +360,12 @@ class MultiProcessEngine(engine.BaseEngine):
       raise KeyError(
           'RPC client (PID: {0:d}) already exists'.format(pid))
 
+    # The process publishes its status on the status queue, hence there is
+    # no RPC server to connect to.
+    if self._status_queue:
+      self._process_information_per_pid[pid] = process_info.ProcessInfo(pid)
+      return
+
     rpc_client = plaso_xmlrpc.XMLProcessStatusRPCClient()
 
     # Make sure that a worker process has started its RPC server.
@@ -377,6 +430,9 @@ class MultiProcessEngine(engine.BaseEngine):
     if pid in self._rpc_errors_per_pid:
       del self._rpc_errors_per_pid[pid]
 
+    if pid in self._status_per_pid:
+      del self._status_per_pid[pid]
+
     logger.debug('Stopped monitoring process: {0:s} (PID: {1:d})'.format(
         process.name, pid))
 
@@ -5,6 +5,7 @@ from __future__ import unicode_literals
 
 import collections
 import heapq
+import json
 import os
 import time
 
@@ -17,6 +18,7 @@ from plaso.lib import definitions
 from plaso.multi_processing import analysis_process
 from plaso.multi_processing import engine as multi_process_engine
 from plaso.multi_processing import logger
+from plaso.serializer import json_serializer
 from plaso.storage import event_tag_index
 from plaso.storage import time_range as storage_time_range
 
@@ -191,6 +193,12 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
 
   _QUEUE_TIMEOUT = 10 * 60
 
+  _JSON_SERIALIZER = json_serializer.JSONAttributeContainerSerializer
+
+  # Maximum number of event data, and their serialized form, that are cached
+  # when exporting events with serialized event data.
+  _MAXIMUM_NUMBER_OF_CACHED_EVENT_DATA = 4096
+
   def __init__(self):
     """Initializes a psort multi-processing engine."""
     super(PsortMultiProcessEngine, self).__init__()
@@ -203,8 +211,10 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
     self._events_status = processing_status.EventsStatus()
     # The export event heap is used to make sure the events are sorted in
     # a deterministic way.
+    self._export_event_data_cache = collections.OrderedDict()
     self._export_event_heap = PsortEventHeap()
     self._export_event_timestamp = 0
+    self._export_serialized_event_data = {}
     self._knowledge_base = None
     self._memory_profiler = None
     self._merge_task = None
@@ -426,7 +436,7 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
 
   def _ExportEvent(
       self, storage_reader, output_module, event, event_data,
-      deduplicate_events=True):
+      deduplicate_events=True, event_data_json_dict=None):
     """Exports an event using an output module.
 
     Args:
@@ -436,6 +446,9 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
       event_data (EventData): event data.
       deduplicate_events (Optional[bool]): True if events should be
           deduplicated.
+      event_data_json_dict (Optional[dict[str, object]]): JSON serialized
+          event data, as read from storage, or None if the output module
+          should serialize the event data.
     """
     if event.timestamp != self._export_event_timestamp:
       self._FlushExportBuffer(
@@ -443,6 +456,10 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
           deduplicate_events=deduplicate_events)
       self._export_event_timestamp = event.timestamp
 
+    if event_data_json_dict is not None:
+      lookup_key = event.GetEventDataIdentifier().CopyToString()
+      self._export_serialized_event_data[lookup_key] = event_data_json_dict
+
     self._export_event_heap.PushEvent(event, event_data)
 
   def _ExportEvents(
@@ -478,13 +495,24 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
     filter_limit = getattr(event_filter, 'limit', None)
     forward_entries = 0
 
+    # The serialized event data can only be reused when every event is
+    # exported as-is.
+    use_serialized_event_data = (
+        output_module.SUPPORTS_SERIALIZED_EVENT_DATA and
+        not event_filter and not time_slice_buffer)
+    event_data_json_dict = None
+
     self._events_status.number_of_filtered_events = 0
     self._events_status.number_of_events_from_time_slice = 0
 
     for event in storage_reader.GetSortedEvents(time_range=time_slice_range):
       event_data_identifier = event.GetEventDataIdentifier()
-      event_data = storage_reader.GetEventDataByIdentifier(
-          event_data_identifier)
+      if use_serialized_event_data:
+        event_data, event_data_json_dict = self._GetEventDataWithJSONDict(
+            storage_reader, event_data_identifier)
+      else:
+        event_data = storage_reader.GetEventDataByIdentifier(
+            event_data_identifier)
 
       event_identifier = event.GetIdentifier()
       event_tag = self._event_tag_index.GetEventTagByIdentifier(
@@ -538,7 +566,8 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
 
         self._ExportEvent(
             storage_reader, output_module, event, event_data,
-            deduplicate_events=deduplicate_events)
+            deduplicate_events=deduplicate_events,
+            event_data_json_dict=event_data_json_dict)
         self._number_of_consumed_events += 1
 
         # pylint: disable=singleton-comparison
@@ -548,6 +577,8 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
 
     self._FlushExportBuffer(storage_reader, output_module)
 
+    self._export_event_data_cache = collections.OrderedDict()
+
   def _FlushExportBuffer(
       self, storage_reader, output_module, deduplicate_events=True):
     """Flushes buffered events and writes them to the output module.
@@ -574,7 +605,18 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
       event_tag = self._event_tag_index.GetEventTagByIdentifier(
           storage_reader, event_identifier)
 
-      if macb_group_identifier is None:
+      if self._export_serialized_event_data:
+        # Output modules that support serialized event data output the events
+        # of a MACB group individually.
+        lookup_key = event.GetEventDataIdentifier().CopyToString()
+        output_module.WriteSerializedEvent(
+            event, event_data, event_tag,
+            self._export_serialized_event_data[lookup_key])
+
+        if macb_group_identifier is not None:
+          self._events_status.number_of_macb_grouped_events += 1
+
+      elif macb_group_identifier is None:
         if macb_group:
           output_module.WriteEventMACBGroup(macb_group)
           macb_group = []
@@ -598,6 +640,65 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
     if macb_group:
       output_module.WriteEventMACBGroup(macb_group)
 
+    self._export_serialized_event_data = {}
+
+  def _GetEventDataWithJSONDict(self, storage_reader, event_data_identifier):
+    """Retrieves event data together with its serialized form.
+
+    Event data is commonly shared by multiple events, for example the
+    events of a MACB group, hence the most recently used event data is
+    cached.
+
+    Args:
+      storage_reader (StorageReader): storage reader.
+      event_data_identifier (AttributeContainerIdentifier): event data
+          identifier.
+
+    Returns:
+      tuple: containing:
+
+        EventData: event data or None if not available.
+        dict[str, object]: JSON serialized event data, as read from storage,
+            or None if not available.
+
+    Raises:
+      IOError: if the event data cannot be read.
+      OSError: if the event data cannot be read.
+    """
+    lookup_key = event_data_identifier.CopyToString()
+
+    cached_values = self._export_event_data_cache.get(lookup_key, None)
+    if cached_values:
+      self._export_event_data_cache.move_to_end(lookup_key)
+      return cached_values
+
+    serialized_data = storage_reader.GetSerializedEventDataByIdentifier(
+        event_data_identifier)
+    if not serialized_data:
+      return None, None
+
+    try:
+      serialized_string = serialized_data.decode('utf-8')
+      event_data_json_dict = json.loads(serialized_string)
+      event_data = self._JSON_SERIALIZER.ReadSerializedDict(
+          event_data_json_dict)
+
+    except UnicodeDecodeError as exception:
+      raise IOError('Unable to decode serialized data: {0!s}'.format(exception))
+
+    except (ValueError, TypeError) as exception:
+      raise IOError('Unable to read serialized data: {0!s}'.format(exception))
+
+    event_data.SetIdentifier(event_data_identifier)
+
+    cached_values = (event_data, event_data_json_dict)
+    self._export_event_data_cache[lookup_key] = cached_values
+    if (len(self._export_event_data_cache) >
+        self._MAXIMUM_NUMBER_OF_CACHED_EVENT_DATA):
+      self._export_event_data_cache.popitem(last=False)
+
+    return cached_values
+
   def _MergeEventTag(self, storage_writer, attribute_container):
     """Merges an event tag with the last stored event tag.
 
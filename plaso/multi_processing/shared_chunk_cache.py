@@ -0,0 +1,530 @@
+# -*- coding: utf-8 -*-
+"""The shared chunk cache.
+
+The shared chunk cache stores decompressed chunks of compressed storage media
+images, such as EWF, in a memory-mapped file that is shared by the worker
+processes, so that a chunk read by multiple worker processes is only read and
+decompressed once.
+"""
+
+from __future__ import unicode_literals
+
+import hashlib
+import mmap
+import multiprocessing
+import os
+import struct
+import time
+
+from dfvfs.file_io import ewf_file_io
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.resolver_helpers import ewf_resolver_helper
+from dfvfs.resolver_helpers import manager as resolver_helpers_manager
+
+from plaso.multi_processing import logger
+
+
+class SharedChunkCache(object):
+  """Cache of decompressed chunks that is shared by processes.
+
+  The cache is stored in a memory-mapped file that consists of:
+  * a header with the least recently used counter and the cache statistics;
+  * an index with an entry per chunk slot;
+  * the chunk slots.
+
+  The index is set associative, where a chunk can only be stored in one of
+  the slots of the set that corresponds to its chunk number. When all slots
+  of a set are used, the least recently used chunk in the set is replaced.
+  """
+
+  _HEADER = struct.Struct('<QQQQ')
+
+  # The index entry contains the image key, the chunk number + 1, where 0
+  # represents an unused slot, the value of the least recently used counter
+  # when the chunk was last used and the size of the chunk data.
+  _INDEX_ENTRY = struct.Struct('<QQQQ')
+
+  # Maximum number of seconds to wait for the lock.
+  _LOCK_TIMEOUT = 10.0
+
+  _NUMBER_OF_SLOTS_PER_SET = 8
+
+  def __init__(self, path, maximum_size, maximum_chunk_size=32768):
+    """Initializes a shared chunk cache.
+
+    The cache is created by the process that creates the processes that share
+    the cache, which then open it.
+
+    Args:
+      path (str): path of the memory-mapped file of the cache.
+      maximum_size (int): maximum size of the chunk data in the cache, in bytes.
+      maximum_chunk_size (Optional[int]): maximum size of a chunk that can be
+          cached, in bytes.
+    """
+    number_of_sets = max(
+        1, maximum_size // (maximum_chunk_size * self._NUMBER_OF_SLOTS_PER_SET))
+
+    super(SharedChunkCache, self).__init__()
+    self._file_object = None
+    self._index_offset = self._HEADER.size
+    self._is_disabled = False
+    self._lock = multiprocessing.Lock()
+    self._memory_map = None
+    self._number_of_sets = number_of_sets
+    self._number_of_slots = number_of_sets * self._NUMBER_OF_SLOTS_PER_SET
+    self._path = path
+    self._replaced_resolver_helper = None
+    self._slots_offset = self._index_offset + (
+        self._number_of_slots * self._INDEX_ENTRY.size)
+
+    self.maximum_chunk_size = maximum_chunk_size
+
+  def __getstate__(self):
+    """Retrieves the state of the cache when it is pickled.
+
+    Returns:
+      dict[str, object]: state of the cache, without the memory-mapped file.
+    """
+    state = dict(self.__dict__)
+    state['_file_object'] = None
+    state['_memory_map'] = None
+    state['_replaced_resolver_helper'] = None
+    return state
+
+  def _AcquireLock(self):
+    """Acquires the lock of the cache.
+
+    When the lock cannot be acquired in time, for example because it is held
+    by a process that was terminated, the cache is no longer used by
+    the current process.
+
+    Returns:
+      bool: True if the lock was acquired.
+    """
+    if self._is_disabled:
+      return False
+
+    if not self._lock.acquire(timeout=self._LOCK_TIMEOUT):
+      logger.warning(
+          'Unable to acquire lock of shared chunk cache, disabling cache.')
+      self._is_disabled = True
+      return False
+
+    return True
+
+  def _GetSlot(self, image_key, chunk_number):
+    """Retrieves the slot of a chunk.
+
+    Args:
+      image_key (int): key that identifies the image.
+      chunk_number (int): number of the chunk in the image.
+
+    Returns:
+      tuple[int, bool]: index of the slot and True if the slot contains
+          the chunk or False if the slot is the least recently used slot
+          of the set of the chunk.
+    """
+    first_slot_index = ((image_key + chunk_number) % self._number_of_sets) * (
+        self._NUMBER_OF_SLOTS_PER_SET)
+
+    least_recently_used = None
+    least_recently_used_slot_index = first_slot_index
+
+    for slot_index in range(
+        first_slot_index, first_slot_index + self._NUMBER_OF_SLOTS_PER_SET):
+      entry_offset = self._index_offset + (slot_index * self._INDEX_ENTRY.size)
+      entry_image_key, entry_chunk_number, last_used, _ = (
+          self._INDEX_ENTRY.unpack_from(self._memory_map, entry_offset))
+
+      if entry_image_key == image_key and entry_chunk_number == (
+          chunk_number + 1):
+        return slot_index, True
+
+      if least_recently_used is None or last_used < least_recently_used:
+        least_recently_used = last_used
+        least_recently_used_slot_index = slot_index
+
+    return least_recently_used_slot_index, False
+
+  def _UpdateHeader(
+      self, number_of_hits=0, number_of_misses=0, decompression_time=0.0):
+    """Increments the least recently used counter and the cache statistics.
+
+    Args:
+      number_of_hits (Optional[int]): number of cache hits to add.
+      number_of_misses (Optional[int]): number of cache misses to add.
+      decompression_time (Optional[float]): CPU time, in seconds, spent in
+          reading and decompressing chunks to add.
+
+    Returns:
+      int: value of the least recently used counter.
+    """
+    (last_used, total_number_of_hits, total_number_of_misses,
+     total_decompression_time) = self._HEADER.unpack_from(self._memory_map, 0)
+
+    last_used += 1
+    total_decompression_time += int(decompression_time * 1000000)
+
+    self._HEADER.pack_into(
+        self._memory_map, 0, last_used, total_number_of_hits + number_of_hits,
+        total_number_of_misses + number_of_misses, total_decompression_time)
+
+    return last_used
+
+  def Close(self):
+    """Closes the cache."""
+    if self._memory_map:
+      self._memory_map.close()
+      self._memory_map = None
+
+    if self._file_object:
+      self._file_object.close()
+      self._file_object = None
+
+  def Create(self):
+    """Creates the memory-mapped file of the cache.
+
+    Raises:
+      IOError: if the memory-mapped file cannot be created.
+      OSError: if the memory-mapped file cannot be created.
+    """
+    cache_size = self._slots_offset + (
+        self._number_of_slots * self.maximum_chunk_size)
+
+    with open(self._path, 'wb') as file_object:
+      file_object.truncate(cache_size)
+
+  def DeregisterResolverHelper(self):
+    """Restores the EWF image resolver helper replaced by the cache."""
+    if self._replaced_resolver_helper:
+      resolver_helpers_manager.ResolverHelperManager.DeregisterHelper(
+          self._replaced_resolver_helper)
+      resolver_helpers_manager.ResolverHelperManager.RegisterHelper(
+          self._replaced_resolver_helper)
+      self._replaced_resolver_helper = None
+
+  def GetChunk(self, image_key, chunk_number):
+    """Retrieves a chunk from the cache.
+
+    Args:
+      image_key (int): key that identifies the image.
+      chunk_number (int): number of the chunk in the image.
+
+    Returns:
+      bytes: chunk data or None if the chunk is not cached.
+    """
+    if not self._AcquireLock():
+      return None
+
+    try:
+      slot_index, is_cached = self._GetSlot(image_key, chunk_number)
+      if not is_cached:
+        return None
+
+      last_used = self._UpdateHeader(number_of_hits=1)
+
+      entry_offset = self._index_offset + (slot_index * self._INDEX_ENTRY.size)
+      _, _, _, data_size = self._INDEX_ENTRY.unpack_from(
+          self._memory_map, entry_offset)
+
+      self._INDEX_ENTRY.pack_into(
+          self._memory_map, entry_offset, image_key, chunk_number + 1,
+          last_used, data_size)
+
+      slot_offset = self._slots_offset + (
+          slot_index * self.maximum_chunk_size)
+      return self._memory_map[slot_offset:slot_offset + data_size]
+
+    finally:
+      self._lock.release()
+
+  def GetStatistics(self):
+    """Retrieves the statistics of the cache.
+
+    Returns:
+      tuple[int, int, float]: number of cache hits, number of cache misses
+          and CPU time, in seconds, spent in reading and decompressing
+          the chunks that were not cached.
+    """
+    # The statistics are read without the lock, if it is held by a process
+    # that was terminated.
+    is_locked = self._AcquireLock()
+    try:
+      _, number_of_hits, number_of_misses, decompression_time = (
+          self._HEADER.unpack_from(self._memory_map, 0))
+
+    finally:
+      if is_locked:
+        self._lock.release()
+
+    return number_of_hits, number_of_misses, decompression_time / 1000000.0
+
+  def Open(self):
+    """Opens the memory-mapped file of the cache.
+
+    Raises:
+      IOError: if the memory-mapped file cannot be opened.
+      OSError: if the memory-mapped file cannot be opened.
+    """
+    self._file_object = open(self._path, 'r+b')
+    self._memory_map = mmap.mmap(self._file_object.fileno(), 0)
+
+  def RegisterResolverHelper(self):
+    """Replaces the EWF image resolver helper by one that uses the cache.
+
+    The resolver helper is replaced for all resolver contexts in the current
+    process.
+    """
+    if self._replaced_resolver_helper:
+      return
+
+    resolver_helper = resolver_helpers_manager.ResolverHelperManager.GetHelper(
+        dfvfs_definitions.TYPE_INDICATOR_EWF)
+
+    resolver_helpers_manager.ResolverHelperManager.DeregisterHelper(
+        resolver_helper)
+    resolver_helpers_manager.ResolverHelperManager.RegisterHelper(
+        SharedChunkCacheEWFResolverHelper(self))
+
+    self._replaced_resolver_helper = resolver_helper
+
+  def Remove(self):
+    """Removes the memory-mapped file of the cache.
+
+    Raises:
+      IOError: if the memory-mapped file cannot be removed.
+      OSError: if the memory-mapped file cannot be removed.
+    """
+    os.remove(self._path)
+
+  def SetChunk(self, image_key, chunk_number, data, decompression_time):
+    """Stores a chunk in the cache.
+
+    Args:
+      image_key (int): key that identifies the image.
+      chunk_number (int): number of the chunk in the image.
+      data (bytes): chunk data.
+      decompression_time (float): CPU time, in seconds, spent in reading and
+          decompressing the chunk.
+    """
+    if len(data) > self.maximum_chunk_size:
+      return
+
+    if not self._AcquireLock():
+      return
+
+    try:
+      last_used = self._UpdateHeader(
+          number_of_misses=1, decompression_time=decompression_time)
+
+      slot_index, _ = self._GetSlot(image_key, chunk_number)
+
+      # The index entry is marked as unused while the chunk data is written,
+      # so that a process that is terminated in between does not leave an
+      # index entry that refers to partially written chunk data.
+      entry_offset = self._index_offset + (slot_index * self._INDEX_ENTRY.size)
+      self._INDEX_ENTRY.pack_into(
+          self._memory_map, entry_offset, 0, 0, 0, 0)
+
+      slot_offset = self._slots_offset + (
+          slot_index * self.maximum_chunk_size)
+      self._memory_map[slot_offset:slot_offset + len(data)] = data
+
+      self._INDEX_ENTRY.pack_into(
+          self._memory_map, entry_offset, image_key, chunk_number + 1,
+          last_used, len(data))
+
+    finally:
+      self._lock.release()
+
+
+class SharedChunkCacheEWFHandle(object):
+  """Handle of an EWF image that reads its chunks via a shared chunk cache.
+
+  The handle provides the part of the interface of pyewf.handle that is used
+  by dfVFS.
+  """
+
+  def __init__(self, ewf_handle, chunk_cache, image_key):
+    """Initializes a handle.
+
+    Args:
+      ewf_handle (pyewf.handle): EWF handle.
+      chunk_cache (SharedChunkCache): shared chunk cache.
+      image_key (int): key that identifies the image.
+    """
+    super(SharedChunkCacheEWFHandle, self).__init__()
+    self._chunk_cache = chunk_cache
+    self._chunk_size = ewf_handle.get_chunk_size()
+    self._current_offset = 0
+    self._ewf_handle = ewf_handle
+    self._image_key = image_key
+    self._last_chunk_data = None
+    self._last_chunk_number = None
+    self._media_size = ewf_handle.get_media_size()
+
+  def _ReadChunk(self, chunk_number):
+    """Reads a chunk.
+
+    Args:
+      chunk_number (int): number of the chunk in the image.
+
+    Returns:
+      bytes: chunk data.
+    """
+    # Consecutive reads commonly read from the same chunk.
+    if chunk_number == self._last_chunk_number:
+      return self._last_chunk_data
+
+    chunk_data = self._chunk_cache.GetChunk(self._image_key, chunk_number)
+    if chunk_data is None:
+      start_time = time.process_time()
+      chunk_data = self._ewf_handle.read_buffer_at_offset(
+          self._chunk_size, chunk_number * self._chunk_size)
+      decompression_time = time.process_time() - start_time
+
+      self._chunk_cache.SetChunk(
+          self._image_key, chunk_number, chunk_data, decompression_time)
+
+    self._last_chunk_data = chunk_data
+    self._last_chunk_number = chunk_number
+
+    return chunk_data
+
+  def close(self):
+    """Closes the handle."""
+    self._ewf_handle.close()
+    self._last_chunk_data = None
+    self._last_chunk_number = None
+
+  def get_media_size(self):
+    """Retrieves the size of the media data.
+
+    Returns:
+      int: size of the media data.
+    """
+    return self._media_size
+
+  def get_offset(self):
+    """Retrieves the current offset into the media data.
+
+    Returns:
+      int: current offset into the media data.
+    """
+    return self._current_offset
+
+  def read(self, size=None):
+    """Reads media data at the current offset.
+
+    Args:
+      size (Optional[int]): number of bytes to read, where None represents
+          all remaining data.
+
+    Returns:
+      bytes: media data read.
+    """
+    if size is None or self._current_offset + size > self._media_size:
+      size = max(0, self._media_size - self._current_offset)
+
+    data_segments = []
+    while size > 0:
+      chunk_number, chunk_offset = divmod(
+          self._current_offset, self._chunk_size)
+
+      chunk_data = self._ReadChunk(chunk_number)
+      data_segment = chunk_data[chunk_offset:chunk_offset + size]
+      if not data_segment:
+        break
+
+      data_segments.append(data_segment)
+      self._current_offset += len(data_segment)
+      size -= len(data_segment)
+
+    return b''.join(data_segments)
+
+  def seek(self, offset, whence=os.SEEK_SET):
+    """Seeks a specific offset in the media data.
+
+    Args:
+      offset (int): offset to seek.
+      whence (Optional[int]): value that indicates whether offset is an
+          absolute or relative position within the media data.
+
+    Raises:
+      IOError: if the seek failed.
+      OSError: if the seek failed.
+    """
+    if whence == os.SEEK_CUR:
+      offset += self._current_offset
+    elif whence == os.SEEK_END:
+      offset += self._media_size
+    elif whence != os.SEEK_SET:
+      raise IOError('Unsupported whence.')
+
+    if offset < 0:
+      raise IOError('Invalid offset value less than zero.')
+
+    self._current_offset = offset
+
+
+class SharedChunkCacheEWFFile(ewf_file_io.EWFFile):
+  """File-like object of an EWF image that uses a shared chunk cache."""
+
+  def __init__(self, resolver_context, chunk_cache):
+    """Initializes a file-like object.
+
+    Args:
+      resolver_context (Context): resolver context.
+      chunk_cache (SharedChunkCache): shared chunk cache.
+    """
+    super(SharedChunkCacheEWFFile, self).__init__(resolver_context)
+    self._chunk_cache = chunk_cache
+
+  def _OpenFileObject(self, path_spec):
+    """Opens the file-like object defined by path specification.
+
+    Args:
+      path_spec (PathSpec): path specification.
+
+    Returns:
+      pyewf.handle|SharedChunkCacheEWFHandle: a file-like object or None.
+
+    Raises:
+      PathSpecError: if the path specification is invalid.
+    """
+    ewf_handle = super(SharedChunkCacheEWFFile, self)._OpenFileObject(
+        path_spec)
+
+    if (not ewf_handle or ewf_handle.get_chunk_size() >
+        self._chunk_cache.maximum_chunk_size):
+      return ewf_handle
+
+    comparable = path_spec.comparable.encode('utf-8')
+    image_key, = struct.unpack('<Q', hashlib.md5(comparable).digest()[:8])
+
+    return SharedChunkCacheEWFHandle(ewf_handle, self._chunk_cache, image_key)
+
+
+class SharedChunkCacheEWFResolverHelper(
+    ewf_resolver_helper.EWFResolverHelper):
+  """EWF image resolver helper that uses a shared chunk cache."""
+
+  def __init__(self, chunk_cache):
+    """Initializes a resolver helper.
+
+    Args:
+      chunk_cache (SharedChunkCache): shared chunk cache.
+    """
+    super(SharedChunkCacheEWFResolverHelper, self).__init__()
+    self._chunk_cache = chunk_cache
+
+  def NewFileObject(self, resolver_context):
+    """Creates a new file-like object.
+
+    Args:
+      resolver_context (Context): resolver context.
+
+    Returns:
+      FileIO: file-like object.
+    """
+    return SharedChunkCacheEWFFile(resolver_context, self._chunk_cache)
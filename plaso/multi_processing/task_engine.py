@@ -7,15 +7,20 @@ import heapq
 import logging
 import multiprocessing
 import os
+import tempfile
 import time
 import traceback
 
 from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.resolver import context
 
+import psutil
+import zmq
+
 from plaso.containers import event_sources
 from plaso.containers import warnings
 from plaso.engine import extractors
+from plaso.engine import path_spec_cache
 from plaso.engine import plaso_queue
 from plaso.engine import zeromq_queue
 from plaso.lib import definitions
@@ -23,24 +28,153 @@ from plaso.lib import errors
 from plaso.lib import loggers
 from plaso.multi_processing import engine
 from plaso.multi_processing import logger
+from plaso.multi_processing import shared_chunk_cache
 from plaso.multi_processing import task_manager
 from plaso.multi_processing import worker_process
 from plaso.storage.redis import redis_store
 
 
 class _EventSourceHeap(object):
-  """Class that defines an event source heap."""
+  """Class that defines an event source heap.
+
+  Directories are popped first, since processing them produces new event
+  sources. Other event sources are popped in descending order of their
+  estimated processing time, so that long running tasks are started early
+  and do not delay the end of processing.
+
+  The processing time of an event source is estimated from its file size and
+  the processing rate measured for previously processed event sources with
+  the same file name extension.
+
+  When ordered by data offset, event sources with a data offset are popped
+  after directories, per volume in ascending order of their data offset, and
+  before the other event sources, such that file entries are read in the
+  order their data is stored.
+  """
+
+  # Processing rate in bytes per second, used when no processing rate
+  # was measured yet.
+  _DEFAULT_PROCESSING_RATE = 10.0 * 1024 * 1024
+
+  # Weight of event sources that are ordered by data offset.
+  _DATA_OFFSET_WEIGHT = 50
 
-  def __init__(self, maximum_number_of_items=50000):
+  def __init__(self, maximum_number_of_items=50000, order_by_data_offset=False):
     """Initializes an event source heap.
 
     Args:
       maximum_number_of_items (Optional[int]): maximum number of items
           in the heap.
+      order_by_data_offset (Optional[bool]): True if event sources with
+          a data offset should be ordered by data offset instead of by
+          estimated processing time.
     """
     super(_EventSourceHeap, self).__init__()
     self._heap = []
     self._maximum_number_of_items = maximum_number_of_items
+    self._number_of_pushed_event_sources = 0
+    self._order_by_data_offset = order_by_data_offset
+    # The processing statistics contain the number of bytes processed and
+    # the processing time in seconds, per file name extension.
+    self._processing_statistics = {}
+    self._total_processing_statistics = [0, 0.0]
+
+  def _GetFileNameExtension(self, path_spec):
+    """Retrieves the file name extension of a path specification.
+
+    Args:
+      path_spec (dfvfs.PathSpec): path specification.
+
+    Returns:
+      str: lower case file name extension without the leading dot or an empty
+          string if not available.
+    """
+    location = None
+    while path_spec and not location:
+      location = getattr(path_spec, 'location', None)
+      path_spec = path_spec.parent
+
+    if not location:
+      return ''
+
+    _, _, file_name = location.rpartition('/')
+    _, _, extension = file_name.rpartition('.')
+    if extension == file_name:
+      return ''
+
+    return extension.lower()
+
+  def _GetVolumeKey(self, path_spec):
+    """Retrieves a key that identifies the volume of a path specification.
+
+    Args:
+      path_spec (dfvfs.PathSpec): path specification.
+
+    Returns:
+      str: comparable of the parent path specification, which identifies
+          the volume that contains the file system, or an empty string if
+          not available.
+    """
+    if not path_spec or not path_spec.parent:
+      return ''
+
+    return path_spec.parent.comparable
+
+  def _GetProcessingRate(self, extension):
+    """Retrieves the processing rate of a file name extension.
+
+    Args:
+      extension (str): file name extension.
+
+    Returns:
+      float: processing rate in bytes per second.
+    """
+    processing_statistics = self._processing_statistics.get(
+        extension, self._total_processing_statistics)
+
+    number_of_bytes, processing_time = processing_statistics
+    if not number_of_bytes or not processing_time:
+      return self._DEFAULT_PROCESSING_RATE
+
+    return number_of_bytes / processing_time
+
+  def AddProcessingTime(self, path_spec, file_size, processing_time):
+    """Adds the measured processing time of a path specification.
+
+    Args:
+      path_spec (dfvfs.PathSpec): path specification.
+      file_size (int): size of the file entry data in bytes or None if not
+          available.
+      processing_time (float): number of seconds it took to process the path
+          specification.
+    """
+    if not file_size or processing_time <= 0.0:
+      return
+
+    extension = self._GetFileNameExtension(path_spec)
+    processing_statistics = self._processing_statistics.setdefault(
+        extension, [0, 0.0])
+
+    for statistics in (
+        processing_statistics, self._total_processing_statistics):
+      statistics[0] += file_size
+      statistics[1] += processing_time
+
+  def EstimateProcessingTime(self, event_source):
+    """Estimates the processing time of an event source.
+
+    Args:
+      event_source (EventSource): event source.
+
+    Returns:
+      float: estimated number of seconds it takes to process the event source
+          or 0.0 if the file size of the event source is not available.
+    """
+    if not event_source.file_size:
+      return 0.0
+
+    extension = self._GetFileNameExtension(event_source.path_spec)
+    return event_source.file_size / self._GetProcessingRate(extension)
 
   def IsFull(self):
     """Determines if the heap is full.
@@ -57,13 +191,45 @@ class _EventSourceHeap(object):
       EventSource: an event source or None on if no event source is available.
     """
     try:
-      _, _, event_source = heapq.heappop(self._heap)
+      _, _, _, event_source = heapq.heappop(self._heap)
 
     except IndexError:
       return None
 
     return event_source
 
+  def PopNeighbouringEventSource(self, event_source, maximum_distance):
+    """Pops the event source with data that neighbours that of another.
+
+    Args:
+      event_source (EventSource): event source, with a data offset, that was
+          previously popped from the heap.
+      maximum_distance (int): maximum number of bytes between the end of
+          the data of the event source and the start of the data of
+          the neighbouring event source.
+
+    Returns:
+      EventSource: an event source or None if the event source on top of
+          the heap does not neighbour the event source.
+    """
+    if not self._heap:
+      return None
+
+    weight, sort_key, _, _ = self._heap[0]
+    if weight != self._DATA_OFFSET_WEIGHT:
+      return None
+
+    volume_key, data_offset = sort_key
+    if volume_key != self._GetVolumeKey(event_source.path_spec):
+      return None
+
+    end_offset = event_source.data_offset + (event_source.file_size or 0)
+    if (data_offset < event_source.data_offset or
+        data_offset - end_offset > maximum_distance):
+      return None
+
+    return self.PopEventSource()
+
   def PushEventSource(self, event_source):
     """Pushes an event source onto the heap.
 
@@ -73,13 +239,122 @@ class _EventSourceHeap(object):
     if event_source.file_entry_type == (
         dfvfs_definitions.FILE_ENTRY_TYPE_DIRECTORY):
       weight = 1
+      sort_key = 0.0
+
+    elif (self._order_by_data_offset and
+          getattr(event_source, 'data_offset', None) is not None):
+      weight = self._DATA_OFFSET_WEIGHT
+      sort_key = (
+          self._GetVolumeKey(event_source.path_spec), event_source.data_offset)
+
     else:
       weight = 100
+      sort_key = -self.EstimateProcessingTime(event_source)
+
+    self._number_of_pushed_event_sources += 1
 
-    heap_values = (weight, time.time(), event_source)
+    # The number of pushed event sources keeps event sources with the same
+    # estimated processing time or data offset in the order they were pushed.
+    heap_values = (
+        weight, sort_key, self._number_of_pushed_event_sources, event_source)
     heapq.heappush(self._heap, heap_values)
 
 
+class _WorkerProcessesScaler(object):
+  """Determines if worker processes should be added or retired.
+
+  Worker processes are added when there are queued tasks and the CPUs are
+  not fully used, for example because the worker processes are waiting on
+  I/O. Worker processes are retired when the CPUs are oversubscribed or
+  when there is not enough memory available for the current worker processes.
+  """
+
+  # Percentage of CPU usage above which worker processes are retired if there
+  # are more worker processes than CPUs.
+  _CPU_USAGE_HIGH = 95.0
+
+  # Percentage of CPU usage below which worker processes are added.
+  _CPU_USAGE_LOW = 75.0
+
+  # Percentage of CPU time spent waiting on I/O above which worker processes
+  # are added.
+  _IOWAIT_HIGH = 10.0
+
+  def __init__(
+      self, minimum_number_of_worker_processes,
+      maximum_number_of_worker_processes, number_of_cpus):
+    """Initializes a worker processes scaler.
+
+    Args:
+      minimum_number_of_worker_processes (int): minimum number of worker
+          processes.
+      maximum_number_of_worker_processes (int): maximum number of worker
+          processes.
+      number_of_cpus (int): number of CPUs of the host.
+    """
+    super(_WorkerProcessesScaler, self).__init__()
+    self._maximum_number_of_worker_processes = (
+        maximum_number_of_worker_processes)
+    self._minimum_number_of_worker_processes = (
+        minimum_number_of_worker_processes)
+    self._number_of_cpus = number_of_cpus
+
+  def GetScalingDecision(
+      self, number_of_worker_processes, number_of_queued_tasks,
+      used_memory_per_worker, cpu_usage, iowait, available_memory):
+    """Determines if worker processes should be added or retired.
+
+    Args:
+      number_of_worker_processes (int): number of running worker processes.
+      number_of_queued_tasks (int): number of tasks waiting to be processed.
+      used_memory_per_worker (list[int]): memory used by each of the worker
+          processes in bytes.
+      cpu_usage (float): percentage of CPU time of the host spent on
+          processing.
+      iowait (float): percentage of CPU time of the host spent waiting on I/O.
+      available_memory (int): memory available on the host in bytes.
+
+    Returns:
+      tuple[int, str]: number of worker processes to add, which is negative
+          if worker processes should be retired, and a description of the
+          reason of the decision.
+    """
+    if used_memory_per_worker:
+      average_used_memory = (
+          sum(used_memory_per_worker) // len(used_memory_per_worker))
+    else:
+      average_used_memory = 0
+
+    can_retire = (
+        number_of_worker_processes > self._minimum_number_of_worker_processes)
+
+    if can_retire and available_memory < average_used_memory:
+      return -1, 'low available memory'
+
+    if (can_retire and cpu_usage >= self._CPU_USAGE_HIGH and
+        number_of_worker_processes > self._number_of_cpus):
+      return -1, 'CPUs oversubscribed'
+
+    if number_of_worker_processes >= self._maximum_number_of_worker_processes:
+      return 0, 'maximum number of worker processes'
+
+    if not number_of_queued_tasks:
+      return 0, 'no queued tasks'
+
+    # Keep memory available for the worker process to add and for the
+    # existing worker processes to grow.
+    if available_memory < 2 * average_used_memory:
+      return 0, 'insufficient available memory'
+
+    if iowait >= self._IOWAIT_HIGH:
+      return 1, 'high I/O wait'
+
+    if cpu_usage < self._CPU_USAGE_LOW:
+      return 1, 'low CPU usage'
+
+    return 0, 'CPUs in use'
+
+
 class TaskMultiProcessEngine(engine.MultiProcessEngine):
   """Class that defines the task multi-process engine.
 
@@ -88,15 +363,33 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
   * merge results returned by extraction workers.
   """
 
+  # Maximum number of bytes between the data of file entries that are grouped
+  # into the same task.
+  _MAXIMUM_GROUPED_DATA_DISTANCE = 1024 * 1024
+
+  # Maximum total size of the data of file entries that are grouped into
+  # the same task.
+  _MAXIMUM_GROUPED_FILE_SIZE = 16 * 1024 * 1024
+
+  # Maximum number of event sources that are grouped into the same task.
+  _MAXIMUM_NUMBER_OF_GROUPED_EVENT_SOURCES = 64
+
   # Maximum number of attribute containers to merge per loop.
   _MAXIMUM_NUMBER_OF_CONTAINERS = 50
 
   # Maximum number of concurrent tasks.
   _MAXIMUM_NUMBER_OF_TASKS = 10000
 
+  # Interval in seconds to scan the task storage for processed tasks of which
+  # the completion was not announced on the task completion queue.
+  _PROCESSED_TASKS_SCAN_INTERVAL = 10.0
+
   # Consider a worker inactive after 15 minutes of no activity.
   _PROCESS_WORKER_TIMEOUT = 15.0 * 60.0
 
+  # Minimum number of seconds between scaling the worker processes.
+  _WORKER_PROCESSES_SCALING_INTERVAL = 30.0
+
   _WORKER_PROCESSES_MINIMUM = 2
   _WORKER_PROCESSES_MAXIMUM = 15
 
@@ -113,8 +406,12 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
           tasks, where 0 represents no limit.
     """
     super(TaskMultiProcessEngine, self).__init__()
+    self._chunk_cache = None
     self._enable_sigsegv_handler = False
+    self._event_source_heap = None
+    self._last_processed_tasks_scan_time = 0.0
     self._last_worker_number = 0
+    self._last_worker_processes_scaling_time = 0.0
     self._maximum_number_of_tasks = maximum_number_of_tasks
     self._merge_task = None
     self._merge_task_on_hold = None
@@ -131,15 +428,52 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
     self._number_of_worker_processes = 0
     self._path_spec_extractor = extractors.PathSpecExtractor()
     self._processing_configuration = None
+    self._processing_time_per_task = {}
     self._redis_client = None
     self._resolver_context = context.Context()
+    self._retiring_worker_pids = set()
+    self._scanned_task_identifiers = set()
     self._session_identifier = None
     self._status = definitions.STATUS_INDICATOR_IDLE
     self._storage_merge_reader = None
     self._storage_merge_reader_on_hold = None
+    self._task_completion_queue = None
+    self._task_completion_queue_port = None
+    self._status_queue_port = None
     self._task_queue = None
     self._task_queue_port = None
     self._task_manager = task_manager.TaskManager()
+    self._worker_processes_scaler = None
+
+  def _CreateSharedChunkCache(self, maximum_size, temporary_directory=None):
+    """Creates a chunk cache that is shared by the worker processes.
+
+    Args:
+      maximum_size (int): maximum size of the chunk data in the cache,
+          in bytes.
+      temporary_directory (Optional[str]): path of the directory to create
+          the memory-mapped file of the cache in, where None represents
+          the default temporary directory.
+
+    Returns:
+      SharedChunkCache: shared chunk cache or None if the cache could not
+          be created.
+    """
+    try:
+      file_descriptor, path = tempfile.mkstemp(
+          prefix='plaso-', suffix='.chunk_cache', dir=temporary_directory)
+      os.close(file_descriptor)
+
+      chunk_cache = shared_chunk_cache.SharedChunkCache(path, maximum_size)
+      chunk_cache.Create()
+
+    except (IOError, OSError) as exception:
+      logger.warning(
+          'Unable to create shared chunk cache with error: {0!s}'.format(
+              exception))
+      return None
+
+    return chunk_cache
 
   def _FillEventSourceHeap(
       self, storage_writer, event_source_heap, start_with_first=False):
@@ -182,37 +516,121 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
     if self._processing_profiler:
       self._processing_profiler.StopTiming('fill_event_source_heap')
 
-  def _MergeTaskStorage(self, storage_writer):
-    """Merges a task storage with the session storage.
+  def _GroupNeighbouringEventSources(
+      self, task, event_source, event_source_heap):
+    """Groups event sources with neighbouring data into a task.
 
-    This function checks all task stores that are ready to merge and updates
-    the scheduled tasks. Note that to prevent this function holding up
-    the task scheduling loop only the first available task storage is merged.
+    Args:
+      task (Task): task that processes the event source.
+      event_source (EventSource): event source with a data offset.
+      event_source_heap (_EventSourceHeap): event source heap.
+    """
+    grouped_path_specs = []
+    file_size = event_source.file_size or 0
+
+    while (len(grouped_path_specs) + 1 <
+           self._MAXIMUM_NUMBER_OF_GROUPED_EVENT_SOURCES and
+           file_size < self._MAXIMUM_GROUPED_FILE_SIZE):
+      event_source = event_source_heap.PopNeighbouringEventSource(
+          event_source, self._MAXIMUM_GROUPED_DATA_DISTANCE)
+      if not event_source:
+        break
+
+      grouped_path_specs.append(event_source.path_spec)
+      file_size += event_source.file_size or 0
+
+      self._number_of_consumed_sources += 1
+
+    if grouped_path_specs:
+      task.file_size = file_size
+      task.grouped_path_specs = grouped_path_specs
+
+  def _GetProcessedTaskIdentifiers(self, storage_writer):
+    """Retrieves the identifiers of tasks that have been processed.
+
+    Worker processes announce the identifiers of the tasks they completed,
+    together with their processing time, on the task completion queue. The task
+    storage is only scanned periodically for processed tasks of which the
+    announcement was lost, for example when a worker process was terminated.
 
     Args:
-      storage_writer (StorageWriter): storage writer for a session storage used
-          to merge task storage.
+      storage_writer (StorageWriter): storage writer for a session storage.
+
+    Returns:
+      set[str]: identifiers of processed tasks.
     """
-    if self._processing_profiler:
-      self._processing_profiler.StartTiming('merge_check')
+    task_identifiers = set()
+    while True:
+      try:
+        task_identifier, processing_time = (
+            self._task_completion_queue.PopItem())
+      except (errors.QueueEmpty, zmq.error.ZMQError):
+        break
+
+      # Ignore announcements of tasks already picked up by a scan.
+      if task_identifier in self._scanned_task_identifiers:
+        self._scanned_task_identifiers.remove(task_identifier)
+      else:
+        task_identifiers.add(task_identifier)
+        self._processing_time_per_task[task_identifier] = processing_time
+
+    current_time = time.time()
+    if current_time < (
+        self._last_processed_tasks_scan_time +
+        self._PROCESSED_TASKS_SCAN_INTERVAL):
+      return task_identifiers
+
+    self._last_processed_tasks_scan_time = current_time
 
     if (self._processing_configuration.task_storage_format ==
         definitions.STORAGE_FORMAT_REDIS):
 
-      task_identifiers, redis_client = (
+      scanned_task_identifiers, redis_client = (
           redis_store.RedisStore.ScanForProcessedTasks(
               self._session_identifier, redis_client=self._redis_client))
       self._redis_client = redis_client
 
     else:
-      task_identifiers = storage_writer.GetProcessedTaskIdentifiers()
+      scanned_task_identifiers = storage_writer.GetProcessedTaskIdentifiers()
+
+    for task_identifier in scanned_task_identifiers:
+      if task_identifier not in task_identifiers:
+        self._scanned_task_identifiers.add(task_identifier)
+        task_identifiers.add(task_identifier)
 
+    return task_identifiers
+
+  def _MergeTaskStorage(self, storage_writer):
+    """Merges a task storage with the session storage.
+
+    This function checks all task stores that are ready to merge and updates
+    the scheduled tasks. Note that to prevent this function holding up
+    the task scheduling loop only the first available task storage is merged.
+
+    Args:
+      storage_writer (StorageWriter): storage writer for a session storage used
+          to merge task storage.
+    """
+    if self._processing_profiler:
+      self._processing_profiler.StartTiming('merge_check')
+
+    task_identifiers = self._GetProcessedTaskIdentifiers(storage_writer)
     for task_identifier in task_identifiers:
+      processing_time = self._processing_time_per_task.pop(
+          task_identifier, None)
+
       try:
         task = self._task_manager.GetProcessedTaskByIdentifier(task_identifier)
 
         self._task_manager.SampleTaskStatus(task, 'processed')
 
+        # The processing time of a task with grouped path specifications
+        # cannot be attributed to a single file name extension.
+        if (processing_time is not None and self._event_source_heap and
+            not task.grouped_path_specs):
+          self._event_source_heap.AddProcessingTime(
+              task.path_spec, task.file_size, processing_time)
+
         to_merge = self._task_manager.CheckTaskToMerge(task)
         if not to_merge:
           storage_writer.RemoveProcessedTaskStorage(task)
@@ -220,6 +638,8 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
           self._task_manager.RemoveTask(task)
           self._task_manager.SampleTaskStatus(task, 'removed_processed')
 
+          self._scanned_task_identifiers.discard(task.identifier)
+
         else:
           storage_writer.PrepareMergeTaskStorage(task)
           self._task_manager.UpdateTaskAsPendingMerge(task)
@@ -228,6 +648,8 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
         logger.error(
             'Unable to retrieve task: {0:s} to prepare it to be merged '
             'with error: {1!s}.'.format(task_identifier, exception))
+
+        self._scanned_task_identifiers.discard(task_identifier)
         continue
 
     if self._processing_profiler:
@@ -287,6 +709,10 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
               'Unable to complete task: {0:s} with error: {1!s}'.format(
                   self._merge_task.identifier, exception))
 
+        # The identifier of a scanned task is only kept until the task is
+        # merged, such that the set does not grow with the number of tasks.
+        self._scanned_task_identifiers.discard(self._merge_task.identifier)
+
         if not self._storage_merge_reader_on_hold:
           self._merge_task = None
           self._storage_merge_reader = None
@@ -421,7 +847,12 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
     # TODO: protect task scheduler loop by catch all and
     # handle abort path.
 
-    event_source_heap = _EventSourceHeap()
+    order_by_data_offset = (
+        self._processing_configuration.extraction.order_by_data_offset)
+
+    event_source_heap = _EventSourceHeap(
+        order_by_data_offset=order_by_data_offset)
+    self._event_source_heap = event_source_heap
 
     self._FillEventSourceHeap(
         storage_writer, event_source_heap, start_with_first=True)
@@ -442,11 +873,18 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
               self._session_identifier,
               storage_format=self._processing_configuration.task_storage_format)
           task.file_entry_type = event_source.file_entry_type
+          task.file_size = event_source.file_size
           task.path_spec = event_source.path_spec
-          event_source = None
 
           self._number_of_consumed_sources += 1
 
+          if (order_by_data_offset and
+              getattr(event_source, 'data_offset', None) is not None):
+            self._GroupNeighbouringEventSources(
+                task, event_source, event_source_heap)
+
+          event_source = None
+
         if task:
           if self._ScheduleTask(task):
             task_path_spec_string = task.path_spec.comparable.replace('\n', ' ')
@@ -481,12 +919,14 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
           self._status_update_callback(self._processing_status)
 
     for task in self._task_manager.GetFailedTasks():
-      warning = warnings.ExtractionWarning(
-          message='Worker failed to process path specification',
-          path_spec=task.path_spec)
-      self._storage_writer.AddWarning(warning)
-      self._processing_status.error_path_specs.append(task.path_spec)
-
+      for path_spec in [task.path_spec] + (task.grouped_path_specs or []):
+        warning = warnings.ExtractionWarning(
+            message='Worker failed to process path specification',
+            path_spec=path_spec)
+        self._storage_writer.AddWarning(warning)
+        self._processing_status.error_path_specs.append(path_spec)
+
+    self._event_source_heap = None
     self._status = definitions.STATUS_INDICATOR_IDLE
 
     if self._abort:
@@ -494,6 +934,36 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
     else:
       logger.debug('Task scheduler stopped')
 
+  def _RemoveSharedChunkCache(self):
+    """Reports the statistics of and removes the shared chunk cache."""
+    try:
+      self._chunk_cache.Open()
+      try:
+        number_of_hits, number_of_misses, decompression_time = (
+            self._chunk_cache.GetStatistics())
+      finally:
+        self._chunk_cache.Close()
+
+      logger.info((
+          'Shared chunk cache: {0:d} chunks read and decompressed using '
+          '{1:.3f} seconds of CPU time, {2:d} chunks read from the '
+          'cache.').format(number_of_misses, decompression_time,
+                           number_of_hits))
+
+    except (IOError, OSError) as exception:
+      logger.error((
+          'Unable to read statistics of shared chunk cache with error: '
+          '{0!s}').format(exception))
+
+    try:
+      self._chunk_cache.Remove()
+    except (IOError, OSError) as exception:
+      logger.error(
+          'Unable to remove shared chunk cache with error: {0!s}'.format(
+              exception))
+
+    self._chunk_cache = None
+
   def _StartWorkerProcess(self, process_name, storage_writer):
     """Creates, starts, monitors and registers a worker process.
 
@@ -515,11 +985,27 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
         port=self._task_queue_port,
         timeout_seconds=self._TASK_QUEUE_TIMEOUT_SECONDS)
 
+    queue_name = '{0:s} task completion queue'.format(process_name)
+    task_completion_queue = zeromq_queue.ZeroMQPushConnectQueue(
+        delay_open=True, linger_seconds=0, name=queue_name,
+        port=self._task_completion_queue_port,
+        timeout_seconds=self._TASK_QUEUE_TIMEOUT_SECONDS)
+
+    status_queue = None
+    if self._status_queue:
+      queue_name = '{0:s} status queue'.format(process_name)
+      status_queue = zeromq_queue.ZeroMQPushConnectQueue(
+          delay_open=True, linger_seconds=1, name=queue_name,
+          port=self._status_queue_port,
+          timeout_seconds=self._TASK_QUEUE_TIMEOUT_SECONDS)
+
     process = worker_process.WorkerProcess(
         task_queue, storage_writer, self.collection_filters_helper,
         self.knowledge_base, self._session_identifier,
-        self._processing_configuration,
-        enable_sigsegv_handler=self._enable_sigsegv_handler, name=process_name)
+        self._processing_configuration, chunk_cache=self._chunk_cache,
+        enable_sigsegv_handler=self._enable_sigsegv_handler,
+        status_queue=status_queue, task_completion_queue=task_completion_queue,
+        name=process_name)
 
     # Remove all possible log handlers to prevent a child process from logging
     # to the main process log file and garbling the log. The log handlers are
@@ -553,12 +1039,85 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
 
     return process
 
+  def _ScaleWorkerProcesses(self, tasks_status):
+    """Adds or retires worker processes based on the resource usage.
+
+    A retired worker process stops after it has processed its current task.
+
+    Args:
+      tasks_status (TasksStatus): status information about tasks.
+    """
+    current_time = time.time()
+    if current_time < (
+        self._last_worker_processes_scaling_time +
+        self._WORKER_PROCESSES_SCALING_INTERVAL):
+      return
+
+    self._last_worker_processes_scaling_time = current_time
+
+    used_memory_per_worker = [
+        worker_status.used_memory
+        for worker_status in self._processing_status.workers_status
+        if worker_status.pid in self._process_information_per_pid]
+
+    number_of_worker_processes = (
+        len(self._process_information_per_pid) -
+        len(self._retiring_worker_pids))
+
+    cpu_times_percent = psutil.cpu_times_percent(interval=None)
+    # Note that I/O wait is only available on Linux.
+    iowait = getattr(cpu_times_percent, 'iowait', 0.0)
+    cpu_usage = 100.0 - cpu_times_percent.idle - iowait
+
+    available_memory = psutil.virtual_memory().available
+
+    number_of_worker_processes_to_add, reason = (
+        self._worker_processes_scaler.GetScalingDecision(
+            number_of_worker_processes, tasks_status.number_of_queued_tasks,
+            used_memory_per_worker, cpu_usage, iowait, available_memory))
+
+    if number_of_worker_processes_to_add > 0:
+      process = self._StartWorkerProcess('', self._storage_writer)
+      if process:
+        logger.info('Added worker process: {0:s} because of: {1:s}.'.format(
+            process.name, reason))
+        self._task_manager.SampleWorkerProcessStatus(
+            process.name, 'added: {0:s}'.format(reason))
+
+    elif number_of_worker_processes_to_add < 0:
+      # Retire the worker process with the highest PID, which typically is
+      # the most recently started one.
+      pid = max(
+          pid for pid in self._process_information_per_pid
+          if pid not in self._retiring_worker_pids)
+      process = self._processes_per_pid[pid]
+      process.SignalRetire()
+
+      self._retiring_worker_pids.add(pid)
+
+      logger.info('Retiring worker process: {0:s} because of: {1:s}.'.format(
+          process.name, reason))
+      self._task_manager.SampleWorkerProcessStatus(
+          process.name, 'retiring: {0:s}'.format(reason))
+
   def _StatusUpdateThreadMain(self):
     """Main function of the status update thread."""
     while self._status_update_active:
       # Make a local copy of the PIDs in case the dict is changed by
       # the main thread.
       for pid in list(self._process_information_per_pid.keys()):
+        # A retiring worker process is not replaced when it stops.
+        if pid in self._retiring_worker_pids:
+          process = self._processes_per_pid[pid]
+          if not process.is_alive():
+            self._StopMonitoringProcess(process)
+            del self._processes_per_pid[pid]
+
+            self._retiring_worker_pids.remove(pid)
+            self._task_manager.SampleWorkerProcessStatus(
+                process.name, 'retired')
+          continue
+
         self._CheckStatusWorkerProcess(pid)
 
       self._UpdateForemanProcessStatus()
@@ -567,6 +1126,9 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
       if self._task_queue_profiler:
         self._task_queue_profiler.Sample(tasks_status)
 
+      if self._worker_processes_scaler:
+        self._ScaleWorkerProcesses(tasks_status)
+
       self._processing_status.UpdateTasksStatus(tasks_status)
 
       if self._status_update_callback:
@@ -716,8 +1278,8 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
   def ProcessSources(
       self, session_identifier, source_path_specs, storage_writer,
       processing_configuration, enable_sigsegv_handler=False,
-      number_of_worker_processes=0, status_update_callback=None,
-      worker_memory_limit=None):
+      maximum_number_of_worker_processes=0, number_of_worker_processes=0,
+      status_update_callback=None, worker_memory_limit=None):
     """Processes the sources and extract events.
 
     Args:
@@ -729,7 +1291,12 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
           configuration.
       enable_sigsegv_handler (Optional[bool]): True if the SIGSEGV handler
           should be enabled.
-      number_of_worker_processes (Optional[int]): number of worker processes.
+      maximum_number_of_worker_processes (Optional[int]): maximum number of
+          worker processes, where 0 represents that the number of worker
+          processes is not scaled based on the resource usage.
+      number_of_worker_processes (Optional[int]): number of worker processes,
+          which is the minimum number of worker processes when they are
+          scaled.
       status_update_callback (Optional[function]): callback function for status
           updates.
       worker_memory_limit (Optional[int]): maximum amount of memory a worker is
@@ -767,6 +1334,16 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
     self._enable_sigsegv_handler = enable_sigsegv_handler
     self._number_of_worker_processes = number_of_worker_processes
 
+    if maximum_number_of_worker_processes > number_of_worker_processes:
+      self._worker_processes_scaler = _WorkerProcessesScaler(
+          number_of_worker_processes, maximum_number_of_worker_processes,
+          multiprocessing.cpu_count())
+
+      # The first measurement of the CPU times is used as the reference for
+      # the measurements taken when scaling the worker processes.
+      psutil.cpu_times_percent(interval=None)
+      self._last_worker_processes_scaling_time = time.time()
+
     if worker_memory_limit is None:
       self._worker_memory_limit = definitions.DEFAULT_WORKER_MEMORY_LIMIT
     else:
@@ -781,6 +1358,12 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
     self._status_update_callback = status_update_callback
     self._storage_writer = storage_writer
 
+    if processing_configuration.path_spec_cache_directory:
+      cache = path_spec_cache.PathSpecCache(
+          processing_configuration.path_spec_cache_directory)
+      self._path_spec_extractor = extractors.PathSpecExtractor(
+          path_spec_cache=cache)
+
     # Set up the task queue.
     task_outbound_queue = zeromq_queue.ZeroMQBufferedReplyBindQueue(
         delay_open=True, linger_seconds=0, maximum_items=1,
@@ -794,6 +1377,27 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
     self._task_queue.Open()
     self._task_queue_port = self._task_queue.port
 
+    # Set up the task completion queue, on which the worker processes announce
+    # the identifiers of the tasks they completed. Note that the queue is
+    # polled without blocking by the task scheduling loop.
+    self._task_completion_queue = zeromq_queue.ZeroMQPullBindQueue(
+        delay_open=True, linger_seconds=0, name='main_task_completion_queue',
+        timeout_seconds=0)
+    self._task_completion_queue.Open()
+    self._task_completion_queue_port = self._task_completion_queue.port
+    self._last_processed_tasks_scan_time = 0.0
+
+    # Set up the status queue, on which the worker processes publish their
+    # status. Note that the queue is polled without blocking by the status
+    # update thread.
+    if (self._processing_configuration.status_transport ==
+        definitions.STATUS_TRANSPORT_ZEROMQ):
+      self._status_queue = zeromq_queue.ZeroMQPullBindQueue(
+          delay_open=True, linger_seconds=0, name='main_status_queue',
+          timeout_seconds=0)
+      self._status_queue.Open()
+      self._status_queue_port = self._status_queue.port
+
     self._StartProfiling(self._processing_configuration.profiling)
     self._task_manager.StartProfiling(
         self._processing_configuration.profiling, self._name)
@@ -807,6 +1411,15 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
     # Set up the storage writer before the worker processes.
     storage_writer.StartTaskStorage()
 
+    # Create the shared chunk cache just before the worker processes that open
+    # it, so that a failure earlier in the set up does not leave it behind.
+    shared_chunk_cache_size = getattr(
+        processing_configuration, 'shared_chunk_cache_size', 0)
+    if shared_chunk_cache_size:
+      self._chunk_cache = self._CreateSharedChunkCache(
+          shared_chunk_cache_size,
+          temporary_directory=processing_configuration.temporary_directory)
+
     for worker_number in range(number_of_worker_processes):
       # First argument to _StartWorkerProcess is not used.
       extraction_process = self._StartWorkerProcess('', storage_writer)
@@ -816,51 +1429,67 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
 
     self._StartStatusUpdateThread()
 
+    # The shared chunk cache contains decompressed data of the storage media
+    # image, hence it is removed regardless of how processing ends.
     try:
-      # Open the storage file after creating the worker processes otherwise
-      # the ZIP storage file will remain locked as long as the worker processes
-      # are alive.
-      storage_writer.Open()
-      storage_writer.WriteSessionStart()
-
       try:
-        storage_writer.WritePreprocessingInformation(self.knowledge_base)
+        # Open the storage file after creating the worker processes otherwise
+        # the ZIP storage file will remain locked as long as the worker
+        # processes are alive.
+        storage_writer.Open()
+        storage_writer.WriteSessionStart()
+
+        try:
+          storage_writer.WritePreprocessingInformation(self.knowledge_base)
 
-        self._ProcessSources(source_path_specs, storage_writer)
+          self._ProcessSources(source_path_specs, storage_writer)
+
+        finally:
+          storage_writer.WriteSessionCompletion(aborted=self._abort)
+
+          storage_writer.Close()
 
       finally:
-        storage_writer.WriteSessionCompletion(aborted=self._abort)
+        # Stop the status update thread after close of the storage writer
+        # so we include the storage sync to disk in the status updates.
+        self._StopStatusUpdateThread()
 
-        storage_writer.Close()
+        if self._serializers_profiler:
+          storage_writer.SetSerializersProfiler(None)
 
-    finally:
-      # Stop the status update thread after close of the storage writer
-      # so we include the storage sync to disk in the status updates.
-      self._StopStatusUpdateThread()
+        if self._storage_profiler:
+          storage_writer.SetStorageProfiler(None)
 
-      if self._serializers_profiler:
-        storage_writer.SetSerializersProfiler(None)
+        self._task_manager.StopProfiling()
+        self._StopProfiling()
 
-      if self._storage_profiler:
-        storage_writer.SetStorageProfiler(None)
+      try:
+        self._StopExtractionProcesses(abort=self._abort)
 
-      self._task_manager.StopProfiling()
-      self._StopProfiling()
+      except KeyboardInterrupt:
+        self._AbortKill()
 
-    try:
-      self._StopExtractionProcesses(abort=self._abort)
+        # The process is killed below, hence the finally clause is not run.
+        if self._chunk_cache:
+          self._RemoveSharedChunkCache()
 
-    except KeyboardInterrupt:
-      self._AbortKill()
+        # The abort can leave the main process unresponsive
+        # due to incorrectly finalized IPC.
+        self._KillProcess(os.getpid())
 
-      # The abort can leave the main process unresponsive
-      # due to incorrectly finalized IPC.
-      self._KillProcess(os.getpid())
+    finally:
+      if self._chunk_cache:
+        self._RemoveSharedChunkCache()
 
     # The task queue should be closed by _StopExtractionProcesses, this
     # close is a failsafe.
     self._task_queue.Close(abort=True)
 
+    self._task_completion_queue.Close(abort=True)
+
+    if self._status_queue:
+      self._status_queue.Close(abort=True)
+
     if self._processing_status.error_path_specs:
       task_storage_abort = True
     else:
@@ -881,12 +1510,21 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
     # Reset values.
     self._enable_sigsegv_handler = None
     self._number_of_worker_processes = None
+    self._retiring_worker_pids = set()
+    self._worker_processes_scaler = None
     self._worker_memory_limit = definitions.DEFAULT_WORKER_MEMORY_LIMIT
 
     self._processing_configuration = None
+    self._processing_time_per_task = {}
 
+    self._scanned_task_identifiers = set()
     self._session_identifier = None
+    self._status_per_pid = {}
+    self._status_queue = None
+    self._status_queue_port = None
     self._status_update_callback = None
     self._storage_writer = None
+    self._task_completion_queue = None
+    self._task_completion_queue_port = None
 
     return self._processing_status
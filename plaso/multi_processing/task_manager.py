@@ -524,6 +524,16 @@ class TaskManager(object):
     if self._tasks_profiler:
       self._tasks_profiler.Sample(task, status)
 
+  def SampleWorkerProcessStatus(self, process_name, status):
+    """Takes a sample of the status of a worker process for profiling.
+
+    Args:
+      process_name (str): name of the worker process.
+      status (str): status.
+    """
+    if self._tasks_profiler:
+      self._tasks_profiler.SampleWorkerProcess(process_name, status)
+
   def StartProfiling(self, configuration, identifier):
     """Starts profiling.
 
@@ -3,16 +3,22 @@
 
 from __future__ import unicode_literals
 
+import multiprocessing
+import time
+
 from dfvfs.lib import errors as dfvfs_errors
 from dfvfs.resolver import context
 from dfvfs.resolver import resolver
 
+import zmq
+
 from plaso.engine import plaso_queue
 from plaso.engine import worker
 from plaso.lib import definitions
 from plaso.lib import errors
 from plaso.multi_processing import base_process
 from plaso.multi_processing import logger
+from plaso.parsers import dtfabric_cache
 from plaso.parsers import mediator as parsers_mediator
 
 
@@ -21,7 +27,8 @@ class WorkerProcess(base_process.MultiProcessBaseProcess):
 
   def __init__(
       self, task_queue, storage_writer, collection_filters_helper,
-      knowledge_base, session_identifier, processing_configuration, **kwargs):
+      knowledge_base, session_identifier, processing_configuration,
+      chunk_cache=None, task_completion_queue=None, **kwargs):
     """Initializes a worker process.
 
     Non-specified keyword arguments (kwargs) are directly passed to
@@ -37,10 +44,16 @@ class WorkerProcess(base_process.MultiProcessBaseProcess):
       session_identifier (str): identifier of the session.
       processing_configuration (ProcessingConfiguration): processing
           configuration.
+      chunk_cache (Optional[SharedChunkCache]): cache of decompressed chunks
+          of compressed storage media images, that is shared by the worker
+          processes.
+      task_completion_queue (Optional[PlasoQueue]): queue on which the
+          identifiers of completed tasks are announced.
       kwargs: keyword arguments to pass to multiprocessing.Process.
     """
     super(WorkerProcess, self).__init__(processing_configuration, **kwargs)
     self._abort = False
+    self._chunk_cache = chunk_cache
     self._collection_filters_helper = collection_filters_helper
     self._buffer_size = 0
     self._current_display_name = ''
@@ -49,12 +62,34 @@ class WorkerProcess(base_process.MultiProcessBaseProcess):
     self._number_of_consumed_events = 0
     self._number_of_consumed_sources = 0
     self._parser_mediator = None
+    self._retire_event = multiprocessing.Event()
     self._session_identifier = session_identifier
     self._status = definitions.STATUS_INDICATOR_INITIALIZED
     self._storage_writer = storage_writer
     self._task = None
+    self._task_completion_queue = task_completion_queue
     self._task_queue = task_queue
 
+  def _AnnounceTaskCompletion(self, task, processing_time):
+    """Announces the completion of a task to the foreman.
+
+    Args:
+      task (Task): task.
+      processing_time (float): number of seconds it took to process the task.
+    """
+    if not self._task_completion_queue:
+      return
+
+    try:
+      self._task_completion_queue.PushItem(
+          (task.identifier, processing_time), block=False)
+    except (errors.QueueFull, zmq.error.ZMQError) as exception:
+      # The foreman periodically scans for processed tasks so the task is
+      # not lost.
+      logger.warning((
+          'Unable to announce completion of task: {0:s} with error: '
+          '{1!s}').format(task.identifier, exception))
+
   def _GetStatus(self):
     """Retrieves status information.
 
@@ -120,6 +155,17 @@ class WorkerProcess(base_process.MultiProcessBaseProcess):
     # issues with file objects stored in images.
     resolver_context = context.Context()
 
+    if self._chunk_cache:
+      try:
+        self._chunk_cache.Open()
+        self._chunk_cache.RegisterResolverHelper()
+
+      except (IOError, OSError) as exception:
+        logger.warning(
+            'Unable to open shared chunk cache with error: {0!s}'.format(
+                exception))
+        self._chunk_cache = None
+
     for credential_configuration in self._processing_configuration.credentials:
       resolver.Resolver.key_chain.SetCredential(
           credential_configuration.path_spec,
@@ -142,6 +188,9 @@ class WorkerProcess(base_process.MultiProcessBaseProcess):
     # We need to initialize the parser and hasher objects after the process
     # has forked otherwise on Windows the "fork" will fail with
     # a PickleError for Python modules that cannot be pickled.
+    dtfabric_cache.DtFabricCache.SetCacheDirectory(
+        self._processing_configuration.dtfabric_cache_directory)
+
     self._extraction_worker = worker.EventExtractionWorker(
         parser_filter_expression=(
             self._processing_configuration.parser_filter_expression))
@@ -173,6 +222,11 @@ class WorkerProcess(base_process.MultiProcessBaseProcess):
           self._name, self._pid))
 
       while not self._abort:
+        if self._retire_event.is_set():
+          logger.debug('{0!s} (PID: {1:d}) retiring.'.format(
+              self._name, self._pid))
+          break
+
         try:
           task = self._task_queue.PopItem()
         except (errors.QueueClose, errors.QueueEmpty) as exception:
@@ -211,6 +265,10 @@ class WorkerProcess(base_process.MultiProcessBaseProcess):
     self._StopProfiling()
     self._parser_mediator.StopProfiling()
 
+    if self._chunk_cache:
+      self._chunk_cache.DeregisterResolverHelper()
+      self._chunk_cache.Close()
+
     self._extraction_worker = None
     self._parser_mediator = None
     self._storage_writer = None
@@ -228,6 +286,17 @@ class WorkerProcess(base_process.MultiProcessBaseProcess):
     except errors.QueueAlreadyClosed:
       logger.error('Queue for {0:s} was already closed.'.format(self.name))
 
+    if self._task_completion_queue:
+      try:
+        self._task_completion_queue.Close(abort=self._abort)
+      except errors.QueueAlreadyClosed:
+        logger.error(
+            'Task completion queue for {0:s} was already closed.'.format(
+                self.name))
+      except RuntimeError:
+        # The queue was not opened since no task was completed.
+        pass
+
   def _ProcessPathSpec(self, extraction_worker, parser_mediator, path_spec):
     """Processes a path specification.
 
@@ -279,6 +348,8 @@ class WorkerProcess(base_process.MultiProcessBaseProcess):
 
     self._task = task
 
+    processing_start_time = time.time()
+
     task_storage_writer = self._storage_writer.CreateTaskStorage(
         task, self._processing_configuration.task_storage_format)
 
@@ -291,13 +362,38 @@ class WorkerProcess(base_process.MultiProcessBaseProcess):
 
     task_storage_writer.WriteTaskStart()
 
+    # The file system of grouped path specifications is kept open for
+    # the duration of the task, since otherwise it is closed and opened,
+    # including its storage media image, for every path specification.
+    file_system = None
+    if task.grouped_path_specs:
+      try:
+        file_system = resolver.Resolver.OpenFileSystem(
+            task.path_spec,
+            resolver_context=self._parser_mediator.resolver_context)
+      except (
+          dfvfs_errors.AccessError, dfvfs_errors.BackEndError,
+          dfvfs_errors.PathSpecError):
+        pass
+
     try:
       # TODO: add support for more task types.
       self._ProcessPathSpec(
           self._extraction_worker, self._parser_mediator, task.path_spec)
       self._number_of_consumed_sources += 1
 
+      for path_spec in task.grouped_path_specs or []:
+        if self._abort:
+          break
+
+        self._ProcessPathSpec(
+            self._extraction_worker, self._parser_mediator, path_spec)
+        self._number_of_consumed_sources += 1
+
     finally:
+      if file_system:
+        file_system.Close()
+
       task_storage_writer.WriteTaskCompletion(aborted=self._abort)
 
       self._parser_mediator.SetStorageWriter(None)
@@ -309,6 +405,10 @@ class WorkerProcess(base_process.MultiProcessBaseProcess):
     except IOError:
       pass
 
+    else:
+      processing_time = time.time() - processing_start_time
+      self._AnnounceTaskCompletion(task, processing_time)
+
     self._task = None
 
     if self._tasks_profiler:
@@ -323,3 +423,11 @@ class WorkerProcess(base_process.MultiProcessBaseProcess):
       self._extraction_worker.SignalAbort()
     if self._parser_mediator:
       self._parser_mediator.SignalAbort()
+
+  def SignalRetire(self):
+    """Signals the process to stop after processing the current task.
+
+    Retirement takes effect before the process requests its next task and is
+    therefore not delayed by the tasks already waiting in the task queue.
+    """
+    self._retire_event.set()
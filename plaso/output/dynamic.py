@@ -3,10 +3,7 @@
 
 from __future__ import unicode_literals
 
-from dfdatetime import posix_time as dfdatetime_posix_time
-
 from plaso.lib import errors
-from plaso.lib import timelib
 from plaso.output import interface
 from plaso.output import logger
 from plaso.output import manager
@@ -63,12 +60,10 @@ class DynamicFieldsHelper(object):
     Returns:
       str: date field.
     """
-    # TODO: preserve dfdatetime as an object.
-    # TODO: add support for self._output_mediator.timezone
-    date_time = dfdatetime_posix_time.PosixTimeInMicroseconds(
-        timestamp=event.timestamp)
+    formatting_context = self._output_mediator.GetFormattingContext(
+        event, event_data)
 
-    year, month, day_of_month = date_time.GetDate()
+    year, month, day_of_month = formatting_context.GetDate()
     try:
       return '{0:04d}-{1:02d}-{2:02d}'.format(year, month, day_of_month)
     except (TypeError, ValueError):
@@ -88,10 +83,11 @@ class DynamicFieldsHelper(object):
     Returns:
       str: date and time field.
     """
+    formatting_context = self._output_mediator.GetFormattingContext(
+        event, event_data)
+
     try:
-      return timelib.Timestamp.CopyToIsoFormat(
-          event.timestamp, timezone=self._output_mediator.timezone,
-          raise_error=True)
+      return formatting_context.GetISODateTime()
 
     except (OverflowError, ValueError) as exception:
       self._ReportEventError(event, event_data, (
@@ -111,7 +107,9 @@ class DynamicFieldsHelper(object):
     Returns:
       str: hostname field.
     """
-    return self._output_mediator.GetHostname(event_data)
+    formatting_context = self._output_mediator.GetFormattingContext(
+        event, event_data)
+    return formatting_context.GetHostname()
 
   def _FormatInode(self, event, event_data):
     """Formats the inode.
@@ -143,7 +141,9 @@ class DynamicFieldsHelper(object):
     Returns:
       str: MACB field.
     """
-    return self._output_mediator.GetMACBRepresentation(event, event_data)
+    formatting_context = self._output_mediator.GetFormattingContext(
+        event, event_data)
+    return formatting_context.GetMACBRepresentation()
 
   def _FormatMessage(self, event, event_data):
     """Formats the message.
@@ -159,7 +159,10 @@ class DynamicFieldsHelper(object):
       NoFormatterFound: if no event formatter can be found to match the data
           type in the event data.
     """
-    message, _ = self._output_mediator.GetFormattedMessages(event_data)
+    formatting_context = self._output_mediator.GetFormattingContext(
+        event, event_data)
+
+    message, _ = formatting_context.GetFormattedMessages()
     if message is None:
       data_type = getattr(event_data, 'data_type', 'UNKNOWN')
       raise errors.NoFormatterFound(
@@ -182,7 +185,10 @@ class DynamicFieldsHelper(object):
       NoFormatterFound: if no event formatter can be found to match the data
           type in the event data.
     """
-    _, message_short = self._output_mediator.GetFormattedMessages(event_data)
+    formatting_context = self._output_mediator.GetFormattingContext(
+        event, event_data)
+
+    _, message_short = formatting_context.GetFormattedMessages()
     if message_short is None:
       data_type = getattr(event_data, 'data_type', 'UNKNOWN')
       raise errors.NoFormatterFound(
@@ -205,7 +211,10 @@ class DynamicFieldsHelper(object):
       NoFormatterFound: if no event formatter can be found to match the data
           type in the event data.
     """
-    _, source = self._output_mediator.GetFormattedSources(event, event_data)
+    formatting_context = self._output_mediator.GetFormattingContext(
+        event, event_data)
+
+    _, source = formatting_context.GetFormattedSources()
     if source is None:
       data_type = getattr(event_data, 'data_type', 'UNKNOWN')
       raise errors.NoFormatterFound(
@@ -228,8 +237,10 @@ class DynamicFieldsHelper(object):
       NoFormatterFound: If no event formatter can be found to match the data
           type in the event data.
     """
-    source_short, _ = self._output_mediator.GetFormattedSources(
+    formatting_context = self._output_mediator.GetFormattingContext(
         event, event_data)
+
+    source_short, _ = formatting_context.GetFormattedSources()
     if source_short is None:
       data_type = getattr(event_data, 'data_type', 'UNKNOWN')
       raise errors.NoFormatterFound(
@@ -262,13 +273,11 @@ class DynamicFieldsHelper(object):
     Returns:
       str: time field.
     """
-    # TODO: preserve dfdatetime as an object.
-    # TODO: add support for self._output_mediator.timezone
-    date_time = dfdatetime_posix_time.PosixTimeInMicroseconds(
-        timestamp=event.timestamp)
+    formatting_context = self._output_mediator.GetFormattingContext(
+        event, event_data)
 
-    year, month, day_of_month = date_time.GetDate()
-    hours, minutes, seconds = date_time.GetTimeOfDay()
+    year, month, day_of_month = formatting_context.GetDate()
+    hours, minutes, seconds = formatting_context.GetTimeOfDay()
     try:
       # Ensure that the date is valid.
       _ = '{0:04d}-{1:02d}-{2:02d}'.format(year, month, day_of_month)
@@ -302,7 +311,9 @@ class DynamicFieldsHelper(object):
     Returns:
       str: username field.
     """
-    return self._output_mediator.GetUsername(event_data)
+    formatting_context = self._output_mediator.GetFormattingContext(
+        event, event_data)
+    return formatting_context.GetUsername()
 
   def _FormatZone(self, event, event_data):
     """Formats the time zone.
@@ -15,6 +15,10 @@ class OutputModule(object):
   NAME = ''
   DESCRIPTION = ''
 
+  # True if the output module can write events using the serialized form of
+  # the event data, as read from storage.
+  SUPPORTS_SERIALIZED_EVENT_DATA = False
+
   def __init__(self, output_mediator):
     """Initializes an output module.
 
@@ -132,6 +136,22 @@ class OutputModule(object):
     """
     return
 
+  def WriteSerializedEvent(
+      self, event, event_data, event_tag, event_data_json_dict):
+    """Writes the event, with serialized event data, to the output.
+
+    If not overridden this function will write the event without using
+    the serialized event data.
+
+    Args:
+      event (EventObject): event.
+      event_data (EventData): event data.
+      event_tag (EventTag): event tag.
+      event_data_json_dict (dict[str, object]): JSON serialized event data,
+          as read from storage.
+    """
+    self.WriteEvent(event, event_data, event_tag)
+
   def WriteFooter(self):
     """Writes the footer to the output.
 
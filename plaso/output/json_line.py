@@ -17,6 +17,8 @@ class JSONLineOutputModule(shared_json.SharedJSONOutputModule):
   NAME = 'json_line'
   DESCRIPTION = 'Saves the events into a JSON line format.'
 
+  SUPPORTS_SERIALIZED_EVENT_DATA = True
+
   def WriteEventBody(self, event, event_data, event_tag):
     """Writes event values to the output.
 
@@ -30,5 +32,26 @@ class JSONLineOutputModule(shared_json.SharedJSONOutputModule):
     self._output_writer.Write(json_string)
     self._output_writer.Write('\n')
 
+  def WriteSerializedEvent(
+      self, event, event_data, event_tag, event_data_json_dict):
+    """Writes the event, with serialized event data, to the output.
+
+    The serialized event data is merged with the event instead of serializing
+    the event data again.
+
+    Args:
+      event (EventObject): event.
+      event_data (EventData): event data.
+      event_tag (EventTag): event tag.
+      event_data_json_dict (dict[str, object]): JSON serialized event data,
+          as read from storage.
+    """
+    json_string = self._WriteSerialized(
+        event, event_data, event_tag,
+        event_data_json_dict=event_data_json_dict)
+
+    self._output_writer.Write(json_string)
+    self._output_writer.Write('\n')
+
 
 manager.OutputManager.RegisterOutput(JSONLineOutputModule)
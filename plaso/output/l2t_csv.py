@@ -7,8 +7,6 @@ http://forensicswiki.org/wiki/L2T_CSV
 
 from __future__ import unicode_literals
 
-from dfdatetime import posix_time as dfdatetime_posix_time
-
 from plaso.formatters import manager as formatters_manager
 from plaso.lib import errors
 from plaso.output import interface
@@ -104,25 +102,19 @@ class L2TCSVOutputModule(interface.LinearOutputModule):
 
     data_type = getattr(event_data, 'data_type', 'UNKNOWN')
 
-    # TODO: add function to pass event_values to GetFormattedMessages.
-    message, message_short = self._output_mediator.GetFormattedMessages(
-        event_data)
+    formatting_context = self._output_mediator.GetFormattingContext(
+        event, event_data)
+
+    message, message_short = formatting_context.GetFormattedMessages()
     if message is None or message_short is None:
       raise errors.NoFormatterFound(
           'Unable to find event formatter for: {0:s}.'.format(data_type))
 
-    # TODO: add function to pass event_values to GetFormattedSources.
-    source_short, source = self._output_mediator.GetFormattedSources(
-        event, event_data)
+    source_short, source = formatting_context.GetFormattedSources()
     if source is None or source_short is None:
       raise errors.NoFormatterFound(
           'Unable to find event formatter for: {0:s}.'.format(data_type))
 
-    # TODO: preserve dfdatetime as an object.
-    # TODO: add support for self._output_mediator.timezone
-    date_time = dfdatetime_posix_time.PosixTimeInMicroseconds(
-        timestamp=event.timestamp)
-
     unformatted_attributes = (
         formatters_manager.FormattersManager.GetUnformattedAttributes(
             event_data))
@@ -151,16 +143,16 @@ class L2TCSVOutputModule(interface.LinearOutputModule):
     extra_attributes = extra_attributes.replace('\n', '-').replace('\r', '')
 
     inode = self._FormatInode(event_data)
-    hostname = self._FormatHostname(event_data)
-    username = self._FormatUsername(event_data)
+    hostname = self._FormatField(formatting_context.GetHostname())
+    username = self._FormatField(formatting_context.GetUsername())
 
     if event_tag:
       notes = ' '.join(event_tag.labels) or '-'
     else:
       notes = '-'
 
-    year, month, day_of_month = date_time.GetDate()
-    hours, minutes, seconds = date_time.GetTimeOfDay()
+    year, month, day_of_month = formatting_context.GetDate()
+    hours, minutes, seconds = formatting_context.GetTimeOfDay()
     try:
       date_string = '{0:02d}/{1:02d}/{2:04d}'.format(month, day_of_month, year)
       time_string = '{0:02d}:{1:02d}:{2:02d}'.format(hours, minutes, seconds)
@@ -222,8 +214,10 @@ class L2TCSVOutputModule(interface.LinearOutputModule):
     """
     output_values = self._GetOutputValues(event, event_data, event_tag)
 
-    output_values[3] = self._output_mediator.GetMACBRepresentation(
+    formatting_context = self._output_mediator.GetFormattingContext(
         event, event_data)
+
+    output_values[3] = formatting_context.GetMACBRepresentation()
     output_values[6] = event.timestamp_desc or '-'
 
     self._WriteOutputValues(output_values)
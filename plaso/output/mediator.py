@@ -3,12 +3,409 @@
 
 from __future__ import unicode_literals
 
+import bisect
+import datetime
+
+from dfdatetime import posix_time as dfdatetime_posix_time
+
 from plaso.formatters import manager as formatters_manager
 from plaso.lib import definitions
+from plaso.lib import timelib
 
 import pytz  # pylint: disable=wrong-import-order
 
 
+class DateTimeRenderingCache(object):
+  """Date and time rendering cache.
+
+  Timelines are sorted by timestamp, so consecutive events are likely to
+  have timestamps within the same second. The cache keeps the date and time
+  values of the most recently rendered second, so that rendering another
+  timestamp in that second only requires the sub-second digits to be added.
+
+  The UTC offset transitions of the time zone are read once into a table,
+  so that determining the UTC offset of a timestamp requires a bisect instead
+  of a time zone conversion per timestamp.
+  """
+
+  _EPOCH = datetime.datetime(1970, 1, 1)
+
+  _MAXIMUM_TIMESTAMP = (
+      ((datetime.datetime.max - _EPOCH).days * 86400) + 86400) * 1000000 - 1
+
+  _MINIMUM_TIMESTAMP = (datetime.datetime.min - _EPOCH).days * 86400 * 1000000
+
+  def __init__(self, timezone=pytz.UTC):
+    """Initializes a date and time rendering cache.
+
+    Args:
+      timezone (Optional[pytz.timezone]): time zone to render ISO 8601 date
+          and time values in.
+    """
+    super(DateTimeRenderingCache, self).__init__()
+    self._date = None
+    self._iso_date_time_prefix = None
+    self._iso_local_seconds = None
+    self._iso_utc_offset = None
+    self._posix_seconds = None
+    self._time_of_day = None
+    self._timezone = timezone
+    self._transition_times = []
+    self._utc_offset_strings = {}
+    self._utc_offsets = None
+
+    self._ReadUTCOffsetTransitions()
+
+  def _GetUTCOffsetString(self, utc_offset):
+    """Retrieves the string representation of an UTC offset.
+
+    Args:
+      utc_offset (int): UTC offset in number of seconds.
+
+    Returns:
+      str: UTC offset formatted as in ISO 8601, such as "+01:00".
+    """
+    utc_offset_string = self._utc_offset_strings.get(utc_offset, None)
+    if utc_offset_string is None:
+      if utc_offset < 0:
+        sign = '-'
+      else:
+        sign = '+'
+
+      minutes, seconds = divmod(abs(utc_offset), 60)
+      hours, minutes = divmod(minutes, 60)
+
+      utc_offset_string = '{0:s}{1:02d}:{2:02d}'.format(sign, hours, minutes)
+      if seconds:
+        utc_offset_string = '{0:s}:{1:02d}'.format(utc_offset_string, seconds)
+
+      self._utc_offset_strings[utc_offset] = utc_offset_string
+
+    return utc_offset_string
+
+  def _ReadUTCOffsetTransitions(self):
+    """Reads the UTC offset transitions of the time zone.
+
+    The UTC offset transitions are stored as a list of timestamps, that
+    contain the number of microseconds since January 1, 1970, 00:00:00 UTC,
+    and a corresponding list of UTC offsets in number of seconds. If the
+    transitions cannot be determined the UTC offsets are set to None.
+    """
+    utc_transition_times = getattr(
+        self._timezone, '_utc_transition_times', None)
+    transition_info = getattr(self._timezone, '_transition_info', None)
+
+    if utc_transition_times and transition_info:
+      for utc_transition_time in utc_transition_times:
+        time_delta = utc_transition_time - self._EPOCH
+        self._transition_times.append((
+            (time_delta.days * 86400) + time_delta.seconds) * 1000000 +
+                                      time_delta.microseconds)
+
+      self._utc_offsets = [
+          int(utc_offset.total_seconds())
+          for utc_offset, _, _ in transition_info]
+
+    else:
+      # Time zones without transitions, such as UTC, have a fixed UTC offset.
+      utc_offset = self._timezone.utcoffset(None)
+      if utc_offset is not None:
+        self._utc_offsets = [int(utc_offset.total_seconds())]
+
+  def _UpdateDateAndTimeOfDay(self, timestamp):
+    """Updates the cached date and time of day if necessary.
+
+    Args:
+      timestamp (int): timestamp containing the number of microseconds since
+          January 1, 1970, 00:00:00 UTC.
+    """
+    # Note that dfdatetime truncates negative timestamps towards zero.
+    if timestamp < 0:
+      posix_seconds = -(-timestamp // 1000000)
+    else:
+      posix_seconds = timestamp // 1000000
+
+    if posix_seconds != self._posix_seconds:
+      date_time = dfdatetime_posix_time.PosixTimeInMicroseconds(
+          timestamp=posix_seconds * 1000000)
+      self._date = date_time.GetDate()
+      self._time_of_day = date_time.GetTimeOfDay()
+      self._posix_seconds = posix_seconds
+
+  def GetDate(self, timestamp):
+    """Retrieves the date of a timestamp in UTC.
+
+    Args:
+      timestamp (int): timestamp containing the number of microseconds since
+          January 1, 1970, 00:00:00 UTC.
+
+    Returns:
+      tuple[int, int, int]: year, month and day of month or (None, None, None)
+          if the date cannot be determined.
+    """
+    if not isinstance(timestamp, int):
+      date_time = dfdatetime_posix_time.PosixTimeInMicroseconds(
+          timestamp=timestamp)
+      return date_time.GetDate()
+
+    self._UpdateDateAndTimeOfDay(timestamp)
+    return self._date
+
+  def GetISODateTime(self, timestamp):
+    """Retrieves the date and time of a timestamp in ISO 8601 format.
+
+    The date and time is represented in the time zone of the cache.
+
+    Args:
+      timestamp (int): timestamp containing the number of microseconds since
+          January 1, 1970, 00:00:00 UTC.
+
+    Returns:
+      str: date and time formatted in ISO 8601.
+
+    Raises:
+      OverflowError: if the timestamp value is out of bounds.
+      ValueError: if the timestamp value is missing.
+    """
+    if not timestamp:
+      raise ValueError('Missing timestamp value')
+
+    if self._utc_offsets is None or not isinstance(timestamp, int):
+      return timelib.Timestamp.CopyToIsoFormat(
+          timestamp, timezone=self._timezone, raise_error=True)
+
+    if (timestamp < self._MINIMUM_TIMESTAMP or
+        timestamp > self._MAXIMUM_TIMESTAMP):
+      raise OverflowError('date value out of range')
+
+    index = bisect.bisect_right(self._transition_times, timestamp) - 1
+    utc_offset = self._utc_offsets[max(0, index)]
+
+    local_seconds, microseconds = divmod(timestamp, 1000000)
+    local_seconds += utc_offset
+
+    if (local_seconds != self._iso_local_seconds or
+        utc_offset != self._iso_utc_offset):
+      date_time = self._EPOCH + datetime.timedelta(seconds=local_seconds)
+
+      self._iso_date_time_prefix = (
+          '{0:04d}-{1:02d}-{2:02d}T{3:02d}:{4:02d}:{5:02d}').format(
+              date_time.year, date_time.month, date_time.day,
+              date_time.hour, date_time.minute, date_time.second)
+      self._iso_local_seconds = local_seconds
+      self._iso_utc_offset = utc_offset
+
+    utc_offset_string = self._GetUTCOffsetString(utc_offset)
+    if not microseconds:
+      return '{0:s}{1:s}'.format(self._iso_date_time_prefix, utc_offset_string)
+
+    return '{0:s}.{1:06d}{2:s}'.format(
+        self._iso_date_time_prefix, microseconds, utc_offset_string)
+
+  def GetPOSIXTimestamp(self, timestamp):
+    """Retrieves the POSIX timestamp of a timestamp.
+
+    Args:
+      timestamp (int): timestamp containing the number of microseconds since
+          January 1, 1970, 00:00:00 UTC.
+
+    Returns:
+      int: POSIX timestamp in seconds or None if the timestamp cannot be
+          determined.
+    """
+    if not isinstance(timestamp, int):
+      date_time = dfdatetime_posix_time.PosixTimeInMicroseconds(
+          timestamp=timestamp)
+      return date_time.CopyToPosixTimestamp()
+
+    self._UpdateDateAndTimeOfDay(timestamp)
+    return self._posix_seconds
+
+  def GetTimeOfDay(self, timestamp):
+    """Retrieves the time of day of a timestamp in UTC.
+
+    Args:
+      timestamp (int): timestamp containing the number of microseconds since
+          January 1, 1970, 00:00:00 UTC.
+
+    Returns:
+      tuple[int, int, int]: hours, minutes and seconds or (None, None, None)
+          if the time of day cannot be determined.
+    """
+    if not isinstance(timestamp, int):
+      date_time = dfdatetime_posix_time.PosixTimeInMicroseconds(
+          timestamp=timestamp)
+      return date_time.GetTimeOfDay()
+
+    self._UpdateDateAndTimeOfDay(timestamp)
+    return self._time_of_day
+
+
+class EventFormattingContext(object):
+  """Formatting context of an event.
+
+  The context is shared by the output field formatting functions so that
+  values derived from an event, such as the formatted messages, are
+  determined at most once per event. Values are determined the first time
+  they are requested.
+
+  Attributes:
+    event (EventObject): event.
+    event_data (EventData): event data.
+    timestamp (int): timestamp of the event at the time the context was
+        created.
+    timestamp_desc (str): timestamp description of the event at the time
+        the context was created.
+  """
+
+  def __init__(self, output_mediator, event, event_data):
+    """Initializes an event formatting context.
+
+    Args:
+      output_mediator (OutputMediator): output mediator.
+      event (EventObject): event.
+      event_data (EventData): event data.
+    """
+    super(EventFormattingContext, self).__init__()
+    self._date = None
+    self._hostname = None
+    self._iso_date_time = None
+    self._iso_date_time_error = None
+    self._macb_representation = None
+    self._messages = None
+    self._output_mediator = output_mediator
+    self._sources = None
+    self._time_of_day = None
+    self._username = None
+
+    self.event = event
+    self.event_data = event_data
+    self.timestamp = getattr(event, 'timestamp', None)
+    self.timestamp_desc = getattr(event, 'timestamp_desc', None)
+
+  def GetDate(self):
+    """Retrieves the date of the event.
+
+    Returns:
+      tuple[int, int, int]: year, month and day of month or (None, None, None)
+          if the date cannot be determined.
+    """
+    if self._date is None:
+      # TODO: add support for self._output_mediator.timezone
+      self._date = self._output_mediator.date_time_rendering_cache.GetDate(
+          self.event.timestamp)
+    return self._date
+
+  def GetFormattedMessages(self):
+    """Retrieves the formatted messages of the event.
+
+    Returns:
+      tuple: containing:
+
+        str: full message string or None if no event formatter was found.
+        str: short message string or None if no event formatter was found.
+    """
+    if self._messages is None:
+      self._messages = self._output_mediator.GetFormattedMessages(
+          self.event_data)
+    return self._messages
+
+  def GetFormattedSources(self):
+    """Retrieves the formatted sources of the event.
+
+    Returns:
+      tuple: containing:
+
+        str: short source string or None if no event formatter was found.
+        str: full source string or None if no event formatter was found.
+    """
+    if self._sources is None:
+      self._sources = self._output_mediator.GetFormattedSources(
+          self.event, self.event_data)
+    return self._sources
+
+  def GetHostname(self):
+    """Retrieves the hostname of the event.
+
+    Returns:
+      str: hostname.
+    """
+    if self._hostname is None:
+      self._hostname = self._output_mediator.GetHostname(self.event_data)
+    return self._hostname
+
+  def GetISODateTime(self):
+    """Retrieves the date and time of the event in ISO 8601 format.
+
+    The date and time is represented in the time zone of the output mediator.
+
+    Returns:
+      str: date and time formatted in ISO 8601.
+
+    Raises:
+      OverflowError: if the timestamp value is out of bounds.
+      ValueError: if the timestamp value is missing.
+    """
+    if self._iso_date_time is None and self._iso_date_time_error is None:
+      try:
+        self._iso_date_time = (
+            self._output_mediator.date_time_rendering_cache.GetISODateTime(
+                self.event.timestamp))
+      except (OverflowError, ValueError) as exception:
+        self._iso_date_time_error = exception
+
+    if self._iso_date_time_error is not None:
+      raise self._iso_date_time_error
+
+    return self._iso_date_time
+
+  def GetMACBRepresentation(self):
+    """Retrieves the MACB representation of the event.
+
+    Returns:
+      str: MACB representation.
+    """
+    if self._macb_representation is None:
+      self._macb_representation = (
+          self._output_mediator.GetMACBRepresentation(
+              self.event, self.event_data))
+    return self._macb_representation
+
+  def GetPOSIXTimestamp(self):
+    """Retrieves the POSIX timestamp of the event.
+
+    Returns:
+      int: POSIX timestamp in seconds or None if the timestamp cannot be
+          determined.
+    """
+    return self._output_mediator.date_time_rendering_cache.GetPOSIXTimestamp(
+        self.event.timestamp)
+
+  def GetTimeOfDay(self):
+    """Retrieves the time of day of the event.
+
+    Returns:
+      tuple[int, int, int]: hours, minutes and seconds or (None, None, None)
+          if the time of day cannot be determined.
+    """
+    if self._time_of_day is None:
+      # TODO: add support for self._output_mediator.timezone
+      self._time_of_day = (
+          self._output_mediator.date_time_rendering_cache.GetTimeOfDay(
+              self.event.timestamp))
+    return self._time_of_day
+
+  def GetUsername(self):
+    """Retrieves the username of the event.
+
+    Returns:
+      str: username.
+    """
+    if self._username is None:
+      self._username = self._output_mediator.GetUsername(self.event_data)
+    return self._username
+
+
 class OutputMediator(object):
   """Output mediator.
 
@@ -30,13 +427,20 @@ class OutputMediator(object):
       preferred_encoding (Optional[str]): preferred encoding to output.
     """
     super(OutputMediator, self).__init__()
+    self._date_time_rendering_cache = DateTimeRenderingCache()
     self._formatter_mediator = formatter_mediator
+    self._formatting_context = None
     self._knowledge_base = knowledge_base
     self._preferred_encoding = preferred_encoding
     self._timezone = pytz.UTC
 
     self.fields_filter = fields_filter
 
+  @property
+  def date_time_rendering_cache(self):
+    """DateTimeRenderingCache: date and time rendering cache."""
+    return self._date_time_rendering_cache
+
   @property
   def encoding(self):
     """str: preferred encoding."""
@@ -108,6 +512,31 @@ class OutputMediator(object):
 
     return event_formatter.GetSources(event, event_data)
 
+  def GetFormattingContext(self, event, event_data):
+    """Retrieves the formatting context of an event.
+
+    The formatting context of the most recently requested event is kept so
+    that it can be shared by all the fields of that event. A new context is
+    created when the timestamp of the event has changed.
+
+    Args:
+      event (EventObject): event.
+      event_data (EventData): event data.
+
+    Returns:
+      EventFormattingContext: formatting context of the event.
+    """
+    formatting_context = self._formatting_context
+    if (not formatting_context or formatting_context.event is not event or
+        formatting_context.event_data is not event_data or
+        formatting_context.timestamp != getattr(event, 'timestamp', None) or
+        formatting_context.timestamp_desc != getattr(
+            event, 'timestamp_desc', None)):
+      formatting_context = EventFormattingContext(self, event, event_data)
+      self._formatting_context = formatting_context
+
+    return formatting_context
+
   def GetHostname(self, event_data, default_hostname='-'):
     """Retrieves the hostname related to the event.
 
@@ -294,3 +723,9 @@ class OutputMediator(object):
       self._timezone = pytz.timezone(timezone)
     except pytz.UnknownTimeZoneError:
       raise ValueError('Unsupported timezone: {0:s}'.format(timezone))
+
+    # The date and time rendering cache and the formatting context depend on
+    # the timezone.
+    self._date_time_rendering_cache = DateTimeRenderingCache(
+        timezone=self._timezone)
+    self._formatting_context = None
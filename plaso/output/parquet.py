@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+"""Output module for the Apache Parquet format."""
+
+from __future__ import unicode_literals
+
+import os
+
+try:
+  import pyarrow
+  from pyarrow import parquet
+except ImportError:
+  pyarrow = None
+  parquet = None
+
+from plaso.lib import errors
+from plaso.output import interface
+from plaso.output import logger
+from plaso.output import manager
+
+
+class ParquetOutputModule(interface.OutputModule):
+  """Output module for the Apache Parquet format.
+
+  Events are written in batches, where every batch is stored as a row group.
+  The standard fields are stored in typed columns and the remaining event
+  data attributes are stored in a map column.
+  """
+
+  NAME = 'parquet'
+  DESCRIPTION = 'Apache Parquet columnar format.'
+
+  _DEFAULT_ROW_GROUP_SIZE = 65536
+
+  # Event data attributes that are stored in their own column or that are
+  # not written to the output.
+  _EXCLUDED_ATTRIBUTE_NAMES = frozenset([
+      'data_type',
+      'filename',
+      'parser',
+      'pathspec',
+      'timestamp',
+      'timestamp_desc'])
+
+  # Names of the columns for which min and max statistics are stored per row
+  # group.
+  _STATISTICS_COLUMN_NAMES = ['timestamp']
+
+  if pyarrow:
+    _SCHEMA = pyarrow.schema([
+        ('timestamp', pyarrow.int64()),
+        ('timestamp_desc', pyarrow.string()),
+        ('data_type', pyarrow.string()),
+        ('parser', pyarrow.string()),
+        ('filename', pyarrow.string()),
+        ('message', pyarrow.string()),
+        ('tag', pyarrow.list_(pyarrow.string())),
+        ('attributes', pyarrow.map_(pyarrow.string(), pyarrow.string()))])
+
+  def __init__(self, output_mediator):
+    """Initializes an output module.
+
+    Args:
+      output_mediator (OutputMediator): mediates interactions between output
+          modules and other components, such as storage and dfvfs.
+    """
+    super(ParquetOutputModule, self).__init__(output_mediator)
+    self._columns = None
+    self._filename = None
+    self._number_of_buffered_events = 0
+    self._number_of_row_groups = 0
+    self._parquet_writer = None
+    self._row_group_size = self._DEFAULT_ROW_GROUP_SIZE
+
+  def _FlushEvents(self):
+    """Writes the buffered events as a row group."""
+    if not self._number_of_buffered_events:
+      return
+
+    table = pyarrow.Table.from_pydict(self._columns, schema=self._SCHEMA)
+    self._parquet_writer.write_table(table)
+
+    self._number_of_row_groups += 1
+    self._ResetColumns()
+
+  def _GetAttributes(self, event_data):
+    """Retrieves the event data attributes stored in the map column.
+
+    Args:
+      event_data (EventData): event data.
+
+    Returns:
+      list[tuple[str, str]]: names and string values of the attributes,
+          sorted by name.
+    """
+    attributes = []
+    for attribute_name, attribute_value in sorted(event_data.GetAttributes()):
+      if (attribute_name in self._EXCLUDED_ATTRIBUTE_NAMES or
+          attribute_value is None):
+        continue
+
+      # Some parsers have written bytes values to storage.
+      if isinstance(attribute_value, bytes):
+        attribute_value = attribute_value.decode('utf-8', 'replace')
+        logger.warning(
+            'Found bytes value for attribute "{0:s}" for data type: '
+            '{1!s}. Value was converted to UTF-8: "{2:s}"'.format(
+                attribute_name, event_data.data_type, attribute_value))
+
+      attributes.append((attribute_name, '{0!s}'.format(attribute_value)))
+
+    return attributes
+
+  def _ResetColumns(self):
+    """Resets the buffered column values."""
+    self._columns = {field.name: [] for field in self._SCHEMA}
+    self._number_of_buffered_events = 0
+
+  def Close(self):
+    """Closes the output."""
+    if self._parquet_writer:
+      self._FlushEvents()
+      self._parquet_writer.close()
+      self._parquet_writer = None
+
+      logger.info('Parquet output written in {0:d} row groups.'.format(
+          self._number_of_row_groups))
+
+    self._columns = None
+
+  def Open(self):
+    """Opens the Parquet file.
+
+    Raises:
+      IOError: if the specified output file already exists.
+      OSError: if the specified output file already exists.
+      ValueError: if the filename is not set.
+    """
+    if not self._filename:
+      raise ValueError('Missing filename.')
+
+    if os.path.isfile(self._filename):
+      raise IOError((
+          'Unable to use an already existing file for output '
+          '[{0:s}]').format(self._filename))
+
+    self._parquet_writer = parquet.ParquetWriter(
+        self._filename, self._SCHEMA,
+        write_statistics=self._STATISTICS_COLUMN_NAMES)
+
+    self._number_of_row_groups = 0
+    self._ResetColumns()
+
+  def SetFilename(self, filename):
+    """Sets the filename.
+
+    Args:
+      filename (str): filename.
+    """
+    self._filename = filename
+
+  def SetRowGroupSize(self, row_group_size):
+    """Sets the number of events per row group.
+
+    Args:
+      row_group_size (int): number of events per row group.
+    """
+    self._row_group_size = row_group_size
+
+  def WriteEventBody(self, event, event_data, event_tag):
+    """Writes event values to the output.
+
+    Args:
+      event (EventObject): event.
+      event_data (EventData): event data.
+      event_tag (EventTag): event tag.
+
+    Raises:
+      NoFormatterFound: if no event formatter can be found to match the data
+          type in the event data.
+    """
+    formatting_context = self._output_mediator.GetFormattingContext(
+        event, event_data)
+
+    message, _ = formatting_context.GetFormattedMessages()
+    if message is None:
+      data_type = getattr(event_data, 'data_type', 'UNKNOWN')
+      raise errors.NoFormatterFound(
+          'Unable to create message for event with data type: {0:s}.'.format(
+              data_type))
+
+    labels = None
+    if event_tag:
+      labels = list(event_tag.labels)
+
+    self._columns['timestamp'].append(event.timestamp)
+    self._columns['timestamp_desc'].append(
+        getattr(event, 'timestamp_desc', None))
+    self._columns['data_type'].append(event_data.data_type)
+    self._columns['parser'].append(getattr(event_data, 'parser', None))
+    self._columns['filename'].append(getattr(event_data, 'filename', None))
+    self._columns['message'].append(message)
+    self._columns['tag'].append(labels)
+    self._columns['attributes'].append(self._GetAttributes(event_data))
+
+    self._number_of_buffered_events += 1
+    if self._number_of_buffered_events >= self._row_group_size:
+      self._FlushEvents()
+
+
+manager.OutputManager.RegisterOutput(
+    ParquetOutputModule, disabled=pyarrow is None)
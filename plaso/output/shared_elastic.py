@@ -3,8 +3,12 @@
 
 from __future__ import unicode_literals
 
+import collections
 import os
 import logging
+import queue
+import threading
+import time
 
 from dfvfs.serializer.json_serializer import JsonPathSpecSerializer
 
@@ -35,9 +39,21 @@ class SharedElasticsearchOutputModule(interface.OutputModule):
 
   _DEFAULT_FLUSH_INTERVAL = 1000
 
+  # Number of bulk requests that are sent to Elasticsearch concurrently.
+  _DEFAULT_NUMBER_OF_CONCURRENT_REQUESTS = 4
+
   # Number of seconds to wait before a request to Elasticsearch is timed out.
   _DEFAULT_REQUEST_TIMEOUT = 300
 
+  # Maximum number of times a bulk request, or the part of it that was
+  # rejected, is retried when Elasticsearch is too busy (HTTP status 429).
+  _MAXIMUM_NUMBER_OF_RETRIES = 5
+
+  # Number of seconds to wait before the first retry, which doubles with
+  # every next retry up to the maximum.
+  _RETRY_INITIAL_DELAY = 1.0
+  _RETRY_MAXIMUM_DELAY = 30.0
+
   def __init__(self, output_mediator):
     """Initializes an Elasticsearch output module.
 
@@ -46,6 +62,7 @@ class SharedElasticsearchOutputModule(interface.OutputModule):
           modules and other components, such as storage and dfvfs.
     """
     super(SharedElasticsearchOutputModule, self).__init__(output_mediator)
+    self._bulk_requests_queue = None
     self._client = None
     self._document_type = self._DEFAULT_DOCUMENT_TYPE
     self._event_documents = []
@@ -53,13 +70,21 @@ class SharedElasticsearchOutputModule(interface.OutputModule):
     self._host = None
     self._index_name = None
     self._number_of_buffered_events = 0
+    self._number_of_concurrent_requests = (
+        self._DEFAULT_NUMBER_OF_CONCURRENT_REQUESTS)
     self._password = None
+    self._sender_threads = []
     self._port = None
+    self._statistics_lock = threading.Lock()
     self._username = None
     self._use_ssl = None
     self._ca_certs = None
     self._url_prefix = None
 
+    self.errors_counter = collections.Counter()
+    self.number_of_failed_events = 0
+    self.number_of_inserted_events = 0
+
   def _Connect(self):
     """Connects to an Elasticsearch server."""
     elastic_host = {'host': self._host, 'port': self._port}
@@ -71,11 +96,13 @@ class SharedElasticsearchOutputModule(interface.OutputModule):
     if self._username is not None:
       elastic_http_auth = (self._username, self._password)
 
+    # The connection pool is sized to the number of sender threads.
     self._client = elasticsearch.Elasticsearch(
         [elastic_host],
         http_auth=elastic_http_auth,
         use_ssl=self._use_ssl,
-        ca_certs=self._ca_certs
+        ca_certs=self._ca_certs,
+        maxsize=self._number_of_concurrent_requests
     )
 
     logger.debug(
@@ -103,11 +130,53 @@ class SharedElasticsearchOutputModule(interface.OutputModule):
               exception))
 
   def _FlushEvents(self):
-    """Inserts the buffered event documents into Elasticsearch."""
-    try:
+    """Hands the buffered event documents to the sender threads.
+
+    The bulk requests queue is bounded, so this blocks while the maximum
+    number of bulk requests is already waiting to be sent.
+    """
+    if self._number_of_buffered_events:
+      if not self._sender_threads:
+        self._StartSenderThreads()
+
+      self._bulk_requests_queue.put(
+          (self._event_documents, self._number_of_buffered_events))
+
+    self._event_documents = []
+    self._number_of_buffered_events = 0
+
+  def _RecordBulkRequestResult(
+      self, number_of_inserted_events, number_of_failed_events, error_types):
+    """Records the result of a bulk request.
+
+    Args:
+      number_of_inserted_events (int): number of events that were inserted.
+      number_of_failed_events (int): number of events that failed to insert.
+      error_types (list[str]): types of the errors of the failed events.
+    """
+    with self._statistics_lock:
+      self.number_of_inserted_events += number_of_inserted_events
+      self.number_of_failed_events += number_of_failed_events
+      self.errors_counter.update(error_types)
+
+  def _SendBulkRequest(self, event_documents, number_of_events):
+    """Sends a bulk request to insert event documents into Elasticsearch.
+
+    Events that Elasticsearch rejected because it is too busy are retried
+    with an exponential backoff. Other errors are counted per event.
+
+    Args:
+      event_documents (list[dict[str, object]]): event documents, which
+          consist of an action and a source document per event.
+      number_of_events (int): number of events in the event documents.
+    """
+    retry_delay = self._RETRY_INITIAL_DELAY
+    number_of_retries = 0
+
+    while event_documents:
       # pylint: disable=unexpected-keyword-arg
       bulk_arguments = {
-          'body': self._event_documents,
+          'body': event_documents,
           'index': self._index_name,
           'request_timeout': self._DEFAULT_REQUEST_TIMEOUT}
 
@@ -115,20 +184,132 @@ class SharedElasticsearchOutputModule(interface.OutputModule):
       if self._GetClientMajorVersion() < 7:
         bulk_arguments['doc_type'] = self._document_type
 
-      self._client.bulk(**bulk_arguments)
+      can_retry = number_of_retries < self._MAXIMUM_NUMBER_OF_RETRIES
 
-    except (
-        ValueError,
-        elasticsearch.exceptions.ElasticsearchException) as exception:
-      # Ignore problematic events
-      logger.warning('Unable to bulk insert with error: {0!s}'.format(
-          exception))
+      try:
+        response = self._client.bulk(**bulk_arguments)
 
-    logger.debug('Inserted {0:d} events into Elasticsearch'.format(
-        self._number_of_buffered_events))
+      except elasticsearch.exceptions.TransportError as exception:
+        if exception.status_code == 429 and can_retry:
+          response = None
+        else:
+          logger.warning('Unable to bulk insert with error: {0!s}'.format(
+              exception))
+          self._RecordBulkRequestResult(
+              0, number_of_events,
+              [type(exception).__name__] * number_of_events)
+          return
+
+      except (
+          ValueError,
+          elasticsearch.exceptions.ElasticsearchException) as exception:
+        logger.warning('Unable to bulk insert with error: {0!s}'.format(
+            exception))
+        self._RecordBulkRequestResult(
+            0, number_of_events, [type(exception).__name__] * number_of_events)
+        return
+
+      if response is None:
+        # The whole request was rejected and is retried.
+        retry_event_documents = event_documents
+
+      else:
+        retry_event_documents = []
+        error_types = []
+        number_of_inserted_events = 0
+
+        items = []
+        if response.get('errors', False):
+          items = response.get('items', None) or []
+
+        for item_index, item in enumerate(items):
+          # An item contains a single action type, such as "index".
+          item_values = list(item.values())[0]
+          status_code = item_values.get('status', 0)
+
+          if 200 <= status_code < 300:
+            number_of_inserted_events += 1
+
+          elif status_code == 429 and can_retry:
+            document_index = item_index * 2
+            retry_event_documents.extend(
+                event_documents[document_index:document_index + 2])
+
+          else:
+            error = item_values.get('error', None)
+            if isinstance(error, dict):
+              error = error.get('type', None)
+            error_types.append(error or 'unknown')
+
+        if not items:
+          number_of_inserted_events = number_of_events
+
+        if error_types:
+          logger.warning(
+              'Unable to insert {0:d} events with errors: {1:s}'.format(
+                  len(error_types), ', '.join(sorted(set(error_types)))))
+
+        self._RecordBulkRequestResult(
+            number_of_inserted_events, len(error_types), error_types)
+
+        logger.debug('Inserted {0:d} events into Elasticsearch'.format(
+            number_of_inserted_events))
+
+      if retry_event_documents:
+        logger.debug((
+            'Elasticsearch too busy, retrying {0:d} events in {1:.1f} '
+            'seconds').format(len(retry_event_documents) // 2, retry_delay))
+
+        time.sleep(retry_delay)
+        retry_delay = min(retry_delay * 2, self._RETRY_MAXIMUM_DELAY)
+        number_of_retries += 1
+
+      event_documents = retry_event_documents
+      number_of_events = len(event_documents) // 2
+
+  def _SenderThreadMain(self):
+    """Sends the bulk requests in the bulk requests queue."""
+    while True:
+      bulk_request = self._bulk_requests_queue.get()
+      try:
+        if bulk_request is None:
+          break
 
-    self._event_documents = []
-    self._number_of_buffered_events = 0
+        event_documents, number_of_events = bulk_request
+        try:
+          self._SendBulkRequest(event_documents, number_of_events)
+        except Exception as exception:  # pylint: disable=broad-except
+          logger.error((
+              'Unable to bulk insert with error: {0!s}').format(exception))
+          self._RecordBulkRequestResult(
+              0, number_of_events,
+              [type(exception).__name__] * number_of_events)
+
+      finally:
+        self._bulk_requests_queue.task_done()
+
+  def _StartSenderThreads(self):
+    """Starts the threads that send bulk requests to Elasticsearch."""
+    self._bulk_requests_queue = queue.Queue(
+        maxsize=self._number_of_concurrent_requests)
+
+    for _ in range(self._number_of_concurrent_requests):
+      sender_thread = threading.Thread(
+          name='elasticsearch_sender', target=self._SenderThreadMain)
+      sender_thread.daemon = True
+      sender_thread.start()
+      self._sender_threads.append(sender_thread)
+
+  def _StopSenderThreads(self):
+    """Stops the sender threads once all bulk requests have been sent."""
+    for _ in self._sender_threads:
+      self._bulk_requests_queue.put(None)
+
+    for sender_thread in self._sender_threads:
+      sender_thread.join()
+
+    self._bulk_requests_queue = None
+    self._sender_threads = []
 
   def _GetSanitizedEventValues(self, event, event_data, event_tag):
     """Sanitizes the event for use in Elasticsearch.
@@ -183,14 +364,23 @@ class SharedElasticsearchOutputModule(interface.OutputModule):
           'Defaulting to 0').format(event.timestamp, exception))
       attribute_value = 0
 
-    attribute_value = timelib.Timestamp.CopyToIsoFormat(
-        attribute_value, timezone=self._output_mediator.timezone)
+    date_time_rendering_cache = self._output_mediator.date_time_rendering_cache
+    try:
+      attribute_value = date_time_rendering_cache.GetISODateTime(
+          attribute_value)
+    except (OverflowError, ValueError):
+      attribute_value = timelib.Timestamp.CopyToIsoFormat(
+          attribute_value, timezone=self._output_mediator.timezone)
+
     event_values['datetime'] = attribute_value
 
     event_values['timestamp'] = event.timestamp
     event_values['timestamp_desc'] = event.timestamp_desc
 
-    message, _ = self._output_mediator.GetFormattedMessages(event_data)
+    formatting_context = self._output_mediator.GetFormattingContext(
+        event, event_data)
+
+    message, _ = formatting_context.GetFormattedMessages()
     if message is None:
       data_type = getattr(event_data, 'data_type', 'UNKNOWN')
       raise errors.NoFormatterFound(
@@ -208,8 +398,7 @@ class SharedElasticsearchOutputModule(interface.OutputModule):
 
     event_values['tag'] = labels
 
-    source_short, source = self._output_mediator.GetFormattedSources(
-        event, event_data)
+    source_short, source = formatting_context.GetFormattedSources()
     if source is None or source_short is None:
       data_type = getattr(event_data, 'data_type', 'UNKNOWN')
       raise errors.NoFormatterFound(
@@ -249,9 +438,20 @@ class SharedElasticsearchOutputModule(interface.OutputModule):
   def Close(self):
     """Closes connection to Elasticsearch.
 
-    Inserts any remaining buffered event documents.
+    Inserts any remaining buffered event documents and waits for all bulk
+    requests to be sent.
     """
     self._FlushEvents()
+    self._StopSenderThreads()
+
+    logger.info((
+        'Inserted {0:d} events into Elasticsearch, failed to insert {1:d} '
+        'events').format(
+            self.number_of_inserted_events, self.number_of_failed_events))
+
+    for error_type, number_of_errors in self.errors_counter.most_common():
+      logger.info('Elasticsearch error: {0:s} occurred {1:d} times'.format(
+          error_type, number_of_errors))
 
     self._client = None
 
@@ -282,6 +482,17 @@ class SharedElasticsearchOutputModule(interface.OutputModule):
     self._flush_interval = flush_interval
     logger.debug('Elasticsearch flush interval: {0:d}'.format(flush_interval))
 
+  def SetNumberOfConcurrentRequests(self, number_of_concurrent_requests):
+    """Sets the number of concurrent bulk requests.
+
+    Args:
+      number_of_concurrent_requests (int): maximum number of bulk requests
+          that are sent to Elasticsearch concurrently.
+    """
+    self._number_of_concurrent_requests = number_of_concurrent_requests
+    logger.debug('Elasticsearch number of concurrent requests: {0:d}'.format(
+        number_of_concurrent_requests))
+
   def SetIndexName(self, index_name):
     """Set the index name.
 
@@ -16,33 +16,49 @@ class SharedJSONOutputModule(interface.LinearOutputModule):
 
   _JSON_SERIALIZER = json_serializer.JSONAttributeContainerSerializer
 
-  def _WriteSerialized(self, event, event_data, event_tag):
+  def _WriteSerialized(
+      self, event, event_data, event_tag, event_data_json_dict=None):
     """Writes an event, event data and event tag to serialized form.
 
     Args:
       event (EventObject): event.
       event_data (EventData): event data.
       event_tag (EventTag): event tag.
+      event_data_json_dict (Optional[dict[str, object]]): JSON serialized
+          event data, as read from storage, or None if the event data should
+          be serialized.
 
     Returns:
       str: A JSON string containing the serialized form.
     """
-    json_dict = self._WriteSerializedDict(event, event_data, event_tag)
+    json_dict = self._WriteSerializedDict(
+        event, event_data, event_tag,
+        event_data_json_dict=event_data_json_dict)
 
     return json.dumps(json_dict, sort_keys=True)
 
-  def _WriteSerializedDict(self, event, event_data, event_tag):
+  def _WriteSerializedDict(
+      self, event, event_data, event_tag, event_data_json_dict=None):
     """Writes an event, event data and event tag to serialized form.
 
     Args:
       event (EventObject): event.
       event_data (EventData): event data.
       event_tag (EventTag): event tag.
+      event_data_json_dict (Optional[dict[str, object]]): JSON serialized
+          event data, as read from storage, or None if the event data should
+          be serialized.
 
     Returns:
       dict[str, object]: JSON serialized objects.
     """
-    event_data_json_dict = self._JSON_SERIALIZER.WriteSerializedDict(event_data)
+    if event_data_json_dict is None:
+      event_data_json_dict = self._JSON_SERIALIZER.WriteSerializedDict(
+          event_data)
+    else:
+      # Copy the serialized event data since it can be shared by other events.
+      event_data_json_dict = dict(event_data_json_dict)
+
     del event_data_json_dict['__container_type__']
     del event_data_json_dict['__type__']
 
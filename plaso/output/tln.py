@@ -6,8 +6,6 @@ For documentation on the TLN format see: http://forensicswiki.org/wiki/TLN
 
 from __future__ import unicode_literals
 
-from dfdatetime import posix_time as dfdatetime_posix_time
-
 from plaso.lib import errors
 from plaso.lib import timelib
 from plaso.output import interface
@@ -38,11 +36,18 @@ class TLNBaseOutputModule(interface.LinearOutputModule):
       NoFormatterFound: If no event formatter can be found to match the data
           type in the event data.
     """
-    date_time_string = timelib.Timestamp.CopyToIsoFormat(
-        event.timestamp, timezone=self._output_mediator.timezone)
+    formatting_context = self._output_mediator.GetFormattingContext(
+        event, event_data)
+
+    try:
+      date_time_string = formatting_context.GetISODateTime()
+    except (OverflowError, ValueError):
+      date_time_string = timelib.Timestamp.CopyToIsoFormat(
+          event.timestamp, timezone=self._output_mediator.timezone)
+
     timestamp_description = event.timestamp_desc or 'UNKNOWN'
 
-    message, _ = self._output_mediator.GetFormattedMessages(event_data)
+    message, _ = formatting_context.GetFormattedMessages()
     if message is None:
       data_type = getattr(event_data, 'data_type', 'UNKNOWN')
       raise errors.NoFormatterFound(
@@ -79,8 +84,10 @@ class TLNBaseOutputModule(interface.LinearOutputModule):
       NoFormatterFound: If no event formatter can be found to match the data
           type in the event data.
     """
-    source_short, _ = self._output_mediator.GetFormattedSources(
+    formatting_context = self._output_mediator.GetFormattingContext(
         event, event_data)
+
+    source_short, _ = formatting_context.GetFormattedSources()
     if source_short is None:
       data_type = getattr(event_data, 'data_type', 'UNKNOWN')
       raise errors.NoFormatterFound(
@@ -147,10 +154,10 @@ class TLNOutputModule(TLNBaseOutputModule):
     if not hasattr(event, 'timestamp'):
       return
 
-    # TODO: preserve dfdatetime as an object.
-    date_time = dfdatetime_posix_time.PosixTimeInMicroseconds(
-        timestamp=event.timestamp)
-    posix_timestamp = date_time.CopyToPosixTimestamp()
+    formatting_context = self._output_mediator.GetFormattingContext(
+        event, event_data)
+
+    posix_timestamp = formatting_context.GetPOSIXTimestamp()
     if not posix_timestamp:
       posix_timestamp = 0
 
@@ -231,10 +238,10 @@ class L2TTLNOutputModule(TLNBaseOutputModule):
     if not hasattr(event, 'timestamp'):
       return
 
-    # TODO: preserve dfdatetime as an object.
-    date_time = dfdatetime_posix_time.PosixTimeInMicroseconds(
-        timestamp=event.timestamp)
-    posix_timestamp = date_time.CopyToPosixTimestamp()
+    formatting_context = self._output_mediator.GetFormattingContext(
+        event, event_data)
+
+    posix_timestamp = formatting_context.GetPOSIXTimestamp()
     if not posix_timestamp:
       posix_timestamp = 0
 
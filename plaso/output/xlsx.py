@@ -6,6 +6,12 @@ from __future__ import unicode_literals
 import datetime
 import os
 import re
+import sys
+
+try:
+  import resource
+except ImportError:
+  resource = None
 
 try:
   import xlsxwriter
@@ -14,6 +20,7 @@ except ImportError:
 
 from plaso.output import dynamic
 from plaso.output import interface
+from plaso.output import logger
 from plaso.output import manager
 
 import pytz  # pylint: disable=wrong-import-order
@@ -34,6 +41,12 @@ class XLSXOutputModule(interface.OutputModule):
   _MAX_COLUMN_WIDTH = 50
   _MIN_COLUMN_WIDTH = 6
 
+  # Maximum number of rows of a sheet, including the header.
+  _MAXIMUM_NUMBER_OF_ROWS = 1048576
+
+  # Number of event rows that are used to determine the column widths.
+  _COLUMN_WIDTHS_SAMPLE_SIZE = 1000
+
   # Illegal Unicode characters for XML.
   _ILLEGAL_XML_RE = re.compile((
       r'[\x00-\x08\x0b-\x1f\x7f-\x84\x86-\x9f\ud800-\udfff\ufdd0-\ufddf'
@@ -51,6 +64,9 @@ class XLSXOutputModule(interface.OutputModule):
     self._dynamic_fields_helper = dynamic.DynamicFieldsHelper(output_mediator)
     self._fields = self._DEFAULT_FIELDS
     self._filename = None
+    self._header_format = None
+    self._number_of_sheets = 0
+    self._sample_rows = None
     self._sheet = None
     self._timestamp_format = self._DEFAULT_TIMESTAMP_FORMAT
     self._workbook = None
@@ -86,6 +102,91 @@ class XLSXOutputModule(interface.OutputModule):
               event.timestamp, exception))
       return 'ERROR'
 
+  def _AddSheet(self):
+    """Adds a sheet to the workbook.
+
+    The column widths, if already determined, are set on the new sheet.
+    """
+    self._number_of_sheets += 1
+    if self._number_of_sheets == 1:
+      sheet_name = 'Sheet'
+    else:
+      sheet_name = 'Sheet {0:d}'.format(self._number_of_sheets)
+
+    self._sheet = self._workbook.add_worksheet(sheet_name)
+    self._current_row = 0
+
+    if self._sample_rows is None:
+      self._SetColumnWidths()
+
+  def _FlushSampleRows(self):
+    """Sets the column widths and writes the sampled rows."""
+    if self._sample_rows is None:
+      return
+
+    sample_rows = self._sample_rows
+    self._sample_rows = None
+
+    self._SetColumnWidths()
+
+    for row_values in sample_rows:
+      self._WriteRow(row_values)
+
+  def _SetColumnWidths(self):
+    """Sets the column widths of the current sheet."""
+    for column_index, column_width in self._column_widths.items():
+      self._sheet.set_column(column_index, column_index, column_width)
+
+  def _UpdateColumnWidths(self, row_values):
+    """Updates the column widths based on the values of a row.
+
+    Args:
+      row_values (list[object]): values of the row.
+    """
+    for column_index, output_value in enumerate(row_values):
+      if self._fields[column_index] == 'datetime':
+        column_width = len(self._timestamp_format) + 2
+      else:
+        column_width = len(output_value) + 2
+
+      column_width = min(self._MAX_COLUMN_WIDTH, column_width)
+
+      self._column_widths[column_index] = max(
+          self._MIN_COLUMN_WIDTH, self._column_widths.get(column_index, 0),
+          column_width)
+
+  def _WriteHeaderRow(self):
+    """Writes the header row to the current sheet."""
+    for column_index, field_name in enumerate(self._fields):
+      self._sheet.write(
+          self._current_row, column_index, field_name, self._header_format)
+
+    self._current_row += 1
+    self._sheet.autofilter(0, len(self._fields) - 1, 0, 0)
+    self._sheet.freeze_panes(1, 0)
+
+  def _WriteRow(self, row_values):
+    """Writes a row to the current sheet.
+
+    If the current sheet is full a new sheet, with a header row, is added
+    to the workbook.
+
+    Args:
+      row_values (list[object]): values of the row.
+    """
+    if self._current_row >= self._MAXIMUM_NUMBER_OF_ROWS:
+      self._AddSheet()
+      self._WriteHeaderRow()
+
+    for column_index, output_value in enumerate(row_values):
+      if isinstance(output_value, datetime.datetime):
+        self._sheet.write_datetime(
+            self._current_row, column_index, output_value)
+      else:
+        self._sheet.write(self._current_row, column_index, output_value)
+
+    self._current_row += 1
+
   def _RemoveIllegalXMLCharacters(self, xml_string):
     """Removes illegal characters for XML.
 
@@ -104,8 +205,20 @@ class XLSXOutputModule(interface.OutputModule):
 
   def Close(self):
     """Closes the output."""
+    self._FlushSampleRows()
+
     self._workbook.close()
 
+    if resource:
+      # ru_maxrss is in bytes on Mac OS and in KiB on other platforms.
+      peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+      if sys.platform != 'darwin':
+        peak_rss *= 1024
+
+      logger.info((
+          'XLSX output written to {0:d} sheets, peak RSS: {1:d} MiB').format(
+              self._number_of_sheets, peak_rss // (1024 * 1024)))
+
   def Open(self):
     """Creates a new workbook.
 
@@ -128,8 +241,9 @@ class XLSXOutputModule(interface.OutputModule):
         'strings_to_formulas': False,
         'default_date_format': self._timestamp_format}
     self._workbook = xlsxwriter.Workbook(self._filename, options)
-    self._sheet = self._workbook.add_worksheet('Sheet')
-    self._current_row = 0
+    self._number_of_sheets = 0
+    self._sample_rows = []
+    self._AddSheet()
 
   def SetFields(self, fields):
     """Sets the fields to output.
@@ -158,11 +272,16 @@ class XLSXOutputModule(interface.OutputModule):
   def WriteEventBody(self, event, event_data, event_tag):
     """Writes event values to the output.
 
+    The column widths are determined from the first rows, which are kept in
+    memory until the sample is complete. Other rows are written directly,
+    which allows xlsxwriter to keep its memory usage constant.
+
     Args:
       event (EventObject): event.
       event_data (EventData): event data.
       event_tag (EventTag): event tag.
     """
+    row_values = []
     for field_name in self._fields:
       if field_name == 'datetime':
         output_value = self._FormatDateTime(event, event_data)
@@ -171,43 +290,28 @@ class XLSXOutputModule(interface.OutputModule):
             event, event_data, event_tag, field_name)
 
       output_value = self._RemoveIllegalXMLCharacters(output_value)
+      row_values.append(output_value)
 
-      # Auto adjust the column width based on the length of the output value.
-      column_index = self._fields.index(field_name)
-      self._column_widths.setdefault(column_index, 0)
+    if self._sample_rows is None:
+      self._WriteRow(row_values)
+      return
 
-      if field_name == 'datetime':
-        column_width = min(
-            self._MAX_COLUMN_WIDTH, len(self._timestamp_format) + 2)
-      else:
-        column_width = min(self._MAX_COLUMN_WIDTH, len(output_value) + 2)
-
-      self._column_widths[column_index] = max(
-          self._MIN_COLUMN_WIDTH, self._column_widths[column_index],
-          column_width)
-      self._sheet.set_column(
-          column_index, column_index, self._column_widths[column_index])
+    self._UpdateColumnWidths(row_values)
+    self._sample_rows.append(row_values)
 
-      if (field_name == 'datetime'
-          and isinstance(output_value, datetime.datetime)):
-        self._sheet.write_datetime(
-            self._current_row, column_index, output_value)
-      else:
-        self._sheet.write(self._current_row, column_index, output_value)
-
-    self._current_row += 1
+    if len(self._sample_rows) >= self._COLUMN_WIDTHS_SAMPLE_SIZE:
+      self._FlushSampleRows()
 
   def WriteHeader(self):
     """Writes the header to the spreadsheet."""
     self._column_widths = {}
-    bold = self._workbook.add_format({'bold': True})
-    bold.set_align('center')
+    self._header_format = self._workbook.add_format({'bold': True})
+    self._header_format.set_align('center')
+
     for index, field_name in enumerate(self._fields):
-      self._sheet.write(self._current_row, index, field_name, bold)
       self._column_widths[index] = len(field_name) + 2
-    self._current_row += 1
-    self._sheet.autofilter(0, len(self._fields) - 1, 0, 0)
-    self._sheet.freeze_panes(1, 0)
+
+    self._WriteHeaderRow()
 
 
 manager.OutputManager.RegisterOutput(
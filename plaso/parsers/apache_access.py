@@ -7,6 +7,8 @@ defined in https://httpd.apache.org/docs/2.4/logs.html
 
 from __future__ import unicode_literals
 
+import re
+
 import pyparsing
 
 from dfdatetime import time_elements as dfdatetime_time_elements
@@ -165,6 +167,83 @@ class ApacheAccessParser(text_parser.PyparsingSingleLineTextParser):
 
   _SUPPORTED_KEYS = frozenset([key for key, _ in LINE_STRUCTURES])
 
+  # Regular expressions that match the same lines as the line structures with
+  # an IPv4 address. Whitespace is matched like pyparsing skips it. Since
+  # pyparsing does not backtrack, the lookaheads prevent that a token of
+  # variable size is matched shorter than pyparsing would.
+  _WHITESPACE = r'[ \t\r\n]*'
+
+  _COMMON_LOG_FORMAT_REGULAR_EXPRESSION = (
+      r'(?=(?P<ip_address>{1:s}))(?P=ip_address){0:s}'
+      r'(?P<remote_name>[0-9A-Za-z]+(?![0-9A-Za-z])|-){0:s}'
+      r'(?P<user_name>[0-9A-Za-z]+(?![0-9A-Za-z])|-){0:s}'
+      r'\[{0:s}(?P<day>[0-9]{{2}}){0:s}/'
+      r'{0:s}(?P<month>[A-Za-z]{{3}}){0:s}/'
+      r'{0:s}(?P<year>[0-9]{{4}}){0:s}:'
+      r'{0:s}(?P<hours>[0-9]{{2}}){0:s}:'
+      r'{0:s}(?P<minutes>[0-9]{{2}}){0:s}:'
+      r'{0:s}(?P<seconds>[0-9]{{2}})'
+      r'{0:s}(?P<time_offset>[+-][0-9]{{4}}){0:s}\]'
+      r'{0:s}"{0:s}(?P<http_request>[^"]*)"'
+      r'{0:s}(?P<response_code>[0-9]+)(?![0-9])'
+      r'{0:s}(?P<response_bytes>-|[0-9]+(?![0-9]))').format(
+          _WHITESPACE, text_parser.PyparsingConstants.IPV4_ADDRESS.pattern)
+
+  _COMBINED_LOG_FORMAT_REGULAR_EXPRESSION = (
+      r'{1:s}{0:s}"{0:s}(?P<referer>[^"]*)"'
+      r'{0:s}"{0:s}(?P<user_agent>[^"]*)"').format(
+          _WHITESPACE, _COMMON_LOG_FORMAT_REGULAR_EXPRESSION)
+
+  _LINE_END_REGULAR_EXPRESSION = r'[ \t\r]*(?:\n|\Z)'
+
+  _LINE_STRUCTURE_REGULAR_EXPRESSIONS = {
+      'combined_log_format': re.compile(
+          _WHITESPACE + _COMBINED_LOG_FORMAT_REGULAR_EXPRESSION +
+          _LINE_END_REGULAR_EXPRESSION),
+      'common_log_format': re.compile(
+          _WHITESPACE + _COMMON_LOG_FORMAT_REGULAR_EXPRESSION +
+          _LINE_END_REGULAR_EXPRESSION),
+      'vhost_combined_log_format': re.compile((
+          r'{0:s}(?P<server_name>[0-9A-Za-z.-]+)(?![0-9A-Za-z.-]){0:s}:'
+          r'{0:s}(?P<port_number>[0-9]+)(?![0-9]){0:s}{1:s}{2:s}').format(
+              _WHITESPACE, _COMBINED_LOG_FORMAT_REGULAR_EXPRESSION,
+              _LINE_END_REGULAR_EXPRESSION))}
+
+  _DATE_TIME_TOKEN_NAMES = (
+      'day', 'month', 'year', 'hours', 'minutes', 'seconds', 'time_offset')
+
+  _INTEGER_TOKEN_NAMES = frozenset([
+      'day', 'hours', 'minutes', 'port_number', 'response_code', 'seconds',
+      'year'])
+
+  def _GetStructureFromRegularExpressionMatch(self, key, match):
+    """Retrieves line structure tokens from a regular expression match.
+
+    Args:
+      key (str): name of the line structure.
+      match (re.Match): regular expression match of the line structure.
+
+    Returns:
+      dict[str, object]: tokens of the line structure.
+    """
+    structure = {}
+    for name, value in match.groupdict().items():
+      if name in self._INTEGER_TOKEN_NAMES or (
+          name == 'response_bytes' and value != '-'):
+        value = int(value, 10)
+      structure[name] = value
+
+    # The date and time values are stored in a pyparsing.ParseResults, as
+    # the structure would be, since its string representation is used in
+    # extraction warnings.
+    date_time = pyparsing.ParseResults([
+        structure.pop(name) for name in self._DATE_TIME_TOKEN_NAMES])
+    for index, name in enumerate(self._DATE_TIME_TOKEN_NAMES):
+      date_time[name] = date_time[index]
+
+    structure['date_time'] = date_time
+    return structure
+
   # TODO: migrate function after dfdatetime issue #47 is fixed.
   def _GetISO8601String(self, structure):
     """Normalize date time parsed format to an ISO 8601 date time string.
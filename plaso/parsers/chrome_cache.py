@@ -11,6 +11,7 @@ from dfvfs.path import factory as path_spec_factory
 
 from plaso.containers import events
 from plaso.containers import time_events
+from plaso.lib import buffered_file
 from plaso.lib import errors
 from plaso.lib import definitions
 from plaso.parsers import dtfabric_parser
@@ -163,9 +164,15 @@ class ChromeCacheIndexFileParser(dtfabric_parser.DtFabricBaseParser):
     cache_address_map = self._GetDataTypeMap('uint32le')
     file_offset = file_object.get_offset()
 
-    cache_address_data = file_object.read(4)
+    # The index table is read at once, where trailing data that is smaller
+    # than a cache address is ignored.
+    index_table_data = file_object.read()
+    index_table_data_size = len(index_table_data)
+    index_table_data_size -= index_table_data_size % 4
+
+    for data_offset in range(0, index_table_data_size, 4):
+      cache_address_data = index_table_data[data_offset:data_offset + 4]
 
-    while len(cache_address_data) == 4:
       try:
         value = self._ReadStructureFromByteStream(
             cache_address_data, file_offset, cache_address_map)
@@ -180,8 +187,6 @@ class ChromeCacheIndexFileParser(dtfabric_parser.DtFabricBaseParser):
 
       file_offset += 4
 
-      cache_address_data = file_object.read(4)
-
   def ParseFileObject(self, parser_mediator, file_object):
     """Parses a file-like object.
 
@@ -337,8 +342,8 @@ class ChromeCacheParser(interface.FileEntryParser):
           and other components, such as storage and dfvfs.
       index_table (list[CacheAddress]): the cache addresses which are stored in
           the index file.
-      data_block_files (dict[str: file]): look up table for the data block
-          file-like object handles.
+      data_block_files (dict[str: BufferedFileObject]): look up table for
+          the data block file-like object handles.
     """
     # Parse the cache entries in the data block files.
     for cache_address in index_table:
@@ -443,9 +448,19 @@ class ChromeCacheParser(interface.FileEntryParser):
 
         data_block_files[cache_address.filename] = data_block_file_object
 
+    # The cache entries are read from the data block files in the order of
+    # the index table hence the data block file-like objects are buffered to
+    # reduce the number of reads.
+    buffered_data_block_files = {}
+    for filename, data_block_file_object in data_block_files.items():
+      if data_block_file_object:
+        data_block_file_object = buffered_file.BufferedFileObject(
+            data_block_file_object)
+      buffered_data_block_files[filename] = data_block_file_object
+
     try:
       self._ParseCacheEntries(
-          parser_mediator, index_table, data_block_files)
+          parser_mediator, index_table, buffered_data_block_files)
     finally:
       for data_block_file_object in data_block_files.values():
         if data_block_file_object:
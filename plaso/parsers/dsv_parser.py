@@ -5,6 +5,8 @@ from __future__ import unicode_literals
 
 import abc
 import csv
+import io
+import itertools
 import os
 
 from dfvfs.helpers import text_file
@@ -14,9 +16,159 @@ from plaso.lib import specification
 from plaso.parsers import interface
 
 
+class DSVBulkLineReader(object):
+  """Reads lines of delimiter separated values (DSV) text in bulk.
+
+  The file-like object is read in large blocks, which are decoded in one pass
+  and split into lines. The reader maintains the offsets of the lines that
+  were read, so that the offset of a row can be determined from the line
+  number of the CSV reader that reads the lines.
+  """
+
+  def __init__(
+      self, file_object, encoding, offset, read_size, maximum_line_size):
+    """Initializes a bulk line reader.
+
+    Args:
+      file_object (dfvfs.FileIO): file-like object.
+      encoding (str): encoding used in the DSV file, which must encode the
+          end-of-line character as a single byte.
+      offset (int): offset of the first line in the file-like object.
+      read_size (int): size of the blocks read from the file-like object.
+      maximum_line_size (int): maximum size of a line in bytes, excluding
+          the end-of-line character.
+    """
+    super(DSVBulkLineReader, self).__init__()
+    self._base_line_number = 0
+    self._encoding = encoding
+    self._file_object = file_object
+    self._line_offsets = [offset]
+    self._maximum_line_size = maximum_line_size
+    self._offset = offset
+    self._read_size = read_size
+
+  def _CheckLineSize(self, line_size):
+    """Checks if the size of the line that is being read is supported.
+
+    Args:
+      line_size (int): size of the line in bytes, excluding the end-of-line
+          character.
+
+    Raises:
+      ParseError: if the line exceeds the maximum line size.
+    """
+    if line_size > self._maximum_line_size:
+      raise errors.ParseError((
+          'Line at offset: {0:d} exceeds maximum line size: {1:d}.').format(
+              self._line_offsets[-1], self._maximum_line_size))
+
+  def __iter__(self):
+    """Returns lines of text.
+
+    Yields:
+      str: line of text, including the end-of-line character, except for
+          the last line of the file if it does not end with one.
+
+    Raises:
+      ParseError: if a line exceeds the maximum line size.
+      UnicodeDecodeError: if a line cannot be decoded.
+    """
+    self._file_object.seek(self._offset, os.SEEK_SET)
+
+    # The blocks of a line that spans multiple reads are kept until the end
+    # of the line is found, so that they are joined only once.
+    pending_data = []
+    pending_data_size = 0
+
+    while True:
+      data = self._file_object.read(self._read_size)
+      if data:
+        line_size = data.find(b'\n')
+        if line_size == -1:
+          line_size = len(data)
+
+        self._CheckLineSize(pending_data_size + line_size)
+
+        end_offset = data.rfind(b'\n') + 1
+        if not end_offset:
+          pending_data.append(data)
+          pending_data_size += len(data)
+          continue
+
+        end_offset += pending_data_size
+        pending_data.append(data)
+        data = b''.join(pending_data)
+
+        remaining_data = data[end_offset:]
+        self._CheckLineSize(len(remaining_data))
+
+        data = data[:end_offset]
+        pending_data = [remaining_data]
+        pending_data_size = len(remaining_data)
+
+      elif pending_data_size:
+        data = b''.join(pending_data)
+        pending_data = []
+        pending_data_size = 0
+
+      else:
+        break
+
+      decode_exception = None
+      try:
+        text = data.decode(self._encoding)
+      except UnicodeDecodeError as exception:
+        # Return the lines before the line that cannot be decoded.
+        decode_exception = exception
+        end_offset = data.rfind(b'\n', 0, exception.start) + 1
+        data = data[:end_offset]
+        text = data.decode(self._encoding)
+
+      lines = data.split(b'\n')
+      if not lines[-1]:
+        lines.pop()
+
+      if lines:
+        line_sizes = [len(line) + 1 for line in lines]
+        line_sizes[0] += self._line_offsets[-1]
+        self._line_offsets.extend(itertools.accumulate(line_sizes))
+
+        for line in io.StringIO(text, newline='\n'):
+          yield line
+
+      if decode_exception:
+        raise decode_exception  # pylint: disable=raising-bad-type
+
+  def DiscardLineOffsets(self, line_number):
+    """Discards the offsets of the lines before a specific line.
+
+    Args:
+      line_number (int): number of the line, where 0 represents the first line.
+    """
+    del self._line_offsets[:line_number - self._base_line_number]
+    self._base_line_number = line_number
+
+  def GetLineOffset(self, line_number):
+    """Retrieves the offset of a specific line.
+
+    Args:
+      line_number (int): number of the line, where 0 represents the first line.
+
+    Returns:
+      int: offset of the line.
+    """
+    return self._line_offsets[line_number - self._base_line_number]
+
+
 class DSVParser(interface.FileObjectParser):
   """Delimiter separated values (DSV) parser interface."""
 
+  # Parsers that support bulk mode read the DSV content, after the first row,
+  # in large blocks, which are decoded in one pass and split into rows that
+  # are passed to ParseRows() in batches. Bulk mode is only used for encodings
+  # that encode the end-of-line character as a single byte.
+  SUPPORTS_BULK_MODE = False
+
   # A list that contains the names of all the fields in the log file. This
   # needs to be defined by each DSV parser.
   COLUMNS = []
@@ -43,6 +195,12 @@ class DSVParser(interface.FileObjectParser):
   # file to see if it confirms to standards.
   _MAGIC_TEST_STRING = 'RegnThvotturMeistarans'
 
+  # The maximum number of rows passed to ParseRows() in bulk mode.
+  _BULK_MODE_NUMBER_OF_ROWS = 1000
+
+  # The size of the blocks read in bulk mode.
+  _BULK_MODE_READ_SIZE = 16 * 1024 * 1024
+
   def __init__(self, encoding=None):
     """Initializes a delimiter separated values (DSV) parser.
 
@@ -51,6 +209,8 @@ class DSVParser(interface.FileObjectParser):
           indicates the codepage of the parser mediator should be used.
     """
     super(DSVParser, self).__init__()
+    self._column_indexes = {
+        name: index for index, name in enumerate(self.COLUMNS)}
     self._encoding = encoding
     self._end_of_line = '\n'
     self._maximum_line_length = (
@@ -140,6 +300,98 @@ class DSVParser(interface.FileObjectParser):
     file_object.seek(original_file_position, os.SEEK_SET)
     return result
 
+  def _GetRowDictionary(self, values):
+    """Retrieves a row dictionary from the values of a row.
+
+    The row dictionary is the same as the one created by csv.DictReader().
+
+    Args:
+      values (list[str]): values of the row.
+
+    Returns:
+      dict[str, str]: fields of a single row, as specified in COLUMNS.
+    """
+    row = dict(zip(self.COLUMNS, values))
+
+    number_of_columns = len(self.COLUMNS)
+    number_of_values = len(values)
+    if number_of_values > number_of_columns:
+      row[self._MAGIC_TEST_STRING] = values[number_of_columns:]
+
+    elif number_of_values < number_of_columns:
+      for name in self.COLUMNS[number_of_values:]:
+        row[name] = self._MAGIC_TEST_STRING
+
+    return row
+
+  def _ParseRowsInBulk(self, parser_mediator, file_object, encoding, offset):
+    """Parses the rows of a DSV text file-like object in bulk.
+
+    Args:
+      parser_mediator (ParserMediator): mediates interactions between parsers
+          and other components, such as storage and dfvfs.
+      file_object (dfvfs.FileIO): file-like object.
+      encoding (str): encoding used in the DSV file.
+      offset (int): offset of the first row to parse.
+
+    Raises:
+      csv.Error: if the rows cannot be read.
+      ParseError: if a row exceeds the maximum line length.
+      UnicodeDecodeError: if the rows cannot be decoded.
+    """
+    maximum_line_size = self._maximum_line_length - len(self._end_of_line)
+    line_reader = DSVBulkLineReader(
+        file_object, encoding, offset, self._BULK_MODE_READ_SIZE,
+        maximum_line_size)
+    reader = csv.reader(
+        line_reader, delimiter=self.DELIMITER, quotechar=self.QUOTE_CHAR)
+
+    number_of_columns = len(self.COLUMNS)
+    line_number = 0
+    rows = []
+
+    try:
+      for values in reader:
+        # Like csv.DictReader() empty rows are skipped, hence the offset of the
+        # next row is the offset of the empty lines that precede it.
+        if not values:
+          continue
+
+        row_offset = line_reader.GetLineOffset(line_number)
+        line_number = reader.line_num
+
+        if len(values) == number_of_columns:
+          rows.append((row_offset, tuple(values)))
+          if len(rows) < self._BULK_MODE_NUMBER_OF_ROWS:
+            continue
+
+          self.ParseRows(parser_mediator, rows)
+          rows = []
+
+        else:
+          if rows:
+            self.ParseRows(parser_mediator, rows)
+            rows = []
+
+          # Rows with an unexpected number of values are parsed as if they were
+          # read by csv.DictReader().
+          self.ParseRow(
+              parser_mediator, row_offset, self._GetRowDictionary(values))
+
+        line_reader.DiscardLineOffsets(line_number)
+
+        if parser_mediator.abort:
+          break
+
+    except (csv.Error, errors.ParseError, UnicodeDecodeError):
+      # Parse the rows that were read before the error.
+      if rows:
+        self.ParseRows(parser_mediator, rows)
+      raise
+
+    if rows and not parser_mediator.abort:
+      self.ParseRows(parser_mediator, rows)
+
   @classmethod
   def GetFormatSpecification(cls):
     """Retrieves the format specification.
@@ -262,6 +514,15 @@ class DSVParser(interface.FileObjectParser):
     self.ParseRow(parser_mediator, row_offset, row)
     row_offset = line_reader.tell()
 
+    if self.SUPPORTS_BULK_MODE and self._end_of_line.encode(encoding) == b'\n':
+      try:
+        self._ParseRowsInBulk(
+            parser_mediator, file_object, encoding, row_offset)
+      except errors.ParseError as exception:
+        parser_mediator.ProduceExtractionWarning(
+            'unable to parse rows with error: {0!s}'.format(exception))
+      return
+
     for row in reader:
       if parser_mediator.abort:
         break
@@ -279,6 +540,24 @@ class DSVParser(interface.FileObjectParser):
       row (dict[str, str]): fields of a single row, as specified in COLUMNS.
     """
 
+  def ParseRows(self, parser_mediator, rows):
+    """Parses rows of the log file and produces events.
+
+    This method is only used in bulk mode. The rows are passed in batches,
+    which allows, for example, for the date and time values of the rows to be
+    converted in one pass. The index of a value in the values of a row can be
+    retrieved from _column_indexes.
+
+    Args:
+      parser_mediator (ParserMediator): mediates interactions between parsers
+          and other components, such as storage and dfvfs.
+      rows (list[tuple[int, tuple[str]]]): offset and values of the rows,
+          where the values are in the order specified in COLUMNS.
+    """
+    for row_offset, values in rows:
+      row = dict(zip(self.COLUMNS, values))
+      self.ParseRow(parser_mediator, row_offset, row)
+
   # pylint: disable=redundant-returns-doc
   @abc.abstractmethod
   def VerifyRow(self, parser_mediator, row):
@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+"""Process-wide cache of dtFabric data type fabrics and maps."""
+
+from __future__ import unicode_literals
+
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+
+import dtfabric
+
+from dtfabric.runtime import fabric as dtfabric_fabric
+
+from plaso.parsers import logger
+
+
+class DtFabricCache(object):
+  """Process-wide cache of dtFabric data type fabrics and maps.
+
+  Reading a dtFabric definition file requires the YAML definitions to be
+  parsed, which is relatively expensive and was done by every parser and
+  plugin instance. The cache builds the data type fabric of a definition file
+  once per process and shares it, and the data type maps created from it,
+  between all parser and plugin instances that use the same definition file.
+
+  Optionally the data type fabrics can be stored, in pickled form, in a cache
+  directory, so that other processes, such as worker processes, do not need
+  to parse the YAML definitions. Note that the cache directory should only be
+  writable by the user running plaso, since the pickled data is trusted.
+  """
+
+  _cache_directory = None
+
+  # Data type fabrics per definition file path.
+  _data_type_fabrics = {}
+
+  # Data type maps per data type fabric.
+  _data_type_maps = {}
+
+  @classmethod
+  def _GetCacheFilePath(cls, path, definition):
+    """Retrieves the path of the cache file of a definition file.
+
+    The name of the cache file contains a digest of the definition and of
+    the versions of dtFabric and Python, so that changes to any of these
+    result in a different cache file.
+
+    Args:
+      path (str): path of the dtFabric definition file.
+      definition (bytes): dtFabric definition.
+
+    Returns:
+      str: path of the cache file.
+    """
+    hasher = hashlib.sha256()
+    hasher.update(definition)
+    hasher.update('{0:s}:{1:d}.{2:d}'.format(
+        dtfabric.__version__, sys.version_info[0],
+        sys.version_info[1]).encode('ascii'))
+
+    filename = os.path.basename(path)
+    filename, _, _ = filename.rpartition('.')
+    filename = '{0:s}-{1:s}.pickle'.format(filename, hasher.hexdigest()[:16])
+
+    return os.path.join(cls._cache_directory, filename)
+
+  @classmethod
+  def _ReadCacheFile(cls, cache_file_path):
+    """Reads a data type fabric from a cache file.
+
+    Args:
+      cache_file_path (str): path of the cache file.
+
+    Returns:
+      dtfabric.DataTypeFabric: data type fabric or None if the cache file does
+          not exist or cannot be read.
+    """
+    if not os.path.isfile(cache_file_path):
+      return None
+
+    try:
+      with open(cache_file_path, 'rb') as file_object:
+        data_type_fabric = pickle.load(file_object)
+
+    except Exception as exception:  # pylint: disable=broad-except
+      logger.debug((
+          'Unable to read dtFabric cache file: {0:s} with error: '
+          '{1!s}').format(cache_file_path, exception))
+      return None
+
+    if not isinstance(data_type_fabric, dtfabric_fabric.DataTypeFabric):
+      logger.debug('Unsupported dtFabric cache file: {0:s}'.format(
+          cache_file_path))
+      return None
+
+    return data_type_fabric
+
+  @classmethod
+  def _WriteCacheFile(cls, cache_file_path, data_type_fabric):
+    """Writes a data type fabric to a cache file.
+
+    The cache file is written to a temporary file first and then renamed, so
+    that concurrent processes never read a partially written cache file.
+
+    Args:
+      cache_file_path (str): path of the cache file.
+      data_type_fabric (dtfabric.DataTypeFabric): data type fabric.
+    """
+    temporary_file_path = None
+    try:
+      file_descriptor, temporary_file_path = tempfile.mkstemp(
+          dir=cls._cache_directory, suffix='.tmp')
+      with os.fdopen(file_descriptor, 'wb') as file_object:
+        pickle.dump(
+            data_type_fabric, file_object, protocol=pickle.HIGHEST_PROTOCOL)
+
+      os.rename(temporary_file_path, cache_file_path)
+      temporary_file_path = None
+
+    except (IOError, OSError, pickle.PicklingError) as exception:
+      logger.debug((
+          'Unable to write dtFabric cache file: {0:s} with error: '
+          '{1!s}').format(cache_file_path, exception))
+
+    finally:
+      if temporary_file_path and os.path.exists(temporary_file_path):
+        os.remove(temporary_file_path)
+
+  @classmethod
+  def Clear(cls):
+    """Clears the cached data type fabrics and maps."""
+    cls._data_type_fabrics = {}
+    cls._data_type_maps = {}
+
+  @classmethod
+  def GetDataTypeFabric(cls, path):
+    """Retrieves the data type fabric of a definition file.
+
+    Args:
+      path (str): path of the dtFabric definition file.
+
+    Returns:
+      dtfabric.DataTypeFabric: data type fabric which contains the data format
+          data type maps of the data type definition, such as a structure, that
+          can be mapped onto binary data.
+    """
+    path = os.path.abspath(path)
+
+    data_type_fabric = cls._data_type_fabrics.get(path, None)
+    if data_type_fabric:
+      return data_type_fabric
+
+    with open(path, 'rb') as file_object:
+      definition = file_object.read()
+
+    cache_file_path = None
+    if cls._cache_directory:
+      cache_file_path = cls._GetCacheFilePath(path, definition)
+      data_type_fabric = cls._ReadCacheFile(cache_file_path)
+
+    if not data_type_fabric:
+      data_type_fabric = dtfabric_fabric.DataTypeFabric(
+          yaml_definition=definition)
+
+      if cache_file_path:
+        cls._WriteCacheFile(cache_file_path, data_type_fabric)
+
+    cls._data_type_fabrics[path] = data_type_fabric
+    cls._data_type_maps[data_type_fabric] = {}
+
+    return data_type_fabric
+
+  @classmethod
+  def GetDataTypeMaps(cls, data_type_fabric):
+    """Retrieves the shared data type maps of a data type fabric.
+
+    Args:
+      data_type_fabric (dtfabric.DataTypeFabric): data type fabric.
+
+    Returns:
+      dict[str, dtfabric.DataTypeMap]: data type maps per name, which are
+          shared by all users of the data type fabric, or an empty dictionary
+          if the data type fabric was not retrieved from the cache.
+    """
+    data_type_maps = cls._data_type_maps.get(data_type_fabric, None)
+    if data_type_maps is None:
+      data_type_maps = {}
+
+    return data_type_maps
+
+  @classmethod
+  def SetCacheDirectory(cls, path):
+    """Sets the directory to store the pickled data type fabrics.
+
+    Args:
+      path (str): path of the cache directory or None to disable storing
+          the data type fabrics.
+    """
+    cls._cache_directory = path
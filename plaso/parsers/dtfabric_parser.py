@@ -8,9 +8,9 @@ import os
 
 from dtfabric import errors as dtfabric_errors
 from dtfabric.runtime import data_maps as dtfabric_data_maps
-from dtfabric.runtime import fabric as dtfabric_fabric
 
 from plaso.lib import errors
+from plaso.parsers import dtfabric_cache
 from plaso.parsers import interface
 
 
@@ -77,8 +77,9 @@ class DtFabricBaseParser(interface.FileObjectParser):
   def __init__(self):
     """Initializes a dtFabric-based data format parser."""
     super(DtFabricBaseParser, self).__init__()
-    self._data_type_maps = {}
     self._fabric = self._ReadDefinitionFile(self._DEFINITION_FILE)
+    self._data_type_maps = dtfabric_cache.DtFabricCache.GetDataTypeMaps(
+        self._fabric)
 
   def _FormatPackedIPv4Address(self, packed_ip_address):
     """Formats a packed IPv4 address as a human readable string.
@@ -110,7 +111,8 @@ class DtFabricBaseParser(interface.FileObjectParser):
   def _GetDataTypeMap(self, name):
     """Retrieves a data type map defined by the definition file.
 
-    The data type maps are cached for reuse.
+    The data type maps are cached for reuse and shared with other instances
+    that use the same definition file.
 
     Args:
       name (str): name of the data type as defined by the definition file.
@@ -182,10 +184,7 @@ class DtFabricBaseParser(interface.FileObjectParser):
       return None
 
     path = os.path.join(self._DEFINITION_FILES_PATH, filename)
-    with open(path, 'rb') as file_object:
-      definition = file_object.read()
-
-    return dtfabric_fabric.DataTypeFabric(yaml_definition=definition)
+    return dtfabric_cache.DtFabricCache.GetDataTypeFabric(path)
 
   def _ReadStructureFromByteStream(
       self, byte_stream, file_offset, data_type_map, context=None):
@@ -61,6 +61,8 @@ class MactimeParser(dsv_parser.DSVParser):
 
   DELIMITER = '|'
 
+  SUPPORTS_BULK_MODE = True
+
   _MD5_RE = re.compile(r'^[0-9a-fA-F]{32}$')
 
   # Mapping according to:
@@ -72,36 +74,82 @@ class MactimeParser(dsv_parser.DSVParser):
       'mtime': definitions.TIME_DESCRIPTION_MODIFICATION,
   }
 
-  def _GetIntegerValue(self, row, value_name):
+  def _GetIntegerValue(self, values, value_name):
     """Converts a specific value of the row to an integer.
 
     Args:
-      row (dict[str, str]): fields of a single row, as specified in COLUMNS.
+      values (tuple[str]): values of a single row, in the order specified in
+          COLUMNS.
       value_name (str): name of the value within the row.
 
     Returns:
       int: value or None if the value cannot be converted.
     """
-    value = row.get(value_name, None)
+    value = values[self._column_indexes[value_name]]
     try:
       return int(value, 10)
     except (TypeError, ValueError):
       return None
 
-  def ParseRow(self, parser_mediator, row_offset, row):
-    """Parses a line of the log file and produces events.
+  def _GetTimestamps(self, rows_values):
+    """Converts the date and time values of rows to timestamps.
+
+    The date and time values are converted in one pass per batch of rows.
+    Since the values of a bodyfile are commonly shared between the date and
+    time columns of a row and between rows, each distinct value is converted
+    only once.
+
+    Args:
+      rows_values (list[tuple[str]]): values of the rows, in the order
+          specified in COLUMNS.
+
+    Returns:
+      dict[str, int]: timestamps per date and time value, where values that
+          are not set or cannot be converted are omitted.
+    """
+    value_indexes = [
+        self._column_indexes[value_name]
+        for value_name in self._TIMESTAMP_DESC_MAP.keys()]
+
+    date_time_values = set()
+    for values in rows_values:
+      date_time_values.update(values[index] for index in value_indexes)
+
+    timestamps = {}
+    for date_time_value in date_time_values:
+      try:
+        posix_time = int(date_time_value, 10)
+      except (TypeError, ValueError):
+        continue
+
+      # mactime will return 0 if the timestamp is not set.
+      if not posix_time:
+        continue
+
+      date_time = dfdatetime_posix_time.PosixTime(timestamp=posix_time)
+      timestamps[date_time_value] = date_time.GetPlasoTimestamp()
+
+    return timestamps
+
+  def _ParseValues(self, parser_mediator, row_offset, values, timestamps):
+    """Parses the values of a row and produces events.
 
     Args:
       parser_mediator (ParserMediator): mediates interactions between parsers
           and other components, such as storage and dfvfs.
       row_offset (int): number of the corresponding line.
-      row (dict[str, str]): fields of a single row, as specified in COLUMNS.
+      values (tuple[str]): values of a single row, in the order specified in
+          COLUMNS.
+      timestamps (dict[str, int]): timestamps per date and time value, as
+          returned by _GetTimestamps().
     """
-    filename = row.get('name', None)
-    md5_hash = row.get('md5', None)
-    mode = row.get('mode_as_string', None)
+    column_indexes = self._column_indexes
+
+    filename = values[column_indexes['name']]
+    md5_hash = values[column_indexes['md5']]
+    mode = values[column_indexes['mode_as_string']]
 
-    inode_number = row.get('inode', None)
+    inode_number = values[column_indexes['inode']]
     if '-' in inode_number:
       inode_number, _, _ = inode_number.partition('-')
 
@@ -110,9 +158,9 @@ class MactimeParser(dsv_parser.DSVParser):
     except (TypeError, ValueError):
       inode_number = None
 
-    data_size = self._GetIntegerValue(row, 'size')
-    user_uid = self._GetIntegerValue(row, 'uid')
-    user_gid = self._GetIntegerValue(row, 'gid')
+    data_size = self._GetIntegerValue(values, 'size')
+    user_uid = self._GetIntegerValue(values, 'uid')
+    user_gid = self._GetIntegerValue(values, 'gid')
 
     event_data = MactimeEventData()
     event_data.filename = filename
@@ -130,15 +178,40 @@ class MactimeParser(dsv_parser.DSVParser):
       event_data.user_sid = '{0:d}'.format(user_uid)
 
     for value_name, timestamp_description in self._TIMESTAMP_DESC_MAP.items():
-      posix_time = self._GetIntegerValue(row, value_name)
-      # mactime will return 0 if the timestamp is not set.
-      if not posix_time:
+      timestamp = timestamps.get(values[column_indexes[value_name]], None)
+      if timestamp is None:
         continue
 
-      date_time = dfdatetime_posix_time.PosixTime(timestamp=posix_time)
-      event = time_events.DateTimeValuesEvent(date_time, timestamp_description)
+      event = time_events.TimestampEvent(timestamp, timestamp_description)
       parser_mediator.ProduceEventWithEventData(event, event_data)
 
+  def ParseRow(self, parser_mediator, row_offset, row):
+    """Parses a line of the log file and produces events.
+
+    Args:
+      parser_mediator (ParserMediator): mediates interactions between parsers
+          and other components, such as storage and dfvfs.
+      row_offset (int): number of the corresponding line.
+      row (dict[str, str]): fields of a single row, as specified in COLUMNS.
+    """
+    values = tuple(row.get(name, None) for name in self.COLUMNS)
+    timestamps = self._GetTimestamps([values])
+    self._ParseValues(parser_mediator, row_offset, values, timestamps)
+
+  def ParseRows(self, parser_mediator, rows):
+    """Parses rows of the log file and produces events.
+
+    Args:
+      parser_mediator (ParserMediator): mediates interactions between parsers
+          and other components, such as storage and dfvfs.
+      rows (list[tuple[int, tuple[str]]]): offset and values of the rows,
+          where the values are in the order specified in COLUMNS.
+    """
+    timestamps = self._GetTimestamps([values for _, values in rows])
+
+    for row_offset, values in rows:
+      self._ParseValues(parser_mediator, row_offset, values, timestamps)
+
   # pylint: disable=unused-argument
   def VerifyRow(self, parser_mediator, row):
     """Verifies if a line of the file is in the expected format.
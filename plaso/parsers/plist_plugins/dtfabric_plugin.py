@@ -7,9 +7,9 @@ import abc
 import os
 
 from dtfabric import errors as dtfabric_errors
-from dtfabric.runtime import fabric as dtfabric_fabric
 
 from plaso.lib import errors
+from plaso.parsers import dtfabric_cache
 from plaso.parsers.plist_plugins import interface
 
 
@@ -76,13 +76,15 @@ class DtFabricBasePlistPlugin(interface.PlistPlugin):
   def __init__(self):
     """Initializes a dtFabric-based data format Registry plugin."""
     super(DtFabricBasePlistPlugin, self).__init__()
-    self._data_type_maps = {}
     self._fabric = self._ReadDefinitionFile(self._DEFINITION_FILE)
+    self._data_type_maps = dtfabric_cache.DtFabricCache.GetDataTypeMaps(
+        self._fabric)
 
   def _GetDataTypeMap(self, name):
     """Retrieves a data type map defined by the definition file.
 
-    The data type maps are cached for reuse.
+    The data type maps are cached for reuse and shared with other instances
+    that use the same definition file.
 
     Args:
       name (str): name of the data type as defined by the definition file.
@@ -113,10 +115,7 @@ class DtFabricBasePlistPlugin(interface.PlistPlugin):
       return None
 
     path = os.path.join(self._DEFINITION_FILES_PATH, filename)
-    with open(path, 'rb') as file_object:
-      definition = file_object.read()
-
-    return dtfabric_fabric.DataTypeFabric(yaml_definition=definition)
+    return dtfabric_cache.DtFabricCache.GetDataTypeFabric(path)
 
   def _ReadStructureFromByteStream(
       self, byte_stream, file_offset, data_type_map, context=None):
@@ -25,6 +25,8 @@ References:
 
 from __future__ import unicode_literals
 
+import re
+
 import pyparsing
 
 from plaso.containers import events
@@ -72,9 +74,8 @@ class SELinuxParser(text_parser.PyparsingSingleLineTextParser):
   _SELINUX_KEY_VALUE_DICT = pyparsing.Dict(
       pyparsing.ZeroOrMore(_SELINUX_KEY_VALUE_GROUP))
 
-  _SELINUX_BODY_GROUP = pyparsing.Group(
-      pyparsing.Empty().setResultsName('key') +
-      pyparsing.restOfLine.setResultsName('value'))
+  _SELINUX_BODY = (
+      pyparsing.Empty() + pyparsing.restOfLine.setResultsName('body'))
 
   _SELINUX_MSG_GROUP = pyparsing.Group(
       pyparsing.Literal('msg').setResultsName('key') +
@@ -101,11 +102,40 @@ class SELinuxParser(text_parser.PyparsingSingleLineTextParser):
   # A log line is formatted as: type=TYPE msg=audit([0-9]+\.[0-9]+:[0-9]+): .*
   _SELINUX_LOG_LINE = pyparsing.Dict(
       _SELINUX_TYPE_GROUP +
-      _SELINUX_MSG_GROUP +
-      _SELINUX_BODY_GROUP)
+      _SELINUX_MSG_GROUP) + _SELINUX_BODY
 
   LINE_STRUCTURES = [('line', _SELINUX_LOG_LINE)]
 
+  # Regular expression that matches the same lines as the line structure.
+  # Whitespace is matched like pyparsing skips it. Since pyparsing does not
+  # backtrack, the lookaheads prevent that a token is matched shorter than
+  # pyparsing would.
+  _LINE_STRUCTURE_REGULAR_EXPRESSIONS = {
+      'line': re.compile((
+          r'{0:s}type{0:s}={0:s}'
+          r'(?P<type>UNKNOWN\[[0-9]+\]|[A-Z_]+(?![A-Z_])){0:s}'
+          r'msg{0:s}=audit\({0:s}(?P<seconds>[0-9]+)(?![0-9]){0:s}\.'
+          r'{0:s}(?P<milliseconds>[0-9]+)(?![0-9]){0:s}:'
+          r'{0:s}(?P<serial>[0-9]+)(?![0-9]){0:s}\):'
+          r'{0:s}(?![ \t\r\n])(?P<body>.*)').format(r'[ \t\r\n]*'))}
+
+  def _GetStructureFromRegularExpressionMatch(self, key, match):
+    """Retrieves line structure tokens from a regular expression match.
+
+    Args:
+      key (str): name of the line structure.
+      match (re.Match): regular expression match of the line structure.
+
+    Returns:
+      dict[str, object]: tokens of the line structure.
+    """
+    return {
+        'body': match.group('body'),
+        'msg': [
+            match.group('seconds'), match.group('milliseconds'),
+            match.group('serial')],
+        'type': match.group('type')}
+
   def ParseRecord(self, parser_mediator, key, structure):
     """Parses a structure of tokens derived from a line of a text file.
 
@@ -146,7 +176,7 @@ class SELinuxParser(text_parser.PyparsingSingleLineTextParser):
       return
 
     timestamp = ((seconds * 1000) + milliseconds) * 1000
-    body_text = structure[2][0]
+    body_text = self._GetValueFromStructure(structure, 'body')
 
     try:
       # Try to parse the body text as key value pairs. Note that not
@@ -3,6 +3,8 @@
 
 from __future__ import unicode_literals
 
+import re
+
 import pyparsing
 
 from dfdatetime import time_elements as dfdatetime_time_elements
@@ -132,6 +134,57 @@ class SkyDriveLogParser(text_parser.PyparsingMultiLineTextParser):
       ('header', _SDF_HEADER)
   ]
 
+  # Regular expression that matches the same log lines as the logline
+  # structure, except for a log line at the end of the buffer. Whitespace is
+  # matched like pyparsing skips it.
+  _WHITESPACE = r'[ \t\r\n]*'
+
+  _DATE_TIME_REGULAR_EXPRESSION = (
+      r'(?P<month>[0-9]{{2}}){0:s}-'
+      r'{0:s}(?P<day>[0-9]{{2}}){0:s}-'
+      r'{0:s}(?P<year>[0-9]{{2}}){0:s},'
+      r'{0:s}(?P<hours>[0-9]{{2}}){0:s}:'
+      r'{0:s}(?P<minutes>[0-9]{{2}}){0:s}:'
+      r'{0:s}(?P<seconds>[0-9]{{2}}){0:s}\.'
+      r'{0:s}(?P<milliseconds>[0-9]{{3}})').format(_WHITESPACE)
+
+  # The end of the detail is the start of the next log line or header.
+  _DETAIL_END_REGULAR_EXPRESSION = (
+      r'(?={0:s}(?:######{0:s}Logging started\.|{1:s}))').format(
+          _WHITESPACE, re.sub(
+              r'\(\?P<[a-z_]+>', '(?:', _DATE_TIME_REGULAR_EXPRESSION))
+
+  _LINE_STRUCTURE_REGULAR_EXPRESSIONS = {
+      'logline': re.compile((
+          r'{0:s}{1:s},[^,]+,[^,]+,[^,]+,(?P<module>[^,]+),'
+          r'(?P<source_code>[^,]+),[^,]+,[^,]+,(?P<log_level>[^,]+),'
+          r'(?P<detail>.*?){2:s}(?:[ \t\r]*\n)*').format(
+              _DATE_TIME_REGULAR_EXPRESSION, _WHITESPACE,
+              _DETAIL_END_REGULAR_EXPRESSION), re.DOTALL)}
+
+  _DATE_TIME_TOKEN_NAMES = (
+      'month', 'day', 'year', 'hours', 'minutes', 'seconds', 'milliseconds')
+
+  def _GetStructureFromRegularExpressionMatch(self, key, match):
+    """Retrieves line structure tokens from a regular expression match.
+
+    Args:
+      key (str): name of the line structure.
+      match (re.Match): regular expression match of the line structure.
+
+    Returns:
+      dict[str, object]: tokens of the line structure.
+    """
+    date_time = tuple([
+        int(match.group(name), 10) for name in self._DATE_TIME_TOKEN_NAMES])
+
+    return {
+        'date_time': date_time,
+        'detail': match.group('detail'),
+        'log_level': match.group('log_level'),
+        'module': match.group('module'),
+        'source_code': match.group('source_code')}
+
   def _ParseHeader(self, parser_mediator, structure):
     """Parse header lines and store appropriate attributes.
 
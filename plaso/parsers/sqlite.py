@@ -324,6 +324,40 @@ class SQLiteParser(interface.FileEntryParser):
 
   _plugin_classes = {}
 
+  def __init__(self):
+    """Initializes a SQLite parser."""
+    self._plugin_indexes_per_schema = {}
+    self._plugin_indexes_per_table = {}
+    self._plugin_indexes_without_required_structure = []
+    super(SQLiteParser, self).__init__()
+
+  def _BuildPluginIndexes(self):
+    """Builds the indexes used to select plugins for a database.
+
+    A plugin is indexed by the name and columns of one of its required tables,
+    since a database can only have the structure required by the plugin if it
+    contains that table. A plugin is also indexed by each of its schemas, so
+    that a schema match is found with a single lookup of the database schema.
+    """
+    self._plugin_indexes_per_schema = {}
+    self._plugin_indexes_per_table = {}
+    self._plugin_indexes_without_required_structure = []
+
+    for plugin_index, plugin in enumerate(self._plugins):
+      if not plugin.REQUIRED_STRUCTURE:
+        self._plugin_indexes_without_required_structure.append(plugin_index)
+      else:
+        table_name = sorted(plugin.REQUIRED_STRUCTURE.keys())[0]
+        required_columns = frozenset(plugin.REQUIRED_STRUCTURE[table_name])
+
+        self._plugin_indexes_per_table.setdefault(table_name, []).append(
+            (required_columns, plugin_index))
+
+      for schema in plugin.SCHEMAS:
+        schema_key = self._GetSchemaKey(schema)
+        self._plugin_indexes_per_schema.setdefault(schema_key, set()).add(
+            plugin_index)
+
   def _CheckRequiredTablesAndColumns(self, database, plugin):
     """Check if the database has the minimal structure required by the plugin.
 
@@ -350,6 +384,50 @@ class SQLiteParser(interface.FileEntryParser):
 
     return has_required_structure
 
+  def _GetPluginsForDatabase(self, database):
+    """Retrieves the plugins that support a database.
+
+    Args:
+      database (SQLiteDatabase): database.
+
+    Returns:
+      list[tuple[SQLitePlugin, bool]]: plugins of which the required tables and
+          columns exist in the database, in the order the plugins are enabled,
+          and whether the schema of the database matches that defined by the
+          plugin.
+    """
+    plugin_indexes = set(self._plugin_indexes_without_required_structure)
+    for table_name, column_names in database.columns_per_table.items():
+      indexes = self._plugin_indexes_per_table.get(table_name, None)
+      if indexes:
+        plugin_indexes.update([
+            plugin_index for required_columns, plugin_index in indexes
+            if required_columns.issubset(column_names)])
+
+    schema_key = self._GetSchemaKey(database.schema)
+    schema_plugin_indexes = self._plugin_indexes_per_schema.get(
+        schema_key, set())
+
+    plugins = []
+    for plugin_index in sorted(plugin_indexes):
+      plugin = self._plugins[plugin_index]
+      if self._CheckRequiredTablesAndColumns(database, plugin):
+        schema_match = plugin_index in schema_plugin_indexes
+        plugins.append((plugin, schema_match))
+
+    return plugins
+
+  def _GetSchemaKey(self, schema):
+    """Retrieves a key that uniquely identifies a schema.
+
+    Args:
+      schema (dict[str, str]): schema as an SQL query per table name.
+
+    Returns:
+      frozenset[tuple[str, str]]: key of the schema.
+    """
+    return frozenset(schema.items())
+
   def _OpenDatabaseWithWAL(
       self, parser_mediator, database_file_entry, database_file_object,
       filename):
@@ -404,6 +482,17 @@ class SQLiteParser(interface.FileEntryParser):
 
     return database_wal, wal_file_entry
 
+  def EnablePlugins(self, plugin_includes):
+    """Enables parser plugins.
+
+    Args:
+      plugin_includes (list[str]): names of the plugins to enable, where None
+          or an empty list represents all plugins. Note the default plugin, if
+          it exists, is always enabled and cannot be disabled.
+    """
+    super(SQLiteParser, self).EnablePlugins(plugin_includes)
+    self._BuildPluginIndexes()
+
   @classmethod
   def GetFormatSpecification(cls):
     """Retrieves the format specification.
@@ -444,17 +533,21 @@ class SQLiteParser(interface.FileEntryParser):
 
     file_object.close()
 
+    # The plugin selection is profiled per database, such that the cost of
+    # selecting the plugins of a specific database can be determined.
+    profiling_name = '{0:s}_plugin_selection:{1:s}'.format(
+        self.NAME, filename or '')
+
     # Create a cache in which the resulting tables are cached.
     cache = SQLiteCache()
     try:
-      for plugin in self._plugins:
-        required_tables_and_column_exist = self._CheckRequiredTablesAndColumns(
-            database, plugin)
-
-        if not required_tables_and_column_exist:
-          continue
+      parser_mediator.SampleStartTiming(profiling_name)
+      try:
+        plugins = self._GetPluginsForDatabase(database)
+      finally:
+        parser_mediator.SampleStopTiming(profiling_name)
 
-        schema_match = plugin.CheckSchema(database)
+      for plugin, schema_match in plugins:
         if plugin.REQUIRES_SCHEMA_MATCH and not schema_match:
           parser_mediator.ProduceExtractionWarning((
               'plugin: {0:s} found required tables but not a matching '
@@ -480,8 +573,6 @@ class SQLiteParser(interface.FileEntryParser):
         if not database_wal:
           continue
 
-        schema_match = plugin.CheckSchema(database)
-
         parser_mediator.SetFileEntry(wal_file_entry)
         parser_mediator.AddEventAttribute('schema_match', schema_match)
 
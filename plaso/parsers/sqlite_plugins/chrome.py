@@ -205,6 +205,10 @@ class GoogleChrome8HistoryPlugin(BaseGoogleChromeHistoryPlugin):
       (('SELECT id, full_path, url, start_time, received_bytes, '
         'total_bytes FROM downloads'), 'ParseFileDownloadedRow')]
 
+  QUERY_KEY_COLUMNS = {
+      'ParseFileDownloadedRow': ('id',),
+      'ParseLastVisitedRow': ('visit_id',)}
+
   _SCHEMA_8 = {
       'downloads': (
           'CREATE TABLE downloads (id INTEGER PRIMARY KEY,full_path '
@@ -413,6 +417,10 @@ class GoogleChrome27HistoryPlugin(BaseGoogleChromeHistoryPlugin):
         ' downloads_url_chains WHERE downloads.id = '
         'downloads_url_chains.id'), 'ParseFileDownloadedRow')]
 
+  QUERY_KEY_COLUMNS = {
+      'ParseFileDownloadedRow': ('id', 'url'),
+      'ParseLastVisitedRow': ('visit_id',)}
+
   _SCHEMA_27 = {
       'downloads': (
           'CREATE TABLE downloads (id INTEGER PRIMARY KEY,current_path '
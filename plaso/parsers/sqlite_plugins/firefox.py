@@ -191,6 +191,12 @@ class FirefoxHistoryPlugin(interface.SQLitePlugin):
         'FROM moz_bookmarks WHERE moz_bookmarks.type = 2'),
        'ParseBookmarkFolderRow')]
 
+  QUERY_KEY_COLUMNS = {
+      'ParseBookmarkAnnotationRow': ('id',),
+      'ParseBookmarkFolderRow': ('id',),
+      'ParseBookmarkRow': ('id',),
+      'ParsePageVisitedRow': ('id',)}
+
   _SCHEMA_V24 = {
       'moz_anno_attributes': (
           'CREATE TABLE moz_anno_attributes ( id INTEGER PRIMARY KEY, name '
@@ -33,6 +33,14 @@ class SQLitePlugin(plugins.BasePlugin):
   # function name.
   QUERIES = []
 
+  # Columns in the results of a query that uniquely identify a row, such as
+  # the primary key of the table, that are used to find duplicate rows when
+  # both a database and the database with its WAL file are parsed.
+  # Should be a dictionary with the callback function name as key and a tuple
+  # of column names as value. Rows of queries without key columns are
+  # identified by all their values.
+  QUERY_KEY_COLUMNS = {}
+
   # Database schemas this plugin was originally designed for.
   # Should be a list of dictionaries with {table_name: SQLCommand} format.
   SCHEMAS = []
@@ -44,6 +52,7 @@ class SQLitePlugin(plugins.BasePlugin):
   def __init__(self):
     """Initializes a SQLite parser plugin."""
     super(SQLitePlugin, self).__init__()
+    self._key_column_indexes_per_query = {}
     self._keys_per_query = {}
 
   def _GetRowValue(self, query_hash, row, value_name):
@@ -70,32 +79,36 @@ class SQLitePlugin(plugins.BasePlugin):
     # will raise "IndexError: Index must be int or string".
     return row[value_index]
 
-  @classmethod
-  def _HashRow(cls, row):
+  def _HashRow(self, query_hash, row, key_column_names):
     """Hashes the given row.
 
     Args:
+      query_hash (int): hash of the query, that uniquely identifies the query
+          that produced the row.
       row (sqlite3.Row): row.
+      key_column_names (tuple[str]): names of the columns that uniquely
+          identify the row or None if the row is identified by all its values.
 
     Returns:
       int: hash value of the given row.
     """
-    values = []
-    for value in row:
-      try:
-        value = '{0!s}'.format(value)
-      except UnicodeDecodeError:
-        # In Python 2, blobs are "read-write buffer" and will cause a
-        # UnicodeDecodeError exception if we try format it as a string.
-        # Since Python 3 does not support the buffer type we cannot check
-        # the type of value.
-        value = repr(value)
+    if not key_column_names:
+      return hash(tuple(row))
 
-      values.append(value)
+    key_column_indexes = self._key_column_indexes_per_query.get(
+        query_hash, None)
+    if not key_column_indexes:
+      keys_name_to_index_map = {
+          name: index for index, name in enumerate(row.keys())}
+      key_column_indexes = [
+          keys_name_to_index_map[name] for name in key_column_names]
+      self._key_column_indexes_per_query[query_hash] = key_column_indexes
 
-    return hash(' '.join(values))
+    return hash(tuple([row[index] for index in key_column_indexes]))
 
-  def _ParseQuery(self, parser_mediator, database, query, callback, cache):
+  def _ParseQuery(
+      self, parser_mediator, database, query, callback, cache,
+      deduplicate_rows=False):
     """Queries a database and parses the results.
 
     Args:
@@ -104,8 +117,17 @@ class SQLitePlugin(plugins.BasePlugin):
       query (str): query.
       callback (function): function to invoke to parse an individual row.
       cache (SQLiteCache): cache.
+      deduplicate_rows (Optional[bool]): True if rows that were parsed before
+          by the same query, for example in the database without its WAL
+          file, should be skipped.
     """
-    row_cache = cache.GetRowCache(query)
+    query_hash = hash(query)
+
+    key_column_names = None
+    row_cache = None
+    if deduplicate_rows:
+      key_column_names = self.QUERY_KEY_COLUMNS.get(callback.__name__, None)
+      row_cache = cache.GetRowCache(query)
 
     try:
       rows = database.Query(query)
@@ -120,9 +142,11 @@ class SQLitePlugin(plugins.BasePlugin):
       if parser_mediator.abort:
         break
 
-      row_hash = self._HashRow(row)
-      if row_hash in row_cache:
-        continue
+      row_hash = None
+      if row_cache is not None:
+        row_hash = self._HashRow(query_hash, row, key_column_names)
+        if row_hash in row_cache:
+          continue
 
       try:
         callback(parser_mediator, query, row, cache=cache, database=database)
@@ -135,7 +159,8 @@ class SQLitePlugin(plugins.BasePlugin):
         # TODO: consider removing return.
         return
 
-      row_cache.add(row_hash)
+      if row_cache is not None:
+        row_cache.add(row_hash)
 
   def CheckSchema(self, database):
     """Checks the schema of a database with that defined in the plugin.
@@ -158,7 +183,8 @@ class SQLitePlugin(plugins.BasePlugin):
 
   # pylint: disable=arguments-differ
   def Process(
-      self, parser_mediator, cache=None, database=None, **unused_kwargs):
+      self, parser_mediator, cache=None, database=None, database_wal=None,
+      **unused_kwargs):
     """Determine if this is the right plugin for this database.
 
     This function takes a SQLiteDatabase object and compares the list
@@ -172,6 +198,9 @@ class SQLitePlugin(plugins.BasePlugin):
       parser_mediator (ParserMediator): parser mediator.
       cache (Optional[SQLiteCache]): cache.
       database (Optional[SQLiteDatabase]): database.
+      database_wal (Optional[SQLiteDatabase]): database with its WAL file
+          committed or None if the database has no WAL file. Duplicate rows
+          are only looked for when the database has a WAL file.
 
     Raises:
       ValueError: If the database or cache value are missing.
@@ -196,4 +225,6 @@ class SQLitePlugin(plugins.BasePlugin):
                 self.NAME, callback_method, query))
         continue
 
-      self._ParseQuery(parser_mediator, database, query, callback, cache)
+      self._ParseQuery(
+          parser_mediator, database, query, callback, cache,
+          deduplicate_rows=database_wal is not None)
@@ -68,6 +68,7 @@ class MacKnowledgeCPlugin(interface.SQLitePlugin):
   QUERIES = [
       (("""
         SELECT
+          ZOBJECT.Z_PK AS "zobject_pk",
           ZOBJECT.ZCREATIONDATE AS "entry_creation", 
           ZOBJECT.ZSTARTDATE AS "start", 
           ZOBJECT.ZENDDATE AS "end",
@@ -80,6 +81,9 @@ class MacKnowledgeCPlugin(interface.SQLitePlugin):
         """),
        'KnowledgeCRow')]
 
+  QUERY_KEY_COLUMNS = {
+      'KnowledgeCRow': ('zobject_pk',)}
+
   # The required tables for the query.
   REQUIRED_TABLES = frozenset(['ZOBJECT', 'ZSTRUCTUREDMETADATA'])
 
@@ -175,6 +175,11 @@ class SkypePlugin(interface.SQLitePlugin):
         'FROM Calls c, CallMembers cm '
         'WHERE c.id = cm.call_db_id;'), 'ParseCall')]
 
+  QUERY_KEY_COLUMNS = {
+      'ParseAccountInformation': ('id',),
+      'ParseFileTransfer': ('id',),
+      'ParseSMS': ('id',)}
+
   SCHEMAS = [{
       'Accounts': (
           'CREATE TABLE Accounts (id INTEGER NOT NULL PRIMARY KEY, '
@@ -197,12 +197,55 @@ class SyslogParser(text_parser.PyparsingMultiLineTextParser):
 
   LINE_STRUCTURES = [
       ('syslog_line', _SYSLOG_LINE),
-      ('syslog_line', _KERNEL_SYSLOG_LINE),
+      ('kernel_syslog_line', _KERNEL_SYSLOG_LINE),
       ('syslog_comment', _SYSLOG_COMMENT),
       ('chromeos_syslog_line', _CHROMEOS_SYSLOG_LINE)]
 
   _SUPPORTED_KEYS = frozenset([key for key, _ in LINE_STRUCTURES])
 
+  # Regular expressions that match the same lines as the syslog line and
+  # kernel syslog line structures. Whitespace is matched like pyparsing skips
+  # it. Since pyparsing does not backtrack, the lookaheads prevent that a token
+  # of variable size is matched shorter than pyparsing would and that an
+  # optional token is skipped when pyparsing would have matched it.
+  _WHITESPACE = r'[ \t\r\n]*'
+
+  _BODY_REGULAR_EXPRESSION = r'{0:s}(?![ \t\r\n])(?P<body>{1:s})\n'.format(
+      _WHITESPACE, _BODY_CONTENT)
+
+  _FRACTIONAL_SECONDS_REGULAR_EXPRESSION = r'{0:s}\.{0:s}[0-9]'.format(
+      _WHITESPACE)
+
+  _DATE_REGULAR_EXPRESSION = (
+      r'(?P<month>[A-Z][a-z]{{2}}){0:s}'
+      r'(?P<day>[0-9]{{1,2}})(?![0-9]){0:s}'
+      r'(?P<hour>[0-9]{{2}}){0:s}:{0:s}'
+      r'(?P<minute>[0-9]{{2}}){0:s}:{0:s}'
+      r'(?P<second>[0-9]{{2}})'
+      r'(?:{0:s}\.{0:s}(?P<fractional_seconds>[0-9]+)(?![0-9])|(?!{1:s}))'
+      ).format(_WHITESPACE, _FRACTIONAL_SECONDS_REGULAR_EXPRESSION)
+
+  _KERNEL_SYSLOG_LINE_REGULAR_EXPRESSION = re.compile((
+      r'{0:s}{1:s}kernel{1:s}:{2:s}').format(
+          _DATE_REGULAR_EXPRESSION, _WHITESPACE, _BODY_REGULAR_EXPRESSION),
+                                                      re.DOTALL)
+
+  _SYSLOG_LINE_REGULAR_EXPRESSION = re.compile((
+      r'{0:s}{1:s}(?P<hostname>[!-~]+)(?![!-~]){1:s}'
+      r'(?P<reporter>[{2:s}]+)(?![{2:s}])'
+      r'(?:{1:s}\[{1:s}(?P<pid>[0-9]{{1,5}})(?![0-9]){1:s}\]|'
+      r'(?!{1:s}\[{1:s}[0-9]{{1,5}}(?![0-9]){1:s}\]))'
+      r'(?:{1:s}<{1:s}(?P<facility>[{3:s}]+)(?![{3:s}]){1:s}>|'
+      r'(?!{1:s}<{1:s}[{3:s}]+(?![{3:s}]){1:s}>))'
+      r'(?:{1:s}:|(?!{1:s}:)){4:s}').format(
+          _DATE_REGULAR_EXPRESSION, _WHITESPACE,
+          re.escape(_REPORTER_CHARACTERS), re.escape(_FACILITY_CHARACTERS),
+          _BODY_REGULAR_EXPRESSION), re.DOTALL)
+
+  _LINE_STRUCTURE_REGULAR_EXPRESSIONS = {
+      'kernel_syslog_line': _KERNEL_SYSLOG_LINE_REGULAR_EXPRESSION,
+      'syslog_line': _SYSLOG_LINE_REGULAR_EXPRESSION}
+
   def __init__(self):
     """Initializes a parser."""
     super(SyslogParser, self).__init__()
@@ -236,6 +279,27 @@ class SyslogParser(text_parser.PyparsingMultiLineTextParser):
         self._year_use += 1
     self._last_month = month
 
+  def _GetStructureFromRegularExpressionMatch(self, key, match):
+    """Retrieves line structure tokens from a regular expression match.
+
+    Args:
+      key (str): name of the line structure.
+      match (re.Match): regular expression match of the line structure.
+
+    Returns:
+      dict[str, object]: tokens of the line structure.
+    """
+    structure = match.groupdict()
+    for name in ('day', 'hour', 'minute', 'second', 'pid'):
+      value = structure.get(name, None)
+      if value is not None:
+        structure[name] = int(value, 10)
+
+    if key == 'kernel_syslog_line':
+      structure['reporter'] = 'kernel'
+
+    return structure
+
   def EnablePlugins(self, plugin_includes):
     """Enables parser plugins.
 
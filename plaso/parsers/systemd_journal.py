@@ -11,6 +11,7 @@ from dfdatetime import posix_time as dfdatetime_posix_time
 
 from plaso.containers import events
 from plaso.containers import time_events
+from plaso.lib import buffered_file
 from plaso.lib import definitions
 from plaso.lib import errors
 from plaso.lib import specification
@@ -284,6 +285,11 @@ class SystemdJournalParser(dtfabric_parser.DtFabricBaseParser):
     Raises:
       UnableToParseFile: when the header cannot be parsed.
     """
+    # The objects are small and entry objects are commonly stored near their
+    # data objects hence the file-like object is buffered to reduce the number
+    # of reads.
+    file_object = buffered_file.BufferedFileObject(file_object)
+
     file_header_map = self._GetDataTypeMap('systemd_journal_file_header')
 
     try:
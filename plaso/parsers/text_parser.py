@@ -9,11 +9,11 @@ parser.
 from __future__ import unicode_literals
 
 import abc
+import codecs
+import os
 
 import pyparsing
 
-from dfvfs.helpers import text_file
-
 from plaso.lib import errors
 from plaso.parsers import interface
 from plaso.parsers import logger
@@ -139,6 +139,119 @@ class PyparsingConstants(object):
       pyparsing.nums, min=1, max=5).setParseAction(PyParseIntCast)
 
 
+class TextLineReader(object):
+  """Text line reader that reads a file-like object in blocks.
+
+  The reader provides the readline interface of dfvfs.TextFile, but reads
+  the file-like object in blocks, instead of in reads of the maximum line
+  size, and splits the blocks into lines in memory. Lines that are longer
+  than the maximum line size are returned in parts of the maximum line size.
+  """
+
+  _BLOCK_SIZE = 64 * 1024
+
+  def __init__(self, file_object, encoding='utf-8', block_size=None):
+    """Initializes a text line reader.
+
+    Args:
+      file_object (dfvfs.FileIO): file-like object to read from.
+      encoding (Optional[str]): text encoding.
+      block_size (Optional[int]): size of the blocks read from the file-like
+          object.
+    """
+    super(TextLineReader, self).__init__()
+    self._block_size = block_size or self._BLOCK_SIZE
+    self._buffer = b''
+    self._buffer_offset = 0
+    self._current_offset = 0
+    self._encoding = encoding
+    self._end_of_line = '\n'.encode(encoding)
+    self._file_object = file_object
+    self._file_offset = 0
+
+  def _ReadBlock(self):
+    """Reads a block from the file-like object into the buffer.
+
+    Returns:
+      bool: True if data was read, False at the end of the file-like object.
+    """
+    self._file_object.seek(self._file_offset, os.SEEK_SET)
+    data = self._file_object.read(self._block_size)
+    if not data:
+      return False
+
+    self._file_offset += len(data)
+    self._buffer = b''.join([self._buffer[self._buffer_offset:], data])
+    self._buffer_offset = 0
+    return True
+
+  # Note: that the following functions do not follow the style guide
+  # because they are part of the readline file-like object interface.
+  # pylint: disable=invalid-name
+
+  def get_offset(self):
+    """Retrieves the current offset into the file-like object.
+
+    Returns:
+      int: current offset into the file-like object.
+    """
+    return self._current_offset
+
+  def readline(self, size=None):
+    """Reads a single line of text.
+
+    Args:
+      size (Optional[int]): maximum byte size to read. If present, it is
+          a maximum byte count (including the trailing end-of-line) and
+          an incomplete line may be returned.
+
+    Returns:
+      str: line of text or an empty string at the end of the file-like
+          object.
+
+    Raises:
+      UnicodeDecodeError: if a line cannot be decoded.
+    """
+    end_of_line_size = len(self._end_of_line)
+    search_offset = self._buffer_offset
+    while True:
+      end_offset = self._buffer.find(self._end_of_line, search_offset)
+      if end_offset != -1:
+        end_offset += end_of_line_size
+        break
+
+      end_offset = len(self._buffer)
+      if size and end_offset - self._buffer_offset >= size:
+        break
+
+      # Continue searching for the end-of-line in the data that is appended
+      # to the remainder of the buffer, which starts at offset 0.
+      search_offset = max(
+          0, end_offset - self._buffer_offset - end_of_line_size + 1)
+      if not self._ReadBlock():
+        break
+
+    if size and end_offset - self._buffer_offset > size:
+      end_offset = self._buffer_offset + size
+
+    line = self._buffer[self._buffer_offset:end_offset]
+    if not line:
+      return ''
+
+    self._buffer_offset = end_offset
+
+    last_offset = self._current_offset
+    self._current_offset += len(line)
+
+    decoded_line = line.decode(self._encoding)
+
+    # Remove a byte-order mark at the start of the file.
+    if last_offset == 0 and decoded_line[0] == '\ufeff':
+      decoded_line = decoded_line[1:]
+
+    return decoded_line
+
+
 class PyparsingSingleLineTextParser(interface.FileObjectParser):
   """Single line text parser interface based on pyparsing."""
 
@@ -172,6 +285,15 @@ class PyparsingSingleLineTextParser(interface.FileObjectParser):
   # Allow for a maximum of 40 empty lines before we bail out.
   _MAXIMUM_DEPTH = 40
 
+  # Regular expressions that provide a fast path for matching line structures,
+  # per line structure key. A line that matches the regular expression of
+  # a line structure is converted into tokens by
+  # _GetStructureFromRegularExpressionMatch(), instead of being parsed by
+  # pyparsing. Pyparsing is used when the line does not match the regular
+  # expression or when no tokens are returned. A regular expression should
+  # only match lines that the line structure parses into the same tokens.
+  _LINE_STRUCTURE_REGULAR_EXPRESSIONS = {}
+
   def __init__(self):
     """Initializes a parser."""
     super(PyparsingSingleLineTextParser, self).__init__()
@@ -180,6 +302,20 @@ class PyparsingSingleLineTextParser(interface.FileObjectParser):
     # a structural fix.
     self._line_structures = list(self.LINE_STRUCTURES)
 
+  def _GetStructureFromRegularExpressionMatch(self, key, match):
+    """Retrieves line structure tokens from a regular expression match.
+
+    Args:
+      key (str): name of the line structure.
+      match (re.Match): regular expression match of the line structure.
+
+    Returns:
+      dict[str, object]: tokens of the line structure, which can be passed
+          to ParseRecord() instead of a pyparsing.ParseResults, or None if
+          the line should be parsed with pyparsing.
+    """
+    return None
+
   def _GetValueFromStructure(self, structure, name, default_value=None):
     """Retrieves a token value from a Pyparsing structure.
 
@@ -188,7 +324,8 @@ class PyparsingSingleLineTextParser(interface.FileObjectParser):
     the Pyparsing default value of an empty byte stream (b'').
 
     Args:
-      structure (pyparsing.ParseResults): tokens from a parsed log line.
+      structure (pyparsing.ParseResults|dict[str, object]): tokens from
+          a parsed log line.
       name (str): name of the token.
       default_value (Optional[object]): default value.
 
@@ -314,7 +451,7 @@ class PyparsingSingleLineTextParser(interface.FileObjectParser):
           'Line structure undeclared, unable to proceed.')
 
     encoding = self._ENCODING or parser_mediator.codepage
-    text_file_object = text_file.TextFile(file_object, encoding=encoding)
+    text_file_object = TextLineReader(file_object, encoding=encoding)
 
     try:
       line = self._ReadLine(text_file_object, max_len=self.MAX_LINE_LENGTH)
@@ -351,10 +488,24 @@ class PyparsingSingleLineTextParser(interface.FileObjectParser):
       use_key = None
       # Try to parse the line using all the line structures.
       for index, (key, structure) in enumerate(self._line_structures):
-        try:
-          parsed_structure = structure.parseString(line)
-        except pyparsing.ParseException:
-          pass
+        regular_expression = self._LINE_STRUCTURE_REGULAR_EXPRESSIONS.get(
+            key, None)
+        if regular_expression:
+          # Pyparsing replaces tabs by spaces unless parseWithTabs() is used.
+          text = line
+          if not structure.keepTabs:
+            text = text.expandtabs()
+
+          match = regular_expression.match(text)
+          if match:
+            parsed_structure = self._GetStructureFromRegularExpressionMatch(
+                key, match)
+
+        if not parsed_structure:
+          try:
+            parsed_structure = structure.parseString(line)
+          except pyparsing.ParseException:
+            pass
         if parsed_structure:
           use_key = key
           break
@@ -422,7 +573,23 @@ class PyparsingSingleLineTextParser(interface.FileObjectParser):
 
 
 class EncodedTextReader(object):
-  """Encoded text reader."""
+  """Encoded text reader.
+
+  The reader decodes the file-like object into a buffer of lines of text and
+  maintains the offset of the unread text in the buffer. Structures can be
+  matched against the buffer at that offset, which means the text does not
+  need to be copied for every record that is read. The buffer contains at
+  least buffer size characters of unread text, if available, and can grow on
+  demand, for example to read records that are larger than the buffer size.
+
+  Attributes:
+    buffer (str): lines of text.
+    buffer_offset (int): offset of the unread text in the buffer.
+  """
+
+  _MAXIMUM_BUFFER_SIZE = 16 * 1024 * 1024
+
+  _READ_SIZE = 64 * 1024
 
   def __init__(self, encoding, buffer_size=2048):
     """Initializes the encoded text reader object.
@@ -432,41 +599,79 @@ class EncodedTextReader(object):
       buffer_size (Optional[int]): buffer size.
     """
     super(EncodedTextReader, self).__init__()
-    self._buffer = ''
     self._buffer_size = buffer_size
-    self._current_offset = 0
-    self._encoding = encoding
-    self.lines = ''
-
-  def _ReadLine(self, file_object):
-    """Reads a line from the file object.
+    self._decoder = codecs.getincrementaldecoder(encoding)()
+    self._end_of_file = False
+    self._partial_line = ''
+    self._read_size = max(buffer_size, self._READ_SIZE)
+    self.buffer = ''
+    self.buffer_offset = 0
+
+  @property
+  def lines(self):
+    """str: unread lines of text of at least buffer size characters."""
+    end_offset = self.buffer.find(
+        '\n', self.buffer_offset + self._buffer_size - 1)
+    if end_offset == -1:
+      return self.buffer[
+          self.buffer_offset:self.buffer_offset + self._buffer_size]
+
+    return self.buffer[self.buffer_offset:end_offset + 1]
+
+  def _ReadText(self, file_object, read_size, maximum_size):
+    """Reads text from the file object.
+
+    Only complete lines are returned, except at the end of the file-like
+    object or when the text is larger than the maximum size.
 
     Args:
       file_object (dfvfs.FileIO): file-like object.
+      read_size (int): number of bytes to read.
+      maximum_size (int): maximum number of characters of text, including
+          the partial line of a previous read, that are held back until an
+          end-of-line character is read.
 
     Returns:
-      str: line read from the file-like object.
+      str: text read from the file-like object.
+
+    Raises:
+      UnicodeDecodeError: if the text cannot be decoded.
     """
-    if len(self._buffer) < self._buffer_size:
-      content = file_object.read(self._buffer_size)
-      content = content.decode(self._encoding)
-      self._buffer = ''.join([self._buffer, content])
+    data = file_object.read(read_size)
+    if not data:
+      self._end_of_file = True
+
+    text = self._decoder.decode(data, final=self._end_of_file)
+    text = ''.join([self._partial_line, text])
+
+    if self._end_of_file or len(text) >= maximum_size:
+      self._partial_line = ''
+    else:
+      text, new_line, self._partial_line = text.rpartition('\n')
+      if not new_line:
+        return ''
 
-    line, new_line, self._buffer = self._buffer.partition('\n')
-    if not line and not new_line:
-      line = self._buffer
-      self._buffer = ''
+      text = ''.join([text, new_line])
 
-    self._current_offset += len(line)
+    # Strip carriage returns from the end of the lines.
+    text = text.replace('\r\n', '\n')
+    if text.endswith('\r'):
+      text = text[:-len('\r')]
 
-    # Strip carriage returns from the text.
-    if line.endswith('\r'):
-      line = line[:-len('\r')]
+    return text
 
-    if new_line:
-      line = ''.join([line, '\n'])
-      self._current_offset += len('\n')
+  def _ReadBufferLine(self):
+    """Reads a line from the lines buffer.
+
+    Returns:
+      str: line read from the lines buffer, without the end-of-line character.
+    """
+    end_offset = self.buffer.find('\n', self.buffer_offset)
+    if end_offset == -1:
+      end_offset = len(self.buffer)
 
+    line = self.buffer[self.buffer_offset:end_offset]
+    self.buffer_offset = min(end_offset + 1, len(self.buffer))
     return line
 
   def ReadLine(self, file_object):
@@ -478,35 +683,64 @@ class EncodedTextReader(object):
     Returns:
       str: line read from the lines buffer.
     """
-    line, _, self.lines = self.lines.partition('\n')
+    line = self._ReadBufferLine()
     if not line:
       self.ReadLines(file_object)
-      line, _, self.lines = self.lines.partition('\n')
+      line = self._ReadBufferLine()
 
     return line
 
-  def ReadLines(self, file_object):
+  def ReadLines(self, file_object, minimum_size=None, maximum_size=None):
     """Reads lines into the lines buffer.
 
     Args:
       file_object (dfvfs.FileIO): file-like object.
-    """
-    lines_size = len(self.lines)
-    if lines_size < self._buffer_size:
-      lines_size = self._buffer_size - lines_size
-      while lines_size > 0:
-        line = self._ReadLine(file_object)
-        if not line:
-          break
+      minimum_size (Optional[int]): minimum number of characters of unread
+          text in the lines buffer, where None represents the buffer size.
+          The minimum size is limited to the maximum buffer size.
+      maximum_size (Optional[int]): number of characters to read after which
+          text without an end-of-line character is added to the lines buffer
+          as well, where None represents the maximum buffer size. A small
+          maximum size prevents reading large amounts of text, when the text
+          contains no end-of-line characters.
+
+    Returns:
+      bool: True if text was added to the lines buffer.
 
-        self.lines = ''.join([self.lines, line])
-        lines_size -= len(line)
+    Raises:
+      UnicodeDecodeError: if the text cannot be decoded.
+    """
+    if minimum_size is None:
+      minimum_size = self._buffer_size
+    minimum_size = min(minimum_size, self._MAXIMUM_BUFFER_SIZE)
+
+    if maximum_size is None:
+      maximum_size = self._MAXIMUM_BUFFER_SIZE
+    read_size = min(self._read_size, maximum_size)
+
+    unread_size = len(self.buffer) - self.buffer_offset
+    if unread_size >= minimum_size or self._end_of_file:
+      return False
+
+    texts = [self.buffer[self.buffer_offset:]]
+    lines_size = unread_size
+    while lines_size < minimum_size and not self._end_of_file:
+      text = self._ReadText(
+          file_object, read_size, maximum_size - lines_size + unread_size)
+      texts.append(text)
+      lines_size += len(text)
+
+    self.buffer = ''.join(texts)
+    self.buffer_offset = 0
+    return lines_size > unread_size
 
   def Reset(self):
     """Resets the encoded text reader."""
-    self._buffer = ''
-    self._current_offset = 0
-    self.lines = ''
+    self._decoder.reset()
+    self._end_of_file = False
+    self._partial_line = ''
+    self.buffer = ''
+    self.buffer_offset = 0
 
   def SkipAhead(self, file_object, number_of_characters):
     """Skips ahead a number of characters.
@@ -515,17 +749,9 @@ class EncodedTextReader(object):
       file_object (dfvfs.FileIO): file-like object.
       number_of_characters (int): number of characters.
     """
-    lines_size = len(self.lines)
-    while number_of_characters >= lines_size:
-      number_of_characters -= lines_size
-
-      self.lines = ''
-      self.ReadLines(file_object)
-      lines_size = len(self.lines)
-      if lines_size == 0:
-        return
-
-    self.lines = self.lines[number_of_characters:]
+    self.buffer_offset = min(
+        self.buffer_offset + number_of_characters, len(self.buffer))
+    self.ReadLines(file_object)
 
 
 class PyparsingMultiLineTextParser(PyparsingSingleLineTextParser):
@@ -538,6 +764,47 @@ class PyparsingMultiLineTextParser(PyparsingSingleLineTextParser):
     super(PyparsingMultiLineTextParser, self).__init__()
     self._buffer_size = self.BUFFER_SIZE
 
+  def _ParseStructureAtOffset(self, key, structure, text, offset):
+    """Parses a line structure at a specific offset in the text.
+
+    Unlike pyparsing scanString(), the structure is only matched at the offset
+    and the text is not searched for a match further on.
+
+    Args:
+      key (str): name of the line structure.
+      structure (pyparsing.ParserElement): line structure.
+      text (str): text.
+      offset (int): offset in the text to parse the structure at.
+
+    Returns:
+      tuple[pyparsing.ParseResults|dict[str, object], int]: tokens and end
+          offset of the line structure or None and the offset if the line
+          structure does not match at the offset.
+    """
+    regular_expression = self._LINE_STRUCTURE_REGULAR_EXPRESSIONS.get(
+        key, None)
+    if regular_expression:
+      match = regular_expression.match(text, offset)
+      if match:
+        tokens = self._GetStructureFromRegularExpressionMatch(key, match)
+        if tokens:
+          return tokens, match.end()
+
+    # A structure that skips leading whitespace does not start at the offset.
+    # pylint: disable=protected-access
+    try:
+      if structure.preParse(text, offset) != offset:
+        return None, offset
+
+      end_offset, tokens = structure._parse(text, offset, callPreParse=False)
+    except pyparsing.ParseException:
+      return None, offset
+
+    if end_offset <= offset:
+      return None, offset
+
+    return tokens, end_offset
+
   def ParseFileObject(self, parser_mediator, file_object):
     """Parses a text file-like object using a pyparsing definition.
 
@@ -558,8 +825,10 @@ class PyparsingMultiLineTextParser(PyparsingSingleLineTextParser):
 
     text_reader.Reset()
 
+    # The structure is verified using at most the buffer size of text, the
+    # buffer is only grown further on once a structure has matched.
     try:
-      text_reader.ReadLines(file_object)
+      text_reader.ReadLines(file_object, maximum_size=self.BUFFER_SIZE)
     except UnicodeDecodeError as exception:
       raise errors.UnableToParseFile(
           'Not a text file, with error: {0!s}'.format(exception))
@@ -569,20 +838,20 @@ class PyparsingMultiLineTextParser(PyparsingSingleLineTextParser):
 
     # Using parseWithTabs() overrides Pyparsing's default replacement of tabs
     # with spaces to SkipAhead() the correct number of bytes after a match.
+    # The structures are streamlined since they are parsed using _parse()
+    # instead of scanString(), which streamlines on every invocation.
     for key, structure in self.LINE_STRUCTURES:
       structure.parseWithTabs()
-
+      structure.streamline()
 
     consecutive_line_failures = 0
     # Read every line in the text file.
-    while text_reader.lines:
+    while text_reader.buffer_offset < len(text_reader.buffer):
       if parser_mediator.abort:
         break
 
-      # Initialize pyparsing objects.
       tokens = None
-      start = 0
-      end = 0
+      end_offset = 0
 
       key = None
 
@@ -590,24 +859,23 @@ class PyparsingMultiLineTextParser(PyparsingSingleLineTextParser):
 
       # Try to parse the line using all the line structures.
       for index, (key, structure) in enumerate(self._line_structures):
-        try:
-          structure_generator = structure.scanString(
-              text_reader.lines, maxMatches=1)
-          parsed_structure = next(structure_generator, None)
-        except pyparsing.ParseException:
-          parsed_structure = None
-
-        if not parsed_structure:
-          continue
-
-        tokens, start, end = parsed_structure
-
-        # Only want to parse the structure if it starts
-        # at the beginning of the buffer.
-        if start == 0:
+        tokens, end_offset = self._ParseStructureAtOffset(
+            key, structure, text_reader.buffer, text_reader.buffer_offset)
+        if tokens is not None:
           break
 
-      if tokens and start == 0:
+      if tokens and end_offset >= len(text_reader.buffer):
+        # The record could continue in text that has not been read yet, hence
+        # the buffer is grown and the record is parsed again.
+        lines_size = len(text_reader.buffer) - text_reader.buffer_offset
+        try:
+          if text_reader.ReadLines(file_object, minimum_size=lines_size * 2):
+            continue
+        except UnicodeDecodeError as exception:
+          parser_mediator.ProduceExtractionWarning(
+              'unable to read lines with error: {0!s}'.format(exception))
+
+      if tokens:
         # Move matching key, structure pair to the front of the list, so that
         # structures that are more likely to match are tried first.
         if index is not None and index != 0:
@@ -622,7 +890,8 @@ class PyparsingMultiLineTextParser(PyparsingSingleLineTextParser):
               'unable to parse record: {0:s} with error: {1!s}'.format(
                   key, exception))
 
-        text_reader.SkipAhead(file_object, end)
+        text_reader.SkipAhead(
+            file_object, end_offset - text_reader.buffer_offset)
 
       else:
         odd_line = text_reader.ReadLine(file_object)
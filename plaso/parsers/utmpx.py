@@ -7,6 +7,7 @@ from dfdatetime import posix_time as dfdatetime_posix_time
 
 from plaso.containers import events
 from plaso.containers import time_events
+from plaso.lib import buffered_file
 from plaso.lib import errors
 from plaso.lib import definitions
 from plaso.lib import specification
@@ -152,6 +153,9 @@ class UtmpxParser(dtfabric_parser.DtFabricBaseParser):
     Raises:
       UnableToParseFile: when the file cannot be parsed.
     """
+    # The entries are small and stored consecutively hence the file-like
+    # object is buffered to reduce the number of reads.
+    file_object = buffered_file.BufferedFileObject(file_object)
     file_offset = 0
 
     try:
@@ -7,9 +7,9 @@ import abc
 import os
 
 from dtfabric import errors as dtfabric_errors
-from dtfabric.runtime import fabric as dtfabric_fabric
 
 from plaso.lib import errors
+from plaso.parsers import dtfabric_cache
 from plaso.parsers.winreg_plugins import interface
 
 
@@ -77,13 +77,15 @@ class DtFabricBaseWindowsRegistryPlugin(interface.WindowsRegistryPlugin):
   def __init__(self):
     """Initializes a dtFabric-based data format Registry plugin."""
     super(DtFabricBaseWindowsRegistryPlugin, self).__init__()
-    self._data_type_maps = {}
     self._fabric = self._ReadDefinitionFile(self._DEFINITION_FILE)
+    self._data_type_maps = dtfabric_cache.DtFabricCache.GetDataTypeMaps(
+        self._fabric)
 
   def _GetDataTypeMap(self, name):
     """Retrieves a data type map defined by the definition file.
 
-    The data type maps are cached for reuse.
+    The data type maps are cached for reuse and shared with other instances
+    that use the same definition file.
 
     Args:
       name (str): name of the data type as defined by the definition file.
@@ -114,10 +116,7 @@ class DtFabricBaseWindowsRegistryPlugin(interface.WindowsRegistryPlugin):
       return None
 
     path = os.path.join(self._DEFINITION_FILES_PATH, filename)
-    with open(path, 'rb') as file_object:
-      definition = file_object.read()
-
-    return dtfabric_fabric.DataTypeFabric(yaml_definition=definition)
+    return dtfabric_cache.DtFabricCache.GetDataTypeFabric(path)
 
   def _ReadStructureFromByteStream(
       self, byte_stream, file_offset, data_type_map, context=None):
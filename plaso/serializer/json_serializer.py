@@ -334,6 +334,10 @@ class JSONAttributeContainerSerializer(interface.AttributeContainerSerializer):
     Returns:
       path.PathSpec: path specification.
     """
+    # The JSON dict is copied so that it is not changed, which allows it to
+    # be reused after it was converted.
+    json_dict = dict(json_dict)
+
     type_indicator = json_dict.get('type_indicator', None)
     if type_indicator:
       del json_dict['type_indicator']
@@ -359,6 +359,17 @@ class StorageFileReader(interface.StorageReader):
     """
     return self._storage_file.GetNumberOfEventSources()
 
+  def GetSerializedEventDataByIdentifier(self, identifier):
+    """Retrieves the serialized form of specific event data.
+
+    Args:
+      identifier (AttributeContainerIdentifier): event data identifier.
+
+    Returns:
+      bytes: serialized event data or None if not available.
+    """
+    return self._storage_file.GetSerializedEventDataByIdentifier(identifier)
+
   def GetSessions(self):
     """Retrieves the sessions.
 
@@ -104,6 +104,24 @@ class BaseStore(object):
       IOError: if an invalid identifier is provided.
     """
 
+  @abc.abstractmethod
+  def _GetSerializedAttributeContainerByIdentifier(
+      self, container_type, identifier):
+    """Retrieves the serialized form of a container with a specific identifier.
+
+    Args:
+      container_type (str): container type.
+      identifier (AttributeContainerIdentifier): attribute container
+          identifier.
+
+    Returns:
+      bytes: serialized attribute container data or None if not available.
+
+    Raises:
+      OSError: if an invalid identifier is provided.
+      IOError: if an invalid identifier is provided.
+    """
+
   @abc.abstractmethod
   def _RaiseIfNotWritable(self):
     """Raises if the store is not writable.
@@ -320,6 +338,18 @@ class BaseStore(object):
     return self._GetNumberOfAttributeContainers(
         self._CONTAINER_TYPE_EVENT_SOURCE)
 
+  def GetSerializedEventDataByIdentifier(self, identifier):
+    """Retrieves the serialized form of specific event data.
+
+    Args:
+      identifier (AttributeContainerIdentifier): event data identifier.
+
+    Returns:
+      bytes: serialized event data or None if not available.
+    """
+    return self._GetSerializedAttributeContainerByIdentifier(
+        self._CONTAINER_TYPE_EVENT_DATA, identifier)
+
   def GetSessions(self):
     """Retrieves the sessions.
 
@@ -778,6 +808,17 @@ class StorageReader(object):
       int: number of event sources.
     """
 
+  @abc.abstractmethod
+  def GetSerializedEventDataByIdentifier(self, identifier):
+    """Retrieves the serialized form of specific event data.
+
+    Args:
+      identifier (AttributeContainerIdentifier): event data identifier.
+
+    Returns:
+      bytes: serialized event data or None if not available.
+    """
+
   @abc.abstractmethod
   def GetSessions(self):
     """Retrieves the sessions.
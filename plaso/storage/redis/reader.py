@@ -116,6 +116,17 @@ class RedisStorageReader(interface.StorageReader):
     """
     return self._store.GetNumberOfEventSources()
 
+  def GetSerializedEventDataByIdentifier(self, identifier):
+    """Retrieves the serialized form of specific event data.
+
+    Args:
+      identifier (AttributeContainerIdentifier): event data identifier.
+
+    Returns:
+      bytes: serialized event data or None if not available.
+    """
+    return self._store.GetSerializedEventDataByIdentifier(identifier)
+
   def GetSortedEvents(self, time_range=None):
     """Retrieves the events in increasing chronological order.
 
@@ -160,6 +160,22 @@ class RedisStore(interface.BaseStore):
     attribute_container.SetIdentifier(identifier)
     return attribute_container
 
+  def _GetSerializedAttributeContainerByIdentifier(
+      self, container_type, identifier):
+    """Retrieves the serialized form of a container with a specific identifier.
+
+    Args:
+      container_type (str): container type.
+      identifier (RedisKeyIdentifier): attributes container identifier.
+
+    Returns:
+      bytes: serialized attribute container data or None if not available.
+    """
+    container_key = self._GenerateRedisKey(container_type)
+    string_identifier = identifier.CopyToString()
+
+    return self._redis_client.hget(container_key, string_identifier) or None
+
   def _GetNumberOfAttributeContainers(self, container_type):
     """Determines the number of containers of a type in the store.
 
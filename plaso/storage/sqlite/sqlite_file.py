@@ -279,46 +279,13 @@ class SQLiteStorageFile(file_interface.BaseStorageFile):
       IOError: when there is an error querying the storage file.
       OSError: when there is an error querying the storage file.
     """
-    sequence_number = index + 1
-    query = 'SELECT _data FROM {0:s} WHERE rowid = {1:d}'.format(
-        container_type, sequence_number)
-
-    try:
-      self._cursor.execute(query)
-    except sqlite3.OperationalError as exception:
-      raise IOError('Unable to query storage file with error: {0!s}'.format(
-          exception))
-
-    row = self._cursor.fetchone()
-    if row:
-      identifier = identifiers.SQLTableIdentifier(
-          container_type, sequence_number)
-
-      if self.compression_format == definitions.COMPRESSION_FORMAT_ZLIB:
-        serialized_data = zlib.decompress(row[0])
-      else:
-        serialized_data = row[0]
-
-      if self._storage_profiler:
-        self._storage_profiler.Sample(
-            'read', container_type, len(serialized_data), len(row[0]))
-
-      attribute_container = self._DeserializeAttributeContainer(
-          container_type, serialized_data)
-      attribute_container.SetIdentifier(identifier)
-      return attribute_container
-
-    count = self._GetNumberOfAttributeContainers(container_type)
-    index -= count
-
-    serialized_data = self._GetSerializedAttributeContainerByIndex(
+    serialized_data = self._ReadSerializedAttributeContainerByIndex(
         container_type, index)
     attribute_container = self._DeserializeAttributeContainer(
         container_type, serialized_data)
 
     if attribute_container:
-      identifier = identifiers.SQLTableIdentifier(
-          container_type, sequence_number)
+      identifier = identifiers.SQLTableIdentifier(container_type, index + 1)
       attribute_container.SetIdentifier(identifier)
     return attribute_container
 
@@ -378,6 +345,28 @@ class SQLiteStorageFile(file_interface.BaseStorageFile):
 
       row = cursor.fetchone()
 
+  def _GetSerializedAttributeContainerByIdentifier(
+      self, container_type, identifier):
+    """Retrieves the serialized form of a container with a specific identifier.
+
+    Args:
+      container_type (str): container type.
+      identifier (SQLTableIdentifier): attribute container identifier.
+
+    Returns:
+      bytes: serialized attribute container data or None if not available.
+
+    Raises:
+      OSError: if an unsupported identifier is provided.
+      IOError: if an unsupported identifier is provided.
+    """
+    if not isinstance(identifier, identifiers.SQLTableIdentifier):
+      raise IOError('Unsupported event data identifier type: {0!s}'.format(
+          type(identifier)))
+
+    return self._ReadSerializedAttributeContainerByIndex(
+        container_type, identifier.row_identifier - 1)
+
   # TODO: determine if this method should account for non-stored attribute
   # containers or that it is better to rename the method to
   # _HasStoredAttributeContainers.
@@ -429,6 +418,49 @@ class SQLiteStorageFile(file_interface.BaseStorageFile):
     self.serialization_format = metadata_values['serialization_format']
     self.storage_type = metadata_values['storage_type']
 
+  def _ReadSerializedAttributeContainerByIndex(self, container_type, index):
+    """Reads the serialized form of a specific attribute container.
+
+    Attribute containers that have not been written to the storage file yet
+    are read from the serialized attribute container list.
+
+    Args:
+      container_type (str): attribute container type.
+      index (int): attribute container index.
+
+    Returns:
+      bytes: serialized attribute container data or None if not available.
+
+    Raises:
+      IOError: when there is an error querying the storage file.
+      OSError: when there is an error querying the storage file.
+    """
+    query = 'SELECT _data FROM {0:s} WHERE rowid = {1:d}'.format(
+        container_type, index + 1)
+
+    try:
+      self._cursor.execute(query)
+    except sqlite3.OperationalError as exception:
+      raise IOError('Unable to query storage file with error: {0!s}'.format(
+          exception))
+
+    row = self._cursor.fetchone()
+    if not row:
+      count = self._GetNumberOfAttributeContainers(container_type)
+      return self._GetSerializedAttributeContainerByIndex(
+          container_type, index - count)
+
+    if self.compression_format == definitions.COMPRESSION_FORMAT_ZLIB:
+      serialized_data = zlib.decompress(row[0])
+    else:
+      serialized_data = row[0]
+
+    if self._storage_profiler:
+      self._storage_profiler.Sample(
+          'read', container_type, len(serialized_data), len(row[0]))
+
+    return serialized_data
+
   def _UpdateEventDataIdentifierAfterDeserialize(self, event):
     """Updates the event data identifier of an event after deserialization.
 
@@ -8,6 +8,7 @@ import argparse
 import unittest
 
 from plaso.cli import extraction_tool
+from plaso.lib import errors
 
 from tests.cli import test_lib
 
@@ -19,7 +20,11 @@ class ExtractionToolTest(test_lib.CLIToolTestCase):
 
   _EXPECTED_PERFORMANCE_OPTIONS = '\n'.join([
       'usage: extraction_tool_test.py [--buffer_size BUFFER_SIZE]',
+      '                               [--dtfabric_cache_directory DIRECTORY]',
+      '                               [--order_by_data_offset]',
+      '                               [--path_spec_cache_directory DIRECTORY]',
       '                               [--queue_size QUEUE_SIZE]',
+      '                               [--shared_chunk_cache_size SIZE]',
       '',
       'Test argument parser.',
       '',
@@ -28,9 +33,50 @@ class ExtractionToolTest(test_lib.CLIToolTestCase):
        '--bs BUFFER_SIZE'),
       ('                        The buffer size for the output (defaults to '
        '196MiB).'),
+      ('  --dtfabric_cache_directory DIRECTORY, '
+       '--dtfabric-cache-directory DIRECTORY'),
+      ('                        Path to a directory to store the parsed '
+       'dtFabric'),
+      ('                        definition files, so that worker processes '
+       'do not need'),
+      '                        to parse them again.',
+      '  --order_by_data_offset, --order-by-data-offset',
+      ('                        Schedule the file entries of a storage '
+       'media image in'),
+      ('                        the order of the offsets of their data and '
+       'group file'),
+      ('                        entries with neighbouring data into the '
+       'same task.'),
+      ('                        This reduces random reads of the image and '
+       'repeated'),
+      ('                        decompression of the same chunks of a '
+       'compressed'),
+      ('                        image, such as EWF, at the expense of '
+       'processing the'),
+      '                        largest files first.',
+      ('  --path_spec_cache_directory DIRECTORY, '
+       '--path-spec-cache-directory DIRECTORY'),
+      ('                        Path to a directory to store the file '
+       'entries'),
+      ('                        enumerated from a storage media image, '
+       'so that'),
+      ('                        subsequent runs over the same image with '
+       'a filter file'),
+      ('                        do not need to walk its file systems '
+       'again.'),
       '  --queue_size QUEUE_SIZE, --queue-size QUEUE_SIZE',
       '                        The maximum number of queued items per worker',
       '                        (defaults to 125000)',
+      '  --shared_chunk_cache_size SIZE, --shared-chunk-cache-size SIZE',
+      ('                        Size in MiB of a cache of decompressed '
+       'chunks of'),
+      ('                        compressed storage media images, such as '
+       'EWF, that is'),
+      ('                        shared by the worker processes, so that a '
+       'chunk is'),
+      ('                        only decompressed once. A value of 0 '
+       'disables the'),
+      '                        cache (defaults to 0).',
       ''])
 
   # TODO: add test for _CreateProcessingConfiguration
@@ -42,6 +88,31 @@ class ExtractionToolTest(test_lib.CLIToolTestCase):
     options = test_lib.TestOptions()
 
     test_tool._ParsePerformanceOptions(options)
+    self.assertEqual(test_tool._shared_chunk_cache_size, 0)
+
+    options.shared_chunk_cache_size = '64'
+
+    test_tool._ParsePerformanceOptions(options)
+    self.assertEqual(test_tool._shared_chunk_cache_size, 64 * 1024 * 1024)
+
+    options.shared_chunk_cache_size = '-1'
+
+    with self.assertRaises(errors.BadConfigOption):
+      test_tool._ParsePerformanceOptions(options)
+
+    options.shared_chunk_cache_size = None
+    options.dtfabric_cache_directory = self._GetTestFilePath([
+        'does_not_exist'])
+
+    with self.assertRaises(errors.BadConfigOption):
+      test_tool._ParsePerformanceOptions(options)
+
+    options.dtfabric_cache_directory = None
+    options.path_spec_cache_directory = self._GetTestFilePath([
+        'does_not_exist'])
+
+    with self.assertRaises(errors.BadConfigOption):
+      test_tool._ParsePerformanceOptions(options)
 
   # TODO: add test for _ParseProcessingOptions
   # TODO: add test for _PreprocessSources
@@ -23,8 +23,9 @@ class ElasticSearchOutputArgumentsHelperTest(
 
   _EXPECTED_OUTPUT = """\
 usage: cli_helper.py [--index_name INDEX_NAME] [--doc_type DOCUMENT_TYPE]
-                     [--flush_interval FLUSH_INTERVAL] [--raw_fields]
-                     [--elastic_user ELASTIC_USER]
+                     [--flush_interval FLUSH_INTERVAL]
+                     [--concurrent_requests CONCURRENT_REQUESTS]
+                     [--raw_fields] [--elastic_user ELASTIC_USER]
                      [--elastic_password ELASTIC_PASSWORD] [--use_ssl]
                      [--ca_certificates_file_path CA_CERTIFICATES_FILE_PATH]
                      [--elastic_url_prefix ELASTIC_URL_PREFIX]
@@ -36,6 +37,9 @@ optional arguments:
   --ca_certificates_file_path CA_CERTIFICATES_FILE_PATH
                         Path to a file containing a list of root certificates
                         to trust.
+  --concurrent_requests CONCURRENT_REQUESTS, --concurrent-requests CONCURRENT_REQUESTS
+                        Maximum number of bulk inserts that are sent to
+                        ElasticSearch concurrently.
   --doc_type DOCUMENT_TYPE
                         Name of the document type that will be used in
                         ElasticSearch.
@@ -87,6 +91,12 @@ optional arguments:
       elastic_output.ElasticSearchOutputArgumentsHelper.ParseOptions(
           options, None)
 
+    options.concurrent_requests = 0
+
+    with self.assertRaises(errors.BadConfigOption):
+      elastic_output.ElasticSearchOutputArgumentsHelper.ParseOptions(
+          options, output_module)
+
 
 if __name__ == '__main__':
   unittest.main()
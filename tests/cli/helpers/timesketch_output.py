@@ -40,11 +40,15 @@ class TimesketchOutputArgumentsHelperTest(
   _EXPECTED_OUTPUT = """\
 usage: cli_helper.py [--name TIMELINE_NAME] [--index INDEX]
                      [--flush_interval FLUSH_INTERVAL]
+                     [--concurrent_requests CONCURRENT_REQUESTS]
                      [--doc_type DOCUMENT_TYPE] [--username USERNAME]
 
 Test argument parser.
 
 optional arguments:
+  --concurrent_requests CONCURRENT_REQUESTS, --concurrent-requests CONCURRENT_REQUESTS
+                        The maximum number of bulk requests that are sent to
+                        Elasticsearch concurrently.
   --doc_type DOCUMENT_TYPE
                         Name of the document type that will be used in
                         ElasticSearch.
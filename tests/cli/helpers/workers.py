@@ -20,11 +20,23 @@ class WorkersArgumentsHelperTest(cli_test_lib.CLIToolTestCase):
   # pylint: disable=no-member,protected-access
 
   _EXPECTED_OUTPUT = """\
-usage: cli_helper.py [--worker_memory_limit SIZE] [--workers WORKERS]
+usage: cli_helper.py [--maximum_workers MAXIMUM_WORKERS]
+                     [--status_transport TRANSPORT]
+                     [--worker_memory_limit SIZE] [--workers WORKERS]
 
 Test argument parser.
 
 optional arguments:
+  --maximum_workers MAXIMUM_WORKERS, --maximum-workers MAXIMUM_WORKERS
+                        Maximum number of worker processes. If set to a value
+                        larger than the number of worker processes, worker
+                        processes are added or retired based on the CPU, I/O
+                        wait and memory usage of the system [defaults to 0,
+                        which represents a fixed number of worker processes].
+  --status_transport TRANSPORT, --status-transport TRANSPORT
+                        Transport used by the worker processes to report their
+                        status to the main (foreman) process, the default is:
+                        zeromq. Supported options: xmlrpc, zeromq
   --worker_memory_limit SIZE, --worker-memory-limit SIZE
                         Maximum amount of memory (data segment and shared
                         memory) a worker process is allowed to consume in
@@ -55,7 +67,9 @@ optional arguments:
     test_tool = tools.CLITool()
     workers.WorkersArgumentsHelper.ParseOptions(options, test_tool)
 
+    self.assertEqual(test_tool._maximum_number_of_extraction_workers, 0)
     self.assertEqual(test_tool._number_of_extraction_workers, options.workers)
+    self.assertEqual(test_tool._status_transport, 'zeromq')
 
     with self.assertRaises(errors.BadConfigObject):
       workers.WorkersArgumentsHelper.ParseOptions(options, None)
@@ -68,6 +82,20 @@ optional arguments:
       options.workers = -1
       workers.WorkersArgumentsHelper.ParseOptions(options, test_tool)
 
+    options.workers = 0
+
+    with self.assertRaises(errors.BadConfigOption):
+      options.maximum_workers = -1
+      workers.WorkersArgumentsHelper.ParseOptions(options, test_tool)
+
+    options.maximum_workers = 0
+
+    with self.assertRaises(errors.BadConfigOption):
+      options.status_transport = 'bogus'
+      workers.WorkersArgumentsHelper.ParseOptions(options, test_tool)
+
+    options.status_transport = 'xmlrpc'
+
     with self.assertRaises(errors.BadConfigOption):
       options.worker_memory_limit = 'bogus'
       workers.WorkersArgumentsHelper.ParseOptions(options, test_tool)
@@ -8,6 +8,10 @@ import io
 import json
 import os
 import unittest
+try:
+  import mock  # pylint: disable=import-error
+except ImportError:
+  from unittest import mock
 
 from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.path import factory as path_spec_factory
@@ -186,7 +190,56 @@ class ImageExportToolTest(test_lib.CLIToolTestCase):
     file_entry = path_spec_resolver.Resolver.OpenFileEntry(tsk_path_spec)
     with shared_test_lib.TempDirectory() as temp_directory:
       destination_path = os.path.join(temp_directory, 'another_file')
-      test_tool._WriteFileEntry(file_entry, '', destination_path)
+      digest_hash = test_tool._WriteFileEntry(file_entry, '', destination_path)
+
+      self.assertTrue(os.path.exists(destination_path))
+
+    expected_digest_hash = (
+        'c7fbc0e821c0871805a99584c6a384533909f68a6bbe9a2a687d28d9f3b10c16')
+    self.assertEqual(digest_hash, expected_digest_hash)
+
+  def testWriteDataStreamToTemporaryFile(self):
+    """Tests the _WriteDataStreamToTemporaryFile function."""
+    test_file_path = self._GetTestFilePath(['ímynd.dd'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    test_tool = image_export_tool.ImageExportTool()
+
+    os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+    tsk_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_TSK, inode=16,
+        location='/a_directory/another_file', parent=os_path_spec)
+
+    file_entry = path_spec_resolver.Resolver.OpenFileEntry(tsk_path_spec)
+    with shared_test_lib.TempDirectory() as temp_directory:
+      exported_data_stream = test_tool._WriteDataStreamToTemporaryFile(
+          file_entry, '', temp_directory)
+
+      self.assertIsNone(exported_data_stream.error_message)
+      self.assertEqual(
+          exported_data_stream.digest,
+          'c7fbc0e821c0871805a99584c6a384533909f68a6bbe9a2a687d28d9f3b10c16')
+      self.assertEqual(
+          exported_data_stream.target_directory,
+          os.path.join(temp_directory, 'a_directory'))
+      self.assertEqual(exported_data_stream.target_filename, 'another_file')
+      self.assertEqual(
+          os.path.dirname(exported_data_stream.temporary_path), temp_directory)
+      self.assertTrue(os.path.exists(exported_data_stream.temporary_path))
+
+    tsk_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_TSK, inode=12,
+        location='/a_directory', parent=os_path_spec)
+
+    file_entry = path_spec_resolver.Resolver.OpenFileEntry(tsk_path_spec)
+    with shared_test_lib.TempDirectory() as temp_directory:
+      exported_data_stream = test_tool._WriteDataStreamToTemporaryFile(
+          file_entry, '', temp_directory)
+
+      self.assertIsNotNone(exported_data_stream.error_message)
+      self.assertIsNone(exported_data_stream.temporary_path)
+      self.assertEqual(os.listdir(temp_directory), [])
 
   # TODO: add tests for AddFilterOptions.
 
@@ -249,6 +302,16 @@ class ImageExportToolTest(test_lib.CLIToolTestCase):
     with self.assertRaises(errors.BadConfigOption):
       test_tool.ParseOptions(options)
 
+    options = test_lib.TestOptions()
+    options.artifact_definitions_path = test_artifacts_path
+    options.image = test_file_path
+    options.workers = '2'
+
+    with mock.patch(
+        'multiprocessing.get_all_start_methods', return_value=['spawn']):
+      with self.assertRaises(errors.BadConfigOption):
+        test_tool.ParseOptions(options)
+
     # TODO: improve test coverage.
 
   def testPrintFilterCollection(self):
@@ -373,6 +436,60 @@ class ImageExportToolTest(test_lib.CLIToolTestCase):
       extracted_files = self._RecursiveList(temp_directory)
       self.assertEqual(sorted(extracted_files), expected_extracted_files)
 
+  def testProcessSourcesWithWorkerProcesses(self):
+    """Tests the ProcessSources function with worker processes."""
+    test_artifacts_path = self._GetTestFilePath(['artifacts'])
+    self._SkipIfPathNotExists(test_artifacts_path)
+
+    test_file_path = self._GetTestFilePath(['ímynd.dd'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    output_writer = test_lib.TestOutputWriter(encoding='utf-8')
+    test_tool = image_export_tool.ImageExportTool(output_writer=output_writer)
+
+    options = test_lib.TestOptions()
+    options.artifact_definitions_path = test_artifacts_path
+    options.image = test_file_path
+    options.quiet = True
+    options.workers = '2'
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      options.path = temp_directory
+
+      test_tool.ParseOptions(options)
+
+      test_tool.ProcessSources()
+
+      extracted_files = self._RecursiveList(temp_directory)
+
+      with open(os.path.join(temp_directory, 'hashes.json')) as json_file:
+        json_data = json.load(json_file)
+
+    output_writer = test_lib.TestOutputWriter(encoding='utf-8')
+    test_tool = image_export_tool.ImageExportTool(output_writer=output_writer)
+
+    options.workers = None
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      options.path = temp_directory
+
+      test_tool.ParseOptions(options)
+
+      test_tool.ProcessSources()
+
+      expected_extracted_files = self._RecursiveList(temp_directory)
+
+      with open(os.path.join(temp_directory, 'hashes.json')) as json_file:
+        expected_json_data = json.load(json_file)
+
+    # Test that the exported files do not depend on the worker processes.
+    self.assertEqual(len(extracted_files), 5)
+    self.assertEqual(
+        [path[len(temp_directory):] for path in sorted(extracted_files)],
+        [path[len(temp_directory):] for path in sorted(
+            expected_extracted_files)])
+    self.assertEqual(json_data, expected_json_data)
+
   def testProcessSourcesExtractWithNamesFilter(self):
     """Tests the ProcessSources function with a names filter."""
     test_artifacts_path = self._GetTestFilePath(['artifacts'])
@@ -445,6 +562,56 @@ class ImageExportToolTest(test_lib.CLIToolTestCase):
 
     self.assertEqual(sorted(extracted_files), expected_extracted_files)
 
+  def testProcessSourcesExtractWithFilterAndPathSpecCache(self):
+    """Tests the ProcessSources function with a filter file and a cache."""
+    test_artifacts_path = self._GetTestFilePath(['artifacts'])
+    self._SkipIfPathNotExists(test_artifacts_path)
+
+    test_file_path = self._GetTestFilePath(['image.qcow2'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    options = test_lib.TestOptions()
+    options.artifact_definitions_path = test_artifacts_path
+    options.image = test_file_path
+    options.quiet = True
+
+    with shared_test_lib.TempDirectory() as cache_directory:
+      options.path_spec_cache_directory = cache_directory
+
+      # The second export reads the file entries from the cache.
+      for _ in range(2):
+        output_writer = test_lib.TestOutputWriter(encoding='utf-8')
+        test_tool = image_export_tool.ImageExportTool(
+            output_writer=output_writer)
+
+        with shared_test_lib.TempDirectory() as temp_directory:
+          filter_file = os.path.join(temp_directory, 'filter.txt')
+          with io.open(filter_file, 'wt', encoding='utf-8') as file_object:
+            file_object.write('/a_directory/.+_file\n')
+
+          options.file_filter = filter_file
+          options.path = temp_directory
+
+          test_tool.ParseOptions(options)
+
+          test_tool.ProcessSources()
+
+          expected_extracted_files = sorted([
+              os.path.join(temp_directory, 'filter.txt'),
+              os.path.join(temp_directory, 'a_directory'),
+              os.path.join(temp_directory, 'a_directory', 'another_file'),
+              os.path.join(temp_directory, 'a_directory', 'a_file'),
+              os.path.join(temp_directory, 'hashes.json')])
+
+          extracted_files = self._RecursiveList(temp_directory)
+
+        self.assertEqual(sorted(extracted_files), expected_extracted_files)
+
+        cache_files = [
+            filename for filename in os.listdir(cache_directory)
+            if filename.endswith('.db')]
+        self.assertEqual(len(cache_files), 1)
+
   def testProcessSourcesExtractWithArtifactsFilter(self):
     """Tests the ProcessSources function with a artifacts filter file."""
     test_artifacts_path = self._GetTestFilePath(['artifacts'])
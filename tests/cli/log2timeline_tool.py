@@ -35,12 +35,24 @@ class Log2TimelineToolTest(test_lib.CLIToolTestCase):
     _EXPECTED_PROCESSING_OPTIONS = ("""\
 usage: log2timeline_test.py [--single_process]
                             [--temporary_directory DIRECTORY]
-                            [--vfs_back_end TYPE] [--worker_memory_limit SIZE]
-                            [--workers WORKERS]
+                            [--vfs_back_end TYPE]
+                            [--maximum_workers MAXIMUM_WORKERS]
+                            [--status_transport TRANSPORT]
+                            [--worker_memory_limit SIZE] [--workers WORKERS]
 
 Test argument parser.
 
 optional arguments:
+  --maximum_workers MAXIMUM_WORKERS, --maximum-workers MAXIMUM_WORKERS
+                        Maximum number of worker processes. If set to a value
+                        larger than the number of worker processes, worker
+                        processes are added or retired based on the CPU, I/O
+                        wait and memory usage of the system [defaults to 0,
+                        which represents a fixed number of worker processes].
+  --status_transport TRANSPORT, --status-transport TRANSPORT
+                        Transport used by the worker processes to report their
+                        status to the main (foreman) process, the default is:
+                        zeromq. Supported options: xmlrpc, zeromq
   --single_process, --single-process
                         Indicate that the tool should run in a single process.
   --temporary_directory DIRECTORY, --temporary-directory DIRECTORY
@@ -61,12 +73,24 @@ optional arguments:
     _EXPECTED_PROCESSING_OPTIONS = ("""\
 usage: log2timeline_test.py [--single_process] [--process_memory_limit SIZE]
                             [--temporary_directory DIRECTORY]
-                            [--vfs_back_end TYPE] [--worker_memory_limit SIZE]
-                            [--workers WORKERS]
+                            [--vfs_back_end TYPE]
+                            [--maximum_workers MAXIMUM_WORKERS]
+                            [--status_transport TRANSPORT]
+                            [--worker_memory_limit SIZE] [--workers WORKERS]
 
 Test argument parser.
 
 optional arguments:
+  --maximum_workers MAXIMUM_WORKERS, --maximum-workers MAXIMUM_WORKERS
+                        Maximum number of worker processes. If set to a value
+                        larger than the number of worker processes, worker
+                        processes are added or retired based on the CPU, I/O
+                        wait and memory usage of the system [defaults to 0,
+                        which represents a fixed number of worker processes].
+  --status_transport TRANSPORT, --status-transport TRANSPORT
+                        Transport used by the worker processes to report their
+                        status to the main (foreman) process, the default is:
+                        zeromq. Supported options: xmlrpc, zeromq
   --process_memory_limit SIZE, --process-memory-limit SIZE
                         Maximum amount of memory (data segment) a process is
                         allowed to allocate in bytes, where 0 represents no
@@ -17,6 +17,7 @@ except ImportError:
 from plaso.cli import psort_tool
 from plaso.cli.helpers import interface as helpers_interface
 from plaso.cli.helpers import manager as helpers_manager
+from plaso.formatters import mediator as formatters_mediator
 from plaso.lib import errors
 from plaso.output import interface as output_interface
 from plaso.output import manager as output_manager
@@ -119,6 +120,8 @@ class TestOutputModuleMissingParameters(output_interface.LinearOutputModule):
 class PsortToolTest(test_lib.CLIToolTestCase):
   """Tests for the psort tool."""
 
+  # pylint: disable=protected-access
+
   if resource is None:
     _EXPECTED_PROCESSING_OPTIONS = """\
 usage: psort_test.py [--temporary_directory DIRECTORY]
@@ -175,6 +178,25 @@ optional arguments:
   # TODO: add test for _PrintStatusUpdate.
   # TODO: add test for _PrintStatusUpdateStream.
 
+  def testPrintWindowsEventMessageCacheDetails(self):
+    """Tests the _PrintWindowsEventMessageCacheDetails function."""
+    output_writer = test_lib.TestOutputWriter(encoding='utf-8')
+    test_tool = psort_tool.PsortTool(output_writer=output_writer)
+
+    formatter_mediator = formatters_mediator.FormatterMediator()
+
+    test_tool._PrintWindowsEventMessageCacheDetails(formatter_mediator)
+    self.assertEqual(output_writer.ReadOutput(), '')
+
+    formatter_mediator._winevt_message_cache_hits = 3
+    formatter_mediator._winevt_message_cache_misses = 1
+
+    test_tool._PrintWindowsEventMessageCacheDetails(formatter_mediator)
+
+    output = output_writer.ReadOutput()
+    self.assertIn('Windows Event Log message cache', output)
+    self.assertIn('Hit rate : 75.0%', output)
+
   def testAddProcessingOptions(self):
     """Tests the AddProcessingOptions function."""
     argument_parser = argparse.ArgumentParser(
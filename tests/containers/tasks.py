@@ -41,12 +41,14 @@ class TaskTest(shared_test_lib.BaseTestCase):
     """Tests the CreateRetryTask function."""
     session_identifier = '{0:s}'.format(uuid.uuid4().hex)
     task = tasks.Task(session_identifier=session_identifier)
+    task.grouped_path_specs = ['test_grouped_path_spec']
     task.path_spec = 'test_path_spec'
 
     retry_task = task.CreateRetryTask()
     self.assertNotEqual(retry_task.identifier, task.identifier)
     self.assertTrue(task.has_retry)
     self.assertFalse(retry_task.has_retry)
+    self.assertEqual(retry_task.grouped_path_specs, task.grouped_path_specs)
     self.assertEqual(retry_task.path_spec, task.path_spec)
 
   def testCreateTaskCompletion(self):
@@ -15,6 +15,7 @@ from dfvfs.resolver import context
 from dfvfs.resolver import resolver as path_spec_resolver
 
 from plaso.engine import extractors
+from plaso.engine import path_spec_cache
 
 from tests import test_lib as shared_test_lib
 
@@ -282,6 +283,87 @@ class PathSpecExtractorTest(shared_test_lib.BaseTestCase):
     # image_offset: 0
     self.assertEqual(paths[1], '/passwords.txt')
 
+  def testExtractPathSpecsStorageMediaImageWithPathSpecCache(self):
+    """Tests the ExtractPathSpecs function with a path specification cache."""
+    test_file_path = self._GetTestFilePath(['ímynd.dd'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    volume_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+    source_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_TSK, location='/',
+        parent=volume_path_spec)
+
+    find_specs = self._GetFindSpecs([
+        '/a_directory/.+zip',
+        '/a_directory/another.+',
+        '/passwords.txt'])
+
+    resolver_context = context.Context()
+    test_extractor = extractors.PathSpecExtractor()
+
+    expected_path_specs = list(test_extractor.ExtractPathSpecs(
+        [source_path_spec], resolver_context=resolver_context))
+    expected_path_specs_with_find_specs = list(
+        test_extractor.ExtractPathSpecs(
+            [source_path_spec], find_specs=find_specs,
+            resolver_context=resolver_context))
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      cache = path_spec_cache.PathSpecCache(temp_directory)
+      test_extractor = extractors.PathSpecExtractor(path_spec_cache=cache)
+
+      # The first extraction creates the cache file and the second extraction
+      # reads from it.
+      for _ in range(2):
+        path_specs = list(test_extractor.ExtractPathSpecs(
+            [source_path_spec], resolver_context=resolver_context))
+        self.assertEqual(len(os.listdir(temp_directory)), 1)
+        self.assertEqual(path_specs, expected_path_specs)
+
+        path_specs = list(test_extractor.ExtractPathSpecs(
+            [source_path_spec], find_specs=find_specs,
+            resolver_context=resolver_context))
+        self.assertEqual(path_specs, expected_path_specs_with_find_specs)
+
+  def testExtractPathSpecsStorageMediaImageWithNTFSMFTEnumeration(self):
+    """Tests the ExtractPathSpecs function with NTFS MFT enumeration."""
+    test_file_path = self._GetTestFilePath(['vsstest.qcow2'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+    qcow_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_QCOW, parent=os_path_spec)
+    vshadow_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_VSHADOW, store_index=1,
+        parent=qcow_path_spec)
+
+    resolver_context = context.Context()
+
+    for volume_path_spec in (qcow_path_spec, vshadow_path_spec):
+      source_path_spec = path_spec_factory.Factory.NewPathSpec(
+          dfvfs_definitions.TYPE_INDICATOR_NTFS, location='\\',
+          parent=volume_path_spec)
+
+      test_extractor = extractors.PathSpecExtractor(
+          ntfs_mft_enumeration=False)
+      expected_path_specs = list(test_extractor.ExtractPathSpecs(
+          [source_path_spec], resolver_context=resolver_context))
+
+      test_extractor = extractors.PathSpecExtractor()
+      path_specs = list(test_extractor.ExtractPathSpecs(
+          [source_path_spec], resolver_context=resolver_context))
+
+      self.assertNotEqual(path_specs, [])
+      self.assertEqual(
+          sorted([path_spec.comparable for path_spec in path_specs]),
+          sorted([path_spec.comparable for path_spec in expected_path_specs]))
+
+      # The path specifications are produced in MFT order.
+      mft_entries = [path_spec.mft_entry for path_spec in path_specs]
+      self.assertEqual(mft_entries, sorted(mft_entries))
+
   def testExtractPathSpecsStorageMediaImageWithPartitions(self):
     """Tests the ExtractPathSpecs function an image file with partitions.
 
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the NTFS Master File Table (MFT) enumerator."""
+
+from __future__ import unicode_literals
+
+import unittest
+
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import context
+
+from plaso.engine import ntfs_enumerator
+
+from tests import test_lib as shared_test_lib
+
+
+class NTFSMFTEnumeratorTest(shared_test_lib.BaseTestCase):
+  """Tests for the NTFS MFT enumerator."""
+
+  # pylint: disable=protected-access
+
+  def _GetTestPathSpec(self):
+    """Retrieves the path specification of the test file system.
+
+    Returns:
+      dfvfs.PathSpec: path specification of the root of the file system.
+    """
+    test_file_path = self._GetTestFilePath(['vsstest.qcow2'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+    qcow_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_QCOW, parent=os_path_spec)
+    return path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_NTFS, location='\\',
+        parent=qcow_path_spec)
+
+  def testGetDirectoryLocation(self):
+    """Tests the _GetDirectoryLocation function."""
+    mft_enumerator = ntfs_enumerator.NTFSMFTEnumerator(maximum_depth=2)
+    mft_enumerator._locations = {5: ('', 0)}
+    mft_enumerator._directories = {
+        5: (0x0005000000000005, '.', 0x0005000000000005),
+        64: (0x0001000000000040, 'a', 0x0005000000000005),
+        65: (0x0001000000000041, 'b', 0x0001000000000040),
+        66: (0x0001000000000042, 'c', 0x0002000000000040),
+        67: (0x0001000000000043, 'd', 0x0001000000000044),
+        68: (0x0001000000000044, 'e', 0x0001000000000043)}
+
+    location = mft_enumerator._GetDirectoryLocation(65)
+    self.assertEqual(location, ('\\a\\b', 2))
+
+    # A directory whose parent MFT entry was reused.
+    location = mft_enumerator._GetDirectoryLocation(66)
+    self.assertIsNone(location)
+
+    # Directories that reference each other as parent.
+    location = mft_enumerator._GetDirectoryLocation(67)
+    self.assertIsNone(location)
+
+    # A directory that has no MFT entry.
+    location = mft_enumerator._GetDirectoryLocation(69)
+    self.assertIsNone(location)
+
+    # The entries of a directory at the maximum depth are not enumerated.
+    location = mft_enumerator._GetParentLocation(0x0001000000000041)
+    self.assertIsNone(location)
+
+    location = mft_enumerator._GetParentLocation(0x0001000000000040)
+    self.assertEqual(location, ('\\a', 1))
+
+  def testGetPathSpecs(self):
+    """Tests the ReadMFT and GetPathSpecs functions."""
+    test_path_spec = self._GetTestPathSpec()
+
+    mft_enumerator = ntfs_enumerator.NTFSMFTEnumerator()
+    mft_enumerator.ReadMFT(test_path_spec, resolver_context=context.Context())
+
+    path_specs = list(mft_enumerator.GetPathSpecs())
+    self.assertEqual(len(path_specs), 33)
+
+    path_specs_per_location = {}
+    for path_spec in path_specs:
+      self.assertEqual(path_spec.parent, test_path_spec.parent)
+      path_specs_per_location.setdefault(path_spec.location, []).append(
+          path_spec)
+
+    self.assertNotIn('\\', path_specs_per_location)
+
+    path_spec = path_specs_per_location['\\another_file'][0]
+    self.assertEqual(path_spec.mft_entry, 39)
+    self.assertEqual(path_spec.mft_attribute, 2)
+    self.assertIsNone(path_spec.data_stream)
+
+    # A file entry without a default data stream produces a path
+    # specification for its alternate data stream and the default data
+    # stream.
+    data_streams = sorted([
+        path_spec.data_stream or ''
+        for path_spec in path_specs_per_location['\\$Secure']])
+    self.assertEqual(data_streams, ['', '$SDS'])
+
+    self.assertIn(
+        '\\$Extend\\$RmMetadata\\$TxfLog\\$TxfLog.blf',
+        path_specs_per_location)
+
+  def testReadMFT(self):
+    """Tests the ReadMFT function."""
+    test_file_path = self._GetTestFilePath(['ímynd.dd'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+    test_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_NTFS, location='\\',
+        parent=os_path_spec)
+
+    mft_enumerator = ntfs_enumerator.NTFSMFTEnumerator()
+    with self.assertRaises(IOError):
+      mft_enumerator.ReadMFT(test_path_spec, resolver_context=context.Context())
+
+
+if __name__ == '__main__':
+  unittest.main()
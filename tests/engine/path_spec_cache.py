@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the path specification cache."""
+
+from __future__ import unicode_literals
+
+import os
+import shutil
+import unittest
+
+try:
+  import mock  # pylint: disable=import-error
+except ImportError:
+  from unittest import mock
+
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.lib import errors as dfvfs_errors
+from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import context
+from dfvfs.vfs import tsk_file_entry
+
+from plaso.engine import path_spec_cache
+
+from tests import test_lib as shared_test_lib
+
+
+class CachedDateTimeValueTest(shared_test_lib.BaseTestCase):
+  """Tests for the cached date and time value."""
+
+  def testCopyToDateTimeString(self):
+    """Tests the CopyToDateTimeString function."""
+    date_time_value = path_spec_cache.CachedDateTimeValue(1281643591, 5462540)
+    self.assertEqual(
+        date_time_value.CopyToDateTimeString(), '1281643591.5462540')
+
+  def testCopyToStatTimeTuple(self):
+    """Tests the CopyToStatTimeTuple function."""
+    date_time_value = path_spec_cache.CachedDateTimeValue(1281643591, 5462540)
+    self.assertEqual(
+        date_time_value.CopyToStatTimeTuple(), (1281643591, 5462540))
+
+
+class PathSpecCacheTest(shared_test_lib.BaseTestCase):
+  """Tests for the path specification cache."""
+
+  # pylint: disable=protected-access
+
+  def _GetTestPathSpec(self):
+    """Retrieves the path specification of the test file system.
+
+    Returns:
+      dfvfs.PathSpec: path specification of the root of the file system.
+    """
+    test_file_path = self._GetTestFilePath(['ímynd.dd'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    volume_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+    return path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_TSK, location='/',
+        parent=volume_path_spec)
+
+  def testGetCacheKey(self):
+    """Tests the _GetCacheKey function."""
+    test_path_spec = self._GetTestPathSpec()
+
+    cache = path_spec_cache.PathSpecCache('cache')
+
+    cache_key = cache._GetCacheKey(test_path_spec)
+    self.assertIsNotNone(cache_key)
+    self.assertEqual(len(cache_key), 64)
+    self.assertEqual(cache._GetCacheKey(test_path_spec), cache_key)
+
+    # A file system on the operating system is not cached.
+    os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location='.')
+
+    cache_key = cache._GetCacheKey(os_path_spec)
+    self.assertIsNone(cache_key)
+
+  def testGetCacheKeyWithSegmentFiles(self):
+    """Tests the _GetCacheKey function with a split storage media image."""
+    test_file_paths = []
+    for filename in ('image-split.E01', 'image-split.E02'):
+      test_file_path = self._GetTestFilePath([filename])
+      self._SkipIfPathNotExists(test_file_path)
+      test_file_paths.append(test_file_path)
+
+    cache = path_spec_cache.PathSpecCache('cache')
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      for test_file_path in test_file_paths:
+        shutil.copy(test_file_path, temp_directory)
+
+      os_path_spec = path_spec_factory.Factory.NewPathSpec(
+          dfvfs_definitions.TYPE_INDICATOR_OS,
+          location=os.path.join(temp_directory, 'image-split.E01'))
+      ewf_path_spec = path_spec_factory.Factory.NewPathSpec(
+          dfvfs_definitions.TYPE_INDICATOR_EWF, parent=os_path_spec)
+      tsk_path_spec = path_spec_factory.Factory.NewPathSpec(
+          dfvfs_definitions.TYPE_INDICATOR_TSK, location='/',
+          parent=ewf_path_spec)
+
+      segment_locations = cache._GetSegmentFileLocations(ewf_path_spec)
+      self.assertEqual(segment_locations, [
+          os.path.join(temp_directory, 'image-split.E01'),
+          os.path.join(temp_directory, 'image-split.E02')])
+
+      cache_key = cache._GetCacheKey(tsk_path_spec)
+      self.assertIsNotNone(cache_key)
+
+      # A change to the second segment file changes the cache key.
+      second_segment_path = os.path.join(temp_directory, 'image-split.E02')
+      stat_object = os.stat(second_segment_path)
+      os.utime(second_segment_path, (
+          stat_object.st_atime, stat_object.st_mtime + 60))
+
+      self.assertNotEqual(cache._GetCacheKey(tsk_path_spec), cache_key)
+
+  def testOpenFileSystem(self):
+    """Tests the OpenFileSystem function."""
+    test_path_spec = self._GetTestPathSpec()
+
+    resolver_context = context.Context()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      cache = path_spec_cache.PathSpecCache(temp_directory)
+
+      file_system = cache.OpenFileSystem(
+          test_path_spec, resolver_context=resolver_context)
+      self.assertIsNotNone(file_system)
+
+      try:
+        self.assertEqual(
+            file_system.type_indicator, dfvfs_definitions.TYPE_INDICATOR_TSK)
+
+        file_entry = file_system.GetFileEntryByPathSpec(test_path_spec)
+        self.assertIsNotNone(file_entry)
+        self.assertTrue(file_entry.IsRoot())
+        self.assertTrue(file_entry.IsDirectory())
+
+        sub_file_entries = {
+            sub_file_entry.name: sub_file_entry
+            for sub_file_entry in file_entry.sub_file_entries}
+
+        self.assertIn('a_directory', sub_file_entries)
+        self.assertIn('passwords.txt', sub_file_entries)
+
+        sub_file_entry = sub_file_entries['passwords.txt']
+        self.assertFalse(sub_file_entry.IsRoot())
+        self.assertTrue(sub_file_entry.IsAllocated())
+        self.assertTrue(sub_file_entry.IsFile())
+        self.assertEqual(sub_file_entry.size, 116)
+        self.assertIsNotNone(sub_file_entry.modification_time)
+
+        data_stream_names = [
+            data_stream.name for data_stream in sub_file_entry.data_streams]
+        self.assertEqual(data_stream_names, [''])
+
+        self.assertEqual(sub_file_entry.path_spec.location, '/passwords.txt')
+        self.assertEqual(sub_file_entry.path_spec.parent, test_path_spec.parent)
+
+      finally:
+        file_system.Close()
+
+      self.assertEqual(len(os.listdir(temp_directory)), 1)
+
+      # Test opening the file system from the cache file.
+      file_system = cache.OpenFileSystem(
+          test_path_spec, resolver_context=resolver_context)
+
+      try:
+        file_entry = file_system.GetRootFileEntry()
+        sub_file_entry_names = sorted([
+            sub_file_entry.name
+            for sub_file_entry in file_entry.sub_file_entries])
+
+        self.assertEqual(sub_file_entry_names, sorted(sub_file_entries.keys()))
+
+      finally:
+        file_system.Close()
+
+    # A file system on the operating system is not cached.
+    os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location='.')
+
+    file_system = cache.OpenFileSystem(
+        os_path_spec, resolver_context=resolver_context)
+    self.assertIsNone(file_system)
+
+  def testOpenFileSystemWithListingError(self):
+    """Tests the OpenFileSystem function with an error listing a directory."""
+    test_path_spec = self._GetTestPathSpec()
+
+    resolver_context = context.Context()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      cache = path_spec_cache.PathSpecCache(temp_directory)
+
+      with mock.patch.object(
+          tsk_file_entry.TSKFileEntry, 'sub_file_entries',
+          new_callable=mock.PropertyMock,
+          side_effect=dfvfs_errors.BackEndError('Listing error.')):
+        with self.assertRaises(IOError):
+          cache.OpenFileSystem(
+              test_path_spec, resolver_context=resolver_context)
+
+      # An incomplete cache file is not stored.
+      self.assertEqual(os.listdir(temp_directory), [])
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -10,6 +10,7 @@ from plaso.engine import tagging_file
 from plaso.lib import errors
 
 from tests import test_lib as shared_test_lib
+from tests.containers import test_lib as containers_test_lib
 
 
 class TaggingFileTestCase(shared_test_lib.BaseTestCase):
@@ -24,6 +25,7 @@ class TaggingFileTestCase(shared_test_lib.BaseTestCase):
 
     tagging_rules = tag_file.GetEventTaggingRules()
     self.assertEqual(len(tagging_rules), 5)
+    self.assertEqual(len(tagging_rules['file_downloaded']), 2)
 
   def testGetEventTaggingRulesInvalidSyntax(self):
     """Tests the GetEventTaggingRules function on a file with invalid syntax."""
@@ -37,5 +39,71 @@ class TaggingFileTestCase(shared_test_lib.BaseTestCase):
       tag_file.GetEventTaggingRules()
 
 
+class TaggingRulesIndexTest(shared_test_lib.BaseTestCase):
+  """Tests for the tagging rules index."""
+
+  # pylint: disable=protected-access
+
+  def _CreateTestTaggingRulesIndex(self):
+    """Creates a tagging rules index for testing.
+
+    Returns:
+      TaggingRulesIndex: tagging rules index.
+    """
+    test_file_path = self._GetTestFilePath(['tagging_file', 'valid.txt'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    tag_file = tagging_file.TaggingFile(test_file_path)
+    tagging_rules = tag_file.GetEventTaggingRules()
+
+    return tagging_file.TaggingRulesIndex(tagging_rules)
+
+  def testInitialize(self):
+    """Tests the __init__ function."""
+    tagging_rules_index = self._CreateTestTaggingRulesIndex()
+
+    self.assertEqual(len(tagging_rules_index._indexed_rules), 3)
+    self.assertEqual(
+        sorted(tagging_rules_index._unindexed_rules.keys()),
+        ['file_downloaded', 'text_contains'])
+
+    rules_per_label = tagging_rules_index._indexed_rules['windows:evt:record']
+    self.assertEqual(
+        sorted(rules_per_label.keys()), ['login_attempt', 'security_event'])
+
+  def testGetMatchingLabels(self):
+    """Tests the GetMatchingLabels function."""
+    tagging_rules_index = self._CreateTestTaggingRulesIndex()
+
+    event, event_data = containers_test_lib.CreateEventFromValues({
+        'data_type': 'windows:evt:record',
+        'event_identifier': 538,
+        'source_name': 'Security'})
+
+    labels = tagging_rules_index.GetMatchingLabels(event, event_data)
+    self.assertEqual(labels, ['login_attempt', 'security_event'])
+
+    event, event_data = containers_test_lib.CreateEventFromValues({
+        'body': 'this is a message',
+        'data_type': 'windows:evt:record',
+        'event_identifier': 16,
+        'source_name': 'Messaging'})
+
+    labels = tagging_rules_index.GetMatchingLabels(event, event_data)
+    self.assertEqual(labels, ['text_contains'])
+
+    event, event_data = containers_test_lib.CreateEventFromValues({
+        'data_type': 'windows:prefetch'})
+
+    labels = tagging_rules_index.GetMatchingLabels(event, event_data)
+    self.assertEqual(labels, ['application_execution'])
+
+    event, event_data = containers_test_lib.CreateEventFromValues({
+        'data_type': 'something_else'})
+
+    labels = tagging_rules_index.GetMatchingLabels(event, event_data)
+    self.assertEqual(labels, [])
+
+
 if __name__ == '__main__':
   unittest.main()
@@ -9,6 +9,7 @@ import unittest
 from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.resolver import context
 from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import resolver as path_spec_resolver
 
 from plaso.containers import sessions
 from plaso.engine import configurations
@@ -141,6 +142,100 @@ class EventExtractionWorkerTest(shared_test_lib.BaseTestCase):
     event_attribute = mediator._extra_event_attributes.get('test_result', None)
     self.assertEqual(event_attribute, 'is_vegetable')
 
+  def testGetDataOffset(self):
+    """Tests the _GetDataOffset function."""
+    extraction_worker = worker.EventExtractionWorker()
+
+    test_file_path = self._GetTestFilePath(['ímynd.dd'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+    tsk_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_TSK, inode=16,
+        location='/a_directory/another_file', parent=os_path_spec)
+
+    file_entry = path_spec_resolver.Resolver.OpenFileEntry(tsk_path_spec)
+    data_offset = extraction_worker._GetDataOffset(file_entry)
+    self.assertEqual(data_offset, 31 * 1024)
+
+    test_file_path = self._GetTestFilePath(['vsstest.qcow2'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+    qcow_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_QCOW, parent=os_path_spec)
+    ntfs_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_NTFS, location='\\$LogFile',
+        parent=qcow_path_spec)
+
+    file_entry = path_spec_resolver.Resolver.OpenFileEntry(ntfs_path_spec)
+    data_offset = extraction_worker._GetDataOffset(file_entry)
+    self.assertEqual(data_offset, 342929408)
+
+    # The data of a small file is stored in the MFT entry.
+    ntfs_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_NTFS, location='\\syslog.gz',
+        parent=qcow_path_spec)
+
+    file_entry = path_spec_resolver.Resolver.OpenFileEntry(ntfs_path_spec)
+    data_offset = extraction_worker._GetDataOffset(file_entry)
+    self.assertIsNone(data_offset)
+
+    # A file entry of a file system without data runs.
+    file_entry = self._GetTestFileEntry(['ímynd.dd'])
+    data_offset = extraction_worker._GetDataOffset(file_entry)
+    self.assertIsNone(data_offset)
+
+  def testProcessPathSpecDirectory(self):
+    """Tests the ProcessPathSpec function on a directory."""
+    test_file_path = self._GetTestFilePath(['ímynd.dd'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+    tsk_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_TSK, location='/a_directory',
+        parent=os_path_spec)
+
+    for order_by_data_offset in (False, True):
+      configuration = configurations.ExtractionConfiguration()
+      configuration.order_by_data_offset = order_by_data_offset
+
+      extraction_worker = worker.EventExtractionWorker()
+      extraction_worker.SetExtractionConfiguration(configuration)
+
+      session = sessions.Session()
+      storage_writer = fake_writer.FakeStorageWriter(session)
+      storage_writer.Open()
+
+      mediator = parsers_mediator.ParserMediator(
+          storage_writer, knowledge_base.KnowledgeBase(),
+          resolver_context=context.Context())
+
+      extraction_worker.ProcessPathSpec(mediator, tsk_path_spec)
+
+      data_offsets = {}
+      event_source = storage_writer.GetFirstWrittenEventSource()
+      while event_source:
+        data_offsets[event_source.path_spec.location] = (
+            event_source.data_offset)
+        event_source = storage_writer.GetNextWrittenEventSource()
+
+      storage_writer.Close()
+
+      if order_by_data_offset:
+        expected_data_offset = 31 * 1024
+      else:
+        # The data offset is only determined if file entries are ordered
+        # by the offsets of their data.
+        expected_data_offset = None
+
+      self.assertEqual(
+          data_offsets.get('/a_directory/another_file', 0),
+          expected_data_offset)
+
   def testProcessPathSpecFile(self):
     """Tests the ProcessPathSpec function on a file."""
     knowledge_base_values = {'year': 2016}
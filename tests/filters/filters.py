@@ -107,6 +107,24 @@ class AndFilterTest(shared_test_lib.BaseTestCase):
     result = filter_object.Matches(event, event_data, None)
     self.assertFalse(result)
 
+  def testGetRequiredValues(self):
+    """Tests the GetRequiredValues function."""
+    equals_filter_object = filters.EqualsOperator(
+        arguments=['data_type', 'test:event'])
+    true_filter_object = TrueFilter()
+
+    filter_object = filters.AndFilter(arguments=[
+        true_filter_object, true_filter_object])
+
+    values = filter_object.GetRequiredValues('data_type')
+    self.assertIsNone(values)
+
+    filter_object = filters.AndFilter(arguments=[
+        equals_filter_object, true_filter_object])
+
+    values = filter_object.GetRequiredValues('data_type')
+    self.assertEqual(values, set(['test:event']))
+
 
 class OrFilterTest(shared_test_lib.BaseTestCase):
   """Tests the boolean OR filter."""
@@ -137,6 +155,26 @@ class OrFilterTest(shared_test_lib.BaseTestCase):
     result = filter_object.Matches(event, event_data, None)
     self.assertFalse(result)
 
+  def testGetRequiredValues(self):
+    """Tests the GetRequiredValues function."""
+    equals_filter_object = filters.EqualsOperator(
+        arguments=['data_type', 'test:event'])
+    other_equals_filter_object = filters.EqualsOperator(
+        arguments=['data_type', 'test:other'])
+    true_filter_object = TrueFilter()
+
+    filter_object = filters.OrFilter(arguments=[
+        equals_filter_object, true_filter_object])
+
+    values = filter_object.GetRequiredValues('data_type')
+    self.assertIsNone(values)
+
+    filter_object = filters.OrFilter(arguments=[
+        equals_filter_object, other_equals_filter_object])
+
+    values = filter_object.GetRequiredValues('data_type')
+    self.assertEqual(values, set(['test:event', 'test:other']))
+
 
 class IdentityFilterTest(shared_test_lib.BaseTestCase):
   """Tests the filter which always evaluates to True."""
@@ -223,6 +261,21 @@ class EqualsOperatorTest(shared_test_lib.BaseTestCase):
     result = filter_object._CompareValue(10, 10)
     self.assertTrue(result)
 
+  def testGetRequiredValues(self):
+    """Tests the GetRequiredValues function."""
+    filter_object = filters.EqualsOperator(arguments=['first', 'second'])
+
+    values = filter_object.GetRequiredValues('first')
+    self.assertEqual(values, set(['second']))
+
+    values = filter_object.GetRequiredValues('other')
+    self.assertIsNone(values)
+
+    filter_object.FlipBool()
+
+    values = filter_object.GetRequiredValues('first')
+    self.assertIsNone(values)
+
 
 class NotEqualsOperatorTest(shared_test_lib.BaseTestCase):
   """Tests the not equals operator."""
@@ -49,9 +49,45 @@ class WrongEventFormatter(interface.EventFormatter):
   SOURCE_LONG = 'Weird Log File'
 
 
+class FormatStringTemplateTest(test_lib.EventFormatterTestCase):
+  """Tests for the format string template."""
+
+  # pylint: disable=protected-access
+
+  def testInitialize(self):
+    """Tests the __init__ function."""
+    template = interface._FormatStringTemplate(
+        'Value: 0x{numeric:02x} {text!r} {numeric}')
+    self.assertEqual(template.attribute_names, ['numeric', 'text'])
+    self.assertEqual(template.number_of_fields, 3)
+
+    template = interface._FormatStringTemplate('{0:s} {text}')
+    self.assertIsNone(template.attribute_names)
+
+    template = interface._FormatStringTemplate('{text[0]}')
+    self.assertIsNone(template.attribute_names)
+
+    template = interface._FormatStringTemplate('Comment')
+    self.assertEqual(template.attribute_names, [])
+    self.assertEqual(template.number_of_fields, 0)
+
+  def testFormat(self):
+    """Tests the Format function."""
+    template = interface._FormatStringTemplate(
+        'Value: 0x{numeric:02x} {text!r}')
+
+    string = template.Format({'numeric': 12, 'text': 'value'})
+    self.assertEqual(string, 'Value: 0x0c \'value\'')
+
+    with self.assertRaises(KeyError):
+      template.Format({'numeric': 12})
+
+
 class EventFormatterTest(test_lib.EventFormatterTestCase):
   """Tests for the event formatter."""
 
+  # pylint: disable=protected-access
+
   _TEST_EVENTS = [
       {'data_type': 'test:event',
        'description': 'this is beyond words',
@@ -68,6 +104,20 @@ class EventFormatterTest(test_lib.EventFormatterTestCase):
   # TODO: add tests for _FormatMessage
   # TODO: add tests for _FormatMessages
 
+  def testGetEventValues(self):
+    """Tests the _GetEventValues function."""
+    event_formatter = test_lib.TestEventFormatter()
+
+    _, event_data = containers_test_lib.CreateEventFromValues(
+        self._TEST_EVENTS[0])
+
+    event_values = event_formatter._GetEventValues(
+        event_data, ['optional', 'text'])
+    self.assertEqual(event_values, {'text': self._TEST_EVENTS[0]['text']})
+
+    event_values = event_formatter._GetEventValues(event_data, None)
+    self.assertEqual(event_values['numeric'], 12)
+
   def testGetFormatStringAttributeNames(self):
     """Tests the GetFormatStringAttributeNames function."""
     event_formatter = test_lib.TestEventFormatter()
@@ -90,6 +140,11 @@ class EventFormatterTest(test_lib.EventFormatterTestCase):
     self.assertEqual(
         message, 'but we\'re still trying to say something about the event')
 
+    event_formatter = WrongEventFormatter()
+    event_data.data_type = 'test:wrong'
+    message, _ = event_formatter.GetMessages(formatter_mediator, event_data)
+    self.assertIn('text: but we\'re still trying', message)
+
   # TODO: add tests for GetSources
 
 
@@ -4,11 +4,13 @@
 
 from __future__ import unicode_literals
 
+import os
 import unittest
 
 from plaso.formatters import mediator
 
 from tests import test_lib as shared_test_lib
+from tests.formatters import test_lib
 
 
 class FormatterMediatorTest(shared_test_lib.BaseTestCase):
@@ -19,6 +21,59 @@ class FormatterMediatorTest(shared_test_lib.BaseTestCase):
     formatter_mediator = mediator.FormatterMediator()
     self.assertIsNotNone(formatter_mediator)
 
+  def testGetWindowsEventMessage(self):
+    """Tests the GetWindowsEventMessage function."""
+    formatter_mediator = mediator.FormatterMediator()
+
+    message_string = formatter_mediator.GetWindowsEventMessage('Test', 1)
+    self.assertIsNone(message_string)
+    self.assertEqual(formatter_mediator.winevt_message_cache_misses, 0)
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      database_path = os.path.join(temp_directory, 'winevt-rc.db')
+      test_lib.CreateWinevtResourcesDatabase(database_path)
+
+      formatter_mediator = mediator.FormatterMediator(
+          data_location=temp_directory)
+
+      for _ in range(3):
+        message_string = formatter_mediator.GetWindowsEventMessage('Test', 1)
+        self.assertEqual(message_string, 'Message: {0:s}.')
+
+      message_string = formatter_mediator.GetWindowsEventMessage('Test', 3)
+      self.assertIsNone(message_string)
+
+      self.assertEqual(formatter_mediator.winevt_message_cache_hits, 2)
+      self.assertEqual(formatter_mediator.winevt_message_cache_misses, 2)
+
+      formatter_mediator.SetPreferredLanguageIdentifier('nl-NL')
+
+      message_string = formatter_mediator.GetWindowsEventMessage('Test', 1)
+      self.assertEqual(message_string, 'Bericht: {0:s}.')
+
+      message_string = formatter_mediator.GetWindowsEventMessage('Test', 2)
+      self.assertEqual(message_string, 'Value: {{{1:s}}}')
+
+  def testPreloadWindowsEventMessages(self):
+    """Tests the PreloadWindowsEventMessages function."""
+    formatter_mediator = mediator.FormatterMediator()
+
+    result = formatter_mediator.PreloadWindowsEventMessages()
+    self.assertFalse(result)
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      database_path = os.path.join(temp_directory, 'winevt-rc.db')
+      test_lib.CreateWinevtResourcesDatabase(database_path)
+
+      formatter_mediator = mediator.FormatterMediator(
+          data_location=temp_directory)
+
+      result = formatter_mediator.PreloadWindowsEventMessages()
+      self.assertTrue(result)
+
+      message_string = formatter_mediator.GetWindowsEventMessage('Test', 1)
+      self.assertEqual(message_string, 'Message: {0:s}.')
+
 
 if __name__ == '__main__':
   unittest.main()
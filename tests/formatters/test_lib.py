@@ -3,11 +3,62 @@
 
 from __future__ import unicode_literals
 
+import sqlite3
+
 from plaso.formatters import interface
 
 from tests import test_lib as shared_test_lib
 
 
+def CreateWinevtResourcesDatabase(path):
+  """Creates a Windows Event Log resources database for testing.
+
+  The database contains the Event Log sources "Test" and "Duplicate", where
+  the messages of "Test" are stored in the message file with key 2 for LCID
+  0x0409 and in the message file with key 1 for LCID 0x0413.
+
+  Args:
+    path (str): path of the database.
+  """
+  connection = sqlite3.connect(path)
+  cursor = connection.cursor()
+
+  cursor.execute('CREATE TABLE metadata (name TEXT, value TEXT)')
+  cursor.executemany('INSERT INTO metadata VALUES (?, ?)', [
+      ('version', '20150315'), ('string_format', 'wrc')])
+
+  cursor.execute(
+      'CREATE TABLE event_log_providers '
+      '(event_log_provider_key INTEGER, log_source TEXT)')
+  cursor.executemany('INSERT INTO event_log_providers VALUES (?, ?)', [
+      (1, 'Test'), (2, 'Duplicate'), (3, 'Duplicate')])
+
+  cursor.execute(
+      'CREATE TABLE message_file_per_event_log_provider '
+      '(message_file_key INTEGER, event_log_provider_key INTEGER)')
+  cursor.executemany(
+      'INSERT INTO message_file_per_event_log_provider VALUES (?, ?)', [
+          (1, 1), (2, 1)])
+
+  cursor.execute(
+      'CREATE TABLE message_table_1_0x00000413 '
+      '(message_identifier TEXT, message_string TEXT)')
+  cursor.executemany(
+      'INSERT INTO message_table_1_0x00000413 VALUES (?, ?)', [
+          ('0x00000001', 'Bericht: %1.')])
+
+  cursor.execute(
+      'CREATE TABLE message_table_2_0x00000409 '
+      '(message_identifier TEXT, message_string TEXT)')
+  cursor.executemany(
+      'INSERT INTO message_table_2_0x00000409 VALUES (?, ?)', [
+          ('0x00000001', 'Message: %1.'),
+          ('0x00000002', 'Value: {%2}')])
+
+  connection.commit()
+  connection.close()
+
+
 class TestEventFormatter(interface.EventFormatter):
   """Test event formatter."""
 
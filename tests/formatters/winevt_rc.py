@@ -4,11 +4,13 @@
 
 from __future__ import unicode_literals
 
+import os
 import unittest
 
 from plaso.formatters import winevt_rc
 
 from tests import test_lib as shared_test_lib
+from tests.formatters import test_lib
 
 
 class WinevtResourcesSqlite3DatabaseReaderTest(shared_test_lib.BaseTestCase):
@@ -35,6 +37,39 @@ class WinevtResourcesSqlite3DatabaseReaderTest(shared_test_lib.BaseTestCase):
 
     database_reader.Close()
 
+  def testGetMessageWithTestDatabase(self):
+    """Tests the GetMessage function with a test database."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      database_path = os.path.join(temp_directory, 'winevt-rc.db')
+      test_lib.CreateWinevtResourcesDatabase(database_path)
+
+      database_reader = winevt_rc.WinevtResourcesSqlite3DatabaseReader()
+      database_reader.Open(database_path)
+
+      for preload in (False, True):
+        if preload:
+          database_reader.Preload()
+
+        message_string = database_reader.GetMessage('Test', 0x00000409, 1)
+        self.assertEqual(message_string, 'Message: {0:s}.')
+
+        message_string = database_reader.GetMessage('Test', 0x00000413, 1)
+        self.assertEqual(message_string, 'Bericht: {0:s}.')
+
+        message_string = database_reader.GetMessage('Test', 0x00000409, 2)
+        self.assertEqual(message_string, 'Value: {{{1:s}}}')
+
+        message_string = database_reader.GetMessage('Test', 0x00000409, 3)
+        self.assertIsNone(message_string)
+
+        message_string = database_reader.GetMessage('Bogus', 0x00000409, 1)
+        self.assertIsNone(message_string)
+
+        with self.assertRaises(RuntimeError):
+          database_reader.GetMessage('Duplicate', 0x00000409, 1)
+
+      database_reader.Close()
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the buffered file-like object."""
+
+from __future__ import unicode_literals
+
+import os
+import unittest
+
+from dfvfs.file_io import os_file_io
+from dfvfs.path import os_path_spec
+from dfvfs.resolver import context
+
+from plaso.lib import buffered_file
+
+from tests import test_lib as shared_test_lib
+
+
+class BufferedFileObjectTest(shared_test_lib.BaseTestCase):
+  """Tests for the buffered file-like object."""
+
+  # pylint: disable=protected-access
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+
+    test_file_path = self._GetTestFilePath(['utmp'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    with open(test_file_path, 'rb') as file_object:
+      self._test_file_data = file_object.read()
+
+    test_path_spec = os_path_spec.OSPathSpec(location=test_file_path)
+
+    self._file_object = os_file_io.OSFile(self._resolver_context)
+    self._file_object.open(test_path_spec)
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    self._file_object.close()
+
+  def testInitialize(self):
+    """Tests the __init__ function."""
+    buffered_file_object = buffered_file.BufferedFileObject(
+        self._file_object, read_ahead_size=1000)
+    self.assertEqual(buffered_file_object._read_ahead_size, 4096)
+
+    with self.assertRaises(ValueError):
+      buffered_file.BufferedFileObject(self._file_object, read_ahead_size=0)
+
+  def testRead(self):
+    """Tests the read function."""
+    buffered_file_object = buffered_file.BufferedFileObject(
+        self._file_object, read_ahead_size=4096)
+
+    data = buffered_file_object.read(384)
+    self.assertEqual(data, self._test_file_data[:384])
+    self.assertEqual(buffered_file_object.number_of_reads, 1)
+
+    # Test a read that is served from the read-ahead window.
+    data = buffered_file_object.read(384)
+    self.assertEqual(data, self._test_file_data[384:768])
+    self.assertEqual(buffered_file_object.number_of_reads, 1)
+
+    # Test a read that crosses the end of the read-ahead window.
+    buffered_file_object.seek(4000, os.SEEK_SET)
+    data = buffered_file_object.read(200)
+    self.assertEqual(data, self._test_file_data[4000:4200])
+    self.assertEqual(buffered_file_object.number_of_reads, 2)
+    self.assertEqual(buffered_file_object._buffer_offset, 0)
+
+    # Test a read that is larger than the read-ahead window.
+    buffered_file_object.seek(0, os.SEEK_SET)
+    data = buffered_file_object.read(5000)
+    self.assertEqual(data, self._test_file_data[:5000])
+    self.assertEqual(buffered_file_object.number_of_reads, 3)
+
+    # Test a read of all remaining data.
+    data = buffered_file_object.read()
+    self.assertEqual(data, self._test_file_data[5000:])
+
+    # Test a read at the end of the file.
+    data = buffered_file_object.read(4)
+    self.assertEqual(data, b'')
+
+  def testSeekAndTell(self):
+    """Tests the seek, get_offset and tell functions."""
+    buffered_file_object = buffered_file.BufferedFileObject(self._file_object)
+
+    file_size = len(self._test_file_data)
+    self.assertEqual(buffered_file_object.get_size(), file_size)
+
+    buffered_file_object.seek(10, os.SEEK_SET)
+    self.assertEqual(buffered_file_object.get_offset(), 10)
+
+    buffered_file_object.seek(10, os.SEEK_CUR)
+    self.assertEqual(buffered_file_object.tell(), 20)
+
+    buffered_file_object.seek(-10, os.SEEK_END)
+    self.assertEqual(buffered_file_object.tell(), file_size - 10)
+
+    data = buffered_file_object.read(20)
+    self.assertEqual(data, self._test_file_data[-10:])
+
+    with self.assertRaises(IOError):
+      buffered_file_object.seek(-1, os.SEEK_SET)
+
+    with self.assertRaises(IOError):
+      buffered_file_object.seek(0, 99)
+
+
+if __name__ == '__main__':
+  unittest.main()
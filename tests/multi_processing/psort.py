@@ -21,9 +21,11 @@ from plaso.lib import definitions
 from plaso.multi_processing import psort
 from plaso.output import dynamic
 from plaso.output import interface as output_interface
+from plaso.output import json_line
 from plaso.output import mediator as output_mediator
 from plaso.output import null
 from plaso.storage import factory as storage_factory
+from plaso.storage import identifiers
 
 from tests import test_lib as shared_test_lib
 from tests.cli import test_lib as cli_test_lib
@@ -426,7 +428,89 @@ class PsortMultiProcessEngineTest(test_lib.MultiProcessingTestCase):
     self.assertEqual(len(output_module.events), 15)
     self.assertEqual(len(output_module.macb_groups), 3)
 
+  def testInternalExportEventsWithSerializedEventData(self):
+    """Tests the _ExportEvents function with serialized event data."""
+    knowledge_base_object = knowledge_base.KnowledgeBase()
+    formatter_mediator = formatters_mediator.FormatterMediator()
+
+    output_mediator_object = output_mediator.OutputMediator(
+        knowledge_base_object, formatter_mediator)
+
+    formatters_manager.FormattersManager.RegisterFormatter(TestEventFormatter)
+
+    outputs = []
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'storage.plaso')
+      self._CreateTestStorageFile(temp_file)
+
+      for use_serialized_event_data in (False, True):
+        output_writer = cli_test_lib.TestOutputWriter()
+
+        output_module = json_line.JSONLineOutputModule(output_mediator_object)
+        output_module.SetOutputWriter(output_writer)
+        output_module.SUPPORTS_SERIALIZED_EVENT_DATA = (
+            use_serialized_event_data)
+
+        storage_reader = (
+            storage_factory.StorageFactory.CreateStorageReaderForFile(
+                temp_file))
+        storage_reader.ReadSystemConfiguration(knowledge_base_object)
+
+        test_engine = psort.PsortMultiProcessEngine()
+        test_engine._ExportEvents(storage_reader, output_module)
+
+        storage_reader.Close()
+
+        outputs.append((
+            output_writer.ReadOutput(),
+            test_engine._events_status.number_of_duplicate_events,
+            test_engine._events_status.number_of_macb_grouped_events))
+
+    formatters_manager.FormattersManager.DeregisterFormatter(TestEventFormatter)
+
+    regular_output, serialized_output = outputs
+    self.assertEqual(len(serialized_output[0].split('\n')), 16)
+    self.assertEqual(serialized_output, regular_output)
+
   # TODO: add test for _FlushExportBuffer.
+
+  def testGetEventDataWithJSONDict(self):
+    """Tests the _GetEventDataWithJSONDict function."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'storage.plaso')
+      self._CreateTestStorageFile(temp_file)
+
+      storage_reader = (
+          storage_factory.StorageFactory.CreateStorageReaderForFile(
+              temp_file))
+
+      try:
+        event = next(storage_reader.GetSortedEvents())
+        event_data_identifier = event.GetEventDataIdentifier()
+
+        test_engine = psort.PsortMultiProcessEngine()
+        event_data, event_data_json_dict = (
+            test_engine._GetEventDataWithJSONDict(
+                storage_reader, event_data_identifier))
+
+        self.assertIsNotNone(event_data)
+        self.assertEqual(
+            event_data_json_dict['__container_type__'], 'event_data')
+
+        # A missing event data identifier does not raise.
+        event_data_identifier = identifiers.SQLTableIdentifier(
+            'event_data', 9999)
+
+        event_data, event_data_json_dict = (
+            test_engine._GetEventDataWithJSONDict(
+                storage_reader, event_data_identifier))
+
+        self.assertIsNone(event_data)
+        self.assertIsNone(event_data_json_dict)
+
+      finally:
+        storage_reader.Close()
+
   # TODO: add test for _StartAnalysisProcesses.
   # TODO: add test for _StatusUpdateThreadMain.
   # TODO: add test for _StopAnalysisProcesses.
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the shared chunk cache."""
+
+from __future__ import unicode_literals
+
+import os
+import unittest
+
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import context
+from dfvfs.resolver import resolver
+
+from plaso.multi_processing import shared_chunk_cache
+
+from tests import test_lib as shared_test_lib
+
+
+class SharedChunkCacheTest(shared_test_lib.BaseTestCase):
+  """Tests for the shared chunk cache."""
+
+  def testGetAndSetChunk(self):
+    """Tests the GetChunk and SetChunk functions."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      path = os.path.join(temp_directory, 'chunk_cache')
+
+      # The cache consists of a single set of 8 slots of 16 bytes.
+      cache = shared_chunk_cache.SharedChunkCache(
+          path, 128, maximum_chunk_size=16)
+      cache.Create()
+      cache.Open()
+
+      try:
+        self.assertIsNone(cache.GetChunk(1, 0))
+
+        for chunk_number in range(8):
+          chunk_data = 'chunk{0:d}'.format(chunk_number).encode('ascii')
+          cache.SetChunk(1, chunk_number, chunk_data, 0.5)
+
+        self.assertEqual(cache.GetChunk(1, 0), b'chunk0')
+        self.assertEqual(cache.GetChunk(1, 7), b'chunk7')
+        self.assertIsNone(cache.GetChunk(2, 0))
+
+        # The least recently used chunk is replaced.
+        cache.SetChunk(1, 8, b'chunk8', 0.5)
+        self.assertIsNone(cache.GetChunk(1, 1))
+        self.assertEqual(cache.GetChunk(1, 0), b'chunk0')
+        self.assertEqual(cache.GetChunk(1, 8), b'chunk8')
+
+        # A chunk that exceeds the maximum chunk size is not cached.
+        cache.SetChunk(1, 9, b'A' * 32, 0.5)
+        self.assertIsNone(cache.GetChunk(1, 9))
+
+        number_of_hits, number_of_misses, decompression_time = (
+            cache.GetStatistics())
+        self.assertEqual(number_of_hits, 4)
+        self.assertEqual(number_of_misses, 9)
+        self.assertEqual(decompression_time, 4.5)
+
+      finally:
+        cache.Close()
+
+      cache.Remove()
+      self.assertFalse(os.path.exists(path))
+
+  def testRegisterResolverHelper(self):
+    """Tests the RegisterResolverHelper function."""
+    test_file_path = self._GetTestFilePath(['image.E01'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+    ewf_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_EWF, parent=os_path_spec)
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      path = os.path.join(temp_directory, 'chunk_cache')
+
+      cache = shared_chunk_cache.SharedChunkCache(path, 1024 * 1024)
+      cache.Create()
+      cache.Open()
+
+      try:
+        cache.RegisterResolverHelper()
+
+        try:
+          file_object = resolver.Resolver.OpenFileObject(
+              ewf_path_spec, resolver_context=context.Context())
+          self.assertIsInstance(
+              file_object, shared_chunk_cache.SharedChunkCacheEWFFile)
+          file_object.close()
+
+        finally:
+          cache.DeregisterResolverHelper()
+
+        file_object = resolver.Resolver.OpenFileObject(
+            ewf_path_spec, resolver_context=context.Context())
+        self.assertNotIsInstance(
+            file_object, shared_chunk_cache.SharedChunkCacheEWFFile)
+        file_object.close()
+
+      finally:
+        cache.Close()
+
+
+class SharedChunkCacheEWFFileTest(shared_test_lib.BaseTestCase):
+  """Tests for the EWF image file-like object that uses a shared cache."""
+
+  def testRead(self):
+    """Tests the read function."""
+    test_file_path = self._GetTestFilePath(['image.E01'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+    ewf_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_EWF, parent=os_path_spec)
+
+    resolver_context = context.Context()
+
+    file_object = resolver.Resolver.OpenFileObject(
+        ewf_path_spec, resolver_context=resolver_context)
+    try:
+      expected_data = file_object.read(file_object.get_size())
+    finally:
+      file_object.close()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      path = os.path.join(temp_directory, 'chunk_cache')
+
+      cache = shared_chunk_cache.SharedChunkCache(path, 1024 * 1024)
+      cache.Create()
+      cache.Open()
+
+      try:
+        file_object = shared_chunk_cache.SharedChunkCacheEWFFile(
+            resolver_context, cache)
+        file_object.open(path_spec=ewf_path_spec)
+
+        try:
+          self.assertEqual(file_object.get_size(), len(expected_data))
+
+          # Read across a chunk boundary.
+          file_object.seek(32760)
+          self.assertEqual(file_object.read(16), expected_data[32760:32776])
+          self.assertEqual(file_object.get_offset(), 32776)
+
+          file_object.seek(0)
+          self.assertEqual(file_object.read(), expected_data)
+
+          file_object.seek(-16, os.SEEK_END)
+          self.assertEqual(file_object.read(32), expected_data[-16:])
+          self.assertEqual(file_object.read(32), b'')
+
+        finally:
+          file_object.close()
+
+        # A second file-like object reads the chunks from the cache.
+        file_object = shared_chunk_cache.SharedChunkCacheEWFFile(
+            context.Context(), cache)
+        file_object.open(path_spec=ewf_path_spec)
+
+        try:
+          self.assertEqual(file_object.read(), expected_data)
+
+        finally:
+          file_object.close()
+
+        number_of_hits, number_of_misses, _ = cache.GetStatistics()
+        self.assertGreater(number_of_hits, 0)
+        self.assertGreater(number_of_misses, 0)
+
+      finally:
+        cache.Close()
+
+
+if __name__ == '__main__':
+  unittest.main()
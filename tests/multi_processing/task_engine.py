@@ -5,25 +5,476 @@
 from __future__ import unicode_literals
 
 import os
+import time
 import unittest
+try:
+  import mock  # pylint: disable=import-error
+except ImportError:
+  from unittest import mock
 
 from artifacts import reader as artifacts_reader
 from artifacts import registry as artifacts_registry
 from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.path import factory as path_spec_factory
 
+from plaso.containers import event_sources
 from plaso.containers import sessions
+from plaso.containers import tasks
 from plaso.lib import definitions
+from plaso.lib import errors
 from plaso.engine import configurations
+from plaso.engine import zeromq_queue
 from plaso.multi_processing import task_engine
 from plaso.storage.sqlite import writer as sqlite_writer
 
 from tests import test_lib as shared_test_lib
 
 
+class TestProcess(object):
+  """Process for testing."""
+
+  def __init__(self, pid):
+    """Initializes a process for testing.
+
+    Args:
+      pid (int): process identifier (PID).
+    """
+    super(TestProcess, self).__init__()
+    self.name = 'Test process'
+    self.pid = pid
+
+  def is_alive(self):  # pylint: disable=invalid-name
+    """Determines if the process is alive.
+
+    Returns:
+      bool: True if the process is alive.
+    """
+    return True
+
+
+class TestStorageWriter(object):
+  """Storage writer for testing."""
+
+  def __init__(self, processed_task_identifiers):
+    """Initializes a storage writer for testing.
+
+    Args:
+      processed_task_identifiers (list[str]): identifiers of processed tasks.
+    """
+    super(TestStorageWriter, self).__init__()
+    self._processed_task_identifiers = processed_task_identifiers
+
+  def GetProcessedTaskIdentifiers(self):
+    """Identifiers for tasks which have been processed.
+
+    Returns:
+      list[str]: task identifiers that are processed.
+    """
+    return list(self._processed_task_identifiers)
+
+
+class EventSourceHeapTest(shared_test_lib.BaseTestCase):
+  """Tests the event source heap."""
+
+  # pylint: disable=protected-access
+
+  def _CreateEventSource(
+      self, location, file_entry_type, data_offset=None, file_size=None):
+    """Creates an event source.
+
+    Args:
+      location (str): location.
+      file_entry_type (str): dfVFS file entry type.
+      data_offset (Optional[int]): data offset.
+      file_size (Optional[int]): file size.
+
+    Returns:
+      FileEntryEventSource: event source.
+    """
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=location)
+
+    event_source = event_sources.FileEntryEventSource(path_spec=path_spec)
+    event_source.data_offset = data_offset
+    event_source.file_entry_type = file_entry_type
+    event_source.file_size = file_size
+    return event_source
+
+  def testGetFileNameExtension(self):
+    """Tests the _GetFileNameExtension function."""
+    event_source_heap = task_engine._EventSourceHeap()
+
+    event_source = self._CreateEventSource(
+        '/Windows/System32/winevt/Logs/System.EVTX',
+        dfvfs_definitions.FILE_ENTRY_TYPE_FILE)
+    extension = event_source_heap._GetFileNameExtension(
+        event_source.path_spec)
+    self.assertEqual(extension, 'evtx')
+
+    event_source = self._CreateEventSource(
+        '/etc.d/passwd', dfvfs_definitions.FILE_ENTRY_TYPE_FILE)
+    extension = event_source_heap._GetFileNameExtension(
+        event_source.path_spec)
+    self.assertEqual(extension, '')
+
+  def testEstimateProcessingTime(self):
+    """Tests the EstimateProcessingTime function."""
+    event_source_heap = task_engine._EventSourceHeap()
+
+    event_source = self._CreateEventSource(
+        '/log.evtx', dfvfs_definitions.FILE_ENTRY_TYPE_FILE, file_size=4096)
+
+    processing_time = event_source_heap.EstimateProcessingTime(event_source)
+    self.assertAlmostEqual(
+        processing_time,
+        4096 / event_source_heap._DEFAULT_PROCESSING_RATE)
+
+    event_source_heap.AddProcessingTime(event_source.path_spec, 1024, 2.0)
+
+    processing_time = event_source_heap.EstimateProcessingTime(event_source)
+    self.assertAlmostEqual(processing_time, 8.0)
+
+    # Test an extension without measured processing rate.
+    event_source = self._CreateEventSource(
+        '/log.txt', dfvfs_definitions.FILE_ENTRY_TYPE_FILE, file_size=512)
+
+    processing_time = event_source_heap.EstimateProcessingTime(event_source)
+    self.assertAlmostEqual(processing_time, 1.0)
+
+    event_source = self._CreateEventSource(
+        '/log.txt', dfvfs_definitions.FILE_ENTRY_TYPE_FILE)
+
+    processing_time = event_source_heap.EstimateProcessingTime(event_source)
+    self.assertEqual(processing_time, 0.0)
+
+  def testPushPopEventSource(self):
+    """Tests the PushEventSource and PopEventSource functions."""
+    event_source_heap = task_engine._EventSourceHeap(maximum_number_of_items=4)
+
+    event_source_heap.PushEventSource(self._CreateEventSource(
+        '/small.log', dfvfs_definitions.FILE_ENTRY_TYPE_FILE, file_size=10))
+    event_source_heap.PushEventSource(self._CreateEventSource(
+        '/large.log', dfvfs_definitions.FILE_ENTRY_TYPE_FILE, file_size=1000))
+    event_source_heap.PushEventSource(self._CreateEventSource(
+        '/directory', dfvfs_definitions.FILE_ENTRY_TYPE_DIRECTORY))
+    self.assertFalse(event_source_heap.IsFull())
+
+    event_source_heap.PushEventSource(self._CreateEventSource(
+        '/other.log', dfvfs_definitions.FILE_ENTRY_TYPE_FILE, file_size=10))
+    self.assertTrue(event_source_heap.IsFull())
+
+    locations = []
+    event_source = event_source_heap.PopEventSource()
+    while event_source:
+      locations.append(event_source.path_spec.location)
+      event_source = event_source_heap.PopEventSource()
+
+    expected_locations = [
+        '/directory', '/large.log', '/small.log', '/other.log']
+    self.assertEqual(locations, expected_locations)
+
+  def testPushPopEventSourceOrderByDataOffset(self):
+    """Tests the PushEventSource and PopEventSource functions."""
+    event_source_heap = task_engine._EventSourceHeap(order_by_data_offset=True)
+
+    event_source_heap.PushEventSource(self._CreateEventSource(
+        '/large.log', dfvfs_definitions.FILE_ENTRY_TYPE_FILE,
+        data_offset=8192, file_size=1000))
+    event_source_heap.PushEventSource(self._CreateEventSource(
+        '/resident.log', dfvfs_definitions.FILE_ENTRY_TYPE_FILE,
+        file_size=10))
+    event_source_heap.PushEventSource(self._CreateEventSource(
+        '/small.log', dfvfs_definitions.FILE_ENTRY_TYPE_FILE,
+        data_offset=4096, file_size=10))
+    event_source_heap.PushEventSource(self._CreateEventSource(
+        '/directory', dfvfs_definitions.FILE_ENTRY_TYPE_DIRECTORY))
+
+    locations = []
+    event_source = event_source_heap.PopEventSource()
+    while event_source:
+      locations.append(event_source.path_spec.location)
+      event_source = event_source_heap.PopEventSource()
+
+    expected_locations = [
+        '/directory', '/small.log', '/large.log', '/resident.log']
+    self.assertEqual(locations, expected_locations)
+
+  def testPopNeighbouringEventSource(self):
+    """Tests the PopNeighbouringEventSource function."""
+    event_source_heap = task_engine._EventSourceHeap(order_by_data_offset=True)
+
+    event_source_heap.PushEventSource(self._CreateEventSource(
+        '/first.log', dfvfs_definitions.FILE_ENTRY_TYPE_FILE,
+        data_offset=4096, file_size=100))
+    event_source_heap.PushEventSource(self._CreateEventSource(
+        '/second.log', dfvfs_definitions.FILE_ENTRY_TYPE_FILE,
+        data_offset=8192, file_size=100))
+    event_source_heap.PushEventSource(self._CreateEventSource(
+        '/third.log', dfvfs_definitions.FILE_ENTRY_TYPE_FILE,
+        data_offset=1048576, file_size=100))
+    event_source_heap.PushEventSource(self._CreateEventSource(
+        '/resident.log', dfvfs_definitions.FILE_ENTRY_TYPE_FILE,
+        file_size=10))
+
+    event_source = event_source_heap.PopEventSource()
+    self.assertEqual(event_source.path_spec.location, '/first.log')
+
+    event_source = event_source_heap.PopNeighbouringEventSource(
+        event_source, 65536)
+    self.assertIsNotNone(event_source)
+    self.assertEqual(event_source.path_spec.location, '/second.log')
+
+    neighbouring_event_source = event_source_heap.PopNeighbouringEventSource(
+        event_source, 65536)
+    self.assertIsNone(neighbouring_event_source)
+
+    event_source = event_source_heap.PopEventSource()
+    self.assertEqual(event_source.path_spec.location, '/third.log')
+
+    # An event source without a data offset is not a neighbour.
+    neighbouring_event_source = event_source_heap.PopNeighbouringEventSource(
+        event_source, 65536)
+    self.assertIsNone(neighbouring_event_source)
+
+
+class WorkerProcessesScalerTest(shared_test_lib.BaseTestCase):
+  """Tests the worker processes scaler."""
+
+  # pylint: disable=protected-access
+
+  _MEMORY_PER_WORKER = 512 * 1024 * 1024
+
+  def testGetScalingDecision(self):
+    """Tests the GetScalingDecision function."""
+    scaler = task_engine._WorkerProcessesScaler(2, 8, 4)
+
+    used_memory_per_worker = [self._MEMORY_PER_WORKER] * 3
+    available_memory = 8 * self._MEMORY_PER_WORKER
+
+    # Test adding a worker process when the worker processes wait on I/O.
+    number_of_worker_processes_to_add, _ = scaler.GetScalingDecision(
+        3, 10, used_memory_per_worker, 80.0, 15.0, available_memory)
+    self.assertEqual(number_of_worker_processes_to_add, 1)
+
+    # Test adding a worker process when the CPUs are not fully used.
+    number_of_worker_processes_to_add, _ = scaler.GetScalingDecision(
+        3, 10, used_memory_per_worker, 50.0, 0.0, available_memory)
+    self.assertEqual(number_of_worker_processes_to_add, 1)
+
+    # Test no change when the CPUs are in use.
+    number_of_worker_processes_to_add, _ = scaler.GetScalingDecision(
+        3, 10, used_memory_per_worker, 90.0, 0.0, available_memory)
+    self.assertEqual(number_of_worker_processes_to_add, 0)
+
+    # Test no change when there are no queued tasks.
+    number_of_worker_processes_to_add, _ = scaler.GetScalingDecision(
+        3, 0, used_memory_per_worker, 50.0, 15.0, available_memory)
+    self.assertEqual(number_of_worker_processes_to_add, 0)
+
+    # Test no change when the maximum number of worker processes is reached.
+    number_of_worker_processes_to_add, _ = scaler.GetScalingDecision(
+        8, 10, used_memory_per_worker, 50.0, 15.0, available_memory)
+    self.assertEqual(number_of_worker_processes_to_add, 0)
+
+    # Test no change when there is insufficient memory available.
+    number_of_worker_processes_to_add, _ = scaler.GetScalingDecision(
+        3, 10, used_memory_per_worker, 50.0, 15.0, self._MEMORY_PER_WORKER)
+    self.assertEqual(number_of_worker_processes_to_add, 0)
+
+    # Test retiring a worker process when there is little memory available.
+    number_of_worker_processes_to_add, _ = scaler.GetScalingDecision(
+        3, 10, used_memory_per_worker, 50.0, 15.0, 1024)
+    self.assertEqual(number_of_worker_processes_to_add, -1)
+
+    # Test retiring a worker process when the CPUs are oversubscribed.
+    used_memory_per_worker = [self._MEMORY_PER_WORKER] * 6
+    number_of_worker_processes_to_add, _ = scaler.GetScalingDecision(
+        6, 10, used_memory_per_worker, 99.0, 0.0, available_memory)
+    self.assertEqual(number_of_worker_processes_to_add, -1)
+
+    # Test no retirement below the minimum number of worker processes.
+    used_memory_per_worker = [self._MEMORY_PER_WORKER] * 2
+    number_of_worker_processes_to_add, _ = scaler.GetScalingDecision(
+        2, 10, used_memory_per_worker, 50.0, 15.0, 1024)
+    self.assertEqual(number_of_worker_processes_to_add, 0)
+
+
 class TaskMultiProcessEngineTest(shared_test_lib.BaseTestCase):
   """Tests for the task multi-process engine."""
 
+  # pylint: disable=protected-access
+
+  def testGetProcessedTaskIdentifiers(self):
+    """Tests the _GetProcessedTaskIdentifiers function."""
+    test_engine = task_engine.TaskMultiProcessEngine()
+
+    configuration = configurations.ProcessingConfiguration()
+    configuration.task_storage_format = definitions.STORAGE_FORMAT_SQLITE
+    test_engine._processing_configuration = configuration
+
+    pull_queue = zeromq_queue.ZeroMQPullBindQueue(
+        delay_open=False, linger_seconds=0, name='test_completion_pull',
+        timeout_seconds=0)
+    push_queue = zeromq_queue.ZeroMQPushConnectQueue(
+        delay_open=False, linger_seconds=0, name='test_completion_push',
+        port=pull_queue.port)
+    test_engine._task_completion_queue = pull_queue
+
+    storage_writer = TestStorageWriter(['task1', 'task2'])
+
+    # The first call scans the task storage.
+    task_identifiers = test_engine._GetProcessedTaskIdentifiers(storage_writer)
+    self.assertEqual(task_identifiers, set(['task1', 'task2']))
+
+    # Announcements of tasks picked up by the scan are ignored.
+    push_queue.PushItem(('task1', 1.0))
+    push_queue.PushItem(('task3', 2.0))
+
+    task_identifiers = set()
+    for _ in range(10):
+      task_identifiers.update(
+          test_engine._GetProcessedTaskIdentifiers(storage_writer))
+      if task_identifiers:
+        break
+
+      time.sleep(0.1)
+
+    self.assertEqual(task_identifiers, set(['task3']))
+    self.assertEqual(test_engine._processing_time_per_task, {'task3': 2.0})
+
+    push_queue.Close(abort=True)
+    pull_queue.Close(abort=True)
+
+  def testMergeTaskStorage(self):
+    """Tests the _MergeTaskStorage function."""
+    test_engine = task_engine.TaskMultiProcessEngine()
+
+    configuration = configurations.ProcessingConfiguration()
+    configuration.task_storage_format = definitions.STORAGE_FORMAT_SQLITE
+    test_engine._processing_configuration = configuration
+    test_engine._task_completion_queue = mock.MagicMock()
+    test_engine._task_completion_queue.PopItem.side_effect = errors.QueueEmpty
+
+    task = test_engine._task_manager.CreateTask('session')
+    test_engine._task_manager.UpdateTaskAsProcessingByIdentifier(
+        task.identifier)
+
+    task.storage_file_size = 1024
+
+    merge_reader = mock.MagicMock()
+    merge_reader.MergeAttributeContainers.return_value = True
+
+    storage_writer = mock.MagicMock()
+    storage_writer.GetProcessedTaskIdentifiers.return_value = [
+        task.identifier, 'unknown']
+    storage_writer.StartMergeTaskStorage.return_value = merge_reader
+    storage_writer.number_of_events = 0
+    storage_writer.number_of_event_sources = 0
+    storage_writer.number_of_warnings = 0
+
+    test_engine._MergeTaskStorage(storage_writer)
+
+    self.assertIsNone(test_engine._merge_task)
+    self.assertFalse(test_engine._task_manager.HasPendingTasks())
+
+    # The identifiers of scanned tasks are not kept once the tasks are merged
+    # or are unknown.
+    self.assertEqual(test_engine._scanned_task_identifiers, set())
+
+  def testGroupNeighbouringEventSources(self):
+    """Tests the _GroupNeighbouringEventSources function."""
+    test_engine = task_engine.TaskMultiProcessEngine()
+
+    event_source_heap = task_engine._EventSourceHeap(order_by_data_offset=True)
+
+    for index in range(1, 100):
+      path_spec = path_spec_factory.Factory.NewPathSpec(
+          dfvfs_definitions.TYPE_INDICATOR_OS,
+          location='/file{0:d}.log'.format(index))
+
+      event_source = event_sources.FileEntryEventSource(path_spec=path_spec)
+      event_source.data_offset = index * 4096
+      event_source.file_entry_type = dfvfs_definitions.FILE_ENTRY_TYPE_FILE
+      event_source.file_size = 1024
+      event_source_heap.PushEventSource(event_source)
+
+    event_source = event_source_heap.PopEventSource()
+
+    task = tasks.Task()
+    task.file_size = event_source.file_size
+    task.path_spec = event_source.path_spec
+
+    test_engine._GroupNeighbouringEventSources(
+        task, event_source, event_source_heap)
+
+    maximum_number_of_event_sources = (
+        test_engine._MAXIMUM_NUMBER_OF_GROUPED_EVENT_SOURCES)
+    self.assertEqual(
+        len(task.grouped_path_specs), maximum_number_of_event_sources - 1)
+    self.assertEqual(task.file_size, maximum_number_of_event_sources * 1024)
+    self.assertEqual(
+        test_engine._number_of_consumed_sources,
+        maximum_number_of_event_sources - 1)
+
+    locations = [path_spec.location for path_spec in task.grouped_path_specs]
+    self.assertEqual(locations[0], '/file2.log')
+    self.assertEqual(locations[-1], '/file{0:d}.log'.format(
+        maximum_number_of_event_sources))
+
+  def testQueryProcessStatus(self):
+    """Tests the _QueryProcessStatus function with a status queue."""
+    test_engine = task_engine.TaskMultiProcessEngine()
+
+    pull_queue = zeromq_queue.ZeroMQPullBindQueue(
+        delay_open=False, linger_seconds=0, name='test_status_pull',
+        timeout_seconds=0)
+    push_queue = zeromq_queue.ZeroMQPushConnectQueue(
+        delay_open=False, linger_seconds=0, name='test_status_push',
+        port=pull_queue.port)
+    test_engine._status_queue = pull_queue
+
+    test_process = TestProcess(1)
+    test_engine._StartMonitoringProcess(test_process)
+
+    # No status has been published yet.
+    process_status = test_engine._QueryProcessStatus(test_process)
+    self.assertIsNone(process_status)
+
+    # Only the most recent status of a monitored process is kept.
+    push_queue.PushItem((1, {'processing_status': 'idle'}))
+    push_queue.PushItem((2, {'processing_status': 'running'}))
+    push_queue.PushItem((1, {'processing_status': 'running'}))
+
+    for _ in range(10):
+      process_status = test_engine._QueryProcessStatus(test_process)
+      if process_status and process_status.get(
+          'processing_status', None) == 'running':
+        break
+
+      time.sleep(0.1)
+
+    self.assertEqual(process_status, {'processing_status': 'running'})
+    self.assertEqual(list(test_engine._status_per_pid.keys()), [1])
+
+    # A status that was received too long ago is not returned.
+    receive_time, process_status = test_engine._status_per_pid[1]
+    test_engine._status_per_pid[1] = (
+        receive_time - test_engine._MAXIMUM_STATUS_AGE - 1.0, process_status)
+
+    process_status = test_engine._QueryProcessStatus(test_process)
+    self.assertIsNone(process_status)
+
+    # A process without a recent status is handled as not responding.
+    test_engine._RegisterProcess(test_process)
+    test_engine._CheckStatusWorkerProcess(1)
+    self.assertEqual(test_engine._rpc_errors_per_pid[1], 1)
+
+    test_engine._StopMonitoringProcess(test_process)
+    self.assertEqual(test_engine._status_per_pid, {})
+
+    push_queue.Close(abort=True)
+    pull_queue.Close(abort=True)
+
   def testProcessSources(self):
     """Tests the PreprocessSources and ProcessSources function."""
     artifacts_path = shared_test_lib.GetTestFilePath(['artifacts'])
@@ -64,6 +515,48 @@ class TaskMultiProcessEngineTest(shared_test_lib.BaseTestCase):
     # on multi-process primitives e.g. by writing to a file.
     # self.assertEqual(storage_writer.number_of_events, 15)
 
+  def testProcessSourcesWithSharedChunkCache(self):
+    """Tests that ProcessSources removes the shared chunk cache on error."""
+    test_engine = task_engine.TaskMultiProcessEngine(
+        maximum_number_of_tasks=100)
+
+    test_file_path = self._GetTestFilePath(['ímynd.dd'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+    source_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_TSK, location='/',
+        parent=os_path_spec)
+
+    session = sessions.Session()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      configuration = configurations.ProcessingConfiguration()
+      configuration.parser_filter_expression = 'filestat'
+      configuration.shared_chunk_cache_size = 1024 * 1024
+      configuration.task_storage_format = definitions.STORAGE_FORMAT_SQLITE
+      configuration.temporary_directory = temp_directory
+
+      temp_file = os.path.join(temp_directory, 'storage.plaso')
+      storage_writer = sqlite_writer.SQLiteStorageFileWriter(session, temp_file)
+
+      with mock.patch.object(
+          test_engine, '_ProcessSources', side_effect=RuntimeError):
+        try:
+          with self.assertRaises(RuntimeError):
+            test_engine.ProcessSources(
+                session.identifier, [source_path_spec], storage_writer,
+                configuration)
+
+        finally:
+          test_engine._StopExtractionProcesses(abort=True)
+
+      chunk_cache_files = [
+          filename for filename in os.listdir(temp_directory)
+          if filename.endswith('.chunk_cache')]
+      self.assertEqual(chunk_cache_files, [])
+
 
 if __name__ == '__main__':
   unittest.main()
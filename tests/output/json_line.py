@@ -122,6 +122,33 @@ class JSONLinesOutputTest(test_lib.OutputModuleTestCase):
     json_dict = json.loads(event_body)
     self.assertEqual(json_dict, expected_json_dict)
 
+  def testWriteSerializedEvent(self):
+    """Tests the WriteSerializedEvent function."""
+    formatters_manager.FormattersManager.RegisterFormatter(
+        test_lib.TestEventFormatter)
+
+    event, event_data = containers_test_lib.CreateEventFromValues(
+        self._TEST_EVENTS[0])
+
+    self._output_module.WriteEventBody(event, event_data, None)
+    expected_event_body = self._output_writer.ReadOutput()
+
+    serialized_data = self._output_module._JSON_SERIALIZER.WriteSerialized(
+        event_data)
+    event_data_json_dict = json.loads(serialized_data)
+
+    self._output_module.WriteSerializedEvent(
+        event, event_data, None, event_data_json_dict)
+    event_body = self._output_writer.ReadOutput()
+
+    formatters_manager.FormattersManager.DeregisterFormatter(
+        test_lib.TestEventFormatter)
+
+    self.assertEqual(event_body, expected_event_body)
+
+    # The serialized event data is not changed.
+    self.assertEqual(event_data_json_dict, json.loads(serialized_data))
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -6,6 +6,8 @@ from __future__ import unicode_literals
 
 import unittest
 
+import pytz
+
 from plaso.containers import artifacts
 from plaso.engine import knowledge_base
 from plaso.formatters import interface as formatters_interface
@@ -27,6 +29,160 @@ class TestEventFormatter(formatters_interface.EventFormatter):
   SOURCE_LONG = 'Syslog'
 
 
+class DateTimeRenderingCacheTest(test_lib.OutputModuleTestCase):
+  """Tests for the date and time rendering cache."""
+
+  # pylint: disable=protected-access
+
+  def testGetUTCOffsetString(self):
+    """Tests the _GetUTCOffsetString function."""
+    date_time_rendering_cache = mediator.DateTimeRenderingCache()
+
+    self.assertEqual(date_time_rendering_cache._GetUTCOffsetString(0), '+00:00')
+    self.assertEqual(
+        date_time_rendering_cache._GetUTCOffsetString(19800), '+05:30')
+    self.assertEqual(
+        date_time_rendering_cache._GetUTCOffsetString(-1172), '-00:19:32')
+
+  def testGetDateAndTimeOfDay(self):
+    """Tests the GetDate and GetTimeOfDay functions."""
+    date_time_rendering_cache = mediator.DateTimeRenderingCache()
+
+    date_tuple = date_time_rendering_cache.GetDate(1335791207939596)
+    self.assertEqual(date_tuple, (2012, 4, 30))
+
+    time_of_day_tuple = date_time_rendering_cache.GetTimeOfDay(
+        1335791207939596)
+    self.assertEqual(time_of_day_tuple, (13, 6, 47))
+
+    time_of_day_tuple = date_time_rendering_cache.GetTimeOfDay(-1000001)
+    self.assertEqual(time_of_day_tuple, (23, 59, 59))
+
+    posix_timestamp = date_time_rendering_cache.GetPOSIXTimestamp(-1000001)
+    self.assertEqual(posix_timestamp, -1)
+
+    date_tuple = date_time_rendering_cache.GetDate(None)
+    self.assertEqual(date_tuple, (None, None, None))
+
+  def testGetISODateTime(self):
+    """Tests the GetISODateTime function."""
+    date_time_rendering_cache = mediator.DateTimeRenderingCache()
+
+    date_time_string = date_time_rendering_cache.GetISODateTime(
+        1335791207939596)
+    self.assertEqual(date_time_string, '2012-04-30T13:06:47.939596+00:00')
+
+    date_time_string = date_time_rendering_cache.GetISODateTime(
+        1335791207000000)
+    self.assertEqual(date_time_string, '2012-04-30T13:06:47+00:00')
+
+    with self.assertRaises(ValueError):
+      date_time_rendering_cache.GetISODateTime(0)
+
+    with self.assertRaises(OverflowError):
+      date_time_rendering_cache.GetISODateTime(2**62)
+
+    date_time_rendering_cache = mediator.DateTimeRenderingCache(
+        timezone=pytz.timezone('Europe/Amsterdam'))
+
+    timestamps = [
+        1335791207939596, 1335791207939597, 1351990800000000,
+        1351990800000001, -2840140800000000]
+    for timestamp in timestamps:
+      expected_date_time_string = timelib.Timestamp.CopyToIsoFormat(
+          timestamp, timezone=date_time_rendering_cache._timezone)
+      date_time_string = date_time_rendering_cache.GetISODateTime(timestamp)
+      self.assertEqual(date_time_string, expected_date_time_string)
+
+    date_time_string = date_time_rendering_cache.GetISODateTime(
+        1335791207939596)
+    self.assertEqual(date_time_string, '2012-04-30T15:06:47.939596+02:00')
+
+
+class EventFormattingContextTest(test_lib.OutputModuleTestCase):
+  """Tests for the event formatting context."""
+
+  _TEST_EVENTS = [
+      {'data_type': 'test:mediator',
+       'hostname': 'ubuntu',
+       'text': 'Reporter <CRON> PID: 8442',
+       'timestamp': timelib.Timestamp.CopyFromString('2012-06-27 18:17:01'),
+       'timestamp_desc': definitions.TIME_DESCRIPTION_CHANGE,
+       'username': 'root'}]
+
+  def setUp(self):
+    """Makes preparations before running an individual test."""
+    knowledge_base_object = knowledge_base.KnowledgeBase()
+    self._output_mediator = mediator.OutputMediator(knowledge_base_object, None)
+
+  def testGetDateAndTimeOfDay(self):
+    """Tests the GetDate and GetTimeOfDay functions."""
+    event, event_data = containers_test_lib.CreateEventFromValues(
+        self._TEST_EVENTS[0])
+    formatting_context = mediator.EventFormattingContext(
+        self._output_mediator, event, event_data)
+
+    self.assertEqual(formatting_context.GetDate(), (2012, 6, 27))
+    self.assertEqual(formatting_context.GetTimeOfDay(), (18, 17, 1))
+    self.assertEqual(formatting_context.GetPOSIXTimestamp(), 1340821021)
+
+  def testGetFormattedMessages(self):
+    """Tests the GetFormattedMessages function."""
+    formatters_manager.FormattersManager.RegisterFormatter(
+        TestEventFormatter)
+
+    event, event_data = containers_test_lib.CreateEventFromValues(
+        self._TEST_EVENTS[0])
+    formatting_context = mediator.EventFormattingContext(
+        self._output_mediator, event, event_data)
+
+    message, message_short = formatting_context.GetFormattedMessages()
+    self.assertEqual(message, 'Reporter <CRON> PID: 8442')
+    self.assertEqual(message_short, 'Reporter <CRON> PID: 8442')
+
+    source_short, source = formatting_context.GetFormattedSources()
+    self.assertEqual(source, 'Syslog')
+    self.assertEqual(source_short, 'LOG')
+
+    formatters_manager.FormattersManager.DeregisterFormatter(
+        TestEventFormatter)
+
+    # The formatted messages are determined only once.
+    message, _ = formatting_context.GetFormattedMessages()
+    self.assertEqual(message, 'Reporter <CRON> PID: 8442')
+
+  def testGetISODateTime(self):
+    """Tests the GetISODateTime function."""
+    event, event_data = containers_test_lib.CreateEventFromValues(
+        self._TEST_EVENTS[0])
+    formatting_context = mediator.EventFormattingContext(
+        self._output_mediator, event, event_data)
+
+    date_time_string = formatting_context.GetISODateTime()
+    self.assertEqual(date_time_string, '2012-06-27T18:17:01+00:00')
+
+    event.timestamp = -9223372036854775808
+    formatting_context = mediator.EventFormattingContext(
+        self._output_mediator, event, event_data)
+
+    with self.assertRaises(OverflowError):
+      formatting_context.GetISODateTime()
+
+    with self.assertRaises(OverflowError):
+      formatting_context.GetISODateTime()
+
+  def testGetHostnameAndUsername(self):
+    """Tests the GetHostname and GetUsername functions."""
+    event, event_data = containers_test_lib.CreateEventFromValues(
+        self._TEST_EVENTS[0])
+    formatting_context = mediator.EventFormattingContext(
+        self._output_mediator, event, event_data)
+
+    self.assertEqual(formatting_context.GetHostname(), 'ubuntu')
+    self.assertEqual(formatting_context.GetUsername(), 'root')
+    self.assertEqual(formatting_context.GetMACBRepresentation(), '..C.')
+
+
 class OutputMediatorTest(test_lib.OutputModuleTestCase):
   """Tests for the output mediator object."""
 
@@ -97,6 +253,30 @@ class OutputMediatorTest(test_lib.OutputModuleTestCase):
     formatters_manager.FormattersManager.DeregisterFormatter(
         TestEventFormatter)
 
+  def testGetFormattingContext(self):
+    """Tests the GetFormattingContext function."""
+    event, event_data = containers_test_lib.CreateEventFromValues(
+        self._TEST_EVENTS[0])
+    formatting_context = self._output_mediator.GetFormattingContext(
+        event, event_data)
+    self.assertIsNotNone(formatting_context)
+
+    # The context is shared by all the fields of the same event.
+    test_formatting_context = self._output_mediator.GetFormattingContext(
+        event, event_data)
+    self.assertIs(test_formatting_context, formatting_context)
+
+    event.timestamp += 1
+    test_formatting_context = self._output_mediator.GetFormattingContext(
+        event, event_data)
+    self.assertIsNot(test_formatting_context, formatting_context)
+
+    other_event, other_event_data = containers_test_lib.CreateEventFromValues(
+        self._TEST_EVENTS[0])
+    formatting_context = self._output_mediator.GetFormattingContext(
+        other_event, other_event_data)
+    self.assertIsNot(formatting_context, test_formatting_context)
+
   def testGetHostname(self):
     """Tests the GetHostname function."""
     _, event_data = containers_test_lib.CreateEventFromValues(
@@ -124,6 +304,20 @@ class OutputMediatorTest(test_lib.OutputModuleTestCase):
     username = self._output_mediator.GetUsername(event_data)
     self.assertEqual(username, 'root')
 
+  def testSetTimezone(self):
+    """Tests the SetTimezone function."""
+    output_mediator = self._CreateOutputMediator()
+
+    output_mediator.SetTimezone('Europe/Amsterdam')
+
+    date_time_string = (
+        output_mediator.date_time_rendering_cache.GetISODateTime(
+            1335791207939596))
+    self.assertEqual(date_time_string, '2012-04-30T15:06:47.939596+02:00')
+
+    with self.assertRaises(ValueError):
+      output_mediator.SetTimezone('Bogus')
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the Parquet output module."""
+
+from __future__ import unicode_literals
+
+import os
+import unittest
+
+from plaso.containers import events
+from plaso.formatters import interface as formatters_interface
+from plaso.formatters import manager as formatters_manager
+from plaso.lib import definitions
+from plaso.lib import timelib
+from plaso.output import parquet
+
+from tests import test_lib as shared_test_lib
+from tests.containers import test_lib as containers_test_lib
+from tests.output import test_lib
+
+
+class TestEventFormatter(formatters_interface.EventFormatter):
+  """Event object formatter used for testing."""
+
+  DATA_TYPE = 'test:parquet'
+  FORMAT_STRING = '{text}'
+
+  SOURCE_SHORT = 'LOG'
+  SOURCE_LONG = 'Syslog'
+
+
+@unittest.skipIf(parquet.pyarrow is None, 'missing pyarrow')
+class ParquetOutputModuleTest(test_lib.OutputModuleTestCase):
+  """Tests for the Parquet output module."""
+
+  # pylint: disable=protected-access
+
+  _TEST_EVENTS = [
+      {'data_type': 'test:parquet',
+       'filename': 'log/syslog.1',
+       'hostname': 'ubuntu',
+       'parser': 'syslog',
+       'pid': 8442,
+       'text': 'Reporter <CRON> PID: 8442 session closed for user root',
+       'timestamp': timelib.Timestamp.CopyFromString('2012-06-27 18:17:01'),
+       'timestamp_desc': definitions.TIME_DESCRIPTION_CHANGE},
+      {'data_type': 'test:parquet',
+       'filename': 'log/syslog.1',
+       'hostname': 'ubuntu',
+       'parser': 'syslog',
+       'text': 'Reporter <CRON> PID: 8443 session opened for user root',
+       'timestamp': timelib.Timestamp.CopyFromString('2012-06-27 18:18:01'),
+       'timestamp_desc': definitions.TIME_DESCRIPTION_CHANGE},
+      {'data_type': 'test:parquet',
+       'filename': 'log/syslog.1',
+       'hostname': 'ubuntu',
+       'parser': 'syslog',
+       'text': 'Reporter <CRON> PID: 8444 session closed for user root',
+       'timestamp': timelib.Timestamp.CopyFromString('2012-06-27 18:19:01'),
+       'timestamp_desc': definitions.TIME_DESCRIPTION_CHANGE}]
+
+  def setUp(self):
+    """Makes preparations before running an individual test."""
+    formatters_manager.FormattersManager.RegisterFormatter(TestEventFormatter)
+
+  def tearDown(self):
+    """Cleans up after running an individual test."""
+    formatters_manager.FormattersManager.DeregisterFormatter(
+        TestEventFormatter)
+
+  def testOpen(self):
+    """Tests the Open function."""
+    output_mediator = self._CreateOutputMediator()
+    output_module = parquet.ParquetOutputModule(output_mediator)
+
+    with self.assertRaises(ValueError):
+      output_module.Open()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      parquet_file = os.path.join(temp_directory, 'parquet.out')
+      with open(parquet_file, 'wb') as file_object:
+        file_object.write(b'')
+
+      output_module.SetFilename(parquet_file)
+
+      with self.assertRaises(IOError):
+        output_module.Open()
+
+  def testWriteEventBody(self):
+    """Tests the WriteEventBody function."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      output_mediator = self._CreateOutputMediator()
+      output_module = parquet.ParquetOutputModule(output_mediator)
+
+      parquet_file = os.path.join(temp_directory, 'parquet.out')
+      output_module.SetFilename(parquet_file)
+      output_module.SetRowGroupSize(2)
+
+      output_module.Open()
+      output_module.WriteHeader()
+
+      for event_values in self._TEST_EVENTS:
+        event, event_data = containers_test_lib.CreateEventFromValues(
+            event_values)
+
+        event_tag = None
+        if 'pid' in event_values:
+          event_tag = events.EventTag()
+          event_tag.AddLabels(['cron', 'session'])
+
+        output_module.WriteEvent(event, event_data, event_tag)
+
+      output_module.WriteFooter()
+      output_module.Close()
+
+      parquet_file_object = parquet.parquet.ParquetFile(parquet_file)
+
+      metadata = parquet_file_object.metadata
+      self.assertEqual(metadata.num_rows, 3)
+      self.assertEqual(metadata.num_row_groups, 2)
+
+      timestamp_column_index = (
+          parquet_file_object.schema_arrow.get_field_index('timestamp'))
+
+      statistics = metadata.row_group(0).column(
+          timestamp_column_index).statistics
+      self.assertIsNotNone(statistics)
+      self.assertEqual(statistics.min, self._TEST_EVENTS[0]['timestamp'])
+      self.assertEqual(statistics.max, self._TEST_EVENTS[1]['timestamp'])
+
+      statistics = metadata.row_group(1).column(
+          timestamp_column_index).statistics
+      self.assertEqual(statistics.min, self._TEST_EVENTS[2]['timestamp'])
+      self.assertEqual(statistics.max, self._TEST_EVENTS[2]['timestamp'])
+
+      rows = parquet_file_object.read().to_pylist()
+
+    self.assertEqual(len(rows), 3)
+
+    expected_row = {
+        'attributes': [('hostname', 'ubuntu'), ('pid', '8442')],
+        'data_type': 'test:parquet',
+        'filename': 'log/syslog.1',
+        'message': 'Reporter <CRON> PID: 8442 session closed for user root',
+        'parser': 'syslog',
+        'tag': ['cron', 'session'],
+        'timestamp': self._TEST_EVENTS[0]['timestamp'],
+        'timestamp_desc': definitions.TIME_DESCRIPTION_CHANGE}
+
+    row = dict(rows[0])
+    # Ignore attributes added by the test library, such as "text".
+    row['attributes'] = [
+        (name, value) for name, value in row['attributes']
+        if name in ('hostname', 'pid')]
+    self.assertEqual(row, expected_row)
+
+    self.assertIsNone(rows[1]['tag'])
+
+
+if __name__ == '__main__':
+  unittest.main()
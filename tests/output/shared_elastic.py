@@ -4,8 +4,12 @@
 
 from __future__ import unicode_literals
 
+import json
+import threading
 import unittest
 
+from http import server as http_server
+
 try:
   from mock import MagicMock
 except ImportError:
@@ -29,6 +33,42 @@ class TestElasticsearchOutputModule(
     self._client = MagicMock()
 
 
+class TestBulkRequestHandler(http_server.BaseHTTPRequestHandler):
+  """HTTP request handler that stubs the Elasticsearch bulk API.
+
+  The responses are read from the responses attribute of the server.
+  """
+
+  # pylint: disable=invalid-name
+
+  def do_POST(self):
+    """Handles a POST request."""
+    content_length = int(self.headers.get('Content-Length', 0), 10)
+    self.rfile.read(content_length)
+
+    status_code, response = self.server.responses.pop(0)
+    response_data = json.dumps(response).encode('utf-8')
+
+    self.server.number_of_requests += 1
+
+    self.send_response(status_code)
+    self.send_header('Content-Type', 'application/json')
+    self.send_header('Content-Length', '{0:d}'.format(len(response_data)))
+    self.end_headers()
+    self.wfile.write(response_data)
+
+  def log_message(self, *args):  # pylint: disable=arguments-differ
+    """Ignores log messages."""
+    return
+
+
+class TestRetryElasticsearchOutputModule(
+    shared_elastic.SharedElasticsearchOutputModule):
+  """Elasticsearch output module for testing retries."""
+
+  _RETRY_INITIAL_DELAY = 0.01
+
+
 @unittest.skipIf(shared_elastic.elasticsearch is None, 'missing elasticsearch')
 class SharedElasticsearchOutputModuleTest(test_lib.OutputModuleTestCase):
   """Tests the shared functionality for Elasticsearch output modules."""
@@ -89,6 +129,50 @@ class SharedElasticsearchOutputModuleTest(test_lib.OutputModuleTestCase):
     self.assertEqual(len(output_module._event_documents), 0)
     self.assertEqual(output_module._number_of_buffered_events, 0)
 
+  def testSendBulkRequest(self):
+    """Tests the _SendBulkRequest function against a stub HTTP server."""
+    stub_server = http_server.HTTPServer(
+        ('127.0.0.1', 0), TestBulkRequestHandler)
+    stub_server.number_of_requests = 0
+    stub_server.responses = [
+        (429, {'error': 'too many requests', 'status': 429}),
+        (200, {'errors': True, 'items': [
+            {'index': {'status': 201}},
+            {'index': {'status': 429, 'error': {
+                'type': 'es_rejected_execution_exception'}}},
+            {'index': {'status': 400, 'error': {
+                'type': 'mapper_parsing_exception'}}}]}),
+        (200, {'errors': False, 'items': [{'index': {'status': 201}}]})]
+
+    server_thread = threading.Thread(target=stub_server.serve_forever)
+    server_thread.daemon = True
+    server_thread.start()
+
+    try:
+      output_mediator = self._CreateOutputMediator()
+      output_module = TestRetryElasticsearchOutputModule(output_mediator)
+      output_module.SetIndexName('test')
+      output_module.SetServerInformation(
+          '127.0.0.1', stub_server.server_address[1])
+      output_module._Connect()
+
+      event_documents = []
+      for index in range(3):
+        event_documents.append({'index': {'_index': 'test'}})
+        event_documents.append({'message': 'event {0:d}'.format(index)})
+
+      output_module._SendBulkRequest(event_documents, 3)
+
+    finally:
+      stub_server.shutdown()
+      stub_server.server_close()
+
+    self.assertEqual(stub_server.number_of_requests, 3)
+    self.assertEqual(output_module.number_of_inserted_events, 2)
+    self.assertEqual(output_module.number_of_failed_events, 1)
+    self.assertEqual(
+        dict(output_module.errors_counter), {'mapper_parsing_exception': 1})
+
   def testGetSanitizedEventValues(self):
     """Tests the _GetSanitizedEventValues function."""
     output_mediator = self._CreateOutputMediator()
@@ -166,6 +250,29 @@ class SharedElasticsearchOutputModuleTest(test_lib.OutputModuleTestCase):
 
     self.assertIsNone(output_module._client)
 
+  def testCloseWithBufferedEvents(self):
+    """Tests the Close function with buffered events."""
+    output_mediator = self._CreateOutputMediator()
+    output_module = TestElasticsearchOutputModule(output_mediator)
+
+    output_module._Connect()
+    client = output_module._client
+    client.bulk.return_value = {'errors': False, 'items': []}
+
+    output_module._event_documents = [
+        {'index': {'_index': 'test'}}, {'message': 'event'}]
+    output_module._number_of_buffered_events = 1
+
+    output_module._FlushEvents()
+
+    self.assertEqual(len(output_module._sender_threads), 4)
+
+    output_module.Close()
+
+    self.assertEqual(client.bulk.call_count, 1)
+    self.assertEqual(output_module._sender_threads, [])
+    self.assertEqual(output_module.number_of_inserted_events, 1)
+
   def testSetDocumentType(self):
     """Tests the SetDocumentType function."""
     output_mediator = self._CreateOutputMediator()
@@ -190,6 +297,19 @@ class SharedElasticsearchOutputModuleTest(test_lib.OutputModuleTestCase):
 
     self.assertEqual(output_module._flush_interval, 1234)
 
+  def testSetNumberOfConcurrentRequests(self):
+    """Tests the SetNumberOfConcurrentRequests function."""
+    output_mediator = self._CreateOutputMediator()
+    output_module = TestElasticsearchOutputModule(output_mediator)
+
+    self.assertEqual(
+        output_module._number_of_concurrent_requests,
+        output_module._DEFAULT_NUMBER_OF_CONCURRENT_REQUESTS)
+
+    output_module.SetNumberOfConcurrentRequests(8)
+
+    self.assertEqual(output_module._number_of_concurrent_requests, 8)
+
   def testSetIndexName(self):
     """Tests the SetIndexName function."""
     output_mediator = self._CreateOutputMediator()
@@ -34,8 +34,11 @@ class TestEventFormatter(formatters_interface.EventFormatter):
 class XLSXOutputModuleTest(test_lib.OutputModuleTestCase):
   """Test the XLSX output module."""
 
+  # pylint: disable=protected-access
+
   _SHARED_STRINGS = 'xl/sharedStrings.xml'
   _SHEET1 = 'xl/worksheets/sheet1.xml'
+  _SHEET3 = 'xl/worksheets/sheet3.xml'
 
   _COLUMN_TAG = '}c'
   _ROW_TAG = '}row'
@@ -54,11 +57,12 @@ class XLSXOutputModuleTest(test_lib.OutputModuleTestCase):
        'timestamp': timelib.Timestamp.CopyFromString('2012-06-27 18:17:01'),
        'timestamp_desc': definitions.TIME_DESCRIPTION_CHANGE}]
 
-  def _GetSheetRows(self, filename):
-    """Parses the contents of the first sheet of an XLSX document.
+  def _GetSheetRows(self, filename, sheet=_SHEET1):
+    """Parses the contents of a sheet of an XLSX document.
 
     Args:
       filename (str): The file path of the XLSX document to parse.
+      sheet (Optional[str]): path of the sheet within the XLSX document.
 
     Returns:
       list[list[str]]: A list of lists representing the rows of the first sheet.
@@ -68,10 +72,10 @@ class XLSXOutputModuleTest(test_lib.OutputModuleTestCase):
     """
     zip_file = zipfile.ZipFile(filename)
 
-    # Fail if we can't find the expected first sheet.
-    if self._SHEET1 not in zip_file.namelist():
+    # Fail if we can't find the expected sheet.
+    if sheet not in zip_file.namelist():
       raise ValueError(
-          'Unable to locate expected sheet: {0:s}'.format(self._SHEET1))
+          'Unable to locate expected sheet: {0:s}'.format(sheet))
 
     # Generate a reference table of shared strings if available.
     strings = []
@@ -84,7 +88,7 @@ class XLSXOutputModuleTest(test_lib.OutputModuleTestCase):
     row = []
     rows = []
     value = ''
-    zip_file_object = zip_file.open(self._SHEET1)
+    zip_file_object = zip_file.open(sheet)
     for _, element in ElementTree.iterparse(zip_file_object):
       if (element.tag.endswith(self._VALUE_STRING_TAG) or
           element.tag.endswith(self._SHARED_STRING_TAG)):
@@ -148,6 +152,94 @@ class XLSXOutputModuleTest(test_lib.OutputModuleTestCase):
       self.assertEqual(len(expected_event_body), len(rows[1]))
       self.assertEqual(expected_event_body, rows[1])
 
+    formatters_manager.FormattersManager.DeregisterFormatter(
+        TestEventFormatter)
+
+  def testWriteEventBodyWithSheetRollover(self):
+    """Tests the WriteEventBody function with more rows than fit a sheet."""
+    formatters_manager.FormattersManager.RegisterFormatter(TestEventFormatter)
+
+    expected_header = [
+        'datetime', 'timestamp_desc', 'source', 'source_long',
+        'message', 'parser', 'display_name', 'tag']
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      output_mediator = self._CreateOutputMediator()
+      output_module = xlsx.XLSXOutputModule(output_mediator)
+      output_module._COLUMN_WIDTHS_SAMPLE_SIZE = 2
+      output_module._MAXIMUM_NUMBER_OF_ROWS = 3
+
+      xlsx_file = os.path.join(temp_directory, 'xlsx.out')
+      output_module.SetFilename(xlsx_file)
+
+      output_module.Open()
+      output_module.WriteHeader()
+
+      for _ in range(5):
+        event, event_data = containers_test_lib.CreateEventFromValues(
+            self._TEST_EVENTS[0])
+        output_module.WriteEvent(event, event_data, None)
+
+      output_module.WriteFooter()
+      output_module.Close()
+
+      self.assertEqual(output_module._number_of_sheets, 3)
+
+      try:
+        first_sheet_rows = self._GetSheetRows(xlsx_file)
+        last_sheet_rows = self._GetSheetRows(xlsx_file, sheet=self._SHEET3)
+      except ValueError as exception:
+        self.fail(exception)
+
+      self.assertEqual(len(first_sheet_rows), 3)
+      self.assertEqual(first_sheet_rows[0], expected_header)
+
+      self.assertEqual(len(last_sheet_rows), 2)
+      self.assertEqual(last_sheet_rows[0], expected_header)
+      self.assertEqual(last_sheet_rows[1][2], 'LOG')
+
+    formatters_manager.FormattersManager.DeregisterFormatter(
+        TestEventFormatter)
+
+  def testWriteEventBodyColumnWidths(self):
+    """Tests that WriteEventBody determines the column widths from a sample."""
+    formatters_manager.FormattersManager.RegisterFormatter(TestEventFormatter)
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      output_mediator = self._CreateOutputMediator()
+      output_module = xlsx.XLSXOutputModule(output_mediator)
+      output_module._COLUMN_WIDTHS_SAMPLE_SIZE = 1
+
+      xlsx_file = os.path.join(temp_directory, 'xlsx.out')
+      output_module.SetFilename(xlsx_file)
+
+      output_module.Open()
+      output_module.WriteHeader()
+
+      event, event_data = containers_test_lib.CreateEventFromValues(
+          self._TEST_EVENTS[0])
+      output_module.WriteEvent(event, event_data, None)
+
+      self.assertIsNone(output_module._sample_rows)
+
+      column_widths = dict(output_module._column_widths)
+
+      # Rows after the sample do not change the column widths.
+      event_data.text = 'A much longer message {0:s}'.format('A' * 100)
+      output_module.WriteEvent(event, event_data, None)
+
+      output_module.WriteFooter()
+      output_module.Close()
+
+      self.assertEqual(output_module._column_widths, column_widths)
+      # The message column width is capped at the maximum width.
+      self.assertEqual(column_widths[4], 50)
+      # The source column width is determined by the header.
+      self.assertEqual(column_widths[2], 8)
+
+    formatters_manager.FormattersManager.DeregisterFormatter(
+        TestEventFormatter)
+
   def testWriteHeader(self):
     """Tests the WriteHeader function."""
     expected_header = [
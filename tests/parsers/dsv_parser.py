@@ -7,6 +7,7 @@ from __future__ import unicode_literals
 import io
 import unittest
 
+from plaso.lib import errors
 from plaso.parsers import dsv_parser
 
 from tests.parsers import test_lib
@@ -57,6 +58,76 @@ class TestDSVParser(dsv_parser.DSVParser):
     return True
 
 
+class TestBulkDSVParser(TestDSVParser):
+  """Delimiter separated values (DSV) parser for testing bulk mode."""
+
+  SUPPORTS_BULK_MODE = True
+
+  _BULK_MODE_NUMBER_OF_ROWS = 2
+
+  _BULK_MODE_READ_SIZE = 16
+
+
+class DSVBulkLineReaderTest(test_lib.ParserTestCase):
+  """Tests the delimiter separated values (DSV) bulk line reader."""
+
+  def testIterateAndGetLineOffset(self):
+    """Tests the __iter__ and GetLineOffset functions."""
+    file_object = io.BytesIO(
+        'header\nfirst,líne\nsecond,line\r\n\nlast,line'.encode('utf-8'))
+
+    line_reader = dsv_parser.DSVBulkLineReader(
+        file_object, 'utf-8', 7, 4, 1024)
+
+    lines = list(line_reader)
+    self.assertEqual(
+        lines, ['first,líne\n', 'second,line\r\n', '\n', 'last,line'])
+
+    self.assertEqual(line_reader.GetLineOffset(0), 7)
+    self.assertEqual(line_reader.GetLineOffset(1), 19)
+    self.assertEqual(line_reader.GetLineOffset(3), 33)
+
+    line_reader.DiscardLineOffsets(2)
+    self.assertEqual(line_reader.GetLineOffset(2), 32)
+    self.assertEqual(line_reader.GetLineOffset(3), 33)
+
+  def testIterateWithDecodeError(self):
+    """Tests the __iter__ function with data that cannot be decoded."""
+    file_object = io.BytesIO(b'first,line\nsecond,\xff\n')
+
+    line_reader = dsv_parser.DSVBulkLineReader(
+        file_object, 'utf-8', 0, 1024, 1024)
+
+    lines = []
+    with self.assertRaises(UnicodeDecodeError):
+      for line in line_reader:
+        lines.append(line)
+
+    self.assertEqual(lines, ['first,line\n'])
+
+  def testIterateWithLongLine(self):
+    """Tests the __iter__ function with a line that exceeds the maximum size."""
+    file_object = io.BytesIO(b'first,line\nsecond,line,' + b'x' * 64 + b'\n')
+
+    line_reader = dsv_parser.DSVBulkLineReader(
+        file_object, 'utf-8', 0, 4, 32)
+
+    lines = []
+    with self.assertRaises(errors.ParseError):
+      for line in line_reader:
+        lines.append(line)
+
+    self.assertEqual(lines, ['first,line\n'])
+
+    file_object = io.BytesIO(b'first,line\n' + b'x' * 64)
+
+    line_reader = dsv_parser.DSVBulkLineReader(
+        file_object, 'utf-8', 0, 1024, 32)
+
+    with self.assertRaises(errors.ParseError):
+      list(line_reader)
+
+
 class DSVParserTest(test_lib.ParserTestCase):
   """Tests the delimiter separated values (DSV) parser."""
 
@@ -118,6 +189,38 @@ class DSVParserTest(test_lib.ParserTestCase):
     self.assertEqual(row['user'], 'joesmith')
     self.assertEqual(row['password'], 'superrich')
 
+  def testParseFileObjectInBulkMode(self):
+    """Tests the ParseFileObject function in bulk mode."""
+    parser = TestBulkDSVParser()
+
+    self._ParseFile(['password.csv'], parser)
+
+    self.assertEqual(len(parser.rows), 4)
+    self.assertEqual(parser.row_offsets, [20, 44, 64, 86])
+
+    row = parser.rows[3]
+    self.assertEqual(row['place'], 'uber secret laire')
+    self.assertEqual(row['user'], 'admin')
+    self.assertEqual(row['password'], 'admin')
+
+  def testGetRowDictionary(self):
+    """Tests the _GetRowDictionary function."""
+    parser = TestDSVParser()
+
+    row = parser._GetRowDictionary(['bank', 'joesmith', 'superrich'])
+    self.assertEqual(row, {
+        'place': 'bank', 'user': 'joesmith', 'password': 'superrich'})
+
+    row = parser._GetRowDictionary(['bank'])
+    self.assertEqual(row, {
+        'place': 'bank', 'user': parser._MAGIC_TEST_STRING,
+        'password': parser._MAGIC_TEST_STRING})
+
+    row = parser._GetRowDictionary(['bank', 'joesmith', 'superrich', 'x'])
+    self.assertEqual(row, {
+        'place': 'bank', 'user': 'joesmith', 'password': 'superrich',
+        parser._MAGIC_TEST_STRING: ['x']})
+
   def testHasExpectedLineLength(self):
     """Tests the _HasExpectedLineLength function."""
     parser = TestDSVParser()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the process-wide cache of dtFabric data type fabrics and maps."""
+
+from __future__ import unicode_literals
+
+import os
+import unittest
+
+from dtfabric.runtime import fabric as dtfabric_fabric
+
+from plaso.parsers import dtfabric_cache
+
+from tests import test_lib as shared_test_lib
+
+
+class DtFabricCacheTest(shared_test_lib.BaseTestCase):
+  """Tests for the process-wide cache of dtFabric data type fabrics and maps."""
+
+  # pylint: disable=protected-access
+
+  _DEFINITION_FILE_PATH = os.path.join(
+      os.path.dirname(dtfabric_cache.__file__), 'bsm.yaml')
+
+  def setUp(self):
+    """Makes preparations before running an individual test."""
+    dtfabric_cache.DtFabricCache.Clear()
+
+  def tearDown(self):
+    """Cleans up after running an individual test."""
+    dtfabric_cache.DtFabricCache.Clear()
+    dtfabric_cache.DtFabricCache.SetCacheDirectory(None)
+
+  def testGetCacheFilePath(self):
+    """Tests the _GetCacheFilePath function."""
+    dtfabric_cache.DtFabricCache.SetCacheDirectory('cache')
+
+    cache_file_path = dtfabric_cache.DtFabricCache._GetCacheFilePath(
+        self._DEFINITION_FILE_PATH, b'definition')
+    self.assertEqual(os.path.dirname(cache_file_path), 'cache')
+    self.assertTrue(os.path.basename(cache_file_path).startswith('bsm-'))
+    self.assertTrue(cache_file_path.endswith('.pickle'))
+
+    other_cache_file_path = dtfabric_cache.DtFabricCache._GetCacheFilePath(
+        self._DEFINITION_FILE_PATH, b'other definition')
+    self.assertNotEqual(other_cache_file_path, cache_file_path)
+
+  def testGetDataTypeFabric(self):
+    """Tests the GetDataTypeFabric function."""
+    data_type_fabric = dtfabric_cache.DtFabricCache.GetDataTypeFabric(
+        self._DEFINITION_FILE_PATH)
+    self.assertIsInstance(data_type_fabric, dtfabric_fabric.DataTypeFabric)
+
+    # Test that the data type fabric is shared.
+    cached_data_type_fabric = dtfabric_cache.DtFabricCache.GetDataTypeFabric(
+        self._DEFINITION_FILE_PATH)
+    self.assertIs(cached_data_type_fabric, data_type_fabric)
+
+    # Test with a non-existing definition file.
+    with self.assertRaises(IOError):
+      dtfabric_cache.DtFabricCache.GetDataTypeFabric(
+          self._GetTestFilePath(['does_not_exist.yaml']))
+
+  def testGetDataTypeFabricWithCacheDirectory(self):
+    """Tests the GetDataTypeFabric function with a cache directory."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      dtfabric_cache.DtFabricCache.SetCacheDirectory(temp_directory)
+
+      data_type_fabric = dtfabric_cache.DtFabricCache.GetDataTypeFabric(
+          self._DEFINITION_FILE_PATH)
+      self.assertIsInstance(data_type_fabric, dtfabric_fabric.DataTypeFabric)
+
+      cache_filenames = os.listdir(temp_directory)
+      self.assertEqual(len(cache_filenames), 1)
+      self.assertTrue(cache_filenames[0].endswith('.pickle'))
+
+      # Test that the data type fabric is read from the cache file.
+      dtfabric_cache.DtFabricCache.Clear()
+
+      cached_data_type_fabric = (
+          dtfabric_cache.DtFabricCache.GetDataTypeFabric(
+              self._DEFINITION_FILE_PATH))
+      self.assertIsNot(cached_data_type_fabric, data_type_fabric)
+
+      data_type_map = cached_data_type_fabric.CreateDataTypeMap(
+          'bsm_token_data_arg32')
+      self.assertIsNotNone(data_type_map)
+
+      # Test with a corrupt cache file.
+      cache_file_path = os.path.join(temp_directory, cache_filenames[0])
+      with open(cache_file_path, 'wb') as file_object:
+        file_object.write(b'corrupt')
+
+      dtfabric_cache.DtFabricCache.Clear()
+
+      data_type_fabric = dtfabric_cache.DtFabricCache.GetDataTypeFabric(
+          self._DEFINITION_FILE_PATH)
+      self.assertIsInstance(data_type_fabric, dtfabric_fabric.DataTypeFabric)
+
+  def testGetDataTypeMaps(self):
+    """Tests the GetDataTypeMaps function."""
+    data_type_fabric = dtfabric_cache.DtFabricCache.GetDataTypeFabric(
+        self._DEFINITION_FILE_PATH)
+
+    data_type_maps = dtfabric_cache.DtFabricCache.GetDataTypeMaps(
+        data_type_fabric)
+    self.assertEqual(data_type_maps, {})
+
+    data_type_maps['test'] = None
+
+    # Test that the data type maps are shared.
+    cached_data_type_maps = dtfabric_cache.DtFabricCache.GetDataTypeMaps(
+        data_type_fabric)
+    self.assertIs(cached_data_type_maps, data_type_maps)
+
+    # Test with a data type fabric that was not retrieved from the cache.
+    data_type_maps = dtfabric_cache.DtFabricCache.GetDataTypeMaps(
+        dtfabric_fabric.DataTypeFabric())
+    self.assertEqual(data_type_maps, {})
+
+    data_type_maps = dtfabric_cache.DtFabricCache.GetDataTypeMaps(None)
+    self.assertEqual(data_type_maps, {})
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -15,8 +15,9 @@ class ParserImportTest(test_lib.ImportCheckTestCase):
   """Tests that parser classes are imported correctly."""
 
   _IGNORABLE_FILES = frozenset([
-      'dtfabric_parser.py', 'dtfabric_plugin.py', 'logger.py', 'manager.py',
-      'presets.py', 'mediator.py', 'interface.py', 'plugins.py'])
+      'dtfabric_cache.py', 'dtfabric_parser.py', 'dtfabric_plugin.py',
+      'logger.py', 'manager.py', 'presets.py', 'mediator.py', 'interface.py',
+      'plugins.py'])
 
   def testParsersImported(self):
     """Tests that all parsers are imported."""
@@ -15,6 +15,24 @@ from tests.parsers import test_lib
 class MactimeTest(test_lib.ParserTestCase):
   """Tests the for mactime parser."""
 
+  # pylint: disable=protected-access
+
+  def testGetTimestamps(self):
+    """Tests the _GetTimestamps function."""
+    parser = mactime.MactimeParser()
+
+    rows_values = [
+        ('0', '/a', '16', 'r/rrw-------', '151107', '5000', '22',
+         '1337961583', '1337961584', '1337961585', '0'),
+        ('0', '/b', '17', 'r/rrw-------', '151107', '5000', '22',
+         '1337961583', '1337961583', 'bogus', '')]
+
+    timestamps = parser._GetTimestamps(rows_values)
+    self.assertEqual(timestamps, {
+        '1337961583': 1337961583000000,
+        '1337961584': 1337961584000000,
+        '1337961585': 1337961585000000})
+
   def testParse(self):
     """Tests the Parse function."""
     parser = mactime.MactimeParser()
@@ -4,6 +4,12 @@
 
 import unittest
 
+try:
+  import mock  # pylint: disable=import-error
+except ImportError:
+  from unittest import mock
+
+from plaso.parsers import mediator
 from plaso.parsers import sqlite
 # Register all plugins.
 from plaso.parsers import sqlite_plugins  # pylint: disable=unused-import
@@ -26,6 +32,10 @@ class SQLiteParserTest(test_lib.ParserTestCase):
     self.assertNotEqual(parser._plugins, [])
     self.assertEqual(len(parser._plugins), 1)
 
+    self.assertEqual(len(parser._plugin_indexes_per_table), 1)
+    self.assertEqual(len(parser._plugin_indexes_per_schema), 11)
+    self.assertEqual(parser._plugin_indexes_without_required_structure, [])
+
   def testFileParserChainMaintenance(self):
     """Tests that the parser chain is correctly maintained by the parser."""
     parser = sqlite.SQLiteParser()
@@ -35,6 +45,54 @@ class SQLiteParserTest(test_lib.ParserTestCase):
       event_data = self._GetEventDataOfEvent(storage_writer, event)
       self.assertEqual(1, event_data.parser.count('/'))
 
+  def testGetPluginsForDatabase(self):
+    """Tests the _GetPluginsForDatabase function."""
+    parser = sqlite.SQLiteParser()
+    parser.EnablePlugins(['chrome_8_history', 'chrome_27_history'])
+
+    database_file_path = self._GetTestFilePath(['History'])
+    self._SkipIfPathNotExists(database_file_path)
+
+    database = sqlite.SQLiteDatabase('History')
+    with open(database_file_path, 'rb') as database_file_object:
+      database.Open(database_file_object)
+
+    try:
+      plugins = parser._GetPluginsForDatabase(database)
+    finally:
+      database.Close()
+
+    self.assertEqual(len(plugins), 1)
+
+    plugin, schema_match = plugins[0]
+    self.assertEqual(plugin.NAME, 'chrome_8_history')
+    self.assertTrue(schema_match)
+
+    # Test with a database that has no matching plugins.
+    database_file_path = self._GetTestFilePath(['wal_database.db'])
+    self._SkipIfPathNotExists(database_file_path)
+
+    database = sqlite.SQLiteDatabase('wal_database.db')
+    with open(database_file_path, 'rb') as database_file_object:
+      database.Open(database_file_object)
+
+    try:
+      plugins = parser._GetPluginsForDatabase(database)
+    finally:
+      database.Close()
+
+    self.assertEqual(plugins, [])
+
+  def testParseFileEntryPluginSelectionProfiling(self):
+    """Tests that ParseFileEntry profiles the plugin selection per database."""
+    parser = sqlite.SQLiteParser()
+
+    with mock.patch.object(
+        mediator.ParserMediator, 'SampleStartTiming') as sample_start_timing:
+      self._ParseFile(['contacts2.db'], parser)
+
+    sample_start_timing.assert_any_call('sqlite_plugin_selection:contacts2.db')
+
   def testQueryDatabaseWithWAL(self):
     """Tests the Query function on a database with a WAL file."""
     database_file_path = self._GetTestFilePath(['wal_database.db'])
@@ -6,7 +6,10 @@ from __future__ import unicode_literals
 
 import unittest
 
+from plaso.containers import sessions
+from plaso.parsers import sqlite
 from plaso.parsers.sqlite_plugins import interface
+from plaso.storage.fake import writer as fake_writer
 
 from tests.parsers.sqlite_plugins import test_lib
 
@@ -53,6 +56,82 @@ class TestSQLitePlugin(interface.SQLitePlugin):
 class SQLiteInterfaceTest(test_lib.SQLitePluginTestCase):
   """Tests for the SQLite plugin interface."""
 
+  # pylint: disable=protected-access
+
+  def testHashRow(self):
+    """Tests the _HashRow function."""
+    plugin = TestSQLitePlugin()
+    query = plugin.QUERIES[0][0]
+    query_hash = hash(query)
+
+    _, database = self._OpenDatabaseFile(['wal_database.db'])
+    try:
+      rows = list(database.Query(query))
+    finally:
+      database.Close()
+
+    row_hash = plugin._HashRow(query_hash, rows[0], None)
+    self.assertEqual(row_hash, hash(('Committed Text 1', 1, None)))
+
+    row_hash = plugin._HashRow(query_hash, rows[0], ('Field2',))
+    self.assertEqual(row_hash, hash((1,)))
+
+    row_hash = plugin._HashRow(query_hash, rows[1], ('Field2',))
+    self.assertEqual(row_hash, hash((2,)))
+
+  def testProcessWithRowDeduplication(self):
+    """Tests the Process function with deduplication of rows."""
+    plugin = TestSQLitePlugin()
+
+    session = sessions.Session()
+    storage_writer = fake_writer.FakeStorageWriter(session)
+    storage_writer.Open()
+
+    file_entry, database = self._OpenDatabaseFile(['wal_database.db'])
+    parser_mediator = self._CreateParserMediator(
+        storage_writer, file_entry=file_entry)
+
+    _, database_wal = self._OpenDatabaseFile(
+        ['wal_database.db'], wal_path_segments=['wal_database.db-wal'])
+
+    try:
+      cache = sqlite.SQLiteCache()
+
+      plugin.Process(
+          parser_mediator, cache=cache, database=database,
+          database_wal=database_wal)
+      self.assertEqual(len(plugin.results), 10)
+
+      # Test that rows parsed before are skipped.
+      plugin.Process(
+          parser_mediator, cache=cache, database=database_wal,
+          database_wal=database_wal)
+      self.assertEqual(len(plugin.results), 14)
+
+      expected_results = [
+          ('Modified Committed Text 3', 4, None),
+          ('Unhashable Row 2', 11, b'More Binary Text!\x01\x02\x03'),
+          ('New Text 1', 12, None),
+          ('New Text 2', 13, None)]
+      self.assertEqual(plugin.results[10:], expected_results)
+
+      # Test that rows are skipped by the values of the key columns.
+      plugin = TestSQLitePlugin()
+      plugin.QUERY_KEY_COLUMNS = {'ParseMyTableRow': ('Field2',)}
+      cache = sqlite.SQLiteCache()
+
+      plugin.Process(
+          parser_mediator, cache=cache, database=database,
+          database_wal=database_wal)
+      plugin.Process(
+          parser_mediator, cache=cache, database=database_wal,
+          database_wal=database_wal)
+      self.assertEqual(len(plugin.results), 13)
+
+    finally:
+      database.Close()
+      database_wal.Close()
+
   def testProcessWithWAL(self):
     """Tests the Process function on a database with WAL file."""
     plugin = TestSQLitePlugin()
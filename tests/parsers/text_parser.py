@@ -4,10 +4,12 @@
 
 from __future__ import unicode_literals
 
+import io
 import unittest
 
 import pyparsing
 
+from plaso.lib import errors
 from plaso.parsers import text_parser
 
 from tests.parsers import test_lib
@@ -54,6 +56,126 @@ class PyparsingConstantsTest(test_lib.ParserTestCase):
       text_parser.PyparsingConstants.IPV4_ADDRESS.parseString('34.258')
 
 
+class EncodedTextReaderTest(unittest.TestCase):
+  """Tests for the encoded text reader."""
+
+  # pylint: disable=protected-access
+
+  def testReadLines(self):
+    """Tests the ReadLines function."""
+    file_object = io.BytesIO(
+        'First line\r\nSecond línea\nThird line\r\n'.encode('utf-8'))
+    text_reader = text_parser.EncodedTextReader('utf-8', buffer_size=12)
+    text_reader._read_size = 4
+
+    result = text_reader.ReadLines(file_object)
+    self.assertTrue(result)
+    self.assertEqual(text_reader.buffer, 'First line\nSecond línea\n')
+    self.assertEqual(text_reader.lines, 'First line\nSecond línea\n')
+
+    result = text_reader.ReadLines(file_object)
+    self.assertFalse(result)
+
+    result = text_reader.ReadLines(file_object, minimum_size=1024)
+    self.assertTrue(result)
+    self.assertEqual(
+        text_reader.buffer, 'First line\nSecond línea\nThird line\n')
+    self.assertEqual(text_reader.lines, 'First line\nSecond línea\n')
+
+    result = text_reader.ReadLines(file_object, minimum_size=2048)
+    self.assertFalse(result)
+
+  def testReadLinesWithoutEndOfLine(self):
+    """Tests the ReadLines function on text without end-of-line characters."""
+    file_object = io.BytesIO(b'A' * (2 * 1024 * 1024))
+    text_reader = text_parser.EncodedTextReader('utf-8', buffer_size=2048)
+
+    result = text_reader.ReadLines(file_object, maximum_size=2048)
+    self.assertTrue(result)
+    self.assertEqual(file_object.tell(), 2048)
+    self.assertEqual(text_reader.lines, 'A' * 2048)
+
+    result = text_reader.ReadLines(file_object, minimum_size=4096)
+    self.assertTrue(result)
+    self.assertEqual(len(text_reader.buffer), 2 * 1024 * 1024)
+    self.assertEqual(text_reader.lines, 'A' * 2048)
+
+  def testReadLine(self):
+    """Tests the ReadLine function."""
+    file_object = io.BytesIO(b'First line\n\nThird line')
+    text_reader = text_parser.EncodedTextReader('utf-8')
+    text_reader.ReadLines(file_object)
+
+    line = text_reader.ReadLine(file_object)
+    self.assertEqual(line, 'First line')
+
+    line = text_reader.ReadLine(file_object)
+    self.assertEqual(line, 'Third line')
+
+    line = text_reader.ReadLine(file_object)
+    self.assertEqual(line, '')
+
+  def testSkipAhead(self):
+    """Tests the SkipAhead function."""
+    file_object = io.BytesIO(b'First line\nSecond line\nThird line\n')
+    text_reader = text_parser.EncodedTextReader('utf-8', buffer_size=12)
+    text_reader._read_size = 12
+    text_reader.ReadLines(file_object)
+
+    text_reader.SkipAhead(file_object, 11)
+    self.assertEqual(text_reader.lines, 'Second line\n')
+
+    text_reader.SkipAhead(file_object, 12)
+    self.assertEqual(text_reader.buffer_offset, 0)
+    self.assertEqual(text_reader.lines, 'Third line\n')
+
+    text_reader.SkipAhead(file_object, 100)
+    self.assertEqual(text_reader.lines, '')
+
+
+class TextLineReaderTest(unittest.TestCase):
+  """Tests for the text line reader."""
+
+  # pylint: disable=protected-access
+
+  def testReadline(self):
+    """Tests the readline function."""
+    file_object = io.BytesIO(
+        '\ufeffFirst line\nSecond line\n\nLong line\n'.encode('utf-8'))
+    text_reader = text_parser.TextLineReader(file_object, block_size=4)
+
+    line = text_reader.readline()
+    self.assertEqual(line, 'First line\n')
+    self.assertEqual(text_reader.get_offset(), 14)
+
+    line = text_reader.readline()
+    self.assertEqual(line, 'Second line\n')
+
+    line = text_reader.readline()
+    self.assertEqual(line, '\n')
+
+    line = text_reader.readline(size=4)
+    self.assertEqual(line, 'Long')
+
+    line = text_reader.readline()
+    self.assertEqual(line, ' line\n')
+    self.assertEqual(text_reader.get_offset(), 37)
+
+    line = text_reader.readline()
+    self.assertEqual(line, '')
+
+  def testReadlineWithDecodeError(self):
+    """Tests the readline function with data that cannot be decoded."""
+    file_object = io.BytesIO(b'First line\n\xff\xfe\n')
+    text_reader = text_parser.TextLineReader(file_object)
+
+    line = text_reader.readline()
+    self.assertEqual(line, 'First line\n')
+
+    with self.assertRaises(UnicodeDecodeError):
+      text_reader.readline()
+
+
 class PyparsingSingleLineTextParserTest(unittest.TestCase):
   """Tests for the single line PyParsing-based text parser."""
 
@@ -82,5 +204,67 @@ class PyparsingSingleLineTextParserTest(unittest.TestCase):
     self.assertFalse(parser._IsText(bytes_in))
 
 
+class ExampleMultiLineTextParser(
+    text_parser.PyparsingMultiLineTextParser):
+  """Example multi line text parser.
+
+  Attributes:
+    verified_lines (str): lines passed to VerifyStructure.
+  """
+
+  NAME = 'test_multi_line_text'
+
+  LINE_STRUCTURES = [('line', pyparsing.Regex('[^\\n]*\\n'))]
+
+  def __init__(self):
+    """Initializes a parser object."""
+    super(ExampleMultiLineTextParser, self).__init__()
+    self.verified_lines = None
+
+  def ParseRecord(self, parser_mediator, key, structure):
+    """Parses a log record structure.
+
+    Args:
+      parser_mediator (ParserMediator): mediates interactions between parsers
+          and other components, such as storage and dfvfs.
+      key (str): name of the parsed structure.
+      structure (pyparsing.ParseResults): structure parsed from the log file.
+    """
+    return
+
+  def VerifyStructure(self, parser_mediator, lines):
+    """Verify that this file is a supported text file.
+
+    Args:
+      parser_mediator (ParserMediator): mediates interactions between parsers
+          and other components, such as storage and dfvfs.
+      lines (str): one or more lines from the text file.
+
+    Returns:
+      bool: True if this is the correct parser, False otherwise.
+    """
+    self.verified_lines = lines
+    return False
+
+
+class PyparsingMultiLineTextParserTest(test_lib.ParserTestCase):
+  """Tests for the multi line PyParsing-based text parser."""
+
+  def testParseFileObjectWithoutEndOfLine(self):
+    """Tests the ParseFileObject function on a file without end-of-lines."""
+    parser = ExampleMultiLineTextParser()
+    storage_writer = self._CreateStorageWriter()
+    parser_mediator = self._CreateParserMediator(storage_writer)
+
+    file_object = self._CreateFileObject(
+        'no_end_of_line.txt', b'A' * (2 * 1024 * 1024))
+
+    with self.assertRaises(errors.UnableToParseFile):
+      parser.ParseFileObject(parser_mediator, file_object)
+
+    self.assertEqual(parser.verified_lines, 'A' * parser.BUFFER_SIZE)
+    self.assertEqual(file_object.get_offset(), parser.BUFFER_SIZE)
+
+
 if __name__ == '__main__':
   unittest.main()
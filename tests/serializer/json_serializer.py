@@ -493,6 +493,33 @@ class JSONAttributeContainerSerializerTest(JSONSerializerTestCase):
         sorted(task_start_dict.items()),
         sorted(expected_task_start_dict.items()))
 
+  def testReadSerializedDict(self):
+    """Test ReadSerializedDict does not change the JSON dict."""
+    test_file = self._GetTestFilePath(['ímynd.dd'])
+
+    volume_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file)
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_TSK, location='/',
+        parent=volume_path_spec)
+
+    expected_event_data = events.EventData()
+    expected_event_data.data_type = 'test:event2'
+    expected_event_data.pathspec = path_spec
+
+    json_dict = (
+        json_serializer.JSONAttributeContainerSerializer.WriteSerializedDict(
+            expected_event_data))
+    expected_json_dict = json.loads(json.dumps(json_dict))
+
+    json_dict = json.loads(json.dumps(json_dict))
+    event_data = (
+        json_serializer.JSONAttributeContainerSerializer.ReadSerializedDict(
+            json_dict))
+
+    self.assertIsNotNone(event_data)
+    self.assertEqual(event_data.pathspec.comparable, path_spec.comparable)
+    self.assertEqual(json_dict, expected_json_dict)
 
 
 if __name__ == '__main__':
@@ -14,6 +14,7 @@ from plaso.containers import sessions
 from plaso.containers import tasks
 from plaso.containers import warnings
 from plaso.lib import definitions
+from plaso.storage import identifiers
 from plaso.storage.sqlite import sqlite_file
 
 from tests import test_lib as shared_test_lib
@@ -499,6 +500,46 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
 
   # TODO: add tests for GetSessions
 
+  def testGetSerializedEventDataByIdentifier(self):
+    """Tests the GetSerializedEventDataByIdentifier function."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'plaso.sqlite')
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=temp_file, read_only=False)
+
+      for event, event_data in containers_test_lib.CreateEventsFromValues(
+          self._TEST_EVENTS):
+        storage_file.AddEventData(event_data)
+
+        event.SetEventDataIdentifier(event_data.GetIdentifier())
+        storage_file.AddEvent(event)
+
+      storage_file.Close()
+
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=temp_file)
+
+      test_event = next(storage_file.GetSortedEvents())
+      event_data_identifier = test_event.GetEventDataIdentifier()
+
+      serialized_data = storage_file.GetSerializedEventDataByIdentifier(
+          event_data_identifier)
+      self.assertIsNotNone(serialized_data)
+
+      test_event_data = storage_file._serializer.ReadSerialized(
+          serialized_data.decode('utf-8'))
+      expected_event_data = storage_file.GetEventDataByIdentifier(
+          event_data_identifier)
+      self.assertEqual(
+          test_event_data.CopyToDict(), expected_event_data.CopyToDict())
+
+      identifier = identifiers.SQLTableIdentifier('event_data', 99)
+      serialized_data = storage_file.GetSerializedEventDataByIdentifier(
+          identifier)
+      self.assertIsNone(serialized_data)
+
+      storage_file.Close()
+
   def testGetSortedEvents(self):
     """Tests the GetSortedEvents function."""
     with shared_test_lib.TempDirectory() as temp_directory:
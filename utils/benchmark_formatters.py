@@ -0,0 +1,226 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Script to benchmark the throughput of the event formatters."""
+
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import argparse
+import logging
+import os
+import string
+import sys
+import time
+
+from plaso.containers import events
+from plaso.formatters import interface
+from plaso.formatters import manager
+from plaso.formatters import mediator
+
+# The formatters are registered when the modules are imported.
+import plaso.formatters  # pylint: disable=unused-import
+
+
+class FormattersBenchmark(object):
+  """Event formatters benchmark."""
+
+  # Format specification types that require an integer or a floating-point
+  # value.
+  _FLOAT_FORMAT_TYPES = frozenset(['e', 'E', 'f', 'F', 'g', 'G', '%'])
+  _INTEGER_FORMAT_TYPES = frozenset(['b', 'c', 'd', 'n', 'o', 'x', 'X'])
+
+  _FORMATTER = string.Formatter()
+
+  # Attributes that are typically set on event data by the extraction but
+  # that are not used by most format strings.
+  _COMMON_EVENT_DATA_ATTRIBUTES = {
+      'display_name': 'OS:/tmp/benchmark',
+      'filename': '/tmp/benchmark',
+      'hostname': 'benchmark',
+      'inode': 12,
+      'offset': 1024,
+      'parser': 'benchmark',
+      'query': 'SELECT * FROM benchmark',
+      'sha256_hash': (
+          'e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855'),
+      'username': 'benchmark'}
+
+  def _GetFormatStrings(self, formatter_object):
+    """Retrieves the format strings of a formatter.
+
+    Args:
+      formatter_object (EventFormatter): formatter.
+
+    Returns:
+      list[str]: format strings.
+    """
+    if isinstance(formatter_object, interface.ConditionalEventFormatter):
+      format_strings = list(formatter_object.FORMAT_STRING_PIECES)
+      format_strings.extend(formatter_object.FORMAT_STRING_SHORT_PIECES)
+    else:
+      format_strings = [
+          formatter_object.FORMAT_STRING, formatter_object.FORMAT_STRING_SHORT]
+
+    return [
+        format_string for format_string in format_strings
+        if isinstance(format_string, str)]
+
+  def _CreateEventData(self, formatter_object):
+    """Creates synthetic event data for a formatter.
+
+    Every attribute used by the format strings is set to a value of a type
+    that matches its format specification. Attributes that are typically set
+    by the extraction are added as well.
+
+    Args:
+      formatter_object (EventFormatter): formatter.
+
+    Returns:
+      EventData: event data.
+    """
+    event_data = events.EventData(data_type=formatter_object.DATA_TYPE)
+    for attribute_name, attribute_value in (
+        self._COMMON_EVENT_DATA_ATTRIBUTES.items()):
+      setattr(event_data, attribute_name, attribute_value)
+
+    for format_string in self._GetFormatStrings(formatter_object):
+      try:
+        parsed_format_string = list(self._FORMATTER.parse(format_string))
+      except ValueError:
+        continue
+
+      for _, field_name, format_spec, _ in parsed_format_string:
+        if not field_name or not field_name.isidentifier():
+          continue
+
+        if format_spec and format_spec[-1] in self._INTEGER_FORMAT_TYPES:
+          attribute_value = 12
+        elif format_spec and format_spec[-1] in self._FLOAT_FORMAT_TYPES:
+          attribute_value = 1.5
+        else:
+          attribute_value = 'value of {0:s}'.format(field_name)
+
+        setattr(event_data, field_name, attribute_value)
+
+    for helper in formatter_object.helpers:
+      input_attribute = getattr(helper, 'input_attribute', None)
+      if input_attribute and not hasattr(event_data, input_attribute):
+        setattr(event_data, input_attribute, 1)
+
+    return event_data
+
+  def GetFormatterObjects(self):
+    """Retrieves the registered formatters.
+
+    Returns:
+      list[EventFormatter]: formatters sorted by data type.
+    """
+    # pylint: disable=protected-access
+    data_types = set(manager.FormattersManager._formatter_classes.keys())
+    data_types.update(manager.FormattersManager._formatter_objects.keys())
+
+    return [
+        manager.FormattersManager.GetFormatterObject(data_type)
+        for data_type in sorted(data_types)]
+
+  def Run(self, formatter_objects, number_of_iterations):
+    """Runs the benchmark.
+
+    Args:
+      formatter_objects (list[EventFormatter]): formatters.
+      number_of_iterations (int): number of times to format the event data
+          of every formatter.
+
+    Returns:
+      tuple: containing:
+
+        int: number of formatted events.
+        float: number of seconds it took to format the events.
+        list[str]: data types of the formatters that failed.
+    """
+    formatter_mediator = mediator.FormatterMediator()
+
+    benchmark_formatters = []
+    failed_data_types = []
+    for formatter_object in formatter_objects:
+      event_data = self._CreateEventData(formatter_object)
+      try:
+        formatter_object.GetMessages(formatter_mediator, event_data)
+      except Exception as exception:  # pylint: disable=broad-except
+        logging.debug('Unable to format: {0:s} with error: {1!s}'.format(
+            formatter_object.DATA_TYPE, exception))
+        failed_data_types.append(formatter_object.DATA_TYPE)
+        continue
+
+      benchmark_formatters.append((formatter_object, event_data))
+
+    start_time = time.time()
+    for _ in range(number_of_iterations):
+      for formatter_object, event_data in benchmark_formatters:
+        formatter_object.GetMessages(formatter_mediator, event_data)
+
+    elapsed_time = time.time() - start_time
+
+    number_of_events = number_of_iterations * len(benchmark_formatters)
+    return number_of_events, elapsed_time, failed_data_types
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      'Benchmarks the throughput of the event formatters using synthetic '
+      'event data.'))
+
+  argument_parser.add_argument(
+      '--formatters_directory', '--formatters-directory',
+      dest='formatters_directory', type=str, action='store',
+      default=os.path.join('data', 'formatters'), metavar='PATH',
+      help='path of the directory that contains the formatters files.')
+
+  argument_parser.add_argument(
+      '--iterations', dest='iterations', type=int, action='store',
+      default=1000, metavar='NUMBER', help=(
+          'number of times to format the event data of every formatter.'))
+
+  options = argument_parser.parse_args()
+
+  logging.basicConfig(
+      level=logging.ERROR, format='[%(levelname)s] %(message)s')
+
+  if os.path.isdir(options.formatters_directory):
+    manager.FormattersManager.ReadFormattersFromDirectory(
+        options.formatters_directory)
+
+  benchmark = FormattersBenchmark()
+
+  formatter_objects = benchmark.GetFormatterObjects()
+  if not formatter_objects:
+    print('Unable to determine formatters')
+    return False
+
+  number_of_events, elapsed_time, failed_data_types = benchmark.Run(
+      formatter_objects, options.iterations)
+
+  print('Formatters\t\t: {0:d}'.format(len(formatter_objects)))
+  print('Skipped formatters\t: {0:d}'.format(len(failed_data_types)))
+  print('Formatted events\t: {0:d}'.format(number_of_events))
+  print('Elapsed time\t\t: {0:.3f} seconds'.format(elapsed_time))
+  if elapsed_time:
+    print('Throughput\t\t: {0:.0f} events per second'.format(
+        number_of_events / elapsed_time))
+
+  for data_type in failed_data_types:
+    print('Skipped: {0:s}'.format(data_type))
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
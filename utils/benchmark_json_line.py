@@ -0,0 +1,168 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Script to benchmark the throughput of the json_line event export."""
+
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+from plaso.engine import configurations
+from plaso.engine import knowledge_base
+from plaso.formatters import manager as formatters_manager
+from plaso.formatters import mediator as formatters_mediator
+from plaso.multi_processing import psort
+from plaso.output import json_line
+from plaso.output import mediator as output_mediator
+from plaso.storage import factory as storage_factory
+
+# The formatters are registered when the modules are imported.
+import plaso.formatters  # pylint: disable=unused-import
+
+
+class NullOutputWriter(object):
+  """Output writer that discards the output."""
+
+  def Write(self, string):
+    """Discards a string.
+
+    Args:
+      string (str): string to write.
+    """
+    return
+
+
+class JSONLineExportBenchmark(object):
+  """JSON line event export benchmark."""
+
+  def _ExportEvents(self, storage_file_path, use_serialized_event_data):
+    """Exports the events of a storage file to a null output writer.
+
+    Args:
+      storage_file_path (str): path of the storage file.
+      use_serialized_event_data (bool): True if the serialized event data,
+          as read from storage, should be reused.
+
+    Returns:
+      tuple: containing:
+
+        int: number of exported events.
+        float: number of seconds it took to export the events.
+    """
+    knowledge_base_object = knowledge_base.KnowledgeBase()
+    formatter_mediator = formatters_mediator.FormatterMediator()
+    mediator_object = output_mediator.OutputMediator(
+        knowledge_base_object, formatter_mediator)
+
+    output_module = json_line.JSONLineOutputModule(mediator_object)
+    output_module.SetOutputWriter(NullOutputWriter())
+    output_module.SUPPORTS_SERIALIZED_EVENT_DATA = use_serialized_event_data
+
+    storage_reader = (
+        storage_factory.StorageFactory.CreateStorageReaderForFile(
+            storage_file_path))
+
+    engine = psort.PsortMultiProcessEngine()
+
+    start_time = time.time()
+    try:
+      engine.ExportEvents(
+          knowledge_base_object, storage_reader, output_module,
+          configurations.ProcessingConfiguration())
+    finally:
+      storage_reader.Close()
+
+    elapsed_time = time.time() - start_time
+
+    # pylint: disable=protected-access
+    number_of_events = engine._number_of_consumed_events
+    return number_of_events, elapsed_time
+
+  def Run(self, storage_file_path, number_of_iterations):
+    """Runs the benchmark.
+
+    Args:
+      storage_file_path (str): path of the storage file.
+      number_of_iterations (int): number of times to export the events for
+          every export path.
+
+    Returns:
+      dict[str, list[tuple[int, float]]]: number of exported events and
+          elapsed time per iteration, per export path.
+    """
+    results = {'regular': [], 'serialized': []}
+    for _ in range(number_of_iterations):
+      results['regular'].append(self._ExportEvents(storage_file_path, False))
+      results['serialized'].append(
+          self._ExportEvents(storage_file_path, True))
+
+    return results
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      'Benchmarks the throughput of the json_line event export with and '
+      'without reusing the serialized event data.'))
+
+  argument_parser.add_argument(
+      'storage_file', nargs='?', action='store', metavar='PATH',
+      default=None, help='path of the storage file.')
+
+  argument_parser.add_argument(
+      '--formatters_directory', '--formatters-directory',
+      dest='formatters_directory', type=str, action='store',
+      default=os.path.join('data', 'formatters'), metavar='PATH',
+      help='path of the directory that contains the formatters files.')
+
+  argument_parser.add_argument(
+      '--iterations', dest='iterations', type=int, action='store',
+      default=3, metavar='NUMBER', help=(
+          'number of times to export the events for every export path.'))
+
+  options = argument_parser.parse_args()
+
+  if not options.storage_file:
+    print('Storage file missing.')
+    print('')
+    argument_parser.print_help()
+    print('')
+    return False
+
+  logging.basicConfig(
+      level=logging.ERROR, format='[%(levelname)s] %(message)s')
+
+  if os.path.isdir(options.formatters_directory):
+    formatters_manager.FormattersManager.ReadFormattersFromDirectory(
+        options.formatters_directory)
+
+  benchmark = JSONLineExportBenchmark()
+  results = benchmark.Run(options.storage_file, options.iterations)
+
+  for export_path in ('regular', 'serialized'):
+    for number_of_events, elapsed_time in results[export_path]:
+      throughput = 0.0
+      if elapsed_time:
+        throughput = number_of_events / elapsed_time
+
+      print((
+          '{0:s}\t: {1:d} events in {2:.3f} seconds, {3:.0f} events per '
+          'second').format(
+              export_path, number_of_events, elapsed_time, throughput))
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
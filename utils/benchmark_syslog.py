@@ -0,0 +1,259 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Script to benchmark the throughput of the syslog parser."""
+
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import argparse
+import logging
+import os
+import random
+import sys
+import time
+
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import resolver as path_spec_resolver
+
+from plaso.engine import knowledge_base
+from plaso.parsers import mediator as parsers_mediator
+from plaso.parsers import syslog
+
+
+class CountingStorageWriter(object):
+  """Storage writer that only counts the attribute containers it is given.
+
+  Attributes:
+    number_of_events (int): number of events.
+    number_of_warnings (int): number of warnings.
+  """
+
+  def __init__(self):
+    """Initializes a counting storage writer."""
+    super(CountingStorageWriter, self).__init__()
+    self.number_of_events = 0
+    self.number_of_warnings = 0
+
+  def AddEvent(self, event):  # pylint: disable=unused-argument
+    """Adds an event.
+
+    Args:
+      event (EventObject): event.
+    """
+    self.number_of_events += 1
+
+  def AddEventData(self, event_data):  # pylint: disable=unused-argument
+    """Adds event data.
+
+    Args:
+      event_data (EventData): event data.
+    """
+    return
+
+  def AddWarning(self, warning):  # pylint: disable=unused-argument
+    """Adds a warning.
+
+    Args:
+      warning (ExtractionWarning): warning.
+    """
+    self.number_of_warnings += 1
+
+
+class SyslogBenchmark(object):
+  """Syslog parser benchmark."""
+
+  _HOSTNAMES = ['myhostname.myhost.com', 'server01', 'build-agent-7']
+
+  _MONTHS = [
+      'Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct',
+      'Nov', 'Dec']
+
+  _REPORTERS = ['client', 'sshd', 'kernel', 'CRON', 'systemd']
+
+  _WORDS = [
+      'connection', 'from', 'closed', 'session', 'opened', 'for', 'user',
+      'root', 'No', 'new', 'content', 'in', 'ímynd.dd', 'port', '22']
+
+  def _GenerateRecord(self, random_generator, month_index, long_body_size):
+    """Generates a syslog record.
+
+    Args:
+      random_generator (random.Random): random number generator.
+      month_index (int): index of the month of the record.
+      long_body_size (int): size of the body of the record, where 0 represents
+          a single line body and a larger size a body that spans multiple
+          lines.
+
+    Returns:
+      str: syslog record.
+    """
+    body = ' '.join(random_generator.sample(self._WORDS, 8))
+    if long_body_size:
+      body_lines = [body]
+      body_size = len(body)
+      while body_size < long_body_size:
+        body_line = '\t{0:s}'.format(
+            ' '.join(random_generator.sample(self._WORDS, 10)))
+        body_lines.append(body_line)
+        body_size += len(body_line) + 1
+
+      body = '\n'.join(body_lines)
+
+    return (
+        '{0:s} {1:2d} {2:02d}:{3:02d}:{4:02d} {5:s} {6:s}[{7:d}]: '
+        '{8:s}\n').format(
+            self._MONTHS[month_index % 12], random_generator.randint(1, 28),
+            random_generator.randint(0, 23), random_generator.randint(0, 59),
+            random_generator.randint(0, 59),
+            random_generator.choice(self._HOSTNAMES),
+            random_generator.choice(self._REPORTERS),
+            random_generator.randint(1, 65535), body)
+
+  def GenerateFile(self, path, size, long_body_interval, long_body_size):
+    """Generates a synthetic syslog file.
+
+    Args:
+      path (str): path of the syslog file.
+      size (int): size of the syslog file in bytes.
+      long_body_interval (int): interval of records with a body that spans
+          multiple lines, where 0 represents no such records.
+      long_body_size (int): size of a body that spans multiple lines.
+    """
+    random_generator = random.Random(1)
+
+    number_of_bytes = 0
+    number_of_records = 0
+    with open(path, 'wb') as file_object:
+      while number_of_bytes < size:
+        records = []
+        for _ in range(1000):
+          # The first record has a single line body, since the syslog parser
+          # only supports files that start with such a record.
+          record_long_body_size = 0
+          if long_body_interval and number_of_records:
+            _, remainder = divmod(number_of_records, long_body_interval)
+            if not remainder:
+              record_long_body_size = long_body_size
+
+          records.append(self._GenerateRecord(
+              random_generator, number_of_records // 100000,
+              record_long_body_size))
+          number_of_records += 1
+
+        data = ''.join(records).encode('utf-8')
+        file_object.write(data)
+        number_of_bytes += len(data)
+
+  def Run(self, path):
+    """Runs the benchmark.
+
+    Args:
+      path (str): path of the syslog file.
+
+    Returns:
+      tuple: containing:
+
+        CountingStorageWriter: storage writer.
+        float: number of seconds it took to parse the syslog file.
+    """
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=path)
+    file_entry = path_spec_resolver.Resolver.OpenFileEntry(path_spec)
+
+    knowledge_base_object = knowledge_base.KnowledgeBase()
+    knowledge_base_object.SetTimeZone('UTC')
+
+    storage_writer = CountingStorageWriter()
+    parser_mediator = parsers_mediator.ParserMediator(
+        storage_writer, knowledge_base_object)
+    parser_mediator.SetFileEntry(file_entry)
+
+    parser = syslog.SyslogParser()
+    file_object = file_entry.GetFileObject()
+
+    start_time = time.time()
+    try:
+      parser.Parse(parser_mediator, file_object)
+    finally:
+      file_object.close()
+
+    elapsed_time = time.time() - start_time
+
+    return storage_writer, elapsed_time
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      'Benchmarks the throughput of the syslog parser on a synthetic syslog '
+      'file. The file is generated if it does not exist.'))
+
+  argument_parser.add_argument(
+      'syslog_file', nargs='?', action='store', metavar='PATH',
+      default=None, help='path of the synthetic syslog file.')
+
+  argument_parser.add_argument(
+      '--size', dest='size', type=int, action='store', default=1024,
+      metavar='MIB', help=(
+          'size of the synthetic syslog file in MiB, the default is 1024.'))
+
+  argument_parser.add_argument(
+      '--long_body_interval', '--long-body-interval',
+      dest='long_body_interval', type=int, action='store', default=100,
+      metavar='NUMBER', help=(
+          'interval of records with a body that spans multiple lines, '
+          'where 0 represents no such records.'))
+
+  argument_parser.add_argument(
+      '--long_body_size', '--long-body-size', dest='long_body_size',
+      type=int, action='store', default=16384, metavar='SIZE', help=(
+          'size of a body that spans multiple lines.'))
+
+  options = argument_parser.parse_args()
+
+  if not options.syslog_file:
+    print('Syslog file missing.')
+    print('')
+    argument_parser.print_help()
+    print('')
+    return False
+
+  logging.basicConfig(
+      level=logging.ERROR, format='[%(levelname)s] %(message)s')
+
+  benchmark = SyslogBenchmark()
+
+  if not os.path.exists(options.syslog_file):
+    print('Generating synthetic syslog file: {0:s}'.format(
+        options.syslog_file))
+    benchmark.GenerateFile(
+        options.syslog_file, options.size * 1024 * 1024,
+        options.long_body_interval, options.long_body_size)
+
+  file_size = os.path.getsize(options.syslog_file)
+
+  storage_writer, elapsed_time = benchmark.Run(options.syslog_file)
+
+  throughput = 0.0
+  if elapsed_time:
+    throughput = file_size / (elapsed_time * 1024 * 1024)
+
+  print((
+      '{0:d} events and {1:d} warnings in {2:.3f} seconds, {3:.2f} MiB per '
+      'second').format(
+          storage_writer.number_of_events, storage_writer.number_of_warnings,
+          elapsed_time, throughput))
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)